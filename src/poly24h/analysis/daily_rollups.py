@@ -0,0 +1,224 @@
+"""F-057: Materialized daily rollups with incremental refresh.
+
+분석(``analyze``), 사이클 리포트, ``get_paper_trading_summary``가 매번 원본 레코드
+전체에서 P&L/승률/마켓·자산별 통계를 다시 계산하던 것을, 하루치 ``TradeAggregate``를
+``paper_trades/rollups/YYYY-MM-DD.json``에 저장해 두고 합치기만 하도록 바꾼다.
+
+- 소스 키: trade store의 일별 리비전(F-057, 행 추가/정산 시 증가) + 그날
+  paired_/market_stats_ 파일의 (size, mtime_ns). 키가 바뀐 날만 다시 계산한다
+  → 평소에는 오늘과 방금 정산된 날만 재계산
+- 동결: 끝난 지 ``FREEZE_AFTER`` 이상 지났고 미정산 거래가 없는 날은 frozen —
+  이후로는 소스를 확인하지 않고 저장된 롤업을 그대로 쓴다
+- 저장은 F-055 ``JsonlWriter.replace`` (원자적 스냅샷, 실행 중엔 백그라운드)
+- 조회 비용은 O(일 수): ``aggregate``는 일별 롤업을 merge만 한다
+
+Usage:
+    rollups = DailyRollups("data/paper_trades", store)
+    result = rollups.aggregate(start_day="2026-02-08").result(files_read=0)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+from poly24h.analysis.paper_analyzer import (
+    FILE_PREFIXES,
+    KIND_MARKET_STATS,
+    KIND_PAIRED,
+    KIND_SINGLE,
+    PARALLEL_MIN_BYTES,
+    TradeAggregate,
+    aggregate_files,
+    find_files,
+)
+from poly24h.jsonl_writer import JsonlWriter, get_default_writer
+from poly24h.trade_store import TradeStore
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_DIR = "rollups"
+FREEZE_AFTER = timedelta(hours=1)  # 자정 직후 늦게 flush되는 기록 여유
+
+
+@dataclass
+class DayRollup:
+    """One day's materialized aggregate and the source state it was built from."""
+
+    day: str
+    source_key: list
+    frozen: bool
+    aggregate: TradeAggregate
+
+    def to_dict(self) -> dict:
+        return {
+            "day": self.day,
+            "source_key": self.source_key,
+            "frozen": self.frozen,
+            "aggregate": self.aggregate.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DayRollup:
+        return cls(
+            day=data["day"],
+            source_key=data["source_key"],
+            frozen=bool(data.get("frozen", False)),
+            aggregate=TradeAggregate.from_dict(data["aggregate"]),
+        )
+
+
+class DailyRollups:
+    """Per-day rollups of the trade store and the paired/market_stats files.
+
+    Args:
+        data_dir: paper_trades directory (rollups live in ``data_dir/rollups``).
+        store: Trade store holding the single-side trades.
+        writer: Rollup file writer (default: process-wide JsonlWriter).
+        clock: Epoch-seconds clock, for deciding which days are closed.
+        max_workers / parallel_min_bytes: File fan-out for rebuilt days (F-056).
+    """
+
+    def __init__(
+        self,
+        data_dir: Path | str,
+        store: TradeStore,
+        writer: Optional[JsonlWriter] = None,
+        clock: Callable[[], float] = time.time,
+        max_workers: int = 1,
+        parallel_min_bytes: int = PARALLEL_MIN_BYTES,
+    ):
+        self.data_dir = Path(data_dir)
+        self.rollup_dir = self.data_dir / ROLLUP_DIR
+        self._store = store
+        self._writer = writer or get_default_writer()
+        self._clock = clock
+        self.max_workers = max_workers
+        self.parallel_min_bytes = parallel_min_bytes
+        self._cache: dict[str, DayRollup] = {}
+
+        # Metrics
+        self.rebuilt_days = 0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def refresh(
+        self,
+        start_day: Optional[str] = None,
+        end_day: Optional[str] = None,
+        files: Optional[dict[str, list[Path]]] = None,
+    ) -> list[DayRollup]:
+        """Up-to-date rollups for every day in range, rebuilding only stale days.
+
+        ``files`` is ``find_files(data_dir, start_day, end_day)`` if the caller
+        already globbed the directory.
+        """
+        if files is None:
+            files = find_files(self.data_dir, start_day, end_day)
+        revisions = self._store.day_revisions(start_day, end_day)
+        day_files: dict[str, list[tuple[str, Path]]] = {}
+        for kind in (KIND_PAIRED, KIND_MARKET_STATS):
+            prefix_len = len(FILE_PREFIXES[kind])
+            for path in files.get(kind, []):
+                day_files.setdefault(path.stem[prefix_len:], []).append((kind, path))
+
+        rollups: dict[str, DayRollup] = {}
+        stale: list[tuple[str, list]] = []
+        for day in sorted(set(revisions) | set(day_files)):
+            rollup = self._cache.get(day) or self._load(day)
+            if rollup is not None and rollup.frozen:
+                rollups[day] = rollup
+                continue
+            key = self._source_key(revisions.get(day), day_files.get(day, []))
+            if rollup is not None and rollup.source_key == key:
+                rollups[day] = rollup
+                continue
+            stale.append((day, key))
+
+        if stale:
+            tasks = [task for day, _ in stale for task in day_files.get(day, [])]
+            parts = aggregate_files(tasks, self.max_workers, self.parallel_min_bytes)
+            for day, key in stale:
+                aggregate = TradeAggregate()
+                if day in revisions:
+                    aggregate.add(KIND_SINGLE, self._store.iter_trades(days=[day]))
+                for _ in day_files.get(day, []):
+                    aggregate.merge(next(parts))
+                rollups[day] = self._save(DayRollup(
+                    day=day,
+                    source_key=key,
+                    frozen=self._is_closed(day) and aggregate.single.open_trades == 0,
+                    aggregate=aggregate,
+                ))
+            self.rebuilt_days += len(stale)
+            logger.debug("[ROLLUP] Rebuilt %d day(s): %s", len(stale), [d for d, _ in stale])
+
+        return [rollups[day] for day in sorted(rollups)]
+
+    def aggregate(
+        self,
+        start_day: Optional[str] = None,
+        end_day: Optional[str] = None,
+        files: Optional[dict[str, list[Path]]] = None,
+    ) -> TradeAggregate:
+        """All days in range merged into one fresh aggregate — O(days)."""
+        total = TradeAggregate()
+        for rollup in self.refresh(start_day, end_day, files):
+            total.merge(rollup.aggregate)
+        return total
+
+    def recent(self, days: int) -> TradeAggregate:
+        """The last ``days`` UTC days (today included)."""
+        now = datetime.fromtimestamp(self._clock(), tz=timezone.utc)
+        start = now - timedelta(days=days - 1)
+        return self.aggregate(start_day=start.strftime("%Y-%m-%d"))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _source_key(self, revision: Optional[int], files: list[tuple[str, Path]]) -> list:
+        stamps = []
+        for _, path in files:
+            try:
+                st = path.stat()
+                stamps.append([path.name, st.st_size, st.st_mtime_ns])
+            except OSError:
+                stamps.append([path.name, 0, 0])
+        return [f"{self._store.store_id}:{revision or 0}", sorted(stamps)]
+
+    def _is_closed(self, day: str) -> bool:
+        try:
+            start = datetime.strptime(day, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return False
+        day_end = start + timedelta(days=1)
+        return self._clock() >= (day_end + FREEZE_AFTER).timestamp()
+
+    def _path(self, day: str) -> Path:
+        return self.rollup_dir / f"{day}.json"
+
+    def _load(self, day: str) -> Optional[DayRollup]:
+        path = self._path(day)
+        if not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                rollup = DayRollup.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("[ROLLUP] Ignoring unreadable rollup %s: %s", path.name, e)
+            return None
+        self._cache[day] = rollup
+        return rollup
+
+    def _save(self, rollup: DayRollup) -> DayRollup:
+        self._cache[rollup.day] = rollup
+        self._writer.replace(self._path(rollup.day), json.dumps(rollup.to_dict()))
+        return rollup
@@ -1,10 +1,14 @@
 """Paper trade analysis tool — reads JSONL files and generates P&L reports.
 
 Supports three data sources:
-1. paper_trades/*.jsonl — Single-side paper trades (sniper entries)
+1. paper_trades/trades.db — Single-side paper trades (sniper entries, F-053 trade
+   store; legacy paper_trades/YYYY-MM-DD.jsonl files are imported into it)
 2. paper_trades/paired_*.jsonl — Paired entry (YES+NO) paper trades
 3. paper_trades/market_stats_*.jsonl — Per-market opportunity logs
 
+F-056: 모든 소스를 한 번의 스트리밍 패스로 집계하고 (메모리 일정), 큰 히스토리는
+파일 단위로 프로세스 풀에 나눠 부분 결과를 병합한다.
+
 Usage:
     python -m poly24h --mode analyze
     python -m poly24h --mode analyze --date 2026-02-07
@@ -15,10 +19,17 @@ from __future__ import annotations
 
 import json
 import logging
-from collections import defaultdict
-from dataclasses import dataclass, field
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterable, Iterator
+
+from poly24h.jsonl_writer import get_default_writer
+from poly24h.trade_store import DB_NAME, TradeStore
 
 logger = logging.getLogger(__name__)
 
@@ -112,20 +123,413 @@ class AnalysisResult:
     files_read: int = 0
 
 
+# ---------------------------------------------------------------------------
+# Streaming aggregation (F-056)
+# ---------------------------------------------------------------------------
+
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024  # 이보다 작으면 프로세스 풀 기동 비용이 더 큼
+
+# File kinds by filename prefix ("" = legacy single-trade day files)
+KIND_SINGLE = "single"
+KIND_PAIRED = "paired"
+KIND_MARKET_STATS = "market_stats"
+FILE_PREFIXES = {KIND_PAIRED: "paired_", KIND_MARKET_STATS: "market_stats_", KIND_SINGLE: ""}
+
+
+def _extract_date(timestamp: str) -> str:
+    """Extract YYYY-MM-DD from ISO timestamp."""
+    if not timestamp:
+        return "unknown"
+    return timestamp[:10]
+
+
+def _iter_jsonl(file_path: Path) -> Iterator[dict]:
+    """Stream JSON lines from a file, skipping malformed lines."""
+    try:
+        with open(file_path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning("Skipping malformed line in %s: %s", file_path, e)
+    except OSError as e:
+        logger.warning("Error reading %s: %s", file_path, e)
+
+
+def _merge_summary(into: TradeSummary, other: TradeSummary) -> None:
+    into.total_trades += other.total_trades
+    into.total_cost += other.total_cost
+    into.total_payout += other.total_payout
+    into.total_pnl += other.total_pnl
+    into.wins += other.wins
+    into.losses += other.losses
+    into.open_trades += other.open_trades
+    into.max_loss = min(into.max_loss, other.max_loss)
+    into.max_gain = max(into.max_gain, other.max_gain)
+    into.best_roi_pct = max(into.best_roi_pct, other.best_roi_pct)
+    into.worst_roi_pct = min(into.worst_roi_pct, other.worst_roi_pct)
+
+
+@dataclass
+class TradeAggregate:
+    """Single-pass, mergeable partial analysis.
+
+    레코드를 한 번씩만 보고 모든 breakdown을 동시에 누적한다. 메모리는 날짜/소스/
+    자산 수에만 비례하므로 히스토리 크기와 무관하다. 파일(또는 store)별 부분
+    결과를 ``merge``로 합친 뒤 ``result``로 AnalysisResult를 만든다.
+    """
+
+    single: TradeSummary = field(default_factory=TradeSummary)
+    paired: TradeSummary = field(default_factory=TradeSummary)
+    single_prices: list = field(default_factory=lambda: [0.0, 0])   # [sum, count]
+    paired_prices: list = field(default_factory=lambda: [0.0, 0])
+    by_date: dict[str, DailySummary] = field(default_factory=dict)
+    by_market: dict[str, MarketSummary] = field(default_factory=dict)
+    by_asset: dict[str, AssetSummary] = field(default_factory=dict)
+    asset_prices: dict[str, list] = field(default_factory=dict)
+    first_date: str = ""
+    last_date: str = ""
+
+    # -- per-record --------------------------------------------------------
+
+    def _day(self, t: dict) -> DailySummary:
+        timestamp = t.get("timestamp", "")
+        d = _extract_date(timestamp)
+        if timestamp:
+            if not self.first_date or d < self.first_date:
+                self.first_date = d
+            if d > self.last_date:
+                self.last_date = d
+        ds = self.by_date.get(d)
+        if ds is None:
+            ds = self.by_date[d] = DailySummary(date=d)
+        return ds
+
+    def _market(self, t: dict) -> MarketSummary:
+        source = t.get("market_source", "unknown")
+        ms = self.by_market.get(source)
+        if ms is None:
+            ms = self.by_market[source] = MarketSummary(name=source)
+        return ms
+
+    def add_single(self, t: dict) -> None:
+        """Single-side paper trade → overall / date / market."""
+        s = self.single
+        s.total_trades += 1
+        cost = t.get("cost", 0.0)
+        s.total_cost += cost
+        settled = t.get("status", "open") == "settled"
+        pnl = t.get("pnl", 0.0)
+        price = t.get("price", 0.0)
+
+        if price > 0:
+            self.single_prices[0] += price
+            self.single_prices[1] += 1
+
+        if settled:
+            s.total_pnl += pnl
+            s.total_payout += t.get("payout", 0.0)
+            if pnl > 0:
+                s.wins += 1
+                s.max_gain = max(s.max_gain, pnl)
+                roi = (pnl / cost * 100) if cost > 0 else 0
+                s.best_roi_pct = max(s.best_roi_pct, roi)
+            elif pnl < 0:
+                s.losses += 1
+                s.max_loss = min(s.max_loss, pnl)
+                roi = (pnl / cost * 100) if cost > 0 else 0
+                s.worst_roi_pct = min(s.worst_roi_pct, roi)
+            else:
+                # Break-even counts as win
+                s.wins += 1
+        else:
+            s.open_trades += 1
+
+        ds = self._day(t)
+        ds.trades += 1
+        ds.cost += cost
+        ms = self._market(t)
+        ms.trades += 1
+        ms.cost += cost
+        if settled:
+            ds.pnl += pnl
+            ms.pnl += pnl
+            if pnl > 0:
+                ds.wins += 1
+                ms.wins += 1
+            elif pnl < 0:
+                ds.losses += 1
+                ms.losses += 1
+        else:
+            ds.open_count += 1
+
+    def add_paired(self, t: dict) -> None:
+        """Paired (YES+NO) paper trade → paired / date / market."""
+        s = self.paired
+        s.total_trades += 1
+        cost = t.get("cost_usd", 0.0)
+        s.total_cost += cost
+        guaranteed_profit = t.get("guaranteed_profit", 0.0)
+        settled = t.get("status", "open") == "settled"
+        total_cost = t.get("total_cost", 0.0)
+
+        if total_cost > 0:
+            self.paired_prices[0] += total_cost
+            self.paired_prices[1] += 1
+
+        if settled:
+            actual_pnl = t.get("actual_pnl", 0.0)
+            s.total_pnl += actual_pnl
+            if actual_pnl >= 0:
+                s.wins += 1
+            else:
+                s.losses += 1
+        else:
+            s.open_trades += 1
+            # For open paired trades, guaranteed_profit is the expected P&L
+            s.total_pnl += guaranteed_profit
+            s.max_gain = max(s.max_gain, guaranteed_profit)
+            s.best_roi_pct = max(s.best_roi_pct, t.get("roi_pct", 0.0))
+
+        ds = self._day(t)
+        ds.trades += 1
+        ds.cost += cost
+        ds.pnl += guaranteed_profit
+        if not settled:
+            ds.open_count += 1
+        ms = self._market(t)
+        ms.trades += 1
+        ms.cost += cost
+        ms.pnl += guaranteed_profit
+
+    def add_market_stat(self, rec: dict) -> None:
+        """market_stats record → by-asset signal counts."""
+        symbol = rec.get("asset_symbol", "") or "OTHER"
+        a = self.by_asset.get(symbol)
+        if a is None:
+            a = self.by_asset[symbol] = AssetSummary(symbol=symbol)
+            self.asset_prices[symbol] = [0.0, 0]
+        a.total_signals += 1
+        if rec.get("is_paired"):
+            a.paired_signals += 1
+        else:
+            a.single_signals += 1
+
+        price = rec.get("trigger_price", 0.0)
+        if price > 0:
+            a.min_trigger_price = min(a.min_trigger_price, price)
+            a.max_trigger_price = max(a.max_trigger_price, price)
+            self.asset_prices[symbol][0] += price
+            self.asset_prices[symbol][1] += 1
+
+    def add(self, kind: str, records: Iterable[dict]) -> TradeAggregate:
+        """Stream ``records`` of one file kind into this aggregate."""
+        add = {
+            KIND_SINGLE: self.add_single,
+            KIND_PAIRED: self.add_paired,
+            KIND_MARKET_STATS: self.add_market_stat,
+        }[kind]
+        for record in records:
+            add(record)
+        return self
+
+    # -- combine / persist -------------------------------------------------
+
+    def merge(self, other: TradeAggregate) -> TradeAggregate:
+        _merge_summary(self.single, other.single)
+        _merge_summary(self.paired, other.paired)
+        for mine, theirs in (
+            (self.single_prices, other.single_prices),
+            (self.paired_prices, other.paired_prices),
+        ):
+            mine[0] += theirs[0]
+            mine[1] += theirs[1]
+
+        for d, o in other.by_date.items():
+            ds = self.by_date.setdefault(d, DailySummary(date=d))
+            ds.trades += o.trades
+            ds.cost += o.cost
+            ds.pnl += o.pnl
+            ds.wins += o.wins
+            ds.losses += o.losses
+            ds.open_count += o.open_count
+
+        for name, o in other.by_market.items():
+            ms = self.by_market.setdefault(name, MarketSummary(name=name))
+            ms.trades += o.trades
+            ms.cost += o.cost
+            ms.pnl += o.pnl
+            ms.wins += o.wins
+            ms.losses += o.losses
+
+        for symbol, o in other.by_asset.items():
+            a = self.by_asset.setdefault(symbol, AssetSummary(symbol=symbol))
+            a.total_signals += o.total_signals
+            a.paired_signals += o.paired_signals
+            a.single_signals += o.single_signals
+            a.min_trigger_price = min(a.min_trigger_price, o.min_trigger_price)
+            a.max_trigger_price = max(a.max_trigger_price, o.max_trigger_price)
+            prices = self.asset_prices.setdefault(symbol, [0.0, 0])
+            prices[0] += other.asset_prices[symbol][0]
+            prices[1] += other.asset_prices[symbol][1]
+
+        if other.first_date and (not self.first_date or other.first_date < self.first_date):
+            self.first_date = other.first_date
+        self.last_date = max(self.last_date, other.last_date)
+        return self
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TradeAggregate:
+        """Inverse of ``to_dict`` (F-057 rollup files)."""
+        return cls(
+            single=TradeSummary(**data["single"]),
+            paired=TradeSummary(**data["paired"]),
+            single_prices=list(data["single_prices"]),
+            paired_prices=list(data["paired_prices"]),
+            by_date={k: DailySummary(**v) for k, v in data["by_date"].items()},
+            by_market={k: MarketSummary(**v) for k, v in data["by_market"].items()},
+            by_asset={k: AssetSummary(**v) for k, v in data["by_asset"].items()},
+            asset_prices={k: list(v) for k, v in data["asset_prices"].items()},
+            first_date=data.get("first_date", ""),
+            last_date=data.get("last_date", ""),
+        )
+
+    def result(self, files_read: int) -> AnalysisResult:
+        """Final report. The aggregate itself is left untouched (still mergeable)."""
+        result = AnalysisResult(
+            overall=_with_avg_price(self.single, self.single_prices),
+            paired=_with_avg_price(self.paired, self.paired_prices),
+            by_date=sorted(self.by_date.values(), key=lambda x: x.date),
+            by_market=sorted(self.by_market.values(), key=lambda x: -x.trades),
+            files_read=files_read,
+        )
+
+        by_asset = []
+        for symbol, a in self.by_asset.items():
+            total, count = self.asset_prices[symbol]
+            by_asset.append(replace(
+                a,
+                avg_trigger_price=total / count if count else a.avg_trigger_price,
+                # Fix inf sentinel
+                min_trigger_price=(
+                    0.0 if a.min_trigger_price == float("inf") else a.min_trigger_price
+                ),
+            ))
+        result.by_asset = sorted(by_asset, key=lambda x: -x.total_signals)
+
+        if self.first_date:
+            result.date_range = f"{self.first_date} ~ {self.last_date}"
+        else:
+            result.date_range = "No data"
+        return result
+
+
+def _with_avg_price(summary: TradeSummary, prices: list) -> TradeSummary:
+    total, count = prices
+    return replace(summary, avg_price=total / count) if count else replace(summary)
+
+
+def _aggregate_file(kind: str, path: Path) -> TradeAggregate:
+    """Process-pool task: stream one JSONL file into a partial aggregate."""
+    return TradeAggregate().add(kind, _iter_jsonl(path))
+
+
+def aggregate_files(
+    tasks: list[tuple[str, Path]],
+    max_workers: int,
+    parallel_min_bytes: int = PARALLEL_MIN_BYTES,
+) -> Iterator[TradeAggregate]:
+    """Partial aggregates per ``(kind, path)`` task, in task order.
+
+    Large histories fan out over a process pool; small ones (and pool
+    failures) are read serially in-process.
+    """
+    if max_workers > 1 and len(tasks) > 1:
+        total_bytes = 0
+        for _, path in tasks:
+            try:
+                total_bytes += path.stat().st_size
+            except OSError:
+                pass
+        if total_bytes >= parallel_min_bytes:
+            try:
+                with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+                    # Collected before yielding: a pool failure part-way through
+                    # falls back to a full serial pass without duplicating partials
+                    partials = list(pool.map(_aggregate_file, *zip(*tasks)))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning("Process pool unavailable (%s) — analyzing serially", e)
+            else:
+                yield from partials
+                return
+
+    for kind, path in tasks:
+        yield _aggregate_file(kind, path)
+
+
+def find_files(
+    data_dir: Path,
+    start_day: str | None = None,
+    end_day: str | None = None,
+) -> dict[str, list[Path]]:
+    """Dated JSONL files in ``data_dir`` by kind (one glob), days inclusive."""
+    files: dict[str, list[Path]] = {kind: [] for kind in FILE_PREFIXES}
+    if not data_dir.exists():
+        return files
+
+    for f in sorted(data_dir.glob("*.jsonl")):
+        name = f.stem
+        for kind, prefix in FILE_PREFIXES.items():
+            if name.startswith(prefix):
+                date_part = name[len(prefix):]
+                break
+        try:
+            datetime.strptime(date_part, "%Y-%m-%d")
+        except ValueError:
+            continue
+
+        if start_day and date_part < start_day:
+            continue
+        if end_day and date_part > end_day:
+            continue
+        files[kind].append(f)
+
+    return files
+
+
 # ---------------------------------------------------------------------------
 # Analyzer
 # ---------------------------------------------------------------------------
 
 
 class PaperTradeAnalyzer:
-    """Reads paper trade JSONL files and generates comprehensive P&L analysis.
+    """Streams paper trade history into a comprehensive P&L analysis.
+
+    F-056: 모든 레코드는 한 번의 패스로 ``TradeAggregate``에 누적되고, JSONL 파일은
+    크기가 ``parallel_min_bytes``를 넘으면 프로세스 풀로 나눠 처리한 뒤 부분
+    결과를 합친다. 메모리는 히스토리 길이와 무관하게 일정하다.
 
     Args:
         data_dir: Path to paper_trades directory.
+        max_workers: Process pool size (default: CPU count; 1 = serial).
+        parallel_min_bytes: Total JSONL size below which files are read serially.
     """
 
-    def __init__(self, data_dir: str = "data/paper_trades"):
+    def __init__(
+        self,
+        data_dir: str = "data/paper_trades",
+        max_workers: int | None = None,
+        parallel_min_bytes: int = PARALLEL_MIN_BYTES,
+    ):
         self.data_dir = Path(data_dir)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_min_bytes = parallel_min_bytes
 
     def analyze(
         self,
@@ -151,341 +555,64 @@ class PaperTradeAnalyzer:
         if days is not None:
             start_date = now - timedelta(days=days - 1)
 
-        # Collect all relevant files
-        single_trades = self._load_single_trades(start_date, end_date)
-        paired_trades = self._load_paired_trades(start_date, end_date)
-        market_stats = self._load_market_stats(start_date, end_date)
-
-        files_read = (
-            len(self._find_files("", start_date, end_date))
-            + len(self._find_files("paired_", start_date, end_date))
-            + len(self._find_files("market_stats_", start_date, end_date))
+        # F-055: In-process callers may still have JSONL records queued
+        writer = get_default_writer()
+        if writer.pending_writes:
+            writer.flush()
+
+        start_day = start_date.strftime("%Y-%m-%d") if start_date else None
+        end_day = end_date.strftime("%Y-%m-%d") if end_date else None
+        files = find_files(self.data_dir, start_day, end_day)
+
+        # F-057: Per-day rollups; raw files only if the trade store is unavailable
+        total = self._aggregate_rollups(start_day, end_day, files)
+        if total is None:
+            total = TradeAggregate()
+            tasks = [(kind, f) for kind in FILE_PREFIXES for f in files[kind]]
+            for part in aggregate_files(tasks, self.max_workers, self.parallel_min_bytes):
+                total.merge(part)
+
+        files_read = int((self.data_dir / DB_NAME).exists()) + sum(
+            len(paths) for paths in files.values()
         )
-
-        result = AnalysisResult(files_read=files_read)
-
-        # Overall single trade summary
-        result.overall = self._summarize_single_trades(single_trades)
-
-        # Paired trade summary
-        result.paired = self._summarize_paired_trades(paired_trades)
-
-        # By-date breakdown
-        result.by_date = self._by_date_breakdown(single_trades, paired_trades)
-
-        # By-market breakdown
-        result.by_market = self._by_market_breakdown(single_trades, paired_trades)
-
-        # By-asset breakdown from market_stats
-        result.by_asset = self._by_asset_breakdown(market_stats)
-
-        # Date range label
-        dates = sorted(
-            set(
-                self._extract_date(t.get("timestamp", ""))
-                for t in single_trades + paired_trades
-                if t.get("timestamp")
-            )
-        )
-        if dates:
-            result.date_range = f"{dates[0]} ~ {dates[-1]}"
-        else:
-            result.date_range = "No data"
-
-        return result
+        return total.result(files_read)
 
     # ------------------------------------------------------------------
-    # File loading
+    # Sources
     # ------------------------------------------------------------------
 
-    def _find_files(
+    def _aggregate_rollups(
         self,
-        prefix: str,
-        start_date: datetime | None,
-        end_date: datetime | None,
-    ) -> list[Path]:
-        """Find JSONL files matching prefix and date range."""
+        start_day: str | None,
+        end_day: str | None,
+        files: dict[str, list[Path]],
+    ) -> TradeAggregate | None:
+        """Merge the day rollups in range (F-057), rebuilding only stale days.
+
+        Single-side trades come from the trade store (F-053); changed legacy
+        YYYY-MM-DD.jsonl files are imported first. Returns None if the store
+        can't be read, so the caller falls back to the raw files.
+        """
         if not self.data_dir.exists():
-            return []
-
-        files = []
-        for f in sorted(self.data_dir.glob(f"{prefix}*.jsonl")):
-            # Extract date from filename
-            name = f.stem
-            if prefix:
-                date_part = name[len(prefix):]
-            else:
-                date_part = name
+            return TradeAggregate()
+        # daily_rollups builds on TradeAggregate — imported here to avoid a cycle
+        from poly24h.analysis.daily_rollups import DailyRollups
 
+        try:
+            store = TradeStore.for_dir(self.data_dir)
             try:
-                file_date = datetime.strptime(date_part, "%Y-%m-%d").replace(
-                    tzinfo=timezone.utc
+                store.import_dir(self.data_dir)
+                rollups = DailyRollups(
+                    self.data_dir, store,
+                    max_workers=self.max_workers,
+                    parallel_min_bytes=self.parallel_min_bytes,
                 )
-            except ValueError:
-                continue
-
-            if start_date and file_date.date() < start_date.date():
-                continue
-            if end_date and file_date.date() > end_date.date():
-                continue
-
-            files.append(f)
-
-        return files
-
-    def _load_jsonl(self, file_path: Path) -> list[dict]:
-        """Load all JSON lines from a file."""
-        records = []
-        try:
-            with open(file_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        records.append(json.loads(line))
-        except (OSError, json.JSONDecodeError) as e:
-            logger.warning("Error reading %s: %s", file_path, e)
-        return records
-
-    def _load_single_trades(
-        self,
-        start_date: datetime | None,
-        end_date: datetime | None,
-    ) -> list[dict]:
-        """Load single-side paper trades (YYYY-MM-DD.jsonl)."""
-        files = self._find_files("", start_date, end_date)
-        # Filter out files that start with "paired_" or "market_stats_"
-        files = [
-            f for f in files
-            if not f.stem.startswith("paired_") and not f.stem.startswith("market_stats_")
-        ]
-        all_trades = []
-        for f in files:
-            all_trades.extend(self._load_jsonl(f))
-        return all_trades
-
-    def _load_paired_trades(
-        self,
-        start_date: datetime | None,
-        end_date: datetime | None,
-    ) -> list[dict]:
-        """Load paired entry paper trades (paired_YYYY-MM-DD.jsonl)."""
-        files = self._find_files("paired_", start_date, end_date)
-        all_trades = []
-        for f in files:
-            all_trades.extend(self._load_jsonl(f))
-        return all_trades
-
-    def _load_market_stats(
-        self,
-        start_date: datetime | None,
-        end_date: datetime | None,
-    ) -> list[dict]:
-        """Load market stats records (market_stats_YYYY-MM-DD.jsonl)."""
-        files = self._find_files("market_stats_", start_date, end_date)
-        all_records = []
-        for f in files:
-            all_records.extend(self._load_jsonl(f))
-        return all_records
-
-    # ------------------------------------------------------------------
-    # Summaries
-    # ------------------------------------------------------------------
-
-    @staticmethod
-    def _extract_date(timestamp: str) -> str:
-        """Extract YYYY-MM-DD from ISO timestamp."""
-        if not timestamp:
-            return "unknown"
-        return timestamp[:10]
-
-    def _summarize_single_trades(self, trades: list[dict]) -> TradeSummary:
-        """Build overall summary from single-side paper trades."""
-        s = TradeSummary()
-        prices = []
-
-        for t in trades:
-            s.total_trades += 1
-            cost = t.get("cost", 0.0)
-            s.total_cost += cost
-            status = t.get("status", "open")
-            pnl = t.get("pnl", 0.0)
-            payout = t.get("payout", 0.0)
-            price = t.get("price", 0.0)
-
-            if price > 0:
-                prices.append(price)
-
-            if status == "settled":
-                s.total_pnl += pnl
-                s.total_payout += payout
-                if pnl > 0:
-                    s.wins += 1
-                    s.max_gain = max(s.max_gain, pnl)
-                    roi = (pnl / cost * 100) if cost > 0 else 0
-                    s.best_roi_pct = max(s.best_roi_pct, roi)
-                elif pnl < 0:
-                    s.losses += 1
-                    s.max_loss = min(s.max_loss, pnl)
-                    roi = (pnl / cost * 100) if cost > 0 else 0
-                    s.worst_roi_pct = min(s.worst_roi_pct, roi)
-                else:
-                    # Break-even counts as win
-                    s.wins += 1
-            else:
-                s.open_trades += 1
-
-        if prices:
-            s.avg_price = sum(prices) / len(prices)
-
-        return s
-
-    def _summarize_paired_trades(self, trades: list[dict]) -> TradeSummary:
-        """Build summary from paired entry paper trades."""
-        s = TradeSummary()
-        prices = []
-
-        for t in trades:
-            s.total_trades += 1
-            cost = t.get("cost_usd", 0.0)
-            s.total_cost += cost
-            guaranteed_profit = t.get("guaranteed_profit", 0.0)
-            status = t.get("status", "open")
-            actual_pnl = t.get("actual_pnl", 0.0)
-            total_cost = t.get("total_cost", 0.0)
-
-            if total_cost > 0:
-                prices.append(total_cost)
-
-            if status == "settled":
-                s.total_pnl += actual_pnl
-                if actual_pnl >= 0:
-                    s.wins += 1
-                else:
-                    s.losses += 1
-            else:
-                s.open_trades += 1
-                # For open paired trades, guaranteed_profit is the expected P&L
-                s.total_pnl += guaranteed_profit
-                s.max_gain = max(s.max_gain, guaranteed_profit)
-                roi = t.get("roi_pct", 0.0)
-                s.best_roi_pct = max(s.best_roi_pct, roi)
-
-        if prices:
-            s.avg_price = sum(prices) / len(prices)
-
-        return s
-
-    def _by_date_breakdown(
-        self,
-        single_trades: list[dict],
-        paired_trades: list[dict],
-    ) -> list[DailySummary]:
-        """Break down trades by date."""
-        by_date: dict[str, DailySummary] = {}
-
-        for t in single_trades:
-            d = self._extract_date(t.get("timestamp", ""))
-            if d not in by_date:
-                by_date[d] = DailySummary(date=d)
-            ds = by_date[d]
-            ds.trades += 1
-            ds.cost += t.get("cost", 0.0)
-            status = t.get("status", "open")
-            if status == "settled":
-                pnl = t.get("pnl", 0.0)
-                ds.pnl += pnl
-                if pnl > 0:
-                    ds.wins += 1
-                elif pnl < 0:
-                    ds.losses += 1
-            else:
-                ds.open_count += 1
-
-        for t in paired_trades:
-            d = self._extract_date(t.get("timestamp", ""))
-            if d not in by_date:
-                by_date[d] = DailySummary(date=d)
-            ds = by_date[d]
-            ds.trades += 1
-            ds.cost += t.get("cost_usd", 0.0)
-            ds.pnl += t.get("guaranteed_profit", 0.0)
-            status = t.get("status", "open")
-            if status != "settled":
-                ds.open_count += 1
-
-        return sorted(by_date.values(), key=lambda x: x.date)
-
-    def _by_market_breakdown(
-        self,
-        single_trades: list[dict],
-        paired_trades: list[dict],
-    ) -> list[MarketSummary]:
-        """Break down trades by market source."""
-        by_source: dict[str, MarketSummary] = {}
-
-        for t in single_trades:
-            source = t.get("market_source", "unknown")
-            if source not in by_source:
-                by_source[source] = MarketSummary(name=source)
-            ms = by_source[source]
-            ms.trades += 1
-            ms.cost += t.get("cost", 0.0)
-            if t.get("status") == "settled":
-                pnl = t.get("pnl", 0.0)
-                ms.pnl += pnl
-                if pnl > 0:
-                    ms.wins += 1
-                elif pnl < 0:
-                    ms.losses += 1
-
-        for t in paired_trades:
-            source = t.get("market_source", "unknown")
-            if source not in by_source:
-                by_source[source] = MarketSummary(name=source)
-            ms = by_source[source]
-            ms.trades += 1
-            ms.cost += t.get("cost_usd", 0.0)
-            ms.pnl += t.get("guaranteed_profit", 0.0)
-
-        return sorted(by_source.values(), key=lambda x: -x.trades)
-
-    def _by_asset_breakdown(self, market_stats: list[dict]) -> list[AssetSummary]:
-        """Break down signals by asset symbol from market_stats."""
-        by_asset: dict[str, AssetSummary] = {}
-
-        for rec in market_stats:
-            symbol = rec.get("asset_symbol", "") or "OTHER"
-            if symbol not in by_asset:
-                by_asset[symbol] = AssetSummary(symbol=symbol)
-            a = by_asset[symbol]
-            a.total_signals += 1
-
-            if rec.get("is_paired"):
-                a.paired_signals += 1
-            else:
-                a.single_signals += 1
-
-            price = rec.get("trigger_price", 0.0)
-            if price > 0:
-                a.min_trigger_price = min(a.min_trigger_price, price)
-                a.max_trigger_price = max(a.max_trigger_price, price)
-
-        # Compute averages
-        for symbol, a in by_asset.items():
-            prices = [
-                r.get("trigger_price", 0.0)
-                for r in market_stats
-                if (r.get("asset_symbol", "") or "OTHER") == symbol
-                and r.get("trigger_price", 0.0) > 0
-            ]
-            if prices:
-                a.avg_trigger_price = sum(prices) / len(prices)
-
-            # Fix inf sentinel
-            if a.min_trigger_price == float("inf"):
-                a.min_trigger_price = 0.0
-
-        return sorted(by_asset.values(), key=lambda x: -x.total_signals)
+                return rollups.aggregate(start_day, end_day, files=files)
+            finally:
+                store.close()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Trade store unavailable (%s) — reading day files", e)
+            return None
 
 
 # ---------------------------------------------------------------------------
@@ -4,17 +4,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import aiohttp
 
+from poly24h.http_transport import HttpTransport, get_default_transport
+from poly24h.singleflight import RequestCoalescer
+
 logger = logging.getLogger(__name__)
 
 GAMMA_API_URL = "https://gamma-api.polymarket.com"
 CLOB_API_URL = "https://clob.polymarket.com"
 DEFAULT_TIMEOUT = 15  # seconds
 DEFAULT_MAX_RETRIES = 3
+BOOK_CACHE_TTL = 0.5  # seconds — F-039: /book 응답 read-through 캐시
 
 
 def is_market_active(end_date_str: str | None) -> bool:
@@ -36,6 +40,29 @@ def is_market_active(end_date_str: str | None) -> bool:
         return False
 
 
+def filter_stale_markets(markets: list, buffer_hours: float = 1.0) -> list:
+    """Drop markets that settle within ``buffer_hours`` from now.
+
+    Args:
+        markets: Market objects (``end_date`` tz-aware datetime)
+        buffer_hours: Minimum time left before settlement
+
+    Returns:
+        Markets whose end date is after now + buffer (order preserved)
+    """
+    cutoff = datetime.now(tz=timezone.utc) + timedelta(hours=buffer_hours)
+    fresh = []
+    for market in markets:
+        end_date = getattr(market, "end_date", None)
+        if end_date is None:
+            continue
+        if end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=timezone.utc)
+        if end_date > cutoff:
+            fresh.append(market)
+    return fresh
+
+
 class GammaClient:
     """Async client for Polymarket Gamma API.
 
@@ -49,22 +76,28 @@ class GammaClient:
         base_url: str = GAMMA_API_URL,
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        transport: Optional[HttpTransport] = None,
     ):
         self.base_url = base_url
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_retries = max_retries
+        # F-034: 공유 커넥션 풀. 세션은 transport 소유 — close()는 참조만 해제.
+        self._transport = transport or get_default_transport()
         self._session: Optional[aiohttp.ClientSession] = None
+        # F-039: 동일 GET 동시 요청은 하나만 전송 (오더북은 짧게 캐시)
+        self._coalescer = RequestCoalescer()
+
+    def coalesce_stats(self) -> dict:
+        """F-039: single-flight/캐시로 절약한 GET 수."""
+        return self._coalescer.stats()
 
     async def open(self) -> None:
-        """Open aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
+        """Warm up the shared transport session."""
+        self._session = await self._transport.session()
 
     async def close(self) -> None:
-        """Close aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """Release the session reference (shared pool stays open)."""
+        self._session = None
 
     async def __aenter__(self) -> GammaClient:
         await self.open()
@@ -106,7 +139,7 @@ class GammaClient:
         url = f"{CLOB_API_URL}/book"
         params = {"token_id": token_id}
         
-        orderbook = await self._get_dict(url, params)
+        orderbook = await self._get_dict(url, params, cache_ttl=BOOK_CACHE_TTL)
         if not orderbook:
             return False
         
@@ -148,6 +181,11 @@ class GammaClient:
         }
         return await self._get_list(url, params)
 
+    async def fetch_events_by_slug(self, slug: str) -> list[dict]:
+        """GET /events?slug= — slug 직접 조회 (F-045). 없으면 빈 리스트."""
+        url = f"{self.base_url}/events"
+        return await self._get_list(url, {"slug": slug})
+
     async def fetch_events_by_date_range(
         self,
         end_date_min: str,
@@ -242,7 +280,7 @@ class GammaClient:
         """GET /book — 토큰 오더북 조회. 실패 시 None."""
         url = f"{self.base_url}/book"
         params = {"token_id": token_id}
-        return await self._get_dict(url, params)
+        return await self._get_dict(url, params, cache_ttl=BOOK_CACHE_TTL)
 
     @staticmethod
     def best_ask(orderbook: Optional[dict]) -> Optional[float]:
@@ -261,22 +299,41 @@ class GammaClient:
     # HTTP helpers with retry
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _request_key(url: str, params: dict) -> tuple:
+        return (url, tuple(sorted((k, str(v)) for k, v in params.items())))
+
     async def _get_list(self, url: str, params: dict) -> list[dict]:
-        """GET → list. 429시 지수 백오프. 실패 시 빈 리스트 반환 (크래시 방지)."""
+        """GET → list. 동시 동일 요청은 하나로 합침 (F-039)."""
+        return await self._coalescer.do(
+            ("list",) + self._request_key(url, params),
+            lambda: self._get_list_uncached(url, params),
+        )
+
+    async def _get_dict(
+        self, url: str, params: dict, cache_ttl: float = 0.0,
+    ) -> Optional[dict]:
+        """GET → dict. 동시 동일 요청은 하나로 합침, ``cache_ttl`` 동안 캐시 (F-039)."""
+        return await self._coalescer.do(
+            ("dict",) + self._request_key(url, params),
+            lambda: self._get_dict_uncached(url, params),
+            ttl=cache_ttl,
+        )
+
+    async def _get_list_uncached(self, url: str, params: dict) -> list[dict]:
+        """GET → list. 429 백오프는 transport 담당. 실패 시 빈 리스트 반환 (크래시 방지)."""
         for attempt in range(1, self.max_retries + 1):
             try:
-                async with self._session.get(url, params=params) as resp:
+                async with self._transport.get(
+                    url, params=params, timeout=self.timeout,
+                ) as resp:
                     if resp.status == 200:
                         data = await resp.json()
                         return data if isinstance(data, list) else []
                     if resp.status == 429:
-                        wait = 1.0 * (2 ** (attempt - 1))
-                        logger.warning(
-                            "API 429 rate limit %s (attempt %d/%d), backing off %.1fs",
-                            url, attempt, self.max_retries, wait,
-                        )
-                        await asyncio.sleep(wait)
-                        continue
+                        # transport가 이미 백오프 재시도를 소진함
+                        logger.warning("API 429 rate limit %s — giving up", url)
+                        return []
                     logger.warning(
                         "Gamma API %s returned %d (attempt %d/%d)",
                         url, resp.status, attempt, self.max_retries,
@@ -293,22 +350,20 @@ class GammaClient:
 
         return []
 
-    async def _get_dict(self, url: str, params: dict) -> Optional[dict]:
-        """GET → dict. 429시 지수 백오프. 실패 시 None 반환."""
+    async def _get_dict_uncached(self, url: str, params: dict) -> Optional[dict]:
+        """GET → dict. 429 백오프는 transport 담당. 실패 시 None 반환."""
         for attempt in range(1, self.max_retries + 1):
             try:
-                async with self._session.get(url, params=params) as resp:
+                async with self._transport.get(
+                    url, params=params, timeout=self.timeout,
+                ) as resp:
                     if resp.status == 200:
                         data = await resp.json()
                         return data if isinstance(data, dict) else None
                     if resp.status == 429:
-                        wait = 1.0 * (2 ** (attempt - 1))
-                        logger.warning(
-                            "API 429 rate limit %s (attempt %d/%d), backing off %.1fs",
-                            url, attempt, self.max_retries, wait,
-                        )
-                        await asyncio.sleep(wait)
-                        continue
+                        # transport가 이미 백오프 재시도를 소진함
+                        logger.warning("API 429 rate limit %s — giving up", url)
+                        return None
                     logger.warning(
                         "Gamma API %s returned %d (attempt %d/%d)",
                         url, resp.status, attempt, self.max_retries,
@@ -0,0 +1,206 @@
+"""F-045: Predictive next-hour resolution of hourly crypto markets.
+
+1H 크립토 마켓은 slug가 코인/시각으로 정해진다:
+
+    bitcoin-up-or-down-february-6-9am-et   (09:00–10:00 ET, endDate = 10:00 ET)
+
+PRE_OPEN(120s 전)에 tag_slug='1H' 전체 조회 + 텍스트 필터를 하는 대신,
+IDLE 중에 다음 정각의 slug를 템플릿으로 만들어 직접 조회(``/events?slug=``)
+해 두고 토큰 ID를 미리 확보한다. PRE_OPEN은 이 결과를 그대로 쓰므로
+디스커버리 지연이 정각 직전의 critical path에서 빠진다.
+
+예측한 slug 중 하나라도 찾지 못하면(템플릿 변경 등) ``complete``가 False —
+호출자는 기존 tag_slug 전체 조회로 폴백한다.
+
+유동성 필터는 프리페치 시점이 아니라 PRE_OPEN 승격(``promote``) 시점에
+다시 조회한 값으로 적용한다 (프리페치는 최대 수 분 앞서 실행되므로).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from poly24h.config import MARKET_SOURCES
+from poly24h.discovery.gamma_client import GammaClient
+from poly24h.discovery.market_catalog import MarketCatalog
+from poly24h.discovery.market_filter import MarketFilter
+from poly24h.models.market import Market, MarketSource
+
+logger = logging.getLogger(__name__)
+
+EXCHANGE_TZ = ZoneInfo("America/New_York")
+
+# config "coins" 심볼 → slug 코인 이름
+COIN_SLUG_NAMES = {
+    "BTC": "bitcoin",
+    "ETH": "ethereum",
+    "SOL": "solana",
+    "XRP": "xrp",
+}
+
+_MONTHS = (
+    "january", "february", "march", "april", "may", "june", "july",
+    "august", "september", "october", "november", "december",
+)
+
+
+def hourly_slug(coin_name: str, open_at: datetime) -> str:
+    """Slug of the 1H market for ``coin_name`` starting at ``open_at``.
+
+    예: ("bitcoin", 2026-02-06 14:00 UTC) → bitcoin-up-or-down-february-6-9am-et
+    """
+    et = open_at.astimezone(EXCHANGE_TZ)
+    hour12 = et.hour % 12 or 12
+    meridiem = "am" if et.hour < 12 else "pm"
+    return f"{coin_name}-up-or-down-{_MONTHS[et.month - 1]}-{et.day}-{hour12}{meridiem}-et"
+
+
+@dataclass
+class HourlyResolution:
+    """Result of resolving one hour's predicted slugs."""
+
+    open_at: datetime
+    slugs: list[str]
+    markets: list[Market] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)  # slug 조회 실패/불일치
+    resolved_at: datetime | None = None
+
+    @property
+    def complete(self) -> bool:
+        return bool(self.slugs) and not self.missing
+
+
+class HourlyMarketResolver:
+    """Resolve next-hour 1H crypto markets by slug template (direct lookups).
+
+    Args:
+        client: GammaClient (slug 직접 조회).
+        config: hourly_crypto 설정 (``coins``, ``min_liquidity_usd``).
+        catalog: F-038 카탈로그 — 있으면 파싱 결과 재사용.
+    """
+
+    def __init__(
+        self,
+        client: GammaClient,
+        config: dict | None = None,
+        catalog: MarketCatalog | None = None,
+    ):
+        self.client = client
+        self.config = config or MARKET_SOURCES.get("hourly_crypto", {})
+        self.catalog = catalog
+        self._resolution: HourlyResolution | None = None
+
+    def predicted_slugs(self, open_at: datetime) -> list[str]:
+        coins = self.config.get("coins", list(COIN_SLUG_NAMES))
+        return [
+            hourly_slug(COIN_SLUG_NAMES[c], open_at)
+            for c in coins if c in COIN_SLUG_NAMES
+        ]
+
+    def cached(self, open_at: datetime) -> HourlyResolution | None:
+        """Resolution prefetched for ``open_at`` (None if not resolved yet)."""
+        if self._resolution is not None and self._resolution.open_at == open_at:
+            return self._resolution
+        return None
+
+    async def resolve(self, open_at: datetime) -> HourlyResolution:
+        """Look up every predicted slug for the hour starting at ``open_at``.
+
+        슬러그별 조회는 동시에 실행. 결과는 캐시되어 ``cached(open_at)``로 재사용.
+        ``markets``는 유동성 필터 전 후보 — 유동성은 ``promote``가 확인한다.
+        """
+        slugs = self.predicted_slugs(open_at)
+        results = await self._fetch_slugs(slugs)
+
+        resolution = HourlyResolution(open_at=open_at, slugs=slugs)
+        for slug, events in zip(slugs, results):
+            if isinstance(events, Exception) or not events:
+                resolution.missing.append(slug)
+                continue
+            found = self._parse_event(events[0], open_at)
+            if found is None:
+                resolution.missing.append(slug)
+                continue
+            resolution.markets.extend(found)
+
+        resolution.resolved_at = datetime.now(tz=open_at.tzinfo)
+        self._resolution = resolution
+        logger.info(
+            "F-045: Resolved %d/%d hourly slugs for %s → %d markets%s",
+            len(slugs) - len(resolution.missing), len(slugs),
+            open_at.strftime("%H:%M"), len(resolution.markets),
+            f" (missing: {', '.join(resolution.missing)})" if resolution.missing else "",
+        )
+        return resolution
+
+    async def promote(self, open_at: datetime) -> HourlyResolution | None:
+        """Prefetched resolution for ``open_at`` with liquidity re-checked now.
+
+        예측 slug를 다시 조회해 현재 ``liquidity``로 후보를 거르고 값을 갱신한다.
+        재조회에 실패한 slug는 ``missing`` (호출자는 전체 조회로 폴백).
+        캐시된 프리페치 결과는 그대로 둔다.
+        """
+        cached = self.cached(open_at)
+        if cached is None or not cached.complete:
+            return cached
+        results = await self._fetch_slugs(cached.slugs)
+
+        promoted = HourlyResolution(open_at=open_at, slugs=cached.slugs)
+        current: dict[str, dict] = {}
+        for slug, events in zip(cached.slugs, results):
+            if isinstance(events, Exception) or not events:
+                promoted.missing.append(slug)
+                continue
+            for raw_mkt in events[0].get("markets", []):
+                if MarketFilter.is_active(raw_mkt):
+                    current[str(raw_mkt.get("id", ""))] = raw_mkt
+
+        min_liq = self.config.get("min_liquidity_usd", 3000)
+        for market in cached.markets:
+            raw_mkt = current.get(market.id)
+            if raw_mkt is None or not MarketFilter.meets_min_liquidity(raw_mkt, min_liq):
+                continue
+            promoted.markets.append(replace(
+                market, liquidity_usd=float(raw_mkt.get("liquidity", 0) or 0),
+            ))
+        promoted.resolved_at = datetime.now(tz=open_at.tzinfo)
+        if len(promoted.markets) < len(cached.markets):
+            logger.info(
+                "F-045: %d/%d prefetched hourly markets still meet liquidity",
+                len(promoted.markets), len(cached.markets),
+            )
+        return promoted
+
+    async def _fetch_slugs(self, slugs: list[str]) -> list:
+        return await asyncio.gather(
+            *(self.client.fetch_events_by_slug(s) for s in slugs),
+            return_exceptions=True,
+        )
+
+    def _parse_event(self, event: dict, open_at: datetime) -> list[Market] | None:
+        """Markets of one predicted event (discover_hourly_crypto filters but liquidity).
+
+        Returns None when the event does not cover ``open_at`` → +1h,
+        i.e. the template predicted the wrong market.
+        """
+        expected_end = open_at + timedelta(hours=1)
+        markets: list[Market] = []
+        for raw_mkt in event.get("markets", []):
+            if not MarketFilter.is_active(raw_mkt):
+                continue
+            if MarketFilter.is_blacklisted(raw_mkt.get("question", "")):
+                continue
+            if self.catalog is not None:
+                market = self.catalog.parse(raw_mkt, event, MarketSource.HOURLY_CRYPTO)
+            else:
+                market = Market.from_gamma_response(raw_mkt, event, MarketSource.HOURLY_CRYPTO)
+            if market is None:
+                continue
+            if market.end_date != expected_end:
+                return None
+            markets.append(market)
+        return markets
@@ -0,0 +1,356 @@
+"""F-038: Persistent market catalog with incremental Gamma discovery.
+
+PRE_OPEN마다 Gamma를 최대 12페이지 다시 훑고 모든 마켓을
+``Market.from_gamma_response``로 재파싱(outcomePrices/clobTokenIds JSON 디코드)
+하던 것을 카탈로그로 대체한다.
+
+- 인덱스: id, token_id, event_id, end_date(정렬 리스트)
+- raw 마켓 fingerprint가 같으면 파싱 결과 재사용 — 새로 생기거나 바뀐 마켓만 파싱
+- 쿼리별 커버리지: date-range 쿼리는 ``full_refresh_secs``마다 전체 조회,
+  그 사이에는 지난번 커버리지 끝 이후 구간만 조회
+- 공유 결과: 같은 쿼리를 여러 모니터가 ``share_ttl`` 안에 요청하면 한 번만 조회
+- 디스크 스냅샷 (atomic write) — 재시작 후에도 증분 조회 가능
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable
+
+from poly24h.models.market import Market, MarketSource
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_PATH = Path("data/market_catalog.json")
+DEFAULT_FULL_REFRESH_SECS = 900.0   # date-range 쿼리 전체 재조회 주기
+DEFAULT_SHARE_TTL = 60.0            # 모니터 간 디스커버리 결과 공유 시간
+SNAPSHOT_VERSION = 1
+_MAX_ID = "\uffff"  # sorts after every market id (bisect upper bound)
+
+# fingerprint에 포함할 raw 마켓 필드 (파싱 결과에 영향을 주는 것만)
+_FINGERPRINT_FIELDS = (
+    "question", "outcomePrices", "clobTokenIds", "liquidity", "endDate", "slug",
+)
+
+
+def _fingerprint(raw_mkt: dict, event: dict, source: MarketSource) -> tuple:
+    """Cheap identity of a raw market — no JSON decode, no datetime parse."""
+    return (
+        source.value,
+        str(event.get("id", "")),
+        event.get("title", ""),
+        event.get("endDate", ""),
+    ) + tuple(str(raw_mkt.get(f, "")) for f in _FINGERPRINT_FIELDS)
+
+
+def _market_to_dict(market: Market) -> dict:
+    return {
+        "id": market.id,
+        "question": market.question,
+        "source": market.source.value,
+        "yes_token_id": market.yes_token_id,
+        "no_token_id": market.no_token_id,
+        "yes_price": market.yes_price,
+        "no_price": market.no_price,
+        "liquidity_usd": market.liquidity_usd,
+        "end_date": market.end_date.isoformat(),
+        "event_id": market.event_id,
+        "event_title": market.event_title,
+        "is_verified": market.is_verified,
+        "polymarket_url": market.polymarket_url,
+        "slug": market.slug,
+    }
+
+
+def _market_from_dict(data: dict) -> Market:
+    return Market(
+        id=data["id"],
+        question=data.get("question", ""),
+        source=MarketSource(data.get("source", "unknown")),
+        yes_token_id=data["yes_token_id"],
+        no_token_id=data["no_token_id"],
+        yes_price=float(data.get("yes_price", 0.0)),
+        no_price=float(data.get("no_price", 0.0)),
+        liquidity_usd=float(data.get("liquidity_usd", 0.0)),
+        end_date=datetime.fromisoformat(data["end_date"]),
+        event_id=data.get("event_id", ""),
+        event_title=data.get("event_title", ""),
+        is_verified=bool(data.get("is_verified", False)),
+        polymarket_url=data.get("polymarket_url", ""),
+        slug=data.get("slug", ""),
+    )
+
+
+class MarketCatalog:
+    """Indexed, persistent store of discovered markets.
+
+    Args:
+        snapshot_path: 스냅샷 파일 경로 (None이면 메모리 전용).
+        full_refresh_secs: 증분 쿼리의 전체 재조회 주기.
+        share_ttl: 같은 디스커버리 결과를 재사용하는 시간 (초).
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path | None = None,
+        full_refresh_secs: float = DEFAULT_FULL_REFRESH_SECS,
+        share_ttl: float = DEFAULT_SHARE_TTL,
+    ):
+        self.snapshot_path = snapshot_path
+        self.full_refresh_secs = full_refresh_secs
+        self.share_ttl = share_ttl
+
+        self._markets: dict[str, Market] = {}
+        self._fingerprints: dict[str, tuple] = {}
+        self._by_token: dict[str, str] = {}
+        self._by_event: dict[str, set[str]] = {}
+        self._end_index: list[tuple[datetime, str]] = []
+
+        # Query coverage: key → member ids / covered-until / last full refresh (epoch)
+        self._query_members: dict[str, set[str]] = {}
+        self._covered_until: dict[str, datetime] = {}
+        self._last_full: dict[str, float] = {}
+
+        # Shared discovery results: key → (monotonic fetched_at, markets)
+        self._shared: dict[str, tuple[float, list[Market]]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+        # Stats
+        self.parsed = 0
+        self.reused = 0
+        self.shared_hits = 0
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    def __contains__(self, market_id: str) -> bool:
+        return market_id in self._markets
+
+    def get(self, market_id: str) -> Market | None:
+        return self._markets.get(market_id)
+
+    def get_by_token(self, token_id: str) -> Market | None:
+        market_id = self._by_token.get(token_id)
+        return self._markets.get(market_id) if market_id else None
+
+    def markets_for_event(self, event_id: str) -> list[Market]:
+        return [self._markets[mid] for mid in self._by_event.get(event_id, ())]
+
+    def ending_between(self, start: datetime, end: datetime) -> list[Market]:
+        """start < end_date <= end 인 마켓 (end_date 오름차순)."""
+        lo = bisect.bisect_right(self._end_index, (start, _MAX_ID))
+        hi = bisect.bisect_right(self._end_index, (end, _MAX_ID))
+        return [self._markets[mid] for _, mid in self._end_index[lo:hi]]
+
+    def markets(self, source: MarketSource | None = None) -> list[Market]:
+        if source is None:
+            return list(self._markets.values())
+        return [m for m in self._markets.values() if m.source == source]
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def parse(
+        self, raw_mkt: dict, event: dict, source: MarketSource,
+    ) -> Market | None:
+        """``Market.from_gamma_response`` with fingerprint reuse.
+
+        raw 마켓이 지난번과 같으면 캐시된 Market을 그대로 돌려준다.
+        """
+        market_id = str(raw_mkt.get("id", ""))
+        fp = _fingerprint(raw_mkt, event, source)
+        if market_id and self._fingerprints.get(market_id) == fp:
+            cached = self._markets.get(market_id)
+            if cached is not None:
+                self.reused += 1
+                return cached
+
+        market = Market.from_gamma_response(raw_mkt, event, source)
+        self.parsed += 1
+        if market is not None and market.id:
+            self.upsert(market)
+            self._fingerprints[market.id] = fp
+        return market
+
+    def upsert(self, market: Market) -> None:
+        """마켓 추가/교체 + 인덱스 갱신."""
+        old = self._markets.get(market.id)
+        if old is not None:
+            self._unindex(old)
+        self._markets[market.id] = market
+        self._by_token[market.yes_token_id] = market.id
+        self._by_token[market.no_token_id] = market.id
+        self._by_event.setdefault(market.event_id, set()).add(market.id)
+        bisect.insort(self._end_index, (market.end_date, market.id))
+
+    def remove(self, market_id: str) -> Market | None:
+        market = self._markets.pop(market_id, None)
+        if market is None:
+            return None
+        self._unindex(market)
+        self._fingerprints.pop(market_id, None)
+        for members in self._query_members.values():
+            members.discard(market_id)
+        return market
+
+    def prune_expired(self, now: datetime | None = None) -> int:
+        """정산 시간이 지난 마켓 제거. 제거 수 반환."""
+        now = now or datetime.now(tz=timezone.utc)
+        cut = bisect.bisect_right(self._end_index, (now, _MAX_ID))
+        expired = [mid for _, mid in self._end_index[:cut]]
+        for market_id in expired:
+            self.remove(market_id)
+        return len(expired)
+
+    def _unindex(self, market: Market) -> None:
+        for token_id in (market.yes_token_id, market.no_token_id):
+            if self._by_token.get(token_id) == market.id:
+                del self._by_token[token_id]
+        members = self._by_event.get(market.event_id)
+        if members is not None:
+            members.discard(market.id)
+            if not members:
+                del self._by_event[market.event_id]
+        i = bisect.bisect_left(self._end_index, (market.end_date, market.id))
+        if i < len(self._end_index) and self._end_index[i] == (market.end_date, market.id):
+            del self._end_index[i]
+
+    # ------------------------------------------------------------------
+    # Incremental query coverage
+    # ------------------------------------------------------------------
+
+    def needs_full_refresh(self, key: str) -> bool:
+        last = self._last_full.get(key)
+        return last is None or (time.time() - last) >= self.full_refresh_secs
+
+    def covered_until(self, key: str) -> datetime | None:
+        return self._covered_until.get(key)
+
+    def record_query(
+        self,
+        key: str,
+        market_ids: Iterable[str],
+        covered_until: datetime,
+        full: bool,
+    ) -> None:
+        """쿼리 결과 기록. full이면 멤버를 교체, 아니면 추가."""
+        ids = {mid for mid in market_ids if mid in self._markets}
+        if full or key not in self._query_members:
+            self._query_members[key] = ids
+            self._last_full[key] = time.time()
+        else:
+            self._query_members[key].update(ids)
+        self._covered_until[key] = covered_until
+
+    def query_markets(self, key: str) -> list[Market]:
+        return [
+            self._markets[mid]
+            for mid in self._query_members.get(key, ())
+            if mid in self._markets
+        ]
+
+    # ------------------------------------------------------------------
+    # Shared discovery results
+    # ------------------------------------------------------------------
+
+    async def shared(
+        self, key: str, fetch: Callable[[], Awaitable[list[Market]]],
+    ) -> list[Market]:
+        """``share_ttl`` 안의 같은 요청은 한 번만 조회 (동시 요청도 합침)."""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        async with lock:
+            entry = self._shared.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.share_ttl:
+                self.shared_hits += 1
+                return list(entry[1])
+            markets = await fetch()
+            self._shared[key] = (time.monotonic(), markets)
+            return list(markets)
+
+    # ------------------------------------------------------------------
+    # Snapshot
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path | None = None) -> bool:
+        """스냅샷 저장 (atomic write via temp+rename)."""
+        path = path or self.snapshot_path
+        if path is None:
+            return False
+        state = {
+            "version": SNAPSHOT_VERSION,
+            "markets": [_market_to_dict(m) for m in self._markets.values()],
+            "fingerprints": {
+                mid: list(fp) for mid, fp in self._fingerprints.items()
+            },
+            "queries": {
+                key: {
+                    "members": sorted(members),
+                    "covered_until": (
+                        self._covered_until[key].isoformat()
+                        if key in self._covered_until else None
+                    ),
+                    "last_full": self._last_full.get(key),
+                }
+                for key, members in self._query_members.items()
+            },
+        }
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(state))
+            tmp_path.replace(path)
+            return True
+        except Exception as e:
+            logger.warning("Failed to save market catalog: %s", e)
+            if tmp_path.exists():
+                tmp_path.unlink()
+            return False
+
+    def load(self, path: Path | None = None) -> int:
+        """스냅샷 로드 (만료된 마켓 제외). 로드된 마켓 수 반환."""
+        path = path or self.snapshot_path
+        if path is None or not path.exists():
+            return 0
+        try:
+            state = json.loads(path.read_text())
+            if state.get("version") != SNAPSHOT_VERSION:
+                logger.info("Market catalog snapshot version mismatch, ignoring")
+                return 0
+            for data in state.get("markets", []):
+                self.upsert(_market_from_dict(data))
+            for mid, fp in state.get("fingerprints", {}).items():
+                if mid in self._markets:
+                    self._fingerprints[mid] = tuple(fp)
+            for key, q in state.get("queries", {}).items():
+                self._query_members[key] = set(q.get("members", []))
+                if q.get("covered_until"):
+                    self._covered_until[key] = datetime.fromisoformat(q["covered_until"])
+                if q.get("last_full") is not None:
+                    self._last_full[key] = float(q["last_full"])
+        except Exception as e:
+            logger.warning("Failed to load market catalog %s: %s", path, e)
+            return 0
+        self.prune_expired()
+        logger.info("Market catalog: loaded %d markets from %s", len(self), path)
+        return len(self)
+
+    def stats(self) -> dict:
+        return {
+            "markets": len(self._markets),
+            "parsed": self.parsed,
+            "reused": self.reused,
+            "shared_hits": self.shared_hits,
+        }
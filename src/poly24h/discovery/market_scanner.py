@@ -17,6 +17,7 @@ from datetime import datetime, timedelta, timezone
 
 from poly24h.config import MARKET_SOURCES
 from poly24h.discovery.gamma_client import GammaClient
+from poly24h.discovery.market_catalog import MarketCatalog
 from poly24h.discovery.market_filter import MarketFilter
 from poly24h.models.market import Market, MarketSource
 
@@ -93,25 +94,45 @@ GAME_SLUG_RE = re.compile(
 )
 
 
+# F-038: 카탈로그 쿼리 키
+SPORTS_RANGE_QUERY = "sports_date_range"
+
+
 class MarketScanner:
-    """주기적 마켓 스캔 오케스트레이터."""
+    """주기적 마켓 스캔 오케스트레이터.
+
+    F-038: ``catalog``를 주입하면 파싱 결과 재사용, date-range 증분 조회,
+    모니터 간 디스커버리 결과 공유, 스냅샷 저장이 활성화된다.
+    """
 
     def __init__(
         self,
         client: GammaClient,
         config: dict | None = None,
+        catalog: MarketCatalog | None = None,
     ):
         self.client = client
         self.config = config or MARKET_SOURCES
+        self.catalog = catalog
+
+    def _parse(self, raw_mkt: dict, event: dict, source: MarketSource) -> Market | None:
+        """F-038: 카탈로그가 있으면 fingerprint가 바뀐 마켓만 파싱."""
+        if self.catalog is not None:
+            return self.catalog.parse(raw_mkt, event, source)
+        return Market.from_gamma_response(raw_mkt, event, source)
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    async def discover_all(self) -> list[Market]:
+    async def discover_all(
+        self, hourly_markets: list[Market] | None = None,
+    ) -> list[Market]:
         """모든 enabled 소스에서 마켓 수집 + 중복 제거.
 
         스포츠 소스는 discover_all_sports()로 ONE 쿼리 통합 (F-015).
+        F-045: ``hourly_markets``(slug 템플릿으로 미리 조회한 1H 마켓)를 주면
+        tag_slug='1H' 조회를 건너뛰고 그대로 사용.
         """
         markets: list[Market] = []
         seen_ids: set[str] = set()
@@ -119,11 +140,14 @@ class MarketScanner:
         # 1) Hourly crypto (별도 tag_slug 쿼리)
         crypto_cfg = self.config.get("hourly_crypto")
         if crypto_cfg and crypto_cfg.get("enabled"):
-            try:
-                found = await self.discover_hourly_crypto(crypto_cfg)
-            except Exception:
-                logger.exception("Error discovering hourly_crypto")
-                found = []
+            if hourly_markets is not None:
+                found = hourly_markets
+            else:
+                try:
+                    found = await self.discover_hourly_crypto(crypto_cfg)
+                except Exception:
+                    logger.exception("Error discovering hourly_crypto")
+                    found = []
             for mkt in found:
                 if mkt.id not in seen_ids:
                     seen_ids.add(mkt.id)
@@ -147,6 +171,12 @@ class MarketScanner:
                     markets.append(mkt)
 
         logger.info("Discovered %d markets from %d sources", len(markets), len(self.config))
+
+        # F-038: Drop expired entries and persist the catalog snapshot
+        if self.catalog is not None:
+            self.catalog.prune_expired()
+            self.catalog.save()
+            logger.info("Market catalog: %s", self.catalog.stats())
         return markets
 
     # ------------------------------------------------------------------
@@ -186,7 +216,7 @@ class MarketScanner:
                 if MarketFilter.is_blacklisted(question):
                     continue
 
-                market = Market.from_gamma_response(raw_mkt, event, MarketSource.HOURLY_CRYPTO)
+                market = self._parse(raw_mkt, event, MarketSource.HOURLY_CRYPTO)
                 if market:
                     markets.append(market)
 
@@ -221,22 +251,15 @@ class MarketScanner:
         if not source_map:
             return []
 
+        if self.catalog is not None:
+            return await self._discover_all_sports_incremental(source_map)
+
         # 향후 48시간 이내 정산되는 이벤트 조회 — ONE query
         now = datetime.now(tz=timezone.utc)
         end_min = now.isoformat()
         end_max = (now + timedelta(hours=48)).isoformat()
 
-        all_events: list[dict] = []
-        for offset in range(0, 600, 50):
-            batch = await self.client.fetch_events_by_date_range(
-                end_date_min=end_min,
-                end_date_max=end_max,
-                limit=50,
-                offset=offset,
-            )
-            all_events.extend(batch)
-            if len(batch) < 50:
-                break
+        all_events = await self._fetch_events_in_range(end_min, end_max)
 
         markets: list[Market] = []
 
@@ -281,6 +304,77 @@ class MarketScanner:
         )
         return markets
 
+    async def _fetch_events_in_range(self, end_min: str, end_max: str) -> list[dict]:
+        """date range 이벤트 페이지 조회 (50개씩, 최대 600)."""
+        all_events: list[dict] = []
+        for offset in range(0, 600, 50):
+            batch = await self.client.fetch_events_by_date_range(
+                end_date_min=end_min,
+                end_date_max=end_max,
+                limit=50,
+                offset=offset,
+            )
+            all_events.extend(batch)
+            if len(batch) < 50:
+                break
+        return all_events
+
+    async def _discover_all_sports_incremental(
+        self, source_map: dict[MarketSource, float],
+    ) -> list[Market]:
+        """F-038: 카탈로그 기반 증분 스포츠 디스커버리.
+
+        ``full_refresh_secs``마다 48시간 전체 구간을 조회하고, 그 사이에는
+        지난 조회의 커버리지 끝 → now+48h 구간(새로 들어온 이벤트)만 조회한다.
+        결과는 카탈로그의 쿼리 멤버에서 유동성/정산 구간 필터로 뽑는다.
+        """
+        catalog = self.catalog
+        now = datetime.now(tz=timezone.utc)
+        horizon = now + timedelta(hours=48)
+
+        full = catalog.needs_full_refresh(SPORTS_RANGE_QUERY)
+        covered = catalog.covered_until(SPORTS_RANGE_QUERY)
+        window_start = now if full or covered is None else max(now, covered)
+
+        all_events: list[dict] = []
+        if window_start < horizon:
+            all_events = await self._fetch_events_in_range(
+                window_start.isoformat(), horizon.isoformat(),
+            )
+
+        # 모든 스포츠 prefix를 카탈로그에 담고, 소스/유동성 필터는 읽을 때 적용
+        found_ids: list[str] = []
+        for event in all_events:
+            match = GAME_SLUG_RE.match(event.get("slug", ""))
+            if not match:
+                continue
+            slug_source = GAME_SLUG_PREFIXES.get(match.group(1))
+            if slug_source is None:
+                continue
+            if event.get("enableNegRisk") or event.get("negRiskAugmented"):
+                continue
+            for raw_mkt in event.get("markets", []):
+                if not MarketFilter.is_active(raw_mkt):
+                    continue
+                market = self._parse(raw_mkt, event, slug_source)
+                if market:
+                    found_ids.append(market.id)
+
+        catalog.record_query(SPORTS_RANGE_QUERY, found_ids, horizon, full=full)
+
+        markets = [
+            m for m in catalog.query_markets(SPORTS_RANGE_QUERY)
+            if m.source in source_map
+            and now < m.end_date <= horizon
+            and m.liquidity_usd >= source_map[m.source]
+        ]
+        markets.sort(key=lambda m: (m.end_date, m.id))
+        logger.info(
+            "Unified sports (%s): found %d markets, fetched %d events",
+            "full" if full else "incremental", len(markets), len(all_events),
+        )
+        return markets
+
     # ------------------------------------------------------------------
     # F-026: Generic sport discovery by series_id
     # ------------------------------------------------------------------
@@ -298,7 +392,21 @@ class MarketScanner:
 
         Returns:
             List of Market objects for the given sport.
+
+        F-038: With a catalog, monitors asking for the same series within
+        ``share_ttl`` share one Gamma query.
         """
+        if self.catalog is not None:
+            key = (
+                f"series:{sport_config.series_id}:{sport_config.tag_id}"
+                f":{sport_config.source.value}"
+            )
+            return await self.catalog.shared(
+                key, lambda: self._discover_sport_markets(sport_config),
+            )
+        return await self._discover_sport_markets(sport_config)
+
+    async def _discover_sport_markets(self, sport_config) -> list[Market]:
         all_events: list[dict] = []
         for offset in range(0, 600, 50):
             batch = await self.client.fetch_game_events_by_series(
@@ -319,14 +427,17 @@ class MarketScanner:
 
             # Verify slug matches expected prefixes
             if sport_config.slug_prefixes:
-                if not any(slug.startswith(p + "-") or slug.startswith(p) for p in sport_config.slug_prefixes):
+                if not any(
+                    slug.startswith(p + "-") or slug.startswith(p)
+                    for p in sport_config.slug_prefixes
+                ):
                     continue
 
             for raw_mkt in event.get("markets", []):
                 if not MarketFilter.is_active(raw_mkt):
                     continue
 
-                market = Market.from_gamma_response(raw_mkt, event, sport_config.source)
+                market = self._parse(raw_mkt, event, sport_config.source)
                 if market:
                     markets.append(market)
 
@@ -381,7 +492,7 @@ class MarketScanner:
                 if not MarketFilter.is_active(raw_mkt):
                     continue
 
-                market = Market.from_gamma_response(raw_mkt, event, MarketSource.NBA)
+                market = self._parse(raw_mkt, event, MarketSource.NBA)
                 if market:
                     markets.append(market)
 
@@ -456,7 +567,7 @@ class MarketScanner:
                 if not MarketFilter.is_active(raw_mkt):
                     continue
 
-                market = Market.from_gamma_response(raw_mkt, event, source_enum)
+                market = self._parse(raw_mkt, event, source_enum)
                 if market:
                     markets.append(market)
 
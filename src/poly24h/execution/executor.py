@@ -1,5 +1,8 @@
 """Order executor — submit orders to CLOB (or simulate in dry_run).
 
+F-049: ``execute_arb_async`` — live 모드에서 ``PairedExecutionEngine``이 있으면
+두 레그를 동시 제출하고 체결/unwind까지 처리한다.
+
 절대 크래시하지 않는다. 모든 에러를 graceful하게 처리.
 """
 
@@ -8,10 +11,13 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from poly24h.execution.order_builder import Order
 
+if TYPE_CHECKING:
+    from poly24h.execution.paired_engine import PairedExecutionEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,10 +47,16 @@ class OrderExecutor:
 
     dry_run=True (default): 시뮬레이션 결과 반환.
     dry_run=False: 로그만 남김 (Phase 2 placeholder).
+        ``engine``이 있으면 ``execute_arb_async``가 실제 동시 제출을 수행.
     """
 
-    def __init__(self, dry_run: bool = True):
+    def __init__(
+        self,
+        dry_run: bool = True,
+        engine: Optional[PairedExecutionEngine] = None,
+    ):
         self.dry_run = dry_run
+        self.engine = engine
 
     def execute_arb(
         self,
@@ -88,6 +100,55 @@ class OrderExecutor:
                 error=str(exc),
             )
 
+    async def execute_arb_async(
+        self,
+        yes_order: Optional[Order],
+        no_order: Optional[Order],
+        market_id: str = "",
+    ) -> ExecutionResult:
+        """F-049: 두 레그 동시 제출 (live + engine). 그 외에는 ``execute_arb``.
+
+        Returns:
+            ExecutionResult (절대 예외를 던지지 않음). 한쪽만 남은 경우
+            unwind 후 PARTIAL/FAILED.
+        """
+        if self.dry_run or self.engine is None or yes_order is None or no_order is None:
+            return self.execute_arb(yes_order, no_order)
+
+        try:
+            shares = min(yes_order.size, no_order.size)
+            result = await self.engine.execute(
+                market_id, yes_order.token_id, no_order.token_id,
+                yes_order.price, no_order.price, shares,
+            )
+            if result.success:
+                status, error = OrderStatus.SUCCESS, None
+            else:
+                status = OrderStatus.PARTIAL if result.paired_shares > 0 else OrderStatus.FAILED
+                error = (
+                    f"paired_{result.state.name.lower()}: "
+                    f"yes={result.yes.error or result.yes.filled} "
+                    f"no={result.no.error or result.no.filled}"
+                )
+            return ExecutionResult(
+                status=status,
+                yes_filled=result.yes.filled >= shares,
+                no_filled=result.no.filled >= shares,
+                yes_order=yes_order,
+                no_order=no_order,
+                error=error,
+            )
+        except Exception as exc:
+            logger.exception("Unexpected error during paired execution")
+            return ExecutionResult(
+                status=OrderStatus.FAILED,
+                yes_filled=False,
+                no_filled=False,
+                yes_order=yes_order,
+                no_order=no_order,
+                error=str(exc),
+            )
+
     def _execute_dry_run(
         self, yes_order: Order, no_order: Order,
     ) -> ExecutionResult:
@@ -0,0 +1,125 @@
+"""F-049: Local fake CLOB for deterministic execution tests.
+
+``OrderGateway`` 구현체. 네트워크 없이 토큰/사이드별 스크립트대로
+ack 지연, 체결 지연, 부분 체결, 거절, 취소-체결 경합을 재현한다.
+모든 타이밍은 이벤트 루프 타이머(``call_later``) 기반이라 테스트가 결정적이다.
+
+Usage:
+    clob = FakeClob()
+    clob.script("yes-token", fill_after=0.01)
+    clob.script("no-token", fill_after=None)          # 절대 체결 안 됨
+    clob.script("yes-token", side="SELL", fill_after=0.0)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Optional
+
+from poly24h.execution.paired_engine import OrderGateway, OrderRejectedError
+
+
+@dataclass
+class FillScript:
+    """How the fake book treats orders for one (token, side).
+
+    fill_after: Seconds after ack until the order fills (None = never).
+    fill_ratio: Fraction of the size that fills at ``fill_after``.
+    reject: Reject reason (raises ``OrderRejectedError`` on place).
+    fill_on_cancel: Shares that fill in the race with a cancel request.
+    """
+
+    fill_after: Optional[float] = 0.0
+    fill_ratio: float = 1.0
+    reject: Optional[str] = None
+    fill_on_cancel: float = 0.0
+
+
+@dataclass
+class FakeOrder:
+    order_id: str
+    token_id: str
+    side: str
+    price: float
+    size: float
+    placed_at: float  # loop.time() at ack
+    filled: float = 0.0
+    cancelled: bool = False
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class FakeClob(OrderGateway):
+    """In-process CLOB stand-in.
+
+    Args:
+        ack_latency: Seconds each ``place`` takes before the order is live.
+    """
+
+    def __init__(self, ack_latency: float = 0.0):
+        self.ack_latency = ack_latency
+        self.orders: dict[str, FakeOrder] = {}
+        self._scripts: dict[tuple[str, str], FillScript] = {}
+        self._ids = itertools.count(1)
+
+    def script(self, token_id: str, side: str = "BUY", **kwargs) -> FillScript:
+        script = FillScript(**kwargs)
+        self._scripts[(token_id, side.upper())] = script
+        return script
+
+    def orders_for(self, token_id: str, side: str | None = None) -> list[FakeOrder]:
+        return [
+            o for o in self.orders.values()
+            if o.token_id == token_id and (side is None or o.side == side.upper())
+        ]
+
+    def fill(self, order_id: str, shares: float) -> None:
+        """Manually fill ``shares`` more of a live order."""
+        order = self.orders[order_id]
+        if order.cancelled or order.done.is_set():
+            return
+        order.filled = min(order.size, order.filled + shares)
+        if order.filled >= order.size:
+            order.done.set()
+
+    # ------------------------------------------------------------------
+    # OrderGateway
+    # ------------------------------------------------------------------
+
+    async def place(self, token_id: str, side: str, price: float, size: float) -> str:
+        script = self._scripts.get((token_id, side.upper()), FillScript())
+        if self.ack_latency > 0:
+            await asyncio.sleep(self.ack_latency)
+        if script.reject:
+            raise OrderRejectedError(script.reject)
+
+        loop = asyncio.get_running_loop()
+        order = FakeOrder(
+            order_id=f"fake-{next(self._ids)}",
+            token_id=token_id, side=side.upper(), price=price, size=size,
+            placed_at=loop.time(),
+        )
+        self.orders[order.order_id] = order
+        if script.fill_after is not None:
+            loop.call_later(
+                script.fill_after, self.fill, order.order_id, size * script.fill_ratio,
+            )
+        return order.order_id
+
+    async def wait_filled(self, order_id: str, timeout: float) -> float:
+        order = self.orders[order_id]
+        try:
+            await asyncio.wait_for(order.done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return order.filled
+
+    async def cancel(self, order_id: str) -> float:
+        order = self.orders[order_id]
+        script = self._scripts.get((order.token_id, order.side), FillScript())
+        if not order.done.is_set() and script.fill_on_cancel > 0:
+            self.fill(order_id, script.fill_on_cancel)
+        order.cancelled = True
+        order.done.set()
+        return order.filled
@@ -0,0 +1,302 @@
+"""F-050: Pre-signed order template pool.
+
+``SportExecutor``/``ClobOrderGateway``는 기회를 찾은 뒤에야 ``create_order``를
+호출했다. create_order = 토큰 메타데이터 조회(tick size / neg risk / fee rate,
+첫 호출 시 HTTP 3회) + EIP-712 서명 → 매 거래의 time-to-wire에 그대로 더해진다.
+
+- ``warm_tokens``: 메타데이터를 공유 ``HttpTransport``(호스트별 rate limiter)로
+  미리 조회해 풀에 보관. 가격/수량과 무관하므로 거래 후보 토큰 전부에 가능.
+  ``meta_ttl`` 후 만료 → 다시 조회 (CLOB는 0.04/0.96 부근에서 tick size를 바꾼다).
+  tick이 바뀐 토큰의 템플릿은 폐기
+- ``sign``: 보관된 메타데이터로 바로 서명 (ClobClient의 동기 HTTP 조회 없음).
+  템플릿이 없는 주문도 이 경로로 서명한다. 만료된 메타데이터는 쓰지 않는다
+- ``prepare``: 실제로 제출될 (토큰, 사이드, 가격, 수량)을 GTD 만료와 함께 전용
+  스레드 풀에서 미리 서명 (``asyncio.to_thread`` 기본 풀과 분리)
+- ``take``: 같은 (토큰, 사이드, 가격, 수량) 템플릿이 있으면 꺼내 준다 (1회용).
+  서명 payload에 가격·수량이 들어가므로 정확히 일치할 때만 재사용 가능 —
+  없으면 None → 호출자가 ``sign``으로 서명
+- 만료까지 ``min_ttl`` 미만 남은 템플릿은 ``take``/``purge_expired``에서 폐기
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from poly24h.execution.order_builder import DEFAULT_EXPIRATION_SECONDS
+from poly24h.http_transport import HttpTransport, get_default_transport
+
+logger = logging.getLogger(__name__)
+
+CLOB_HOST = "https://clob.polymarket.com"
+
+PRICE_DECIMALS = 3  # finest CLOB tick (0.001)
+SIZE_DECIMALS = 2   # CLOB rounds order size to 2 decimals
+
+TemplateKey = tuple[str, str, float, float]
+
+
+def template_key(token_id: str, side: str, price: float, size: float) -> TemplateKey:
+    return (token_id, side.upper(), round(price, PRICE_DECIMALS), round(size, SIZE_DECIMALS))
+
+
+@dataclass(frozen=True)
+class TokenMeta:
+    """Per-token signing inputs (normally looked up by ``ClobClient.create_order``)."""
+
+    tick_size: str
+    neg_risk: bool
+    fee_rate_bps: int
+    fetched_at: float = 0.0  # time.monotonic()
+
+
+@dataclass
+class PreSignedOrder:
+    """A signed GTD order ready to post as-is."""
+
+    token_id: str
+    side: str
+    price: float
+    size: float
+    expiration: int  # unix seconds
+    signed: object
+
+    def ttl(self, now: float | None = None) -> float:
+        return self.expiration - (time.time() if now is None else now)
+
+
+def on_tick(price: float, tick_size: str) -> bool:
+    """True if ``price`` is a whole number of ticks inside [tick, 1 - tick]."""
+    tick = float(tick_size)
+    if not tick <= price <= 1 - tick:
+        return False
+    steps = price / tick
+    return abs(steps - round(steps)) < 1e-6
+
+
+class PreSignedOrderPool:
+    """Single-use pre-signed order templates keyed by (token, side, price, size).
+
+    Args:
+        clob_client: py-clob-client ``ClobClient`` (Level 1 auth).
+        transport: Shared HTTP transport for metadata lookups.
+        host: CLOB REST base URL.
+        expiration_seconds: GTD lifetime of each template.
+        min_ttl: Templates closer than this to expiry are discarded
+            (CLOB rejects GTD orders expiring within ~60s).
+        max_workers: Signing threads.
+        meta_ttl: Seconds a token's tick size / neg risk / fee rate is trusted.
+    """
+
+    MIN_TTL_SEC = 70.0
+    MAX_SIGNING_WORKERS = 4
+    META_TTL_SEC = 300.0
+
+    def __init__(
+        self,
+        clob_client,
+        transport: HttpTransport | None = None,
+        host: str = CLOB_HOST,
+        expiration_seconds: int = DEFAULT_EXPIRATION_SECONDS,
+        min_ttl: float = MIN_TTL_SEC,
+        max_workers: int = MAX_SIGNING_WORKERS,
+        meta_ttl: float = META_TTL_SEC,
+    ):
+        self._client = clob_client
+        self._transport = transport or get_default_transport()
+        self._host = host.rstrip("/")
+        self.expiration_seconds = expiration_seconds
+        self.min_ttl = min_ttl
+        self.meta_ttl = meta_ttl
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="presign",
+        )
+        self._templates: dict[TemplateKey, list[PreSignedOrder]] = {}
+        self._lock = threading.Lock()  # take() runs in worker threads
+        self._meta: dict[str, TokenMeta] = {}
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self._templates.values())
+
+    # ------------------------------------------------------------------
+    # Preparation (off the entry path)
+    # ------------------------------------------------------------------
+
+    def _fresh_meta(self, token_id: str) -> Optional[TokenMeta]:
+        meta = self._meta.get(token_id)
+        if meta is None or time.monotonic() - meta.fetched_at >= self.meta_ttl:
+            return None
+        return meta
+
+    def is_warm(self, token_id: str) -> bool:
+        return self._fresh_meta(token_id) is not None
+
+    async def warm_tokens(self, token_ids: Iterable[str]) -> int:
+        """Fetch tick size / neg risk / fee rate for new or expired tokens. Never raises.
+
+        Lookups go through the shared transport, so they share the CLOB host's
+        rate limit and the caller's request priority. A token whose tick size
+        changed loses its pooled templates (signed at the old precision).
+        """
+        tokens = [t for t in dict.fromkeys(token_ids) if t and not self.is_warm(t)]
+        if not tokens:
+            return 0
+        results = await asyncio.gather(
+            *(self._fetch_meta(t) for t in tokens), return_exceptions=True,
+        )
+        warmed = 0
+        for token_id, result in zip(tokens, results):
+            if isinstance(result, Exception):
+                logger.warning("[PRESIGN] Token warm-up failed %s: %s", token_id[:16], result)
+                continue
+            previous = self._meta.get(token_id)
+            self._meta[token_id] = result
+            if previous is not None and previous.tick_size != result.tick_size:
+                dropped = self._drop_templates(token_id)
+                logger.info(
+                    "[PRESIGN] Tick size %s → %s for %s, dropped %d templates",
+                    previous.tick_size, result.tick_size, token_id[:16], dropped,
+                )
+            warmed += 1
+        return warmed
+
+    async def _fetch_meta(self, token_id: str) -> TokenMeta:
+        tick, neg_risk, fee = await asyncio.gather(
+            self._get_json("/tick-size", token_id),
+            self._get_json("/neg-risk", token_id),
+            self._get_json("/fee-rate", token_id),
+        )
+        return TokenMeta(
+            tick_size=str(tick["minimum_tick_size"]),
+            neg_risk=bool(neg_risk["neg_risk"]),
+            fee_rate_bps=int(fee.get("base_fee") or 0),
+            fetched_at=time.monotonic(),
+        )
+
+    async def _get_json(self, path: str, token_id: str) -> dict:
+        url = f"{self._host}{path}"
+        async with self._transport.get(url, params={"token_id": token_id}) as resp:
+            if resp.status != 200:
+                raise RuntimeError(f"GET {path} → HTTP {resp.status}")
+            return await resp.json()
+
+    async def prepare(
+        self,
+        orders: Iterable[tuple[str, str, float, float]],
+        copies: int = 1,
+    ) -> int:
+        """Sign ``copies`` templates per (token_id, side, price, size). Never raises.
+
+        Returns the number of templates added.
+        """
+        specs = [
+            template_key(token_id, side, price, size)
+            for token_id, side, price, size in orders
+            if 0 < price < 1 and size > 0
+        ] * max(copies, 0)
+        if not specs:
+            return 0
+        await self.warm_tokens(spec[0] for spec in specs)
+        expiration = int(time.time()) + self.expiration_seconds
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, self._sign, *spec, expiration)
+                for spec in specs
+            ),
+            return_exceptions=True,
+        )
+        added = 0
+        with self._lock:
+            for spec, result in zip(specs, results):
+                if isinstance(result, Exception):
+                    logger.warning("[PRESIGN] Signing failed %s: %s", spec[0][:16], result)
+                    continue
+                self._templates.setdefault(template_key(*spec), []).append(result)
+                added += 1
+        logger.info("[PRESIGN] Prepared %d/%d order templates", added, len(specs))
+        return added
+
+    def _sign(
+        self, token_id: str, side: str, price: float, size: float, expiration: int,
+    ) -> PreSignedOrder:
+        signed = self.sign(token_id, side, price, size, expiration)
+        return PreSignedOrder(token_id, side, price, size, expiration, signed)
+
+    # ------------------------------------------------------------------
+    # Hot path
+    # ------------------------------------------------------------------
+
+    def sign(
+        self, token_id: str, side: str, price: float, size: float, expiration: int = 0,
+    ):
+        """Sign one order (blocking). Uses fresh warmed metadata when available,
+        otherwise falls back to ``ClobClient.create_order``'s own lookups."""
+        from py_clob_client.clob_types import CreateOrderOptions, OrderArgs
+
+        order_args = OrderArgs(
+            token_id=token_id, price=price, size=size, side=side, expiration=expiration,
+        )
+        meta = self._fresh_meta(token_id)
+        if meta is None:
+            return self._client.create_order(order_args)
+        if not on_tick(price, meta.tick_size):
+            raise ValueError(f"price {price} not on the {meta.tick_size} tick grid")
+        order_args.fee_rate_bps = meta.fee_rate_bps
+        return self._client.builder.create_order(
+            order_args,
+            CreateOrderOptions(tick_size=meta.tick_size, neg_risk=meta.neg_risk),
+        )
+
+    def take(
+        self, token_id: str, side: str, price: float, size: float,
+    ) -> Optional[PreSignedOrder]:
+        """Pop a live template for exactly this order, or None."""
+        key = template_key(token_id, side, price, size)
+        now = time.time()
+        with self._lock:
+            bucket = self._templates.get(key)
+            while bucket:
+                template = bucket.pop()
+                if template.ttl(now) >= self.min_ttl:
+                    if not bucket:
+                        del self._templates[key]
+                    self.hits += 1
+                    return template
+                self.expired += 1
+            self._templates.pop(key, None)
+            self.misses += 1
+            return None
+
+    def _drop_templates(self, token_id: str) -> int:
+        with self._lock:
+            keys = [key for key in self._templates if key[0] == token_id]
+            return sum(len(self._templates.pop(key)) for key in keys)
+
+    def purge_expired(self, now: float | None = None) -> int:
+        """Drop templates within ``min_ttl`` of expiry. Returns the count dropped."""
+        now = time.time() if now is None else now
+        dropped = 0
+        with self._lock:
+            for key in list(self._templates):
+                live = [t for t in self._templates[key] if t.ttl(now) >= self.min_ttl]
+                dropped += len(self._templates[key]) - len(live)
+                if live:
+                    self._templates[key] = live
+                else:
+                    del self._templates[key]
+        self.expired += dropped
+        return dropped
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,353 @@
+"""F-049: Concurrent two-leg paired execution engine with automatic unwind.
+
+``AtomicPairedTransaction``은 상태 머신일 뿐 실제로 레그를 쏘지 않았다.
+이 엔진은 YES/NO 두 레그를 동시에 제출하고, 체결을 추적해 상태 머신을
+구동하며, 한쪽만 체결되면 지연 예산(``unwind_budget``) 안에 남은 레그를 되판다.
+
+순차 제출이면 첫 레그 ack ~ 두 번째 레그 제출 사이에 가격이 움직여
+보장 스프레드가 깎인다 — 두 레그는 같은 루프 틱에서 나간다.
+
+- 한 레그가 거절/미체결로 끝나면 다른 레그의 대기 주문을 즉시 취소 (dangling 최소화)
+- 취소와 체결이 경합해도 취소 응답의 최종 체결량으로 판정
+- 양쪽 부분 체결이면 맞는 수량(min)은 페어로 유지, 초과분만 unwind
+- unwind는 시도마다 더 공격적인 지정가(최대 ``max_unwind_slippage_pct``)로 매도,
+  예산 안에 못 끝내면 KillSwitch 발동
+- 거래소 접근은 ``OrderGateway``: 실거래 ``ClobOrderGateway``,
+  테스트/리허설용 ``FakeClob`` (poly24h.execution.fake_clob)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Optional
+
+from poly24h.execution.atomic_paired import AtomicPairedTransaction, PairState
+
+if TYPE_CHECKING:
+    from poly24h.execution.kill_switch import KillSwitch
+    from poly24h.execution.order_pool import PreSignedOrderPool
+
+logger = logging.getLogger(__name__)
+
+_EPS = 1e-9
+_MIN_PRICE = 0.001
+
+# get_order statuses (same as SportExecutor)
+_FILLED_STATUSES = {"MATCHED", "FILLED"}
+_CANCELLED_STATUSES = {"CANCELLED", "CANCELED"}
+
+
+class OrderRejectedError(Exception):
+    """The exchange refused an order (no order id)."""
+
+
+class OrderGateway(ABC):
+    """Minimal async order interface used by ``PairedExecutionEngine``."""
+
+    @abstractmethod
+    async def place(self, token_id: str, side: str, price: float, size: float) -> str:
+        """Submit a limit order → order id. Raises on rejection."""
+
+    @abstractmethod
+    async def wait_filled(self, order_id: str, timeout: float) -> float:
+        """Wait until fully filled, cancelled or ``timeout`` → shares filled so far."""
+
+    @abstractmethod
+    async def cancel(self, order_id: str) -> float:
+        """Cancel the order → final shares filled (fills that won the race count)."""
+
+
+class ClobOrderGateway(OrderGateway):
+    """``OrderGateway`` over a py-clob-client ``ClobClient``.
+
+    Blocking client calls run in worker threads (like F-041
+    ``SportExecutor.submit_order_async``), so both legs sign and post in parallel.
+    F-050: Legs with a matching pre-signed template skip signing.
+    """
+
+    def __init__(
+        self,
+        clob_client,
+        poll_interval: float = 0.2,
+        order_pool: Optional[PreSignedOrderPool] = None,
+    ):
+        self._client = clob_client
+        self.poll_interval = poll_interval
+        self.order_pool = order_pool
+
+    async def place(self, token_id: str, side: str, price: float, size: float) -> str:
+        response = await asyncio.to_thread(self._create_and_post, token_id, side, price, size)
+        if not isinstance(response, dict):
+            raise OrderRejectedError(f"invalid_response_type: {type(response).__name__}")
+        order_id = response.get("orderID") or response.get("order_id", "")
+        if not order_id:
+            raise OrderRejectedError(response.get("errorMsg") or "no_order_id_in_response")
+        return order_id
+
+    def _create_and_post(self, token_id: str, side: str, price: float, size: float):
+        from py_clob_client.clob_types import OrderArgs, OrderType
+
+        if self.order_pool is not None:
+            template = self.order_pool.take(token_id, side, price, size)
+            if template is not None:
+                return self._client.post_order(template.signed, OrderType.GTD)
+            signed_order = self.order_pool.sign(token_id, side, price, size)
+            return self._client.post_order(signed_order, OrderType.GTC)
+        signed_order = self._client.create_order(
+            OrderArgs(token_id=token_id, price=price, size=size, side=side),
+        )
+        return self._client.post_order(signed_order, OrderType.GTC)
+
+    async def wait_filled(self, order_id: str, timeout: float) -> float:
+        deadline = time.monotonic() + timeout
+        matched = 0.0
+        while True:
+            try:
+                order = await asyncio.to_thread(self._client.get_order, order_id)
+                matched = float(order.get("size_matched", 0) or 0)
+                status = order.get("status", "UNKNOWN")
+                if status in _FILLED_STATUSES or status in _CANCELLED_STATUSES:
+                    return matched
+            except Exception as exc:
+                logger.warning("[PAIR-EXEC] get_order %s error: %s", order_id, exc)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return matched
+            await asyncio.sleep(min(self.poll_interval, remaining))
+
+    async def cancel(self, order_id: str) -> float:
+        try:
+            await asyncio.to_thread(self._client.cancel, order_ids=[order_id])
+        except Exception as exc:
+            logger.warning("[PAIR-EXEC] cancel %s failed: %s", order_id, exc)
+        try:
+            order = await asyncio.to_thread(self._client.get_order, order_id)
+            return float(order.get("size_matched", 0) or 0)
+        except Exception as exc:
+            logger.warning("[PAIR-EXEC] get_order %s after cancel failed: %s", order_id, exc)
+            return 0.0
+
+
+@dataclass
+class LegResult:
+    """One leg of a paired execution. Times are ``time.monotonic()`` seconds."""
+
+    side: str
+    token_id: str
+    price: float
+    order_id: Optional[str] = None
+    filled: float = 0.0
+    error: Optional[str] = None
+    sent_at: float = 0.0
+    acked_at: float = 0.0
+
+
+@dataclass
+class PairedExecutionResult:
+    """Outcome of ``PairedExecutionEngine.execute``."""
+
+    txn: AtomicPairedTransaction
+    yes: LegResult
+    no: LegResult
+    paired_shares: float = 0.0      # matched YES+NO pairs kept
+    unwound_shares: float = 0.0     # excess leg shares sold back
+    unwind_latency_ms: float = 0.0  # dangling detected → unwind finished
+    halted: bool = False            # unwind incomplete → kill switch
+
+    @property
+    def state(self) -> PairState:
+        return self.txn.state
+
+    @property
+    def success(self) -> bool:
+        return self.txn.state == PairState.COMMITTED
+
+    @property
+    def leg_skew_ms(self) -> float:
+        """Time between the two legs going live (ack), in ms."""
+        if not self.yes.acked_at or not self.no.acked_at:
+            return 0.0
+        return abs(self.yes.acked_at - self.no.acked_at) * 1000
+
+
+class PairedExecutionEngine:
+    """Fire both legs of a paired entry concurrently and keep the book flat.
+
+    Args:
+        gateway: ``OrderGateway`` (``ClobOrderGateway`` live, ``FakeClob`` in tests).
+        kill_switch: Activated when an unwind can't finish in budget.
+        leg_timeout: Seconds to wait for each leg to fill.
+        unwind_budget: Seconds allowed to sell back a dangling leg.
+        max_unwind_attempts: Sell attempts within the budget.
+        max_unwind_slippage_pct: Limit price discount on the last attempt.
+    """
+
+    LEG_TIMEOUT_SEC = 2.0
+    UNWIND_BUDGET_SEC = 1.0
+    MAX_UNWIND_ATTEMPTS = 3
+    MAX_UNWIND_SLIPPAGE_PCT = 5.0
+
+    def __init__(
+        self,
+        gateway: OrderGateway,
+        kill_switch: Optional[KillSwitch] = None,
+        leg_timeout: float = LEG_TIMEOUT_SEC,
+        unwind_budget: float = UNWIND_BUDGET_SEC,
+        max_unwind_attempts: int = MAX_UNWIND_ATTEMPTS,
+        max_unwind_slippage_pct: float = MAX_UNWIND_SLIPPAGE_PCT,
+    ):
+        self.gateway = gateway
+        self._kill_switch = kill_switch
+        self.leg_timeout = leg_timeout
+        self.unwind_budget = unwind_budget
+        self.max_unwind_attempts = max_unwind_attempts
+        self.max_unwind_slippage_pct = max_unwind_slippage_pct
+
+    async def execute(
+        self,
+        market_id: str,
+        yes_token: str,
+        no_token: str,
+        yes_price: float,
+        no_price: float,
+        shares: float,
+    ) -> PairedExecutionResult:
+        """Buy ``shares`` YES and NO concurrently. Never raises."""
+        txn = AtomicPairedTransaction(market_id=market_id)
+        txn.submit(Decimal(str(yes_price)), Decimal(str(no_price)), Decimal(str(shares)))
+        result = PairedExecutionResult(
+            txn=txn,
+            yes=LegResult("YES", yes_token, yes_price),
+            no=LegResult("NO", no_token, no_price),
+        )
+
+        if self._kill_switch and self._kill_switch.is_active:
+            logger.warning("[PAIR-EXEC] Blocked by kill_switch: %s", self._kill_switch.reason)
+            for leg in (result.yes, result.no):
+                leg.error = "kill_switch_active"
+                txn.timeout_leg(leg.side)
+            return result
+
+        yes_abort, no_abort = asyncio.Event(), asyncio.Event()
+        await asyncio.gather(
+            self._run_leg(result.yes, shares, yes_abort, no_abort),
+            self._run_leg(result.no, shares, no_abort, yes_abort),
+        )
+
+        for leg in (result.yes, result.no):
+            if leg.filled > _EPS:
+                txn.confirm_leg(leg.side, Decimal(str(leg.filled)))
+            else:
+                txn.timeout_leg(leg.side)
+
+        result.paired_shares = min(result.yes.filled, result.no.filled)
+        if txn.state == PairState.BOTH_CONFIRMED:
+            txn.commit()
+        else:
+            heavy = result.yes if result.yes.filled >= result.no.filled else result.no
+            excess = heavy.filled - result.paired_shares
+            if excess > _EPS:
+                await self._unwind(result, heavy, excess)
+
+        logger.info(
+            "[PAIR-EXEC] id=%s market=%s state=%s paired=%.1f unwound=%.1f skew=%.1fms",
+            txn.txn_id, market_id, txn.state.name, result.paired_shares,
+            result.unwound_shares, result.leg_skew_ms,
+        )
+        return result
+
+    # ------------------------------------------------------------------
+    # Legs
+    # ------------------------------------------------------------------
+
+    async def _run_leg(
+        self,
+        leg: LegResult,
+        shares: float,
+        abort: asyncio.Event,
+        abort_peer: asyncio.Event,
+    ) -> None:
+        """Place → wait for fill (or peer failure) → cancel the rest."""
+        leg.sent_at = time.monotonic()
+        try:
+            leg.order_id = await self.gateway.place(leg.token_id, "BUY", leg.price, shares)
+        except Exception as exc:
+            leg.error = str(exc) or type(exc).__name__
+            logger.warning("[PAIR-EXEC] %s leg rejected: %s", leg.side, leg.error)
+            abort_peer.set()
+            return
+        leg.acked_at = time.monotonic()
+
+        try:
+            fill_task = asyncio.ensure_future(
+                self.gateway.wait_filled(leg.order_id, self.leg_timeout),
+            )
+            abort_task = asyncio.ensure_future(abort.wait())
+            try:
+                await asyncio.wait({fill_task, abort_task}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                abort_task.cancel()
+            if fill_task.done():
+                leg.filled = fill_task.result()
+            else:
+                fill_task.cancel()
+
+            if leg.filled < shares - _EPS:
+                leg.filled = await self.gateway.cancel(leg.order_id)
+        except Exception as exc:
+            leg.error = str(exc) or type(exc).__name__
+            logger.warning("[PAIR-EXEC] %s leg error: %s", leg.side, leg.error)
+
+        if leg.filled < shares - _EPS:
+            abort_peer.set()
+
+    # ------------------------------------------------------------------
+    # Unwind
+    # ------------------------------------------------------------------
+
+    async def _unwind(self, result: PairedExecutionResult, leg: LegResult, shares: float) -> None:
+        """Sell back ``shares`` of ``leg`` within ``unwind_budget``."""
+        txn = result.txn
+        started = time.monotonic()
+        deadline = started + self.unwind_budget
+        remaining = shares
+
+        for attempt in range(1, self.max_unwind_attempts + 1):
+            time_left = deadline - time.monotonic()
+            if time_left <= 0:
+                break
+            slippage = self.max_unwind_slippage_pct * attempt / self.max_unwind_attempts
+            price = max(_MIN_PRICE, round(leg.price * (1 - slippage / 100), 3))
+            sold = 0.0
+            try:
+                order_id = await self.gateway.place(leg.token_id, "SELL", price, remaining)
+                # 남은 예산을 남은 시도 수로 나눠 다음 (더 공격적인) 시도 시간을 남긴다
+                wait = time_left / (self.max_unwind_attempts - attempt + 1)
+                sold = await self.gateway.wait_filled(order_id, wait)
+                if sold < remaining - _EPS:
+                    sold = await self.gateway.cancel(order_id)
+            except Exception as exc:
+                logger.warning("[PAIR-EXEC] unwind attempt %d failed: %s", attempt, exc)
+            remaining -= sold
+            txn.record_unwind(
+                leg.side, remaining <= _EPS, Decimal(str(sold)), Decimal(str(slippage)),
+            )
+            if remaining <= _EPS:
+                break
+
+        result.unwound_shares = shares - max(remaining, 0.0)
+        result.unwind_latency_ms = (time.monotonic() - started) * 1000
+        if remaining > _EPS:
+            result.halted = True
+            reason = (
+                f"Paired unwind incomplete: {txn.market_id} {leg.side} "
+                f"{remaining:.1f} shares dangling"
+            )
+            logger.error("[PAIR-EXEC] %s", reason)
+            if self._kill_switch is not None:
+                self._kill_switch.activate(reason)
@@ -2,23 +2,32 @@
 
 F-030: 기본 단일 사이드 오더 제출.
 F-031: 폴링 확인, 취소, 재시도, 슬리피지, 킬스위치, 타임아웃.
+F-041: 논블로킹 async 경로 (``submit_order_async``) — 서명/제출/조회는
+       워커 스레드에서, 대기는 ``asyncio.sleep``으로. 이벤트 루프를 막지 않으며
+       여러 오더를 동시에 진행할 수 있다 (``max_inflight``까지).
+F-050: ``order_pool``에 같은 (토큰, 사이드, 가격, 수량) 사전 서명 템플릿이 있으면
+       서명 없이 바로 post (GTD). 없으면 풀에 미리 받아 둔 토큰 메타데이터로 서명.
 
 절대 크래시하지 않는다. 모든 에러를 graceful하게 처리.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import time
 from typing import TYPE_CHECKING, Optional
 
-if TYPE_CHECKING:
-    from poly24h.execution.kill_switch import KillSwitch
-
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import ApiCreds, OrderArgs, OrderType
 
+from poly24h.execution.order_pool import PreSignedOrderPool
+
+if TYPE_CHECKING:
+    from poly24h.execution.kill_switch import KillSwitch
+    from poly24h.http_transport import HttpTransport
+
 logger = logging.getLogger(__name__)
 
 # Statuses that indicate the order is done (filled)
@@ -38,24 +47,34 @@ class SportExecutor:
     POLL_INTERVAL_SEC = 0.5
     MAX_RETRIES = 2  # Total attempts = 1 + MAX_RETRIES
     RETRY_BACKOFF_SEC = 0.5
+    MAX_INFLIGHT_ORDERS = 8  # F-041: concurrent async orders
 
     def __init__(
         self,
         dry_run: bool = True,
         clob_client: Optional[ClobClient] = None,
         kill_switch: Optional[KillSwitch] = None,
+        max_inflight: int = MAX_INFLIGHT_ORDERS,
+        order_pool: Optional[PreSignedOrderPool] = None,
     ):
         self.dry_run = dry_run
         self._client = clob_client
+        self.order_pool = order_pool
         self._kill_switch = kill_switch
+        self._order_slots = asyncio.Semaphore(max_inflight)
+        self.inflight = 0
 
     @classmethod
     def from_env(
         cls,
         dry_run: bool = True,
         kill_switch: Optional[KillSwitch] = None,
+        transport: Optional[HttpTransport] = None,
     ) -> SportExecutor:
-        """env vars로 ClobClient 초기화 후 SportExecutor 생성."""
+        """env vars로 ClobClient 초기화 후 SportExecutor 생성.
+
+        ``transport``: 주문 풀의 토큰 메타데이터 조회용 공유 HTTP 전송 계층.
+        """
         if dry_run:
             return cls(dry_run=True, kill_switch=kill_switch)
 
@@ -78,7 +97,10 @@ class SportExecutor:
             api_passphrase=api_passphrase,
         ))
 
-        return cls(dry_run=False, clob_client=client, kill_switch=kill_switch)
+        return cls(
+            dry_run=False, clob_client=client, kill_switch=kill_switch,
+            order_pool=PreSignedOrderPool(client, transport=transport),
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -109,6 +131,52 @@ class SportExecutor:
 
         return self._submit_live_with_retry(token_id, side, price, size)
 
+    async def submit_order_async(
+        self,
+        token_id: str,
+        side: str,
+        price: float,
+        size: float,
+    ) -> dict:
+        """F-041: ``submit_order``의 논블로킹 버전 (같은 결과 dict).
+
+        ClobClient 호출(서명, post, get_order, cancel)은 ``asyncio.to_thread``로,
+        폴링/재시도 대기는 ``asyncio.sleep``으로 처리한다. Never raises.
+        """
+        if self.dry_run:
+            return self._submit_dry_run(token_id, side, price, size)
+
+        if self._kill_switch and self._kill_switch.is_active:
+            logger.warning("[LIVE ORDER] Blocked by kill_switch: %s",
+                           self._kill_switch.reason)
+            return self._error_result("kill_switch_active", price)
+
+        async with self._order_slots:
+            self.inflight += 1
+            try:
+                return await self._submit_live_with_retry_async(
+                    token_id, side, price, size,
+                )
+            finally:
+                self.inflight -= 1
+
+    # ------------------------------------------------------------------
+    # F-050: Order preparation (no-ops in dry run / without a pool)
+    # ------------------------------------------------------------------
+
+    async def warm_tokens(self, token_ids) -> int:
+        """Pre-fetch signing metadata for tokens that may be traded."""
+        if self.dry_run or self.order_pool is None:
+            return 0
+        return await self.order_pool.warm_tokens(token_ids)
+
+    async def presign(self, orders) -> int:
+        """Pre-sign exact (token_id, side, price, size) orders about to be submitted."""
+        if self.dry_run or self.order_pool is None:
+            return 0
+        self.order_pool.purge_expired()
+        return await self.order_pool.prepare(orders)
+
     # ------------------------------------------------------------------
     # Dry run
     # ------------------------------------------------------------------
@@ -162,69 +230,145 @@ class SportExecutor:
                 "[LIVE ORDER] Submitting: %s %.1f shares @ $%.4f | token=%s",
                 side, size, price, token_id[:16],
             )
+            response = self._create_and_post(token_id, side, price, size)
 
-            order_args = OrderArgs(
-                token_id=token_id,
-                price=price,
-                size=size,
-                side=side,
-            )
+            order_id, error = self._parse_post_response(response, price)
+            if error is not None:
+                return error
 
-            signed_order = self._client.create_order(order_args)
-            response = self._client.post_order(signed_order, OrderType.GTC)
+            # Poll for fill confirmation
+            poll_result = self._poll_order_status(order_id)
+            return self._fill_result(order_id, poll_result, price)
 
-            # Response validation
-            if not isinstance(response, dict):
-                return self._error_result(
-                    f"invalid_response_type: {type(response).__name__}", price,
-                )
+        except Exception as exc:
+            logger.error(
+                "[LIVE ORDER] Failed: %s | token=%s price=$%.4f size=%.1f",
+                exc, token_id[:16], price, size,
+            )
+            return self._error_result(str(exc), price)
 
-            order_id = response.get("orderID") or response.get("order_id", "")
-            if not order_id:
-                return self._error_result("no_order_id_in_response", price)
+    def _create_and_post(
+        self, token_id: str, side: str, price: float, size: float,
+    ):
+        """Sign + post a GTC order (blocking ClobClient calls).
 
-            logger.info(
-                "[LIVE ORDER] Submitted: order_id=%s | expected=$%.4f",
-                order_id, price,
+        F-050: A matching pre-signed template is posted as GTD without signing;
+        otherwise the pool signs with its pre-fetched token metadata.
+        """
+        if self.order_pool is not None:
+            template = self.order_pool.take(token_id, side, price, size)
+            if template is not None:
+                return self._client.post_order(template.signed, OrderType.GTD)
+            signed_order = self.order_pool.sign(token_id, side, price, size)
+            return self._client.post_order(signed_order, OrderType.GTC)
+
+        order_args = OrderArgs(
+            token_id=token_id,
+            price=price,
+            size=size,
+            side=side,
+        )
+        signed_order = self._client.create_order(order_args)
+        return self._client.post_order(signed_order, OrderType.GTC)
+
+    def _parse_post_response(
+        self, response, price: float,
+    ) -> tuple[str, dict | None]:
+        """Validate post_order response → (order_id, error_result or None)."""
+        if not isinstance(response, dict):
+            return "", self._error_result(
+                f"invalid_response_type: {type(response).__name__}", price,
             )
 
-            # Poll for fill confirmation
-            poll_result = self._poll_order_status(order_id)
+        order_id = response.get("orderID") or response.get("order_id", "")
+        if not order_id:
+            return "", self._error_result("no_order_id_in_response", price)
+
+        logger.info(
+            "[LIVE ORDER] Submitted: order_id=%s | expected=$%.4f",
+            order_id, price,
+        )
+        return order_id, None
+
+    def _fill_result(self, order_id: str, poll_result: dict, price: float) -> dict:
+        """Build the result dict from the final polled order state."""
+        if poll_result["status"] in _FILLED_STATUSES:
+            fill_price = self._extract_fill_price(poll_result, price)
+            size_matched = float(poll_result.get("size_matched", 0))
+            slippage_pct = abs(fill_price - price) / price * 100 if price > 0 else 0.0
+
+            if slippage_pct > 2.0:
+                logger.warning(
+                    "[LIVE ORDER] HIGH SLIPPAGE: expected=$%.4f fill=$%.4f slip=%.1f%%",
+                    price, fill_price, slippage_pct,
+                )
 
-            if poll_result["status"] in _FILLED_STATUSES:
-                fill_price = self._extract_fill_price(poll_result, price)
-                size_matched = float(poll_result.get("size_matched", 0))
-                slippage_pct = abs(fill_price - price) / price * 100 if price > 0 else 0.0
-
-                if slippage_pct > 2.0:
-                    logger.warning(
-                        "[LIVE ORDER] HIGH SLIPPAGE: expected=$%.4f fill=$%.4f slip=%.1f%%",
-                        price, fill_price, slippage_pct,
-                    )
-
-                return {
-                    "success": True,
-                    "order_id": order_id,
-                    "dry_run": False,
-                    "error": None,
-                    "expected_price": price,
-                    "fill_price": fill_price,
-                    "slippage_pct": slippage_pct,
-                    "size_matched": size_matched,
-                }
-
-            # Order timed out or was cancelled
             return {
-                "success": False,
+                "success": True,
                 "order_id": order_id,
                 "dry_run": False,
-                "error": f"order_{poll_result['status'].lower()}",
+                "error": None,
                 "expected_price": price,
-                "fill_price": None,
-                "slippage_pct": None,
-                "size_matched": float(poll_result.get("size_matched", 0)),
+                "fill_price": fill_price,
+                "slippage_pct": slippage_pct,
+                "size_matched": size_matched,
             }
 
+        # Order timed out or was cancelled
+        return {
+            "success": False,
+            "order_id": order_id,
+            "dry_run": False,
+            "error": f"order_{poll_result['status'].lower()}",
+            "expected_price": price,
+            "fill_price": None,
+            "slippage_pct": None,
+            "size_matched": float(poll_result.get("size_matched", 0)),
+        }
+
+    # ------------------------------------------------------------------
+    # F-041: Async live submission (never blocks the event loop)
+    # ------------------------------------------------------------------
+
+    async def _submit_live_with_retry_async(
+        self, token_id: str, side: str, price: float, size: float,
+    ) -> dict:
+        last_error = ""
+
+        for attempt in range(1 + self.MAX_RETRIES):
+            if attempt > 0:
+                await asyncio.sleep(self.RETRY_BACKOFF_SEC * attempt)
+                logger.info("[LIVE ORDER] Retry %d/%d", attempt, self.MAX_RETRIES)
+
+            result = await self._submit_live_async(token_id, side, price, size)
+
+            if result["success"]:
+                return result
+
+            last_error = result.get("error", "unknown")
+            logger.warning("[LIVE ORDER] Attempt %d failed: %s", attempt + 1, last_error)
+
+        return self._error_result(f"all_retries_exhausted: {last_error}", price)
+
+    async def _submit_live_async(
+        self, token_id: str, side: str, price: float, size: float,
+    ) -> dict:
+        try:
+            logger.info(
+                "[LIVE ORDER] Submitting: %s %.1f shares @ $%.4f | token=%s",
+                side, size, price, token_id[:16],
+            )
+            response = await asyncio.to_thread(
+                self._create_and_post, token_id, side, price, size,
+            )
+
+            order_id, error = self._parse_post_response(response, price)
+            if error is not None:
+                return error
+
+            poll_result = await self._poll_order_status_async(order_id)
+            return self._fill_result(order_id, poll_result, price)
+
         except Exception as exc:
             logger.error(
                 "[LIVE ORDER] Failed: %s | token=%s price=$%.4f size=%.1f",
@@ -232,6 +376,50 @@ class SportExecutor:
             )
             return self._error_result(str(exc), price)
 
+    async def _poll_order_status_async(
+        self,
+        order_id: str,
+        timeout_sec: float | None = None,
+        poll_interval: float | None = None,
+    ) -> dict:
+        """Async ``_poll_order_status``: get_order in a thread, asyncio.sleep between."""
+        timeout = timeout_sec if timeout_sec is not None else self.POLL_TIMEOUT_SEC
+        interval = poll_interval if poll_interval is not None else self.POLL_INTERVAL_SEC
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            try:
+                order_data = await asyncio.to_thread(self._client.get_order, order_id)
+                status = order_data.get("status", "UNKNOWN")
+
+                if status in _FILLED_STATUSES or status in _CANCELLED_STATUSES:
+                    return order_data
+
+            except Exception as exc:
+                logger.warning("[POLL] get_order error: %s", exc)
+
+            await asyncio.sleep(interval)
+
+        logger.warning("[POLL] Order %s timed out after %.1fs, cancelling", order_id, timeout)
+        await self._cancel_order_async(order_id)
+
+        return {"status": "TIMEOUT", "size_matched": "0", "order_id": order_id}
+
+    async def _cancel_order_async(self, order_id: str) -> bool:
+        """Async ``_cancel_order``. Retries up to 2 times."""
+        for attempt in range(2):
+            try:
+                await asyncio.to_thread(self._client.cancel, order_ids=[order_id])
+                logger.info("[CANCEL] Order %s cancelled", order_id)
+                return True
+            except Exception as exc:
+                logger.warning("[CANCEL] Attempt %d failed: %s", attempt + 1, exc)
+                if attempt < 1:
+                    await asyncio.sleep(0.5)
+
+        logger.error("[CANCEL] Failed to cancel order %s after 2 attempts", order_id)
+        return False
+
     # ------------------------------------------------------------------
     # Order polling
     # ------------------------------------------------------------------
@@ -15,6 +15,8 @@ from typing import List, Optional
 
 import aiohttp
 
+from poly24h.http_transport import HttpTransport, get_default_transport
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,27 +31,29 @@ class BinanceClient:
     
     BASE_URL = "https://api.binance.com"
     
-    def __init__(self, timeout: float = 10.0):
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        transport: Optional[HttpTransport] = None,
+    ):
         self._timeout = aiohttp.ClientTimeout(total=timeout)
-        self._session: Optional[aiohttp.ClientSession] = None
+        # F-034: 공유 커넥션 풀 — 세션 수명은 transport가 관리
+        self._transport = transport or get_default_transport()
     
     async def __aenter__(self) -> "BinanceClient":
-        self._session = aiohttp.ClientSession(timeout=self._timeout)
+        await self._transport.session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self._session:
-            await self._session.close()
-            self._session = None
+        pass
     
     async def _get(self, endpoint: str, params: dict) -> Optional[dict | list]:
         """Make GET request to Binance API."""
-        if self._session is None:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
-        
         url = f"{self.BASE_URL}{endpoint}"
         try:
-            async with self._session.get(url, params=params) as resp:
+            async with self._transport.get(
+                url, params=params, timeout=self._timeout,
+            ) as resp:
                 if resp.status != 200:
                     logger.warning(
                         "Binance API error: %s %s", resp.status, await resp.text()
@@ -0,0 +1,255 @@
+"""F-034: Shared pooled HTTP transport.
+
+모든 API 클라이언트(Gamma, CLOB, Binance, Odds API, Telegram, Settlement)가
+하나의 aiohttp 세션/커넥터를 공유하도록 하는 전송 계층.
+
+- 호스트별 커넥션 풀 + keep-alive (스나이프 직전 TCP/TLS 핸드셰이크 제거)
+- DNS 캐시
+- 호스트별 동시 요청 제한 (asyncio.Semaphore)
+- 통합 429 백오프 (Retry-After 우선, 없으면 지수 백오프) — 호스트 단위 쿨다운을
+  모든 요청이 공유하므로 한 클라이언트가 429를 맞으면 다른 클라이언트도 대기.
+- F-040: 호스트별 적응형 토큰 버킷 (``HostRateLimiter``) — 429/Retry-After로
+  rate를 스스로 조정하고, 우선순위 레인으로 SNIPE 요청을 먼저 보낸다.
+- F-044: CLOB 응답의 ``Date`` 헤더로 거래소 시계 오프셋(``ExchangeClock``) 보정.
+
+Usage:
+    transport = HttpTransport()
+    async with transport.get(url, params=params) as resp:
+        data = await resp.json()
+    await transport.close()
+
+클라이언트는 생성자에서 ``transport=``를 주입받고, 없으면
+``get_default_transport()``(프로세스 공용 인스턴스)를 사용한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from poly24h.precision_timer import ExchangeClock, get_default_clock
+from poly24h.rate_limiter import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# F-044: 시계 보정에 쓰는 호스트 (매칭 엔진 기준 시각)
+CLOCK_HOSTS = frozenset({"clob.polymarket.com"})
+
+DEFAULT_LIMIT = 100              # 전체 커넥션 풀 크기
+DEFAULT_LIMIT_PER_HOST = 20      # 호스트별 커넥션 풀 크기
+DEFAULT_HOST_CONCURRENCY = 20    # 호스트별 동시 in-flight 요청 수
+DEFAULT_KEEPALIVE = 60.0         # seconds — idle 커넥션 유지
+DEFAULT_DNS_TTL = 300            # seconds
+DEFAULT_TIMEOUT = 15             # seconds
+DEFAULT_MAX_429_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 1.0       # 429 지수 백오프 기준 (seconds)
+MAX_BACKOFF = 30.0               # Retry-After 상한
+
+
+class HttpTransport:
+    """Process-wide pooled HTTP transport.
+
+    세션은 첫 요청 시 lazily 생성되며, 이벤트 루프가 바뀌면(테스트 등)
+    새 루프에 맞춰 다시 만든다.
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        host_concurrency: int = DEFAULT_HOST_CONCURRENCY,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE,
+        dns_ttl: int = DEFAULT_DNS_TTL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_429_retries: int = DEFAULT_MAX_429_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        clock: Optional[ExchangeClock] = None,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.host_concurrency = host_concurrency
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_429_retries = max(1, max_429_retries)
+        self.backoff_base = backoff_base
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        # F-040: 호스트별 토큰 버킷 (429 쿨다운도 버킷 정지로 공유)
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        # F-044: 거래소 시계 오프셋 샘플링
+        self.clock = clock or get_default_clock()
+
+        # Metrics
+        self.request_count = 0
+        self.sessions_created = 0
+        self.rate_limited_count = 0
+        self._host_requests: dict[str, int] = defaultdict(int)
+
+    # ------------------------------------------------------------------
+    # Session lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed is True
+
+    async def session(self) -> aiohttp.ClientSession:
+        """공유 세션 반환 (없거나 닫혔거나 루프가 바뀌면 새로 생성)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 이전 루프에 묶인 세션/세마포어는 재사용 불가 — 버린다.
+            self._abandon_session()
+            self._host_semaphores.clear()
+            self._loop = loop
+        if self.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self.timeout,
+            )
+            self.sessions_created += 1
+        return self._session
+
+    async def close(self) -> None:
+        """세션 및 커넥터 종료."""
+        if self._session is not None and not self.closed:
+            try:
+                await self._session.close()
+            except Exception as exc:
+                logger.debug("HttpTransport close error: %s", exc)
+        self._session = None
+
+    async def __aenter__(self) -> HttpTransport:
+        await self.session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def get(self, url: str, **kwargs):
+        """GET — ``async with transport.get(url) as resp:``."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        """POST — ``async with transport.post(url, json=...) as resp:``."""
+        return self.request("POST", url, **kwargs)
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: str, priority: Optional[int] = None, **kwargs,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """요청 실행 후 응답을 context manager로 노출.
+
+        429는 여기서 재시도한다 (Retry-After 또는 지수 백오프). 재시도를
+        모두 소진하면 429 응답을 그대로 돌려주므로 호출부는 status만 확인하면 된다.
+        네트워크 예외는 호출부로 전파된다.
+
+        F-040: ``priority``가 없으면 ``request_priority`` contextvar를 사용.
+        """
+        host = urlsplit(url).hostname or ""
+        session = await self.session()
+        send = getattr(session, method.lower())
+
+        for attempt in range(1, self.max_429_retries + 1):
+            await self.rate_limiter.acquire(host, priority)
+            async with self._semaphore(host):
+                self.request_count += 1
+                self._host_requests[host] += 1
+                sent_at = time.time()
+                async with send(url, **kwargs) as resp:
+                    if host in CLOCK_HOSTS:
+                        self.clock.observe_http_date(
+                            resp.headers.get("Date"), sent_at, time.time(),
+                        )
+                    if resp.status != 429:
+                        self.rate_limiter.on_success(host)
+                        yield resp
+                        return
+                    wait = self._retry_delay(resp, attempt)
+                    if attempt == self.max_429_retries:
+                        # 재시도 소진 — rate만 낮추고 응답 반환
+                        self.rate_limiter.on_rate_limited(host, wait, pause=False)
+                        yield resp
+                        return
+                    self.rate_limited_count += 1
+                    self.rate_limiter.on_rate_limited(host, wait)
+                    logger.warning(
+                        "HTTP 429 %s (attempt %d/%d), backing off %.1fs",
+                        host, attempt, self.max_429_retries, wait,
+                    )
+
+    def stats(self) -> dict:
+        """전송 계층 통계."""
+        return {
+            "requests": self.request_count,
+            "sessions_created": self.sessions_created,
+            "rate_limited": self.rate_limited_count,
+            "hosts": dict(self._host_requests),
+            "limits": self.rate_limiter.stats(),
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _abandon_session(self) -> None:
+        """Best-effort synchronous teardown of a session from a dead loop."""
+        session, self._session = self._session, None
+        if session is None or session.closed is True:
+            return
+        try:
+            # 커넥션은 죽은 루프에 묶여 있으므로 세션만 분리 (GC 경고 방지)
+            result = session.detach()
+            if asyncio.iscoroutine(result):
+                result.close()
+        except Exception as exc:
+            logger.debug("HttpTransport abandon error: %s", exc)
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._host_semaphores.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.host_concurrency)
+            self._host_semaphores[host] = sem
+        return sem
+
+    def _retry_delay(self, resp, attempt: int) -> float:
+        """Retry-After 헤더(초) 우선, 없으면 base * 2^(attempt-1)."""
+        headers = getattr(resp, "headers", None) or {}
+        retry_after = headers.get("Retry-After") if hasattr(headers, "get") else None
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), MAX_BACKOFF)
+            except (TypeError, ValueError):
+                pass
+        return min(self.backoff_base * (2 ** (attempt - 1)), MAX_BACKOFF)
+
+
+_default_transport: Optional[HttpTransport] = None
+
+
+def get_default_transport() -> HttpTransport:
+    """프로세스 공용 HttpTransport (주입이 없는 클라이언트의 기본값)."""
+    global _default_transport
+    if _default_transport is None:
+        _default_transport = HttpTransport()
+    return _default_transport
@@ -0,0 +1,117 @@
+"""F-042: Append-only JSONL write-ahead journal.
+
+상태 변경을 한 줄씩 append만 하는 저널. 전체 상태를 매번 다시 쓰는 대신
+이벤트 1건 = JSON 1줄 (O(1)), 주기적으로 스냅샷에 압축(compaction)한 뒤 비운다.
+
+- 각 레코드는 ``seq``(단조 증가)를 가진다. 스냅샷에 마지막 seq를 기록하므로
+  "스냅샷 저장 → 저널 비우기" 사이에 크래시가 나도 재생 시 중복 적용되지 않는다.
+- 쓰기 도중 크래시로 잘린 마지막 줄은 재생 시 건너뛴다 (그 이전 이벤트는 보존).
+
+Usage:
+    journal = Journal(Path("data/position_manager_journal.jsonl"))
+    journal.append({"type": "entry", ...})      # seq 자동 부여
+    for record in journal.replay(after_seq=snapshot_seq):
+        apply(record)
+    journal.truncate()                           # 스냅샷 저장 후
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import IO, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class Journal:
+    """Append-only JSONL journal with sequence numbers.
+
+    Args:
+        path: 저널 파일 경로.
+        fsync: True면 append마다 ``os.fsync`` (전원 장애까지 보호).
+    """
+
+    def __init__(self, path: Path, fsync: bool = True):
+        self.path = Path(path)
+        self.fsync = fsync
+        self._fh: IO[str] | None = None
+        self.last_seq = 0
+        self.pending = 0  # records since last truncate
+        self._scan_tail()
+
+    def append(self, record: dict) -> int:
+        """Append one record (``seq`` assigned here). Returns its seq."""
+        self.last_seq += 1
+        line = json.dumps({"seq": self.last_seq, **record}, separators=(",", ":"))
+        fh = self._handle()
+        fh.write(line + "\n")
+        fh.flush()
+        if self.fsync:
+            os.fsync(fh.fileno())
+        self.pending += 1
+        return self.last_seq
+
+    def replay(self, after_seq: int = 0) -> Iterator[dict]:
+        """Yield records with ``seq > after_seq`` (torn/corrupt lines skipped)."""
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        "Journal %s: skipping corrupt line %d", self.path, lineno,
+                    )
+                    continue
+                if record.get("seq", 0) > after_seq:
+                    yield record
+
+    def truncate(self) -> None:
+        """Empty the journal (after its records were compacted into a snapshot).
+
+        ``last_seq`` keeps counting so sequence numbers never repeat.
+        """
+        try:
+            self._handle().truncate(0)
+            self.pending = 0
+        except OSError as e:
+            logger.error("Failed to truncate journal %s: %s", self.path, e)
+
+    def advance(self, seq: int) -> None:
+        """Continue numbering after ``seq`` (e.g. the seq stored in a snapshot)."""
+        self.last_seq = max(self.last_seq, seq)
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _handle(self) -> IO[str]:
+        if self._fh is None or self._fh.closed:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "a")
+            if self._fh.tell() > 0 and not self._ends_with_newline():
+                # 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄을 끊는다
+                self._fh.write("\n")
+        return self._fh
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _scan_tail(self) -> None:
+        """Recover ``last_seq``/``pending`` from an existing journal file."""
+        for record in self.replay():
+            self.last_seq = max(self.last_seq, record.get("seq", 0))
+            self.pending += 1
@@ -0,0 +1,296 @@
+"""F-055: Shared background writer for JSONL sinks.
+
+스나이프 루프 한가운데서 레코드마다 ``open(..., "a")`` + write 하던 싱크들
+(market_stats / paired / paired_sports JSONL, moneyline 검증 히스토리)을
+하나의 백그라운드 스레드로 모은다.
+
+- 핫패스는 직렬화된 줄을 큐에 넣기만 한다 (``append`` / ``replace``)
+- 파일별 버퍼 + 열린 핸들 재사용, 시간(``flush_interval``)·크기(``max_buffer_bytes``) 기준 flush
+- 날짜 롤오버: 경로는 레코드마다 정해지고, ``idle_close_secs`` 동안 쓰이지 않은
+  핸들(어제 파일)은 닫는다
+- fsync 정책은 싱크별 (``fsync=True``인 레코드가 포함된 flush만 fsync)
+- ``replace``는 파일 전체 스냅샷 — 같은 경로의 여러 스냅샷은 마지막 것만 원자적으로 기록
+- ``start()`` 전(테스트, CLI 도구)에는 호출 즉시 동기 기록 (write-through)
+- ``close()``는 큐를 모두 비우고 핸들을 닫은 뒤 write-through로 돌아간다
+
+Usage:
+    writer = get_default_writer()
+    writer.start()
+    writer.append(path, json.dumps(record))
+    writer.close()   # shutdown — drains pending records
+
+Never raises — I/O 오류는 warning 로그만 남긴다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 1.0        # seconds — 버퍼 최대 체류 시간
+DEFAULT_MAX_BUFFER_BYTES = 64_000   # 파일별 버퍼가 이 크기를 넘으면 즉시 flush
+DEFAULT_IDLE_CLOSE_SECS = 300.0     # 이 시간 동안 안 쓰인 핸들은 닫음 (날짜 롤오버)
+DEFAULT_MAX_OPEN_FILES = 32
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class _Pending:
+    """Buffered writes for one path."""
+
+    lines: list[str] = field(default_factory=list)
+    size: int = 0
+    snapshot: Optional[str] = None
+    fsync: bool = False
+    records: int = 0  # submissions folded in (replace coalesces several)
+
+
+class JsonlWriter:
+    """Process-wide buffered writer with a single background thread."""
+
+    def __init__(
+        self,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES,
+        idle_close_secs: float = DEFAULT_IDLE_CLOSE_SECS,
+        max_open_files: int = DEFAULT_MAX_OPEN_FILES,
+    ):
+        self.flush_interval = flush_interval
+        self.max_buffer_bytes = max_buffer_bytes
+        self.idle_close_secs = idle_close_secs
+        self.max_open_files = max(1, max_open_files)
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()   # write-through vs 스레드 전환 보호
+
+        # Writer-thread state
+        self._pending: dict[Path, _Pending] = {}
+        self._handles: dict[Path, IO[str]] = {}
+        self._last_used: dict[Path, float] = {}
+
+        # Submitted vs flushed (or failed) records — see ``pending_writes``
+        self._submitted = 0
+        self._completed = 0
+
+        # Metrics
+        self.records_written = 0
+        self.flush_count = 0
+        self.error_count = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the background thread (idempotent)."""
+        with self._lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="jsonl-writer", daemon=True,
+            )
+            self._thread.start()
+
+    @property
+    def pending_writes(self) -> int:
+        """Records submitted but not yet written (queued or buffered)."""
+        return self._submitted - self._completed
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Block until everything enqueued so far is on disk."""
+        done = threading.Event()
+        with self._lock:
+            if not self.running:
+                return True
+            self._queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Drain pending writes, close handles and stop the thread."""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(("stop", None))
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning("JSONL writer did not stop within %.1fs", timeout)
+            self._thread = None
+
+    # ------------------------------------------------------------------
+    # Hot path
+    # ------------------------------------------------------------------
+
+    def append(self, path: PathLike, line: str, fsync: bool = False) -> None:
+        """Append one serialized JSON line (newline added) to ``path``."""
+        self._submit("append", Path(path), line + "\n", fsync)
+
+    def replace(self, path: PathLike, text: str, fsync: bool = False) -> None:
+        """Atomically replace ``path`` with ``text`` (latest snapshot wins)."""
+        self._submit("replace", Path(path), text, fsync)
+
+    def _submit(self, op: str, path: Path, text: str, fsync: bool) -> None:
+        # Checked and enqueued under the lock: close() holds it from the stop
+        # marker until the thread exits, so nothing lands behind the marker.
+        with self._lock:
+            self._submitted += 1
+            if self.running:
+                self._queue.put((op, (path, text, fsync)))
+                return
+            # Not started: write through synchronously
+            self._buffer(op, path, text, fsync)
+            self._flush_path(path)
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                op, payload = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0))
+            except queue.Empty:
+                op, payload = "tick", None
+
+            if op in ("append", "replace"):
+                path, text, fsync = payload
+                pending = self._buffer(op, path, text, fsync)
+                if pending.size >= self.max_buffer_bytes:
+                    self._flush_path(path)
+                if time.monotonic() < deadline:
+                    continue
+            elif op == "flush":
+                self._flush_all()
+                payload.set()
+                continue
+            elif op == "stop":
+                self._drain()
+                self._flush_all()
+                self._close_handles()
+                return
+
+            self._flush_all()
+            self._close_idle()
+            deadline = time.monotonic() + self.flush_interval
+
+    def _drain(self) -> None:
+        """Buffer everything still queued (shutdown)."""
+        while True:
+            try:
+                op, payload = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if op in ("append", "replace"):
+                self._buffer(op, *payload)
+            elif op == "flush":
+                payload.set()
+
+    def _buffer(self, op: str, path: Path, text: str, fsync: bool) -> _Pending:
+        pending = self._pending.get(path)
+        if pending is None:
+            pending = self._pending[path] = _Pending()
+        if op == "replace":
+            pending.snapshot = text
+            pending.lines.clear()
+            pending.size = len(text)
+        else:
+            pending.lines.append(text)
+            pending.size += len(text)
+        pending.fsync = pending.fsync or fsync
+        pending.records += 1
+        return pending
+
+    def _flush_all(self) -> None:
+        for path in list(self._pending):
+            self._flush_path(path)
+
+    def _flush_path(self, path: Path) -> None:
+        pending = self._pending.pop(path, None)
+        if pending is None:
+            return
+        try:
+            if pending.snapshot is not None:
+                self._close_handle(path)
+                self._write_snapshot(path, pending.snapshot, pending.fsync)
+            if pending.lines:
+                handle = self._handle(path)
+                handle.write("".join(pending.lines))
+                handle.flush()
+                if pending.fsync:
+                    os.fsync(handle.fileno())
+                self.records_written += len(pending.lines)
+            self.flush_count += 1
+        except OSError as e:
+            self.error_count += 1
+            self._close_handle(path)
+            logger.warning("JSONL write to %s failed: %s", path, e)
+        self._completed += pending.records
+        if not self.running:
+            self._close_handle(path)
+
+    def _write_snapshot(self, path: Path, text: str, fsync: bool) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w") as f:
+            f.write(text)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def _handle(self, path: Path) -> IO[str]:
+        handle = self._handles.get(path)
+        if handle is None:
+            if len(self._handles) >= self.max_open_files:
+                oldest = min(self._last_used, key=self._last_used.get)
+                self._close_handle(oldest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = self._handles[path] = open(path, "a")
+        self._last_used[path] = time.monotonic()
+        return handle
+
+    def _close_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_close_secs
+        for path, last_used in list(self._last_used.items()):
+            if last_used < cutoff:
+                self._close_handle(path)
+
+    def _close_handle(self, path: Path) -> None:
+        self._last_used.pop(path, None)
+        handle = self._handles.pop(path, None)
+        if handle is None:
+            return
+        try:
+            handle.close()
+        except OSError as e:
+            logger.warning("Failed to close %s: %s", path, e)
+
+    def _close_handles(self) -> None:
+        for path in list(self._handles):
+            self._close_handle(path)
+
+
+_default_writer: Optional[JsonlWriter] = None
+
+
+def get_default_writer() -> JsonlWriter:
+    """프로세스 공용 JsonlWriter (주입이 없는 싱크의 기본값)."""
+    global _default_writer
+    if _default_writer is None:
+        _default_writer = JsonlWriter()
+    return _default_writer
@@ -17,10 +17,14 @@ from datetime import datetime
 
 from poly24h.config import MARKET_SOURCES, BotConfig
 from poly24h.discovery.gamma_client import GammaClient
+from poly24h.discovery.market_catalog import DEFAULT_SNAPSHOT_PATH, MarketCatalog
 from poly24h.discovery.market_scanner import MarketScanner
+from poly24h.http_transport import HttpTransport, get_default_transport
+from poly24h.jsonl_writer import get_default_writer
 from poly24h.models.market import Market
 from poly24h.models.opportunity import Opportunity
 from poly24h.monitoring.telegram import TelegramAlerter
+from poly24h.precision_timer import get_default_clock
 from poly24h.strategy.dutch_book import detect_single_condition
 from poly24h.strategy.opportunity import rank_opportunities
 from poly24h.strategy.orderbook_scanner import (
@@ -28,6 +32,8 @@ from poly24h.strategy.orderbook_scanner import (
     OrderbookArbDetector,
     OrderbookBatchScanner,
 )
+from poly24h.websocket.price_cache import PriceCache
+from poly24h.websocket.ws_manager import WebSocketManager
 
 logger = logging.getLogger(__name__)
 
@@ -206,17 +212,20 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 # ---------------------------------------------------------------------------
 
 
-def _build_alerter() -> TelegramAlerter:
+def _build_alerter(transport: HttpTransport | None = None) -> TelegramAlerter:
     """환경변수에서 TelegramAlerter 생성."""
     return TelegramAlerter(
         bot_token=os.environ.get("TELEGRAM_BOT_TOKEN"),
         chat_id=os.environ.get("TELEGRAM_CHAT_ID"),
+        transport=transport,
     )
 
 
 async def main_loop(config: BotConfig, scanner_config: dict | None = None) -> None:
     """메인 루프: 주기적 스캔 → 감지 → 로깅 → 텔레그램 알림."""
-    alerter = _build_alerter()
+    # F-034: 공유 커넥션 풀 — 종료 경로(예외/취소 포함)에서 반드시 닫는다
+    transport = get_default_transport()
+    alerter = _build_alerter(transport)
 
     print(BANNER)
     print(f"Mode: {'DRY RUN' if config.dry_run else 'LIVE'}")
@@ -226,54 +235,71 @@ async def main_loop(config: BotConfig, scanner_config: dict | None = None) -> No
     print(f"Enabled sources: {', '.join(enabled.keys())}")
     print("-" * 60)
 
-    # Notify startup
-    if alerter.enabled:
-        mode = "DRY RUN" if config.dry_run else "LIVE"
-        await alerter.alert_error(
-            f"🟢 poly24h started — {mode} mode\n"
-            f"Sources: {', '.join(enabled.keys())}\n"
-            f"Interval: {config.scan_interval}s",
-            level="info",
-        )
-
-    # Graceful shutdown
-    stop_event = asyncio.Event()
-
-    def _handle_signal():
-        print("\n⚡ Shutting down gracefully...")
-        stop_event.set()
+    try:
+        # Notify startup
+        if alerter.enabled:
+            mode = "DRY RUN" if config.dry_run else "LIVE"
+            await alerter.alert_error(
+                f"🟢 poly24h started — {mode} mode\n"
+                f"Sources: {', '.join(enabled.keys())}\n"
+                f"Interval: {config.scan_interval}s",
+                level="info",
+            )
 
-    loop = asyncio.get_running_loop()
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        try:
-            loop.add_signal_handler(sig, _handle_signal)
-        except NotImplementedError:
-            pass  # Windows
+        # Graceful shutdown
+        stop_event = asyncio.Event()
+
+        def _handle_signal():
+            print("\n⚡ Shutting down gracefully...")
+            stop_event.set()
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, _handle_signal)
+            except NotImplementedError:
+                pass  # Windows
+
+        cycle = 0
+        while not stop_event.is_set():
+            cycle += 1
+            logger.info("=== Cycle %d ===", cycle)
+            try:
+                opps = await run_cycle(config, scanner_config or dict(enabled))
+                log_results(opps, dry_run=config.dry_run)
+
+                # Send Telegram alerts for each opportunity
+                for opp in opps:
+                    await alerter.alert_opportunity(opp)
+
+            except Exception:
+                logger.exception("Error in cycle %d", cycle)
+                # Error alerts disabled for Telegram (user request 2026-02-08)
+                # await alerter.alert_error(f"Cycle {cycle} error — check logs")
+
+            # Wait for next cycle or shutdown
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=config.scan_interval)
+            except asyncio.TimeoutError:
+                pass  # normal — time to scan again
+    finally:
+        await transport.close()
 
-    cycle = 0
-    while not stop_event.is_set():
-        cycle += 1
-        logger.info("=== Cycle %d ===", cycle)
-        try:
-            opps = await run_cycle(config, scanner_config or dict(enabled))
-            log_results(opps, dry_run=config.dry_run)
-
-            # Send Telegram alerts for each opportunity
-            for opp in opps:
-                await alerter.alert_opportunity(opp)
+    print("Goodbye! 🤙")
 
-        except Exception:
-            logger.exception("Error in cycle %d", cycle)
-            # Error alerts disabled for Telegram (user request 2026-02-08)
-            # await alerter.alert_error(f"Cycle {cycle} error — check logs")
 
-        # Wait for next cycle or shutdown
-        try:
-            await asyncio.wait_for(stop_event.wait(), timeout=config.scan_interval)
-        except asyncio.TimeoutError:
-            pass  # normal — time to scan again
+def _build_ws_manager(cache: PriceCache) -> WebSocketManager | None:
+    """F-036: websockets 설치 시 sharded WS 매니저 생성. 없으면 None (HTTP only)."""
+    from poly24h.websocket import price_ws
 
-    print("Goodbye! 🤙")
+    if price_ws.websockets is None:
+        logger.warning("websockets not installed — WS price feed disabled")
+        return None
+    return WebSocketManager(
+        cache,
+        max_tokens_per_conn=int(os.environ.get("POLY24H_WS_TOKENS_PER_CONN", "100")),
+        max_connections=int(os.environ.get("POLY24H_WS_MAX_CONNECTIONS", "8")),
+    )
 
 
 async def sniper_loop(config: BotConfig, threshold: float = 0.48) -> None:
@@ -291,7 +317,16 @@ async def sniper_loop(config: BotConfig, threshold: float = 0.48) -> None:
         RapidOrderbookPoller,
     )
 
-    alerter = _build_alerter()
+    # F-034: 프로세스 전체가 하나의 커넥션 풀을 공유 (keep-alive + DNS 캐시)
+    transport = get_default_transport()
+    alerter = _build_alerter(transport)
+    # F-055: JSONL sinks enqueue; one background thread batches the file I/O
+    jsonl_writer = get_default_writer()
+    jsonl_writer.start()
+
+    # F-038: One persistent catalog shared by PRE_OPEN and every sport monitor
+    catalog = MarketCatalog(snapshot_path=DEFAULT_SNAPSHOT_PATH)
+    catalog.load()
 
     print(BANNER_SNIPER)
     mode = "DRY RUN" if config.dry_run else "LIVE"
@@ -343,23 +378,32 @@ async def sniper_loop(config: BotConfig, threshold: float = 0.48) -> None:
     sniper_cfg = SniperConfig()
 
     # Run the event-driven loop with shutdown check
-    from datetime import datetime, timezone
-
     cycle = 0
     consecutive_errors = 0
     MAX_CONSECUTIVE_ERRORS = 10
+    ws_manager = None
     
     # Outer loop: recreates resources on catastrophic failure
     while not stop_event.is_set():
         try:
             # Initialize resources (can be recreated on failure)
             schedule = MarketOpenSchedule()
-            gamma_client = GammaClient()
-            scanner = MarketScanner(gamma_client)
-            preparer = PreOpenPreparer(gamma_client, scanner=scanner)
-            clob_fetcher = ClobOrderbookFetcher(timeout=8)
+            gamma_client = GammaClient(transport=transport)
+            scanner = MarketScanner(gamma_client, catalog=catalog)
+            preparer = PreOpenPreparer(gamma_client, scanner=scanner, transport=transport)
+            clob_fetcher = ClobOrderbookFetcher(transport=transport, timeout=8)
             poller = RapidOrderbookPoller(clob_fetcher)
-            loop = EventDrivenLoop(schedule, preparer, poller, alerter)
+            # F-036: Sharded WS price feed (HTTP polling covers stale/missing tokens)
+            price_cache = PriceCache()
+            if ws_manager is not None:
+                await ws_manager.stop()
+            ws_manager = _build_ws_manager(price_cache)
+            if ws_manager is not None:
+                await ws_manager.start()
+            loop = EventDrivenLoop(
+                schedule, preparer, poller, alerter,
+                price_cache=price_cache, ws_manager=ws_manager,
+            )
 
             # F-026: Launch multi-sport monitors as parallel background tasks
             from poly24h.execution.kill_switch import KillSwitch
@@ -369,7 +413,7 @@ async def sniper_loop(config: BotConfig, threshold: float = 0.48) -> None:
             from poly24h.strategy.sport_config import get_enabled_sport_configs
             from poly24h.strategy.sports_monitor import SportsMonitor
 
-            odds_client = OddsAPIClient(cache_ttl=2400)
+            odds_client = OddsAPIClient(cache_ttl=2400, transport=transport)
             rate_limiter = OddsAPIRateLimiter(
                 monthly_budget=500,
                 min_interval=2400,  # 40min between fetches per sport (budget: ~216/day)
@@ -377,11 +421,13 @@ async def sniper_loop(config: BotConfig, threshold: float = 0.48) -> None:
             # F-031: Kill switch + sport executor
             daily_loss_limit = float(os.environ.get("POLY24H_DAILY_LOSS_LIMIT_USD", "300"))
             kill_switch = KillSwitch(max_daily_loss=daily_loss_limit)
+            # F-050: Order-pool metadata lookups share the rate-limited transport
             sport_executor = SportExecutor.from_env(
-                dry_run=config.dry_run, kill_switch=kill_switch,
+                dry_run=config.dry_run, kill_switch=kill_switch, transport=transport,
             )
             sport_configs = get_enabled_sport_configs()
-            sport_tasks: list[asyncio.Task] = []
+            # F-054: Paper trade settlement runs on its own schedule (cancelled with the rest)
+            sport_tasks: list[asyncio.Task] = [loop.start_settlement_task()]
 
             # F-032c: Moneyline validation gate
             from poly24h.strategy.moneyline_gate import MoneylineValidationGate
@@ -399,6 +445,7 @@ async def sniper_loop(config: BotConfig, threshold: float = 0.48) -> None:
                     rate_limiter=rate_limiter,
                     sport_executor=sport_executor,
                     moneyline_gate=moneyline_gate,
+                    state_path=loop.state_path,
                 )
 
                 async def delayed_start(m, delay):
@@ -428,6 +475,7 @@ async def sniper_loop(config: BotConfig, threshold: float = 0.48) -> None:
                 sport_configs=sport_configs,
                 scan_interval=paired_scan_interval,
                 paper_size_usd=paired_size_usd,
+                paper_trade_dir=str(loop.paper_trade_dir),
             )
             paired_task = asyncio.create_task(sports_paired_scanner.run_forever())
             sport_tasks.append(paired_task)
@@ -453,7 +501,8 @@ async def sniper_loop(config: BotConfig, threshold: float = 0.48) -> None:
             # Inner loop: main event loop
             while not stop_event.is_set():
                 cycle += 1
-                now = datetime.now(tz=timezone.utc)
+                # F-044: Phases follow calibrated exchange time
+                now = get_default_clock().now_datetime()
                 phase = schedule.current_phase(now)
                 secs = schedule.seconds_until_open(now)
 
@@ -510,6 +559,9 @@ async def sniper_loop(config: BotConfig, threshold: float = 0.48) -> None:
                     await asyncio.sleep(backoff)
 
                 # Brief pause between cycles
+                # F-044: PRE_OPEN returns at the open — start SNIPE without the pause
+                if phase.value == "pre_open" and not sports_paired_only:
+                    continue
                 try:
                     await asyncio.wait_for(stop_event.wait(), timeout=1)
                 except asyncio.TimeoutError:
@@ -535,6 +587,10 @@ async def sniper_loop(config: BotConfig, threshold: float = 0.48) -> None:
             # Wait before retry
             await asyncio.sleep(60)
 
+    if ws_manager is not None:
+        await ws_manager.stop()
+    await transport.close()
+    jsonl_writer.close()
     print("Goodbye! 🤙")
 
 
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
+from poly24h.models.market_metadata import MarketMetadata
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +47,12 @@ class Market:
     polymarket_url: str = ""
     slug: str = ""
 
+    # F-052: 질문 파싱 결과 (생성 시 1회)
+    metadata: MarketMetadata = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.metadata = MarketMetadata.parse(self.question)
+
     @property
     def total_cost(self) -> float:
         """YES + NO 가격 합."""
@@ -101,7 +109,7 @@ class Market:
         except (ValueError, AttributeError):
             return None
 
-        return Market(
+        market = Market(
             id=str(raw_mkt.get("id", "")),
             question=raw_mkt.get("question", ""),
             source=source,
@@ -115,3 +123,15 @@ class Market:
             event_title=event.get("title", ""),
             slug=raw_mkt.get("slug", ""),
         )
+
+        # F-052: YES/NO 라벨은 Gamma outcomes 기준 (예: ["Over", "Under"])
+        outcomes = raw_mkt.get("outcomes")
+        if isinstance(outcomes, str):
+            try:
+                outcomes = json.loads(outcomes)
+            except (json.JSONDecodeError, TypeError):
+                outcomes = None
+        if isinstance(outcomes, list) and len(outcomes) >= 2:
+            market.metadata.yes_label = str(outcomes[0])
+            market.metadata.no_label = str(outcomes[1])
+        return market
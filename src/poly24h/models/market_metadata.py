@@ -0,0 +1,117 @@
+"""F-052: Question metadata parsed once per market.
+
+같은 질문 문자열을 여러 곳(odds 매칭, position manager 필터, 로거, fair value)에서
+매번 lower()/정규식/부분 문자열 검색으로 다시 파싱하던 것을 ``Market`` 생성 시
+한 번만 파싱해 ``market.metadata``에 둔다.
+
+- market_type: "moneyline" / "spread" / "totals" / None (BTTS 등 가격 산정 불가)
+- line: spread "(−3.5)" / totals "O/U 220.5"의 라인
+- asset: 크립토 심볼 (BTC, ETH, …) 또는 ""
+- yes_label / no_label: Gamma ``outcomes`` (없으면 Over/Under 또는 Yes/No)
+- 팀처럼 스포츠별 사전이 필요한 값은 ``memo``로 매처/파서당 한 번만 계산
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+CRYPTO_ASSETS = ("BTC", "ETH", "SOL", "XRP", "DOGE", "BNB", "ADA", "MATIC")
+
+SPREAD_LINE_PATTERN = re.compile(r'\(([+-]?\d+\.?\d*)\)')
+TOTALS_LINE_PATTERN = re.compile(r'(?:o/u|over/under)\s+(\d+\.?\d*)')
+
+
+def detect_market_type(question_lower: str) -> str | None:
+    """moneyline / spread / totals, or None for types we can't price (BTTS)."""
+    if "o/u" in question_lower or "over/under" in question_lower or "total" in question_lower:
+        return "totals"
+    if "spread" in question_lower:
+        return "spread"
+    # BTTS (Both Teams to Score) — Odds API doesn't return these in standard query
+    if "both teams" in question_lower or "btts" in question_lower:
+        return None
+    return "moneyline"
+
+
+def parse_line(question_lower: str, market_type: str | None) -> float | None:
+    """Spread/totals line from the question (None for other types or no match)."""
+    if market_type == "totals":
+        match = TOTALS_LINE_PATTERN.search(question_lower)
+    elif market_type == "spread":
+        match = SPREAD_LINE_PATTERN.search(question_lower)
+    else:
+        return None
+    return float(match.group(1)) if match else None
+
+
+def detect_asset(question: str) -> str:
+    question_upper = question.upper()
+    for symbol in CRYPTO_ASSETS:
+        if symbol in question_upper:
+            return symbol
+    return ""
+
+
+@dataclass
+class MarketMetadata:
+    """Parsed view of a market question. Build with ``MarketMetadata.parse``."""
+
+    question_lower: str
+    market_type: Optional[str]
+    line: Optional[float]
+    asset: str
+    is_draw: bool
+    yes_label: str = "Yes"
+    no_label: str = "No"
+    _memo: dict = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def parse(cls, question: str, outcomes: Optional[list] = None) -> MarketMetadata:
+        q = (question or "").lower()
+        market_type = detect_market_type(q)
+        if outcomes and len(outcomes) >= 2:
+            yes_label, no_label = str(outcomes[0]), str(outcomes[1])
+        elif market_type == "totals":
+            yes_label, no_label = "Over", "Under"
+        else:
+            yes_label, no_label = "Yes", "No"
+        return cls(
+            question_lower=q,
+            market_type=market_type,
+            line=parse_line(q, market_type),
+            asset=detect_asset(question or ""),
+            is_draw="draw" in q,
+            yes_label=yes_label,
+            no_label=no_label,
+        )
+
+    @property
+    def position_type(self) -> str:
+        """PositionManager's event-dedup type: "ou" / "spread" / "moneyline"."""
+        if self.market_type == "totals":
+            return "ou"
+        if self.market_type == "spread":
+            return "spread"
+        return "moneyline"
+
+    @property
+    def is_moneyline(self) -> bool:
+        return self.position_type == "moneyline"
+
+    def memo(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Compute a parser-dependent value (e.g. teams per sport) once."""
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+
+
+def market_metadata(market) -> MarketMetadata:
+    """``market.metadata`` — parsed on the fly for objects without one (mocks, duck types)."""
+    metadata = getattr(market, "metadata", None)
+    if isinstance(metadata, MarketMetadata):
+        return metadata
+    return MarketMetadata.parse(str(getattr(market, "question", "") or ""))
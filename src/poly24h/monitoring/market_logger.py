@@ -21,6 +21,9 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
+from poly24h.jsonl_writer import JsonlWriter, get_default_writer
+from poly24h.models.market_metadata import detect_asset
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,11 +67,7 @@ def extract_asset_symbol(question: str) -> str:
         "Will ETH go up in the next 1 hour?" → "ETH"
         "Lakers vs Celtics" → ""
     """
-    question_upper = question.upper()
-    for symbol in ("BTC", "ETH", "SOL", "XRP", "DOGE", "ADA", "MATIC"):
-        if symbol in question_upper:
-            return symbol
-    return ""
+    return detect_asset(question)
 
 
 class MarketOpportunityLogger:
@@ -77,8 +76,14 @@ class MarketOpportunityLogger:
     Writes to JSONL and maintains in-memory stats.
     """
 
-    def __init__(self, data_dir: str = "data/paper_trades"):
+    def __init__(
+        self,
+        data_dir: str = "data/paper_trades",
+        writer: JsonlWriter | None = None,
+    ):
         self.data_dir = Path(data_dir)
+        # F-055: 기록은 공용 백그라운드 writer에 enqueue만 한다
+        self._writer = writer or get_default_writer()
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self._records: list[OpportunityRecord] = []
         # In-memory aggregation
@@ -96,6 +101,7 @@ class MarketOpportunityLogger:
         seconds_since_open: float = 0.0,
         detection_source: str = "http_poll",
         is_paired: bool = False,
+        asset_symbol: str | None = None,
     ) -> OpportunityRecord:
         """Record an opportunity detection event.
 
@@ -109,12 +115,14 @@ class MarketOpportunityLogger:
             seconds_since_open: Time since market open.
             detection_source: How detected (ws_cache, http_poll, orderbook).
             is_paired: Whether this is part of a paired entry.
+            asset_symbol: Pre-parsed asset (``market.metadata.asset``);
+                parsed from market_question when None.
 
         Returns:
             Created OpportunityRecord.
         """
         now = datetime.now(tz=timezone.utc)
-        asset = extract_asset_symbol(market_question)
+        asset = extract_asset_symbol(market_question) if asset_symbol is None else asset_symbol
 
         rec = OpportunityRecord(
             market_id=market_id,
@@ -142,8 +150,7 @@ class MarketOpportunityLogger:
     def _append_to_jsonl(self, rec: OpportunityRecord, now: datetime) -> None:
         """Append record to today's market stats JSONL."""
         file_path = self.data_dir / f"market_stats_{now.strftime('%Y-%m-%d')}.jsonl"
-        with open(file_path, "a") as f:
-            f.write(json.dumps(rec.to_dict()) + "\n")
+        self._writer.append(file_path, json.dumps(rec.to_dict()))
 
     # ------------------------------------------------------------------
     # Statistics
@@ -261,6 +268,7 @@ class MarketOpportunityLogger:
         if date is None:
             date = datetime.now(tz=timezone.utc)
         file_path = self.data_dir / f"market_stats_{date.strftime('%Y-%m-%d')}.jsonl"
+        self._writer.flush()
         if not file_path.exists():
             return []
 
@@ -11,15 +11,22 @@ Inspired by polymarket_trader's settlement_tracker.py and dryrun_pnl.py.
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import json
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal
 
 import aiohttp
 
+from poly24h.http_transport import HttpTransport, get_default_transport
+from poly24h.rate_limiter import PRIORITY_BACKGROUND, priority_scope
+from poly24h.trade_store import TradeStore
+
 logger = logging.getLogger(__name__)
 
 Winner = Literal["YES", "NO", "pending", "unknown"]
@@ -102,38 +109,74 @@ class SettlementSummary:
 class PaperSettlementTracker:
     """Tracks paper trades and resolves them via Gamma API.
 
-    Stores trades in JSONL files: data/paper_trades/YYYY-MM-DD.jsonl
+    F-053: Trades live in the ``TradeStore`` (data/paper_trades/trades.db),
+    opened on first use unless injected.
+    Legacy day files (YYYY-MM-DD.jsonl) are imported when they change and
+    can be re-created with ``export_trades``.
+    F-054: Open trades are settled in end-date order (see ``check_and_settle``/``run``).
     """
 
-    def __init__(self, data_dir: str = "data/paper_trades"):
+    MAX_CONCURRENT_QUERIES = 8
+    RETRY_BASE_SECS = 60.0     # first retry of a still-pending market
+    RETRY_MAX_SECS = 1800.0    # backoff cap
+    IDLE_WAKE_SECS = 300.0     # run(): re-check for externally written trades
+
+    def __init__(
+        self,
+        data_dir: str = "data/paper_trades",
+        transport: HttpTransport | None = None,
+        store: TradeStore | None = None,
+        grace_minutes: int = 5,
+        max_concurrency: int = MAX_CONCURRENT_QUERIES,
+        retry_base_secs: float = RETRY_BASE_SECS,
+        retry_max_secs: float = RETRY_MAX_SECS,
+        clock: Callable[[], float] = time.time,
+    ):
         self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        # F-034: 공유 커넥션 풀 (쿼리마다 세션 생성하지 않음)
+        self._transport = transport or get_default_transport()
+        self._store: TradeStore | None = store
         self._cumulative_pnl: float = 0.0
         self._wins: int = 0
         self._losses: int = 0
-        self._recorded_market_ids: set[str] = set()  # Dedup: prevent duplicate JSONL writes
+        self._recorded_market_ids: set[str] = set()  # Dedup: prevent duplicate writes
+        # F-054: min-heap of (end_date + grace, market_id) over open trades
+        self.grace_minutes = grace_minutes
+        self.max_concurrency = max_concurrency
+        self.retry_base_secs = retry_base_secs
+        self.retry_max_secs = retry_max_secs
+        self._clock = clock
+        self._due: list[tuple[float, str]] = []
+        self._open: dict[str, PaperTrade] = {}   # queued, unsettled (by market)
+        self._attempts: dict[str, int] = {}      # due but unresolved → retries so far
+        self._undated: set[str] = set()          # unparsable end_date, never queued
+        self._store_cursor = 0
+        self._totals_loaded = False
+        self._settled_count = 0
+        self._wake: asyncio.Event | None = None
 
-    def _get_file_path(self, date: datetime | None = None) -> Path:
+    @property
+    def store(self) -> TradeStore:
+        if self._store is None:
+            self._store = TradeStore.for_dir(self.data_dir)
+        return self._store
+
+    @staticmethod
+    def _day(date: datetime | None = None) -> str:
         if date is None:
             date = datetime.now(tz=timezone.utc)
-        return self.data_dir / f"{date.strftime('%Y-%m-%d')}.jsonl"
+        return date.strftime("%Y-%m-%d")
+
+    def _get_file_path(self, date: datetime | None = None) -> Path:
+        return self.data_dir / f"{self._day(date)}.jsonl"
 
     def _load_recorded_ids(self, date: datetime | None = None) -> None:
-        """Load already-recorded market IDs from today's file for dedup."""
+        """Load already-recorded market IDs for today from the store for dedup."""
         if self._recorded_market_ids:
             return  # Already loaded
-        file_path = self._get_file_path(date)
-        if not file_path.exists():
-            return
         try:
-            with open(file_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        data = json.loads(line)
-                        mid = data.get("market_id", "")
-                        if mid:
-                            self._recorded_market_ids.add(mid)
+            self.store.import_jsonl(self._get_file_path(date))
+            self._recorded_market_ids.update(self.store.market_ids(self._day(date)))
         except Exception as e:
             logger.warning("Failed to load recorded IDs: %s", e)
 
@@ -149,34 +192,30 @@ class PaperSettlementTracker:
             return
 
         self._recorded_market_ids.add(trade.market_id)
-        file_path = self._get_file_path()
-        with open(file_path, "a") as f:
-            f.write(json.dumps(trade.to_dict()) + "\n")
+        try:
+            self.store.insert(trade.to_dict(), self._day())
+        except Exception as e:
+            logger.warning("[PAPER-TRADE] Store write failed for %s: %s", trade.market_id, e)
+            return
         logger.info(
             "[PAPER-TRADE] %s %s@$%.4f $%.2f | %s",
             trade.side, trade.market_question[:40],
             trade.price, trade.cost, trade.market_source,
         )
+        if self._wake is not None:
+            self._wake.set()  # run(): queue it on the next pass
 
     def load_trades(self, date: datetime | None = None) -> list[PaperTrade]:
         """Load all trades for a given date."""
-        file_path = self._get_file_path(date)
-        if not file_path.exists():
-            return []
-        trades = []
-        with open(file_path) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    trades.append(PaperTrade.from_dict(json.loads(line)))
-        return trades
-
-    def _save_trades(self, trades: list[PaperTrade], date: datetime | None = None) -> None:
-        """Overwrite trades file for a given date."""
-        file_path = self._get_file_path(date)
-        with open(file_path, "w") as f:
-            for trade in trades:
-                f.write(json.dumps(trade.to_dict()) + "\n")
+        self.store.import_jsonl(self._get_file_path(date))
+        return [
+            PaperTrade.from_dict(record)
+            for record in self.store.iter_trades(days=[self._day(date)])
+        ]
+
+    def export_trades(self, date: datetime | None = None) -> int:
+        """Write a day's trades (with current settlement) to its JSONL file."""
+        return self.store.export_jsonl(self._day(date), self._get_file_path(date))
 
     async def query_market_result(self, market_id: str) -> Winner:
         """Query Gamma API for market settlement.
@@ -185,38 +224,37 @@ class PaperSettlementTracker:
         """
         url = f"{GAMMA_API_URL}/markets/{market_id}"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status != 200:
-                        logger.warning(
-                            "[SETTLEMENT] API error for %s: %d", market_id, resp.status
-                        )
-                        return "unknown"
-
-                    data = await resp.json()
-                    if not data:
-                        return "unknown"
-
-                    # Check if closed
-                    closed = data.get("closed", False)
-                    if not closed:
-                        return "pending"
-
-                    # Check outcomePrices — winner has price ~1.0
-                    outcome_prices = data.get("outcomePrices")
-                    if outcome_prices:
-                        if isinstance(outcome_prices, str):
-                            outcome_prices = json.loads(outcome_prices)
-                        if len(outcome_prices) >= 2:
-                            yes_price = float(outcome_prices[0])
-                            no_price = float(outcome_prices[1])
-                            if yes_price >= 0.99:
-                                return "YES"
-                            if no_price >= 0.99:
-                                return "NO"
+            async with self._transport.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status != 200:
+                    logger.warning(
+                        "[SETTLEMENT] API error for %s: %d", market_id, resp.status
+                    )
+                    return "unknown"
 
+                data = await resp.json()
+                if not data:
                     return "unknown"
 
+                # Check if closed
+                closed = data.get("closed", False)
+                if not closed:
+                    return "pending"
+
+                # Check outcomePrices — winner has price ~1.0
+                outcome_prices = data.get("outcomePrices")
+                if outcome_prices:
+                    if isinstance(outcome_prices, str):
+                        outcome_prices = json.loads(outcome_prices)
+                    if len(outcome_prices) >= 2:
+                        yes_price = float(outcome_prices[0])
+                        no_price = float(outcome_prices[1])
+                        if yes_price >= 0.99:
+                            return "YES"
+                        if no_price >= 0.99:
+                            return "NO"
+
+                return "unknown"
+
         except Exception as exc:
             logger.warning("[SETTLEMENT] Query error for %s: %s", market_id, exc)
             return "unknown"
@@ -247,114 +285,152 @@ class PaperSettlementTracker:
         return pnl
 
     async def check_and_settle(
-        self, date: datetime | None = None, grace_minutes: int = 5,
+        self, date: datetime | None = None, grace_minutes: int | None = None,
     ) -> SettlementSummary:
-        """Check all open trades for settlement.
+        """Settle every open trade that has become resolvable.
 
-        Iterates through today's trades, queries expired markets,
-        updates P&L, and returns summary.
+        F-054: Open trades sit in a min-heap keyed by ``end_date + grace``
+        (end_date parsed once, when the trade is first seen). Only due markets
+        are queried — concurrently, ``max_concurrency`` at a time in the
+        background rate-limit lane. Markets still pending are re-queued with
+        exponential backoff.
 
         Args:
-            date: Date to check (default: today).
-            grace_minutes: Wait this many minutes past end_date before querying.
+            date: Day whose (and the previous day's) legacy JSONL files are
+                imported first (default: today).
+            grace_minutes: Override the grace period for newly queued trades.
                 Gives Polymarket time to resolve the market.
         """
-        now = datetime.now(tz=timezone.utc)
-        # F-023 #0: Load today + yesterday to handle midnight boundary
-        trades = self.load_trades(date or now)
-        yesterday = (date or now) - timedelta(days=1)
-        yesterday_trades = self.load_trades(yesterday)
-        # Merge with dedup by market_id
-        seen_ids = {t.market_id for t in trades}
-        for yt in yesterday_trades:
-            if yt.market_id not in seen_ids:
-                seen_ids.add(yt.market_id)
-                trades.append(yt)
-        summary = SettlementSummary()
-        newly_settled = 0
-
-        for trade in trades:
-            # F-023 #4: Skip test market IDs (non-numeric)
-            if not trade.market_id.isdigit():
-                continue
-
-            if trade.status == "settled":
-                summary.total_settled += 1
-                self._cumulative_pnl += trade.pnl
-                if trade.pnl > 0:
-                    summary.wins += 1
-                    self._wins += 1
-                elif trade.pnl < 0:
-                    summary.losses += 1
-                    self._losses += 1
-                continue
-
-            # Check if past end_date
-            try:
-                end_dt = datetime.fromisoformat(
-                    trade.end_date.replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
-                summary.total_open += 1
-                continue
-
-            if now < end_dt:
-                summary.total_open += 1
-                continue
-
-            # Grace period: wait a few minutes for market to resolve
-            grace_dt = end_dt + timedelta(minutes=grace_minutes)
-            if now < grace_dt:
-                summary.total_expired += 1
-                continue
-
-            # Past end_date + grace — try to settle
-            winner = await self.query_market_result(trade.market_id)
-
+        if grace_minutes is not None:
+            self.grace_minutes = grace_minutes
+        self._refresh(date)
+
+        now_ts = self._clock()
+        due_ids: list[str] = []
+        while self._due and self._due[0][0] <= now_ts:
+            _, market_id = heapq.heappop(self._due)
+            if market_id in self._open and market_id not in due_ids:
+                due_ids.append(market_id)
+
+        winners = await self._resolve_many(due_ids)
+        settled_now: list[PaperTrade] = []
+        for market_id, winner in zip(due_ids, winners):
             if winner in ("YES", "NO"):
+                trade = self._open.pop(market_id)
+                self._attempts.pop(market_id, None)
                 pnl = self.settle_trade(trade, winner)
-                self._cumulative_pnl += pnl
-                newly_settled += 1
-                summary.total_settled += 1
-
-                if pnl > 0:
-                    summary.wins += 1
-                    self._wins += 1
-                elif pnl < 0:
-                    summary.losses += 1
-                    self._losses += 1
-
+                settled_now.append(trade)
+                self._record_result(pnl)
                 logger.info(
                     "[SETTLEMENT] %s → %s | P&L: $%.2f | %s",
                     trade.market_question[:40], winner, pnl,
                     trade.side,
                 )
-            elif winner == "pending":
-                summary.total_expired += 1
             else:
-                summary.total_expired += 1
-
-        # Save updated trades (to both today + yesterday files if needed)
-        if newly_settled > 0:
-            today_trades = []
-            yesterday_trades_out = []
-            today_str = (date or now).strftime("%Y-%m-%d")
-            yesterday_str = yesterday.strftime("%Y-%m-%d")
-            for t in trades:
-                # Route trade back to its original file based on timestamp
-                ts_date = t.timestamp[:10] if len(t.timestamp) >= 10 else today_str
-                if ts_date == yesterday_str:
-                    yesterday_trades_out.append(t)
-                else:
-                    today_trades.append(t)
-            if today_trades:
-                self._save_trades(today_trades, date or now)
-            if yesterday_trades_out:
-                self._save_trades(yesterday_trades_out, yesterday)
-
-        summary.newly_settled = newly_settled
-        summary.cumulative_pnl = self._cumulative_pnl
-        return summary
+                attempts = self._attempts.get(market_id, 0) + 1
+                self._attempts[market_id] = attempts
+                delay = min(self.retry_base_secs * 2 ** (attempts - 1), self.retry_max_secs)
+                heapq.heappush(self._due, (now_ts + delay, market_id))
+
+        # F-053: In-place status update (no day-file rewrite)
+        if settled_now:
+            try:
+                self.store.update_settlements(t.to_dict() for t in settled_now)
+            except Exception as e:
+                logger.warning("[SETTLEMENT] Store update failed: %s", e)
+
+        return SettlementSummary(
+            total_open=len(self._open) - len(self._attempts) + len(self._undated),
+            total_settled=self._settled_count,
+            total_expired=len(self._attempts),
+            newly_settled=len(settled_now),
+            cumulative_pnl=self._cumulative_pnl,
+            wins=self._wins,
+            losses=self._losses,
+        )
+
+    def seconds_until_next_due(self) -> float | None:
+        """Seconds until the next open trade becomes resolvable (None if none)."""
+        while self._due and self._due[0][1] not in self._open:
+            heapq.heappop(self._due)  # settled or re-queued entry
+        if not self._due:
+            return None
+        return max(0.0, self._due[0][0] - self._clock())
+
+    async def run(
+        self, on_settled: Callable[[SettlementSummary], None] | None = None,
+    ) -> None:
+        """Settle trades as they become resolvable. Runs until cancelled.
+
+        Sleeps until the next due trade (at most ``IDLE_WAKE_SECS``, to pick
+        up trades written elsewhere) or until ``record_trade`` wakes it.
+        """
+        self._wake = asyncio.Event()
+        while True:
+            try:
+                summary = await self.check_and_settle()
+                if summary.newly_settled and on_settled is not None:
+                    on_settled(summary)
+            except Exception:
+                logger.exception("[SETTLEMENT] Settlement pass failed")
+            delay = self.seconds_until_next_due()
+            delay = self.IDLE_WAKE_SECS if delay is None else min(delay, self.IDLE_WAKE_SECS)
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def _refresh(self, date: datetime | None) -> None:
+        """Queue open trades added to the store since the last pass."""
+        day = date or datetime.now(tz=timezone.utc)
+        # F-023 #0: today + yesterday day files (midnight boundary)
+        for d in (day, day - timedelta(days=1)):
+            self.store.import_jsonl(self._get_file_path(d))
+        if not self._totals_loaded:
+            self._settled_count, self._wins, self._losses, self._cumulative_pnl = (
+                self.store.settled_totals()
+            )
+            self._totals_loaded = True
+        records, self._store_cursor = self.store.open_trades_since(self._store_cursor)
+        for record in records:
+            self._schedule(PaperTrade.from_dict(record))
+
+    def _schedule(self, trade: PaperTrade) -> None:
+        # F-023 #4: Skip test market IDs (non-numeric)
+        if not trade.market_id.isdigit() or trade.market_id in self._open:
+            return
+        try:
+            end_dt = datetime.fromisoformat(trade.end_date.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            self._undated.add(trade.market_id)
+            return
+        self._open[trade.market_id] = trade
+        due = end_dt.timestamp() + self.grace_minutes * 60
+        heapq.heappush(self._due, (due, trade.market_id))
+
+    async def _resolve_many(self, market_ids: list[str]) -> list[Winner]:
+        if not market_ids:
+            return []
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def resolve(market_id: str) -> Winner:
+            async with sem:
+                return await self.query_market_result(market_id)
+
+        with priority_scope(PRIORITY_BACKGROUND):
+            results = await asyncio.gather(
+                *(resolve(m) for m in market_ids), return_exceptions=True,
+            )
+        return [r if isinstance(r, str) else "unknown" for r in results]
+
+    def _record_result(self, pnl: float) -> None:
+        self._settled_count += 1
+        self._cumulative_pnl += pnl
+        if pnl > 0:
+            self._wins += 1
+        elif pnl < 0:
+            self._losses += 1
 
     def format_settlement_report(self, summary: SettlementSummary) -> str:
         """Format settlement summary for Telegram."""
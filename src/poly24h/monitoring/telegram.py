@@ -9,8 +9,7 @@ from __future__ import annotations
 import logging
 from typing import Union
 
-import aiohttp
-
+from poly24h.http_transport import HttpTransport, get_default_transport
 from poly24h.models.negrisk import NegRiskOpportunity
 from poly24h.models.opportunity import Opportunity
 from poly24h.pipeline import SessionSummary, TradeRecord
@@ -26,15 +25,18 @@ class TelegramAlerter:
     Args:
         bot_token: Telegram Bot API 토큰. None이면 비활성.
         chat_id: 메시지 대상 채팅 ID. None이면 비활성.
+        transport: F-034 공유 HTTP transport. None이면 프로세스 기본값.
     """
 
     def __init__(
         self,
         bot_token: str | None = None,
         chat_id: str | None = None,
+        transport: HttpTransport | None = None,
     ):
         self._bot_token = bot_token
         self._chat_id = chat_id
+        self._transport = transport or get_default_transport()
 
     @property
     def enabled(self) -> bool:
@@ -103,11 +105,10 @@ class TelegramAlerter:
             "text": text,
             "parse_mode": parse_mode,
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    logger.warning("Telegram API %d: %s", resp.status, body[:200])
+        async with self._transport.post(url, json=payload) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                logger.warning("Telegram API %d: %s", resp.status, body[:200])
 
     # ------------------------------------------------------------------
     # Formatting helpers
@@ -11,6 +11,8 @@ Manages positions like a real trading system:
 - F-023 #1: Max 1 Spread entry per event
 - F-023 #2: Max entries per SNIPE cycle
 - P2-2: Max concurrent positions and exposure ratio limits
+- F-042: Append-only journal (entry/settle/daily reset) + periodic snapshot
+- F-041: Reservations hold a slot + bankroll while a live order is in flight
 """
 
 from __future__ import annotations
@@ -23,8 +25,15 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from poly24h.journal import Journal
+from poly24h.models.market_metadata import MarketMetadata, market_metadata
+from poly24h.trade_store import DB_NAME, TradeStore
+
 logger = logging.getLogger(__name__)
 
+# F-042: save_state()가 스냅샷을 다시 쓰기 전까지 쌓을 저널 이벤트 수
+DEFAULT_COMPACT_EVERY = 200
+
 
 @dataclass
 class Position:
@@ -66,8 +75,6 @@ class PositionManager:
     SPORTS_MONEYLINE_MIN_PRICE = 0.35
     # Market sources that use moneyline filter
     _SPORTS_SOURCES = {"nba", "nhl", "soccer"}
-    # Keywords that indicate non-moneyline (spread/O/U) markets
-    _NON_MONEYLINE_KEYWORDS = ("spread", "o/u", "over/under", "total")
 
     def __init__(
         self,
@@ -77,6 +84,8 @@ class PositionManager:
         max_exposure_ratio: float = 0.0,
         max_entries_per_cycle: int = 10,
         max_daily_deployment_usd: float = 0.0,
+        journal_path: Path | None = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
     ):
         """Initialize position manager.
 
@@ -87,6 +96,8 @@ class PositionManager:
             max_exposure_ratio: Max total_invested / initial_bankroll (0 = unlimited)
             max_entries_per_cycle: Max entries per SNIPE cycle (0 = unlimited)
             max_daily_deployment_usd: F-027 daily deployment cap (0 = unlimited)
+            journal_path: F-042 append-only journal (None = snapshot only)
+            compact_every: F-042 journal events before save_state() re-snapshots
         """
         self._initial_bankroll = bankroll  # F-022: track initial
         self.bankroll = bankroll
@@ -117,6 +128,17 @@ class PositionManager:
         self._max_daily_deployment_usd = max_daily_deployment_usd
         self._daily_deployed: float = 0.0
         self._daily_reset_date: str = ""
+        # F-042: Write-ahead journal — entry/settle/reset은 한 줄 append,
+        # save_state()는 compact_every 이벤트마다만 전체 스냅샷을 쓴다.
+        self._journal = Journal(journal_path) if journal_path else None
+        self._compact_every = compact_every
+        self._snapshot_seq: int = 0
+        # 스냅샷을 로드/저장한 적이 없으면 (없거나 깨진 파일) 다음 save_state에서 새로 씀
+        self._snapshot_current = False
+        # F-053: {"trades.db": [마지막으로 동기화한 row id]} — 이후 추가분만 읽음
+        self._synced_files: dict[str, list[int]] = {}
+        # F-041: market_id -> 주문 체결 대기 중 예약된 USD (메모리 전용, 저널 X)
+        self._reservations: dict[str, float] = {}
 
     @property
     def active_position_count(self) -> int:
@@ -134,10 +156,12 @@ class PositionManager:
 
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         if today != self._daily_reset_date:
-            self._daily_deployed = 0.0
-            self._daily_reset_date = today
+            self._apply_daily_reset(today)
+            self._journal_append({"type": "daily_reset", "date": today})
 
-        remaining = self._max_daily_deployment_usd - self._daily_deployed
+        remaining = (
+            self._max_daily_deployment_usd - self._daily_deployed - self._reserved_usd
+        )
         if remaining <= 0:
             return 0.0
         return min(size_usd, remaining)
@@ -238,11 +262,7 @@ class PositionManager:
 
         Returns False for spread or O/U markets.
         """
-        q = question.lower()
-        for kw in PositionManager._NON_MONEYLINE_KEYWORDS:
-            if kw in q:
-                return False
-        return True
+        return MarketMetadata.parse(question).is_moneyline
 
     @staticmethod
     def _detect_market_type(question: str) -> str:
@@ -251,12 +271,7 @@ class PositionManager:
         Returns:
             "ou" for Over/Under, "spread" for spread, "moneyline" otherwise.
         """
-        q = question.lower()
-        if "o/u" in q or "over/under" in q or "total" in q:
-            return "ou"
-        if "spread" in q:
-            return "spread"
-        return "moneyline"
+        return MarketMetadata.parse(question).position_type
 
     def should_skip_entry(
         self,
@@ -283,9 +298,11 @@ class PositionManager:
             else str(market.source)
         )
 
+        meta = market_metadata(market)  # F-052: parsed once per market
+
         # P0-1: Sports moneyline minimum price
         if source_val in self._SPORTS_SOURCES:
-            if self._is_moneyline_market(market.question):
+            if meta.is_moneyline:
                 if trigger_price < self.SPORTS_MONEYLINE_MIN_PRICE:
                     logger.info(
                         "P0-1 SKIP: %s moneyline at $%.2f < $%.2f min | %s",
@@ -297,7 +314,7 @@ class PositionManager:
                     return True
 
         # F-023 #1: O/U and Spread per-event limit (1 each per event)
-        market_type = self._detect_market_type(market.question)
+        market_type = meta.position_type
         if market_type in ("ou", "spread") and market.event_id:
             event_types = self._event_type_entries.get(market.event_id, {})
             if market_type in event_types:
@@ -314,26 +331,61 @@ class PositionManager:
 
         return False
 
+    @property
+    def _reserved_usd(self) -> float:
+        return sum(self._reservations.values())
+
     def can_enter(self, market_id: str) -> bool:
         """Check if we can enter a position in this market.
 
         Returns False if:
-        - Already have a position in this market
-        - Insufficient bankroll (< $1)
-        - P2-2: At max concurrent positions
+        - Already have (or have reserved) a position in this market
+        - Insufficient bankroll (< $1) after reservations
+        - P2-2: At max concurrent positions (reservations included)
         """
-        if market_id in self._positions:
+        if market_id in self._positions or market_id in self._reservations:
             return False
-        if self.bankroll < self.MIN_POSITION_SIZE:
+        if self.bankroll - self._reserved_usd < self.MIN_POSITION_SIZE:
             return False
         # P2-2: Concurrent position limit
         if (
             self._max_concurrent_positions > 0
-            and self.active_position_count >= self._max_concurrent_positions
+            and self.active_position_count + len(self._reservations)
+            >= self._max_concurrent_positions
         ):
             return False
         return True
 
+    def reserve(self, market_id: str, size_usd: float) -> float:
+        """F-041: Hold a slot and bankroll for an order that is about to go live.
+
+        Same limits as ``enter_position``. The reservation is consumed by the
+        next ``enter_position`` for the market, or returned by ``release``.
+
+        Returns:
+            Reserved USD (possibly smaller than requested), 0.0 if cannot enter.
+        """
+        with self._lock:
+            if not self.can_enter(market_id):
+                return 0.0
+            if (
+                self._max_entries_per_cycle > 0
+                and self._cycle_entries + len(self._reservations)
+                >= self._max_entries_per_cycle
+            ):
+                return 0.0
+            available = min(self.max_per_market, self.bankroll - self._reserved_usd)
+            size_usd = self._apply_daily_cap(min(size_usd, available))
+            if size_usd < self.MIN_POSITION_SIZE:
+                return 0.0
+            self._reservations[market_id] = size_usd
+            return size_usd
+
+    def release(self, market_id: str) -> None:
+        """F-041: Drop a reservation whose order did not fill."""
+        with self._lock:
+            self._reservations.pop(market_id, None)
+
     def enter_position(
         self,
         market_id: str,
@@ -350,6 +402,8 @@ class PositionManager:
         F-022: Added lock to prevent concurrent entry causing bankroll overrun.
         P0-2: Tracks event_id + market_type for O/U dedup.
         F-024: Added size_override for Kelly-sized positions.
+        F-041: A ``reserve``d market enters at its reserved size (capped by
+        size_override) without re-checking limits the reservation already holds.
 
         Args:
             market_id: Unique market identifier
@@ -365,10 +419,19 @@ class PositionManager:
             Position object if successful, None if cannot enter
         """
         with self._lock:  # F-022: Ensure thread safety
+            reserved = self._reservations.pop(market_id, 0.0)
+            if reserved > 0 and market_id not in self._positions:
+                size_usd = min(size_override, reserved) if size_override > 0 else reserved
+                return self._enter_locked(
+                    market_id, market_question, side, price, end_date,
+                    event_id, market_type, size_usd,
+                )
+
             # F-023 #2: Cycle entry cap
             if (
                 self._max_entries_per_cycle > 0
-                and self._cycle_entries >= self._max_entries_per_cycle
+                and self._cycle_entries + len(self._reservations)
+                >= self._max_entries_per_cycle
             ):
                 logger.debug(
                     "Cannot enter %s: cycle cap reached (%d/%d)",
@@ -385,15 +448,16 @@ class PositionManager:
                 )
                 return None
 
-            if self.bankroll < self.MIN_POSITION_SIZE:
+            bankroll = self.bankroll - self._reserved_usd  # F-041
+            if bankroll < self.MIN_POSITION_SIZE:
                 logger.debug(
                     "Cannot enter %s: insufficient bankroll ($%.2f)",
-                    market_id, self.bankroll,
+                    market_id, bankroll,
                 )
                 return None
 
             # F-022: Double-check available bankroll under lock
-            available_for_trade = min(self.max_per_market, self.bankroll)
+            available_for_trade = min(self.max_per_market, bankroll)
             if available_for_trade < self.MIN_POSITION_SIZE:
                 logger.debug(
                     "Cannot enter %s: available $%.2f < min $%.2f",
@@ -417,49 +481,62 @@ class PositionManager:
                 )
                 return None
 
-            shares = size_usd / price if price > 0 else 0
-
-            position = Position(
-                market_id=market_id,
-                market_question=market_question,
-                side=side,
-                entry_price=price,
-                size_usd=size_usd,
-                shares=shares,
-                entry_time=datetime.now(timezone.utc).isoformat(),
-                end_date=end_date,
-                status="open",
+            return self._enter_locked(
+                market_id, market_question, side, price, end_date,
+                event_id, market_type, size_usd,
             )
 
-            self._positions[market_id] = position
-            self.bankroll -= size_usd
-            self._total_invested += size_usd  # F-022: track total
-
-            # F-023 #1: Track O/U and Spread entries per event
-            if not market_type:
-                market_type = self._detect_market_type(market_question)
-            if market_type in ("ou", "spread") and event_id:
-                if event_id not in self._event_type_entries:
-                    self._event_type_entries[event_id] = {}
-                self._event_type_entries[event_id][market_type] = market_id
-
-            # F-023 #2: Increment cycle counter
-            self._cycle_entries += 1
-            # F-024: Track cycle investment for budget enforcement
-            self._cycle_invested += size_usd
-            # F-027: Track daily deployment
-            self._daily_deployed += size_usd
+    def _enter_locked(
+        self,
+        market_id: str,
+        market_question: str,
+        side: str,
+        price: float,
+        end_date: str,
+        event_id: str,
+        market_type: str,
+        size_usd: float,
+    ) -> Position:
+        """Record an entry whose size already passed the limits. Caller holds the lock."""
+        shares = size_usd / price if price > 0 else 0
+
+        position = Position(
+            market_id=market_id,
+            market_question=market_question,
+            side=side,
+            entry_price=price,
+            size_usd=size_usd,
+            shares=shares,
+            entry_time=datetime.now(timezone.utc).isoformat(),
+            end_date=end_date,
+            status="open",
+        )
 
-            logger.info(
-                "[POSITION ENTRY] %s | Side: %s @ %.2f | "
-                "Size: $%.2f (%.2f shares) | "
-                "Bankroll: $%.2f | Total Invested: $%.2f",
-                market_question, side, price,
-                size_usd, shares,
-                self.bankroll, self._total_invested,
-            )
+        if not market_type:
+            market_type = self._detect_market_type(market_question)
+        self._apply_entry(position, event_id, market_type)
+        self._journal_append({
+            "type": "entry",
+            "position": position.to_dict(),
+            "event_id": event_id,
+            "market_type": market_type,
+        })
+
+        # F-023 #2: Increment cycle counter
+        self._cycle_entries += 1
+        # F-024: Track cycle investment for budget enforcement
+        self._cycle_invested += size_usd
+
+        logger.info(
+            "[POSITION ENTRY] %s | Side: %s @ %.2f | "
+            "Size: $%.2f (%.2f shares) | "
+            "Bankroll: $%.2f | Total Invested: $%.2f",
+            market_question, side, price,
+            size_usd, shares,
+            self.bankroll, self._total_invested,
+        )
 
-            return position
+        return position
 
     def settle_position(self, market_id: str, winner: str) -> float:
         """Settle a position and calculate P&L.
@@ -476,31 +553,10 @@ class PositionManager:
             if position is None:
                 return 0.0
 
-            # Calculate P&L
-            if position.side == winner:
-                # Win: payout = shares * $1
-                payout = position.shares * 1.0
-                pnl = payout - position.size_usd
-                self._wins += 1
-            else:
-                # Loss: lose entire position
-                pnl = -position.size_usd
-                self._losses += 1
-
-            # Update bankroll (add back position + P&L)
-            # If won: bankroll += size + profit
-            # If lost: bankroll stays same (already deducted on entry)
-            if pnl > 0:
-                self.bankroll += position.size_usd + pnl
-            # If lost, bankroll was already reduced on entry, nothing to add back
-
-            # Track stats
-            self._cumulative_pnl += pnl
-            self._total_settled += 1
-            self._total_invested -= position.size_usd  # F-022
-
-            # Remove position
-            del self._positions[market_id]
+            pnl = self._apply_settlement(position, winner)
+            self._journal_append({
+                "type": "settle", "market_id": market_id, "winner": winner,
+            })
 
             result = "WIN" if pnl > 0 else "LOSS"
             logger.info(
@@ -514,6 +570,107 @@ class PositionManager:
 
             return pnl
 
+    # ------------------------------------------------------------------
+    # F-042: State transitions (shared by live calls and journal replay)
+    # ------------------------------------------------------------------
+
+    def _apply_entry(self, position: Position, event_id: str, market_type: str) -> None:
+        market_id = position.market_id
+        self._positions[market_id] = position
+        self.bankroll -= position.size_usd
+        self._total_invested += position.size_usd  # F-022: track total
+
+        # F-023 #1: Track O/U and Spread entries per event
+        if market_type in ("ou", "spread") and event_id:
+            if event_id not in self._event_type_entries:
+                self._event_type_entries[event_id] = {}
+            self._event_type_entries[event_id][market_type] = market_id
+
+        # F-027: Track daily deployment
+        self._daily_deployed += position.size_usd
+
+    def _apply_settlement(self, position: Position, winner: str) -> float:
+        # Calculate P&L
+        if position.side == winner:
+            # Win: payout = shares * $1
+            payout = position.shares * 1.0
+            pnl = payout - position.size_usd
+            self._wins += 1
+        else:
+            # Loss: lose entire position
+            pnl = -position.size_usd
+            self._losses += 1
+
+        # Update bankroll (add back position + P&L)
+        # If won: bankroll += size + profit
+        # If lost: bankroll stays same (already deducted on entry)
+        if pnl > 0:
+            self.bankroll += position.size_usd + pnl
+        # If lost, bankroll was already reduced on entry, nothing to add back
+
+        # Track stats
+        self._cumulative_pnl += pnl
+        self._total_settled += 1
+        self._total_invested -= position.size_usd  # F-022
+
+        # Remove position
+        del self._positions[position.market_id]
+        return pnl
+
+    def _apply_daily_reset(self, date: str) -> None:
+        self._daily_deployed = 0.0
+        self._daily_reset_date = date
+
+    def _apply_sync(self, positions: list[Position], files: dict[str, list[int]]) -> None:
+        for position in positions:
+            self._positions[position.market_id] = position
+        # Deduct invested amount from bankroll
+        self.bankroll -= sum(p.size_usd for p in positions)
+        self._synced_files.update(files)
+
+    def _journal_append(self, record: dict) -> None:
+        if self._journal is None:
+            return
+        try:
+            self._journal.append(record)
+        except Exception as e:
+            logger.error("Failed to append position journal: %s", e)
+
+    def _replay_journal(self) -> int:
+        """Apply journal events newer than the loaded snapshot. Returns count."""
+        if self._journal is None:
+            return 0
+        self._journal.advance(self._snapshot_seq)
+        applied = 0
+        for record in self._journal.replay(after_seq=self._snapshot_seq):
+            try:
+                kind = record.get("type")
+                if kind == "entry":
+                    position = Position.from_dict(record["position"])
+                    if position.market_id in self._positions:
+                        continue
+                    self._apply_entry(
+                        position, record.get("event_id", ""), record.get("market_type", ""),
+                    )
+                elif kind == "settle":
+                    position = self._positions.get(record["market_id"])
+                    if position is None:
+                        continue
+                    self._apply_settlement(position, record["winner"])
+                elif kind == "daily_reset":
+                    self._apply_daily_reset(record["date"])
+                elif kind == "sync":
+                    self._apply_sync(
+                        [Position.from_dict(d) for d in record.get("positions", [])],
+                        record.get("files", {}),
+                    )
+                else:
+                    continue
+                applied += 1
+            except (KeyError, TypeError) as e:
+                logger.warning("Skipping bad journal record %s: %s", record.get("seq"), e)
+        return applied
+
     def get_active_positions(self) -> list[Position]:
         """Get list of all active positions."""
         return list(self._positions.values())
@@ -523,7 +680,32 @@ class PositionManager:
         return self._positions.get(market_id)
 
     def save_state(self, path: Path) -> None:
-        """Save current state to JSON file (atomic write via temp+rename)."""
+        """Save current state to JSON file (atomic write via temp+rename).
+
+        F-042: 저널이 있으면 이벤트가 이미 기록되어 있으므로, 유효한 스냅샷을 아직
+        로드/저장하지 않았거나 저널이 ``compact_every`` 이상 쌓였을 때만 스냅샷을
+        쓰고 저널을 비운다.
+        """
+        if self._journal is not None:
+            if self._snapshot_current and self._journal.pending < self._compact_every:
+                return
+            self.compact(path)
+            return
+        self._write_snapshot(path)
+
+    def compact(self, path: Path) -> bool:
+        """F-042: 스냅샷 저장 후 저널 비우기 (크래시 시에도 seq로 중복 재생 방지)."""
+        with self._lock:
+            seq = self._journal.last_seq if self._journal is not None else 0
+            if not self._write_snapshot(path, journal_seq=seq):
+                return False
+            self._snapshot_seq = seq
+            self._snapshot_current = True
+            if self._journal is not None:
+                self._journal.truncate()
+            return True
+
+    def _write_snapshot(self, path: Path, journal_seq: int = 0) -> bool:
         state = {
             "bankroll": self.bankroll,
             "initial_bankroll": self._initial_bankroll,  # F-022
@@ -543,6 +725,8 @@ class PositionManager:
             "positions": {
                 mid: pos.to_dict() for mid, pos in self._positions.items()
             },
+            "journal_seq": journal_seq,  # F-042
+            "synced_files": self._synced_files,
         }
         # Atomic write: write to temp file, then rename
         tmp_path = path.with_suffix(".tmp")
@@ -550,14 +734,28 @@ class PositionManager:
             tmp_path.write_text(json.dumps(state, indent=2))
             tmp_path.replace(path)  # Atomic on POSIX
             logger.info("Saved position state to %s", path)
+            return True
         except Exception as e:
             logger.error("Failed to save position state: %s", e)
             # Clean up temp file if rename failed
             if tmp_path.exists():
                 tmp_path.unlink()
+            return False
 
     def load_state(self, path: Path) -> None:
-        """Load state from JSON file with integrity verification."""
+        """Load state from JSON file with integrity verification.
+
+        F-042: 스냅샷 로드 후 저널에서 그 이후 이벤트만 재생한다.
+        """
+        self._load_snapshot(path)
+        replayed = self._replay_journal()
+        if replayed:
+            logger.info(
+                "Replayed %d journal events: bankroll=$%.2f, %d active positions",
+                replayed, self.bankroll, self.active_position_count,
+            )
+
+    def _load_snapshot(self, path: Path) -> None:
         if not path.exists():
             logger.info("No state file at %s, starting fresh", path)
             return
@@ -612,6 +810,9 @@ class PositionManager:
                 mid: Position.from_dict(pos_data)
                 for mid, pos_data in state.get("positions", {}).items()
             }
+            self._snapshot_seq = state.get("journal_seq", 0)
+            self._snapshot_current = True
+            self._synced_files = state.get("synced_files", {})
             logger.info(
                 "Loaded state: bankroll=$%.2f, "
                 "total_invested=$%.2f, "
@@ -625,66 +826,69 @@ class PositionManager:
         except Exception as e:
             logger.error("Failed to load state: %s", e)
 
-    def sync_from_paper_trades(self, data_dir: Path) -> None:
-        """Sync positions from existing paper_trades JSONL files.
+    def sync_from_paper_trades(self, data_dir: Path, store: TradeStore | None = None) -> None:
+        """Sync positions from the paper trade store.
 
         This prevents duplicate entries when starting fresh without state file.
-        Loads all 'open' trades from paper_trades/YYYY-MM-DD.jsonl.
-        Excludes market_stats_*.jsonl and paired_*.jsonl files.
+        Loads all 'open' trades (legacy YYYY-MM-DD.jsonl files are imported
+        into the store first; market_stats_*/paired_* files are not trades).
+        F-053: Only trades added since the last sync are read — the store's
+        high-water row id is kept in ``synced_files`` under the DB file name.
         """
         if not data_dir.exists():
             return
 
-        loaded_count = 0
-        total_invested = 0.0
-        for jsonl_file in data_dir.glob("*.jsonl"):
-            # Skip non-trade files (market stats, paired entries)
-            fname = jsonl_file.name
-            if fname.startswith("market_stats_") or fname.startswith(
-                "paired_"
-            ):
-                continue
+        owned = store is None
+        try:
+            if owned:
+                store = TradeStore.for_dir(data_dir)
             try:
-                with open(jsonl_file) as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        trade = json.loads(line)
-                        # Only sync open trades that aren't settled
-                        if trade.get("status") != "open":
-                            continue
-                        market_id = trade.get("market_id", "")
-                        if not market_id or market_id in self._positions:
-                            continue
-
-                        # Create position from trade
-                        position = Position(
-                            market_id=market_id,
-                            market_question=trade.get(
-                                "market_question", ""
-                            ),
-                            side=trade.get("side", "YES"),
-                            entry_price=trade.get("price", 0.0),
-                            size_usd=trade.get("paper_size_usd", 10.0),
-                            shares=trade.get("paper_shares", 0.0),
-                            entry_time=trade.get("timestamp", ""),
-                            end_date=trade.get("end_date", ""),
-                            status="open",
-                        )
-                        self._positions[market_id] = position
-                        total_invested += position.size_usd
-                        loaded_count += 1
-            except Exception as e:
-                logger.warning("Failed to sync from %s: %s", jsonl_file, e)
-
-        if loaded_count > 0:
-            # Deduct invested amount from bankroll
-            self.bankroll -= total_invested
+                store.import_dir(data_dir)
+                synced_id = self._synced_files.get(DB_NAME, [0])[0]
+                trades, high_id = store.open_trades_since(synced_id)
+            finally:
+                if owned:
+                    store.close()
+        except Exception as e:
+            logger.warning("Failed to sync from %s: %s", data_dir, e)
+            return
+        if high_id == synced_id:
+            return
+
+        synced: list[Position] = []
+        seen: set[str] = set()
+        for trade in trades:
+            market_id = trade["market_id"]
+            if not market_id or market_id in self._positions or market_id in seen:
+                continue
+            seen.add(market_id)
+            synced.append(Position(
+                market_id=market_id,
+                market_question=trade["market_question"],
+                side=trade["side"] or "YES",
+                entry_price=trade["price"],
+                size_usd=trade["cost"] or 10.0,
+                shares=trade["shares"],
+                entry_time=trade["timestamp"],
+                end_date=trade["end_date"],
+                status="open",
+            ))
+
+        files = {DB_NAME: [high_id]}
+        with self._lock:
+            self._apply_sync(synced, files)
+            self._journal_append({
+                "type": "sync",
+                "positions": [p.to_dict() for p in synced],
+                "files": files,
+            })
+
+        if synced:
             logger.info(
-                "Synced %d positions from paper_trades files, "
+                "Synced %d positions from paper trade store, "
                 "deducted $%.2f from bankroll, "
                 "remaining bankroll: $%.2f",
-                loaded_count, total_invested, self.bankroll,
+                len(synced), sum(p.size_usd for p in synced), self.bankroll,
             )
 
     def get_stats_summary(self) -> dict:
@@ -0,0 +1,211 @@
+"""F-044: Exchange clock calibration + precision hour-boundary timer.
+
+로컬 시계(``datetime.now``)는 거래소 시계와 수백 ms씩 어긋날 수 있고,
+``asyncio.sleep(seconds_until_open)`` 한 번으로는 XX:00:00에 정확히 깨어나지 못한다.
+
+ExchangeClock — 거래소 시각 - 로컬 시각 오프셋을 구간(interval)으로 추정:
+    - HTTP ``Date`` 헤더 (1초 해상도): 서버 시각 S ∈ [D, D+1), 응답 생성 시점의
+      로컬 시각 l ∈ [sent, received] → offset ∈ (D - received, D + 1 - sent).
+      서로 다른 sub-second 위상의 샘플을 교차하면 구간이 ms 단위로 좁아진다.
+    - WS 메시지 ``timestamp`` (ms): 수신 전에 찍힌 값 → offset ≥ ts - received (하한).
+    - ``window_secs``보다 오래된 샘플은 버리고, 구간이 비면 (시계 점프) 최신 샘플로 리셋.
+
+PrecisionTimer — ``sleep_until(exchange_ts)``:
+    목표 직전까지 coarse sleep → 깨어나서 최신 오프셋으로 남은 시간을 다시 계산
+    (drift 보정) → ``loop.call_at`` 데드라인으로 마무리. 매번 wake-up 지터를 기록.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_SECS = 600.0   # 오프셋 샘플 유지 시간
+DEFAULT_SPIN_SECS = 0.05      # 마지막 구간은 call_at 데드라인으로
+MAX_COARSE_STEPS = 3          # coarse sleep 재계산 횟수 상한
+
+
+class ExchangeClock:
+    """Offset (exchange − local, seconds) estimated from timestamp bounds."""
+
+    def __init__(self, window_secs: float = DEFAULT_WINDOW_SECS):
+        self.window_secs = window_secs
+        # (observed_at, lower, upper) — upper may be +inf (WS lower-bound samples)
+        self._samples: deque[tuple[float, float, float]] = deque()
+        self._lower = float("-inf")
+        self._upper = float("inf")
+        self.observations = 0
+        self.resets = 0
+
+    # ------------------------------------------------------------------
+    # Observations
+    # ------------------------------------------------------------------
+
+    def observe_http_date(
+        self, date_header: str | None, sent_at: float, received_at: float,
+    ) -> bool:
+        """HTTP ``Date`` header (1s resolution) seen between two ``time.time()`` reads."""
+        if not isinstance(date_header, str) or not date_header:
+            return False
+        try:
+            server = parsedate_to_datetime(date_header).timestamp()
+        except (TypeError, ValueError, IndexError):
+            return False
+        self.observe_bounds(server - received_at, server + 1.0 - sent_at, received_at)
+        return True
+
+    def observe_server_timestamp(self, server_ts: float, received_at: float) -> None:
+        """Server-stamped event (e.g. WS ``timestamp``) received at ``received_at``."""
+        self.observe_bounds(server_ts - received_at, float("inf"), received_at)
+
+    def observe_bounds(
+        self, lower: float, upper: float, observed_at: float | None = None,
+    ) -> None:
+        observed_at = time.time() if observed_at is None else observed_at
+        self.observations += 1
+        self._samples.append((observed_at, lower, upper))
+        self._expire(observed_at)
+
+        new_lower = max(self._lower, lower)
+        new_upper = min(self._upper, upper)
+        if new_lower > new_upper:
+            # 모순 = 시계 점프/드리프트 → 최신 샘플부터 다시 시작
+            self.resets += 1
+            self._samples = deque([(observed_at, lower, upper)])
+            new_lower, new_upper = lower, upper
+        self._lower, self._upper = new_lower, new_upper
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @property
+    def calibrated(self) -> bool:
+        return self._lower != float("-inf")
+
+    @property
+    def offset(self) -> float:
+        """Best offset estimate (midpoint of the bound interval; 0 if unknown)."""
+        if not self.calibrated:
+            return 0.0
+        if self._upper == float("inf"):
+            return self._lower
+        return (self._lower + self._upper) / 2
+
+    @property
+    def uncertainty(self) -> float | None:
+        """Half-width of the offset interval (None if unbounded)."""
+        if not self.calibrated or self._upper == float("inf"):
+            return None
+        return (self._upper - self._lower) / 2
+
+    def now(self) -> float:
+        """Exchange time (epoch seconds)."""
+        return time.time() + self.offset
+
+    def now_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.now(), tz=timezone.utc)
+
+    def stats(self) -> dict:
+        uncertainty = self.uncertainty
+        return {
+            "offset_ms": round(self.offset * 1000, 1),
+            "uncertainty_ms": None if uncertainty is None else round(uncertainty * 1000, 1),
+            "samples": len(self._samples),
+            "observations": self.observations,
+            "resets": self.resets,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window_secs
+        if not self._samples or self._samples[0][0] >= cutoff:
+            return
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+        self._lower = max((s[1] for s in self._samples), default=float("-inf"))
+        self._upper = min((s[2] for s in self._samples), default=float("inf"))
+
+
+class PrecisionTimer:
+    """Sleeps until exchange-time deadlines and records wake-up jitter."""
+
+    def __init__(
+        self,
+        clock: ExchangeClock | None = None,
+        spin_secs: float = DEFAULT_SPIN_SECS,
+    ):
+        self.clock = clock or get_default_clock()
+        self.spin_secs = spin_secs
+        self.wakeups = 0
+        self.last_jitter: float | None = None
+        self._abs_jitter_sum = 0.0
+        self.max_abs_jitter = 0.0
+
+    async def sleep(self, seconds: float) -> float:
+        """Sleep ``seconds`` of exchange time. Returns jitter (seconds, + = late)."""
+        return await self.sleep_until(self.clock.now() + seconds)
+
+    async def sleep_until(self, target: float) -> float:
+        """Wake at exchange epoch ``target``. Returns jitter (seconds, + = late)."""
+        loop = asyncio.get_running_loop()
+        for _ in range(MAX_COARSE_STEPS):
+            remaining = target - self.clock.now()
+            if remaining <= self.spin_secs:
+                break
+            # 깨어난 뒤 최신 오프셋으로 다시 계산 (drift/새 샘플 보정)
+            await asyncio.sleep(remaining - self.spin_secs)
+
+        remaining = target - self.clock.now()
+        if remaining > 0:
+            future = loop.create_future()
+            handle = loop.call_at(
+                loop.time() + remaining,
+                lambda: future.done() or future.set_result(None),
+            )
+            try:
+                await future
+            finally:
+                handle.cancel()
+
+        jitter = self.clock.now() - target
+        self._record(jitter)
+        return jitter
+
+    def stats(self) -> dict:
+        mean = self._abs_jitter_sum / self.wakeups if self.wakeups else 0.0
+        return {
+            "wakeups": self.wakeups,
+            "last_jitter_ms": (
+                None if self.last_jitter is None else round(self.last_jitter * 1000, 2)
+            ),
+            "mean_abs_jitter_ms": round(mean * 1000, 2),
+            "max_abs_jitter_ms": round(self.max_abs_jitter * 1000, 2),
+            "clock": self.clock.stats(),
+        }
+
+    def _record(self, jitter: float) -> None:
+        self.wakeups += 1
+        self.last_jitter = jitter
+        self._abs_jitter_sum += abs(jitter)
+        self.max_abs_jitter = max(self.max_abs_jitter, abs(jitter))
+
+
+_default_clock: ExchangeClock | None = None
+
+
+def get_default_clock() -> ExchangeClock:
+    """프로세스 공용 ExchangeClock (transport/WS가 샘플을 채운다)."""
+    global _default_clock
+    if _default_clock is None:
+        _default_clock = ExchangeClock()
+    return _default_clock
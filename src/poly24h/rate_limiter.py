@@ -0,0 +1,254 @@
+"""F-040: Adaptive per-host token-bucket rate limiter with priority lanes.
+
+HttpTransport의 모든 요청은 보내기 전에 호스트별 토큰 버킷에서 토큰을 받는다.
+
+- 토큰 버킷: ``rate``(req/s)로 충전, ``burst``까지 저장
+- AIMD 자가 조정: 성공마다 ``increase_step``씩 rate 증가 (``max_rate``까지),
+  429를 받으면 rate를 ``decrease_factor`` 배로 줄이고 (``min_rate``까지)
+  ``Retry-After``(없으면 백오프) 동안 버킷 전체를 정지
+- 우선순위 레인: 대기열은 (priority, 도착 순서) 힙 — SNIPE 요청(0)이
+  백그라운드 스포츠 스캔(2)보다 먼저 토큰을 받는다
+
+우선순위는 ``request_priority`` contextvar로 전달된다 (태스크 단위로 상속)::
+
+    with priority_scope(PRIORITY_SNIPE):
+        await poller.poll_many(pairs)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+# Priority lanes (lower = served first)
+PRIORITY_SNIPE = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BACKGROUND = 2
+
+request_priority: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "request_priority", default=PRIORITY_NORMAL,
+)
+
+
+@contextmanager
+def priority_scope(priority: int) -> Iterator[None]:
+    """현재 컨텍스트(및 여기서 생성되는 태스크)의 요청 우선순위 설정."""
+    token = request_priority.set(priority)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """Starting point and bounds for one host's adaptive rate (req/s)."""
+
+    rate: float
+    burst: float
+    min_rate: float
+    max_rate: float
+
+
+# 시작값은 보수적으로, 성공이 이어지면 max_rate까지 스스로 올라간다.
+DEFAULT_HOST_LIMITS: dict[str, HostLimit] = {
+    "clob.polymarket.com": HostLimit(rate=50.0, burst=50.0, min_rate=2.0, max_rate=150.0),
+    "gamma-api.polymarket.com": HostLimit(rate=30.0, burst=30.0, min_rate=1.0, max_rate=50.0),
+    "api.binance.com": HostLimit(rate=20.0, burst=20.0, min_rate=1.0, max_rate=50.0),
+    "api.the-odds-api.com": HostLimit(rate=5.0, burst=5.0, min_rate=0.5, max_rate=10.0),
+}
+# 설정에 없는 호스트는 제한 없이 시작하고, 처음 429를 받으면 이 값으로 버킷 생성
+FALLBACK_LIMIT = HostLimit(rate=10.0, burst=10.0, min_rate=0.5, max_rate=50.0)
+
+DEFAULT_INCREASE_STEP = 0.05    # req/s added per successful request
+DEFAULT_DECREASE_FACTOR = 0.5   # multiplicative decrease on 429
+DEFAULT_PAUSE_SECS = 1.0        # pause when a 429 has no Retry-After
+
+
+class TokenBucket:
+    """Token bucket with a priority wait queue and AIMD rate control."""
+
+    def __init__(
+        self,
+        limit: HostLimit,
+        increase_step: float = DEFAULT_INCREASE_STEP,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+    ):
+        self.rate = limit.rate
+        self.burst = limit.burst
+        self.min_rate = limit.min_rate
+        self.max_rate = limit.max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+        self._tokens = limit.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+        # Metrics
+        self.acquired = 0
+        self.waited = 0
+        self.rate_limited = 0
+
+    @property
+    def paused_until(self) -> float:
+        return self._paused_until
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, f in self._waiters if not f.done())
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL) -> None:
+        """토큰 하나를 받을 때까지 대기 (우선순위 높은 대기자부터)."""
+        self._refill()
+        if not self._waiters and self._available():
+            self._take()
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self.waited += 1
+        if self._timer is None:
+            self._dispatch()
+        await future
+
+    def on_success(self) -> None:
+        """Additive increase."""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_rate_limited(self, retry_after: float | None, pause: bool = True) -> float:
+        """Multiplicative decrease (+ pause). Returns the pause in seconds."""
+        self.rate_limited += 1
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        if not pause:
+            return 0.0
+        secs = retry_after if retry_after is not None else DEFAULT_PAUSE_SECS
+        self._paused_until = max(self._paused_until, time.monotonic() + secs)
+        self._tokens = 0.0
+        return secs
+
+    def reset_waiters(self) -> None:
+        """Drop queued waiters/timer (event loop changed)."""
+        self._waiters.clear()
+        self._timer = None
+
+    def stats(self) -> dict:
+        return {
+            "rate": round(self.rate, 2),
+            "tokens": round(self._tokens, 2),
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "rate_limited": self.rate_limited,
+            "queued": self.waiting,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if now < self._paused_until:
+            self._updated = now
+            return
+        start = max(self._updated, self._paused_until)
+        self._tokens = min(self.burst, self._tokens + (now - start) * self.rate)
+        self._updated = now
+
+    def _available(self) -> bool:
+        return self._tokens >= 1.0 and time.monotonic() >= self._paused_until
+
+    def _take(self) -> None:
+        self._tokens -= 1.0
+        self.acquired += 1
+
+    def _dispatch(self) -> None:
+        """Hand tokens to waiters in priority order; re-arm timer if any remain."""
+        self._timer = None
+        self._refill()
+        while self._waiters:
+            _, _, future = self._waiters[0]
+            if future.done():  # cancelled waiter
+                heapq.heappop(self._waiters)
+                continue
+            if not self._available():
+                break
+            heapq.heappop(self._waiters)
+            self._take()
+            future.set_result(None)
+
+        if self._waiters and self._timer is None:
+            now = time.monotonic()
+            if now < self._paused_until:
+                delay = self._paused_until - now
+            else:
+                delay = max(0.0, (1.0 - self._tokens) / self.rate)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+
+class HostRateLimiter:
+    """Token buckets keyed by host, shared by every client of the transport."""
+
+    def __init__(
+        self,
+        limits: dict[str, HostLimit] | None = None,
+        increase_step: float = DEFAULT_INCREASE_STEP,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+    ):
+        self._limits = dict(DEFAULT_HOST_LIMITS if limits is None else limits)
+        self._increase_step = increase_step
+        self._decrease_factor = decrease_factor
+        self._buckets: dict[str, TokenBucket] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def bucket(self, host: str, create: bool = False) -> TokenBucket | None:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            limit = self._limits.get(host) or (FALLBACK_LIMIT if create else None)
+            if limit is None:
+                return None
+            bucket = TokenBucket(limit, self._increase_step, self._decrease_factor)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, host: str, priority: int | None = None) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 이전 루프의 대기 Future/타이머는 쓸 수 없음 — 학습된 rate만 유지
+            for bucket in self._buckets.values():
+                bucket.reset_waiters()
+            self._loop = loop
+        bucket = self.bucket(host)
+        if bucket is not None:
+            await bucket.acquire(request_priority.get() if priority is None else priority)
+
+    def on_success(self, host: str) -> None:
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            bucket.on_success()
+
+    def on_rate_limited(
+        self, host: str, retry_after: float | None, pause: bool = True,
+    ) -> float:
+        bucket = self.bucket(host, create=True)
+        secs = bucket.on_rate_limited(retry_after, pause)
+        logger.info(
+            "Rate limit %s: rate → %.2f req/s, paused %.1fs", host, bucket.rate, secs,
+        )
+        return secs
+
+    def stats(self) -> dict[str, dict]:
+        return {host: bucket.stats() for host, bucket in self._buckets.items()}
@@ -3,7 +3,8 @@
 Provides event-driven scheduling for crypto market opens that occur every hour.
 Switches between phases:
 - IDLE: >120s before open, low-frequency scan (5min interval)
-- PRE_OPEN: 120s before open, discover markets + warm connections
+- PRE_OPEN: 120s before open, discover markets + seed orderbook cache (F-043)
+  (next hour's 1H crypto markets are resolved by slug during IDLE, F-045)
 - SNIPE: 0-60s after open, rapid orderbook polling (3s interval)
 - COOLDOWN: 60-120s after open, moderate polling (15s interval)
 
@@ -23,24 +24,40 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import sqlite3
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
 
-import aiohttp
-
+from poly24h.analysis.daily_rollups import DailyRollups
+from poly24h.analysis.paper_analyzer import TradeAggregate
 from poly24h.discovery.gamma_client import GammaClient
+from poly24h.discovery.hourly_resolver import HourlyMarketResolver, HourlyResolution
 from poly24h.discovery.market_scanner import MarketScanner
+from poly24h.http_transport import HttpTransport, get_default_transport
 from poly24h.models.market import Market, MarketSource
+from poly24h.models.market_metadata import market_metadata
 from poly24h.monitoring.cycle_report import CycleStats, format_cycle_report
 from poly24h.monitoring.market_logger import MarketOpportunityLogger
 from poly24h.monitoring.settlement import PaperSettlementTracker, PaperTrade
 from poly24h.monitoring.telegram import TelegramAlerter
+from poly24h.portfolio.hybrid_portfolio import HybridPortfolio
+from poly24h.position_manager import PositionManager
+from poly24h.precision_timer import PrecisionTimer
+from poly24h.rate_limiter import PRIORITY_SNIPE, priority_scope
+from poly24h.scheduler.hybrid_strategy import (
+    HybridConfig,
+    HybridStrategy,
+    StrategyType,
+)
+from poly24h.scheduler.market_table import MarketStateTable
+from poly24h.scheduler.push_detector import PushDetector, PushSignal
 from poly24h.strategy.crypto_fair_value import CryptoFairValueCalculator
 from poly24h.strategy.dynamic_threshold import DynamicThreshold
-from poly24h.strategy.fee_calculator import is_profitable_after_fees
+from poly24h.strategy.fee_calculator import is_profitable_after_fees_fast
 from poly24h.strategy.nba_fair_value import NBAFairValueCalculator, NBATeamParser
 from poly24h.strategy.odds_api import (
     OddsAPIClient,
@@ -50,19 +67,20 @@ from poly24h.strategy.odds_api import (
 from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher
 from poly24h.strategy.paired_entry import (
     PairedEntryDetector,
+    PairedEntryOpportunity,
     PairedEntrySimulator,
 )
-from poly24h.scheduler.hybrid_strategy import (
-    HybridConfig,
-    HybridStrategy,
-    StrategyType,
-)
-from poly24h.position_manager import PositionManager
-from poly24h.portfolio.hybrid_portfolio import HybridPortfolio
 from poly24h.websocket.price_cache import PriceCache
+from poly24h.websocket.ws_manager import WebSocketManager
 
 logger = logging.getLogger(__name__)
 
+# Crypto assets with Binance OHLCV fair value (others → neutral 0.50)
+OHLCV_ASSETS = ("BTC", "ETH", "SOL", "XRP", "DOGE", "BNB")
+
+# Runtime state root (position manager snapshot + journal, paper trades)
+DEFAULT_DATA_DIR = Path("data")
+
 
 class Phase(Enum):
     """Scheduler phases based on market open timing."""
@@ -81,6 +99,9 @@ class OrderbookSnapshot:
     no_best_ask: float | None
     spread: float | None
     timestamp: datetime
+    # F-035: Total ask depth (USD) from the local L2 book; 0.0 when unknown
+    yes_ask_depth_usd: float = 0.0
+    no_ask_depth_usd: float = 0.0
 
     def is_opportunity(self, threshold: float) -> bool:
         """Returns True if either side <= threshold."""
@@ -166,9 +187,17 @@ class PreOpenPreparer:
     F-019: No longer limited to crypto only.
     """
 
-    def __init__(self, gamma_client: GammaClient, scanner: MarketScanner | None = None):
+    def __init__(
+        self,
+        gamma_client: GammaClient,
+        scanner: MarketScanner | None = None,
+        transport: HttpTransport | None = None,
+    ):
         self.gamma_client = gamma_client
         self._scanner = scanner
+        # F-034: 워밍은 공유 풀에 해야 스나이프 요청이 같은 커넥션을 재사용
+        self._transport = transport or get_default_transport()
+        self._resolver: HourlyMarketResolver | None = None
 
     @property
     def scanner(self) -> MarketScanner:
@@ -177,14 +206,62 @@ class PreOpenPreparer:
             self._scanner = MarketScanner(self.gamma_client)
         return self._scanner
 
-    async def discover_upcoming_markets(self) -> list[Market]:
+    @property
+    def resolver(self) -> HourlyMarketResolver:
+        """F-045: Lazy-init slug-template resolver (shares the scanner's catalog)."""
+        if self._resolver is None:
+            self._resolver = HourlyMarketResolver(
+                self.gamma_client,
+                config=self.scanner.config.get("hourly_crypto"),
+                catalog=self.scanner.catalog,
+            )
+        return self._resolver
+
+    async def prefetch_next_hour(self, open_at: datetime) -> HourlyResolution | None:
+        """F-045: Resolve the 1H crypto markets opening at ``open_at`` by slug.
+
+        Called during IDLE, well before PRE_OPEN. A complete resolution is
+        reused, with liquidity re-checked at PRE_OPEN; failures return None
+        (PRE_OPEN falls back to discovery).
+        """
+        crypto_cfg = self.scanner.config.get("hourly_crypto")
+        if not crypto_cfg or not crypto_cfg.get("enabled"):
+            return None
+        cached = self.resolver.cached(open_at)
+        if cached is not None and cached.complete:
+            return cached
+        try:
+            await self.gamma_client.open()
+            return await self.resolver.resolve(open_at)
+        except Exception as exc:
+            logger.warning("F-045: Hourly slug prefetch failed: %s", exc)
+            return None
+
+    async def discover_upcoming_markets(
+        self, open_at: datetime | None = None,
+    ) -> list[Market]:
         """Discover ALL enabled markets (crypto + sports) using MarketScanner.
 
         F-019: Now uses discover_all() instead of discover_hourly_crypto() only.
         This includes NBA, soccer, and other enabled sports markets.
+        F-045: If the 1H markets opening at ``open_at`` were prefetched by
+        slug, they replace the tag_slug='1H' query (liquidity re-checked now).
         """
         await self.gamma_client.open()
-        markets = await self.scanner.discover_all()
+        resolution = await self._resolver.promote(open_at) if self._resolver else None
+        if resolution is not None and resolution.complete:
+            logger.info(
+                "PreOpenPreparer: using %d prefetched hourly markets",
+                len(resolution.markets),
+            )
+            markets = await self.scanner.discover_all(hourly_markets=resolution.markets)
+        else:
+            if resolution is not None:
+                logger.info(
+                    "PreOpenPreparer: prefetch incomplete (missing %s) — full discovery",
+                    ", ".join(resolution.missing),
+                )
+            markets = await self.scanner.discover_all()
 
         # Log source breakdown
         by_source: dict[str, int] = {}
@@ -210,14 +287,13 @@ class PreOpenPreparer:
         return mapping
 
     async def warm_clob_connection(self, token_id: str) -> bool:
-        """Single lightweight GET to warm HTTP connection."""
+        """Single lightweight GET to warm the pooled CLOB connection."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://clob.polymarket.com/book",
-                    params={"token_id": token_id}
-                ) as response:
-                    return response.status == 200
+            async with self._transport.get(
+                "https://clob.polymarket.com/book",
+                params={"token_id": token_id}
+            ) as response:
+                return response.status == 200
         except Exception as exc:
             logger.warning("Failed to warm CLOB connection for %s: %s", token_id, exc)
             return False
@@ -317,6 +393,35 @@ class RapidOrderbookPoller:
             timestamp=datetime.now(tz=timezone.utc)
         )
 
+    async def poll_many(
+        self, token_pairs: list[tuple[str, str]],
+    ) -> list[OrderbookSnapshot]:
+        """F-033: Fetch best asks for many pairs with one batched CLOB call.
+
+        Returns snapshots in the same order as ``token_pairs``.
+        """
+        if not token_pairs:
+            return []
+
+        token_ids = [token for pair in token_pairs for token in pair]
+        asks = await self.clob_fetcher.fetch_best_asks_batch(token_ids)
+        now = datetime.now(tz=timezone.utc)
+
+        snapshots: list[OrderbookSnapshot] = []
+        for yes_token, no_token in token_pairs:
+            yes_ask = asks.get(yes_token)
+            no_ask = asks.get(no_token)
+            spread = None
+            if yes_ask is not None and no_ask is not None:
+                spread = yes_ask + no_ask
+            snapshots.append(OrderbookSnapshot(
+                yes_best_ask=yes_ask,
+                no_best_ask=no_ask,
+                spread=spread,
+                timestamp=now,
+            ))
+        return snapshots
+
     def detect_opportunity(
         self,
         snapshot: OrderbookSnapshot,
@@ -395,11 +500,23 @@ class EventDrivenLoop:
         poller: RapidOrderbookPoller,
         alerter: TelegramAlerter,
         price_cache: PriceCache | None = None,
+        ws_manager: WebSocketManager | None = None,
+        timer: PrecisionTimer | None = None,
+        data_dir: Path | str = DEFAULT_DATA_DIR,
     ):
         self.schedule = schedule
         self.preparer = preparer
         self.poller = poller
         self.alerter = alerter
+        # F-044: Phase decisions and the open deadline use exchange time
+        self._timer: PrecisionTimer = timer or PrecisionTimer()
+        self._clock = self._timer.clock
+        # F-042: Position manager snapshot + journal live side by side
+        self._data_dir = Path(data_dir)
+        self._state_path = self._data_dir / "position_manager_state.json"
+        self._journal_path = self._data_dir / "position_manager_journal.jsonl"
+        # Paper trades, paired/market_stats logs and rollups
+        self._paper_trade_dir = self._data_dir / "paper_trades"
         self._active_token_pairs: list[tuple[str, str]] = []
         # F-019: Market info for enriched alerts
         self._active_markets: list[Market] = []
@@ -416,15 +533,35 @@ class EventDrivenLoop:
         self._last_batch_alert: datetime = datetime.now(tz=timezone.utc)
         # Phase 2: Cycle stats, settlement, dynamic threshold
         self._cycle_stats: CycleStats = CycleStats()
-        self._settlement_tracker: PaperSettlementTracker = PaperSettlementTracker()
+        self._settlement_tracker: PaperSettlementTracker = PaperSettlementTracker(
+            data_dir=str(self._paper_trade_dir),
+        )
+        self._settlement_task: asyncio.Task | None = None  # F-054
+        # F-057: Reports read per-day rollups instead of re-aggregating raw trades
+        # (built on first report, under data_dir/paper_trades)
+        self._rollups: DailyRollups | None = None
         self._dynamic_threshold: DynamicThreshold = DynamicThreshold()
         self._previous_phase: Phase = Phase.IDLE
         self._cycle_count: int = 0
         # Phase 3: WebSocket cache, paired entry, market logger
         self._price_cache: PriceCache = price_cache or PriceCache()
+        # F-036: Sharded WS feed writing into _price_cache (optional)
+        self._ws_manager: WebSocketManager | None = ws_manager
+        # F-037: Push detection (active during SNIPE when the WS feed is live)
+        self._push_detector: PushDetector = PushDetector(
+            self._price_cache, self._evaluate_pair_push,
+        )
+        self._push_threshold: float | None = None
+        self._push_paired_seen: set[str] = set()  # market ids, per cycle
+        self._push_signals_consumed: int = 0
+        self._push_latency_ms_max: float = 0.0
         self._paired_detector: PairedEntryDetector = PairedEntryDetector()
-        self._paired_simulator: PairedEntrySimulator = PairedEntrySimulator()
-        self._market_logger: MarketOpportunityLogger = MarketOpportunityLogger()
+        self._paired_simulator: PairedEntrySimulator = PairedEntrySimulator(
+            data_dir=str(self._paper_trade_dir),
+        )
+        self._market_logger: MarketOpportunityLogger = MarketOpportunityLogger(
+            data_dir=str(self._paper_trade_dir),
+        )
         self._ws_cache_hits: int = 0
         self._http_fallback_count: int = 0
         # Phase 5: Fair Value calculators (F-021)
@@ -433,6 +570,8 @@ class EventDrivenLoop:
         self._crypto_fair_value: CryptoFairValueCalculator = CryptoFairValueCalculator()
         self._market_fair_values: dict[str, float] = {}  # market_id → fair_prob
         self._market_edges: dict[str, float] = {}  # market_id → edge (F-024)
+        # F-046: Columnar per-slot state for batch detection passes
+        self._market_table: MarketStateTable = MarketStateTable()
         self._ohlcv_cache: dict[str, list[dict]] = {}  # symbol → ohlcv (per-cycle)
         # F-024: The Odds API client for real-time sportsbook odds
         self._odds_client: OddsAPIClient = OddsAPIClient()
@@ -469,15 +608,27 @@ class EventDrivenLoop:
             max_per_market=_max_per_market,
             max_daily_deployment_usd=_max_daily,
             max_entries_per_cycle=_max_entries,
+            journal_path=self._journal_path,  # F-042
         )
-        # Load persisted state and sync from paper_trades
-        self._position_manager.load_state(Path("data/position_manager_state.json"))
-        self._position_manager.sync_from_paper_trades(Path("data/paper_trades"))
+        # Load persisted state (snapshot + journal tail) and sync from paper_trades
+        self._position_manager.load_state(self._state_path)
+        self._position_manager.sync_from_paper_trades(self._paper_trade_dir)
+
+    @property
+    def state_path(self) -> Path:
+        """Position manager snapshot shared with the sports monitors."""
+        return self._state_path
+
+    @property
+    def paper_trade_dir(self) -> Path:
+        """Directory for paper trade files shared with the sports scanners."""
+        return self._paper_trade_dir
 
     async def run(self, config) -> None:
         """Async main loop that orchestrates the full cycle."""
+        self.start_settlement_task()
         while True:
-            now = datetime.now(tz=timezone.utc)
+            now = self._clock.now_datetime()
             current_phase = self.schedule.current_phase(now)
 
             if current_phase == Phase.IDLE:
@@ -490,10 +641,17 @@ class EventDrivenLoop:
                 await self._handle_cooldown_phase(config)
 
             # Short sleep to prevent tight loop
-            await asyncio.sleep(1)
-
-    # Settlement check interval during IDLE (seconds)
-    IDLE_SETTLEMENT_INTERVAL = 300  # Check every 5 minutes
+            # F-044: PRE_OPEN already slept to the open — first SNIPE poll runs now
+            if current_phase != Phase.PRE_OPEN:
+                await asyncio.sleep(1)
+
+    def start_settlement_task(self) -> asyncio.Task:
+        """F-054: Background settlement that wakes on trade end dates (idempotent)."""
+        if self._settlement_task is None or self._settlement_task.done():
+            self._settlement_task = asyncio.create_task(
+                self._settlement_tracker.run(on_settled=self._apply_settlement_summary),
+            )
+        return self._settlement_task
 
     async def _handle_idle_phase(self, now: datetime, config) -> None:
         """Handle IDLE phase: sleep until pre_open window or run background scan.
@@ -502,11 +660,12 @@ class EventDrivenLoop:
         1. Cycle end summary report
         2. Paper trade settlement check
 
-        Enhanced: Periodic settlement checks during IDLE to resolve
-        expired positions without waiting for next cycle transition.
+        F-054: Other settlements happen in the background settlement task
+        as soon as each trade's end_date (+ grace) passes.
         """
         # F-020: Flush any remaining batched alerts when entering IDLE
         await self._flush_batch_alerts(force=True)
+        self._push_detector.stop()
 
         # Phase 2: Send cycle end report on transition to IDLE
         if self._previous_phase in (Phase.SNIPE, Phase.COOLDOWN):
@@ -518,16 +677,40 @@ class EventDrivenLoop:
         sleep_until_pre_open = seconds_until_open - config.pre_open_window_secs
 
         if sleep_until_pre_open > 300:  # More than 5 minutes
-            # Run periodic settlement check + background scan
-            logger.info("IDLE: Running background scan + settlement check, then sleeping %ds", sleep_until_pre_open)
-            await self._run_settlement_check()
+            logger.info("IDLE: %ds until pre-open, next check in 300s", sleep_until_pre_open)
             await asyncio.sleep(300)  # Background scan every 5 minutes
         else:
+            # F-045: Resolve next hour's markets now, off the PRE_OPEN path
+            await self._prefetch_next_hour(self.schedule.next_open(now))
             # Sleep until pre-open window
             if sleep_until_pre_open > 0:
                 logger.info("IDLE: Sleeping %ds until pre-open", sleep_until_pre_open)
                 await asyncio.sleep(sleep_until_pre_open)
 
+    async def _prefetch_next_hour(self, open_at: datetime) -> None:
+        """F-045: Resolve next hour's 1H markets and subscribe their tokens early.
+
+        PRE_OPEN then reuses the resolution, and its WS subscription update
+        is only a small diff.
+        """
+        try:
+            resolution = await self.preparer.prefetch_next_hour(open_at)
+        except Exception as exc:
+            logger.warning("IDLE: Hourly prefetch failed: %s", exc)
+            return
+        if resolution is None or not resolution.markets:
+            return
+        predicted = [
+            token for m in resolution.markets
+            for token in (m.yes_token_id, m.no_token_id)
+        ]
+        if self._ws_manager is not None:
+            current = [token for pair in self._active_token_pairs for token in pair]
+            try:
+                await self._ws_manager.set_subscriptions(current + predicted)
+            except Exception as exc:
+                logger.warning("IDLE: WS pre-subscription failed: %s", exc)
+
     async def _handle_pre_open_phase(self, config) -> None:
         """Handle PRE_OPEN phase: discover ALL markets, warm connections."""
         self._previous_phase = Phase.PRE_OPEN
@@ -538,7 +721,8 @@ class EventDrivenLoop:
         self._cycle_stats = CycleStats()
 
         # F-019: Discover ALL enabled markets (crypto + sports)
-        markets = await self.preparer.discover_upcoming_markets()
+        open_at = self.schedule.next_open(self._clock.now_datetime())
+        markets = await self.preparer.discover_upcoming_markets(open_at)
         self._active_markets = markets
         self._active_token_pairs = self.preparer.extract_token_pairs(markets)
         self._token_to_market = self.preparer.extract_token_market_map(markets)
@@ -556,29 +740,106 @@ class EventDrivenLoop:
         # Phase 2: Record discovery in cycle stats
         self._cycle_stats.record_discovery(len(markets), by_source)
 
-        # Warm CLOB connections for all token pairs
-        warm_tasks = []
-        for yes_token, no_token in self._active_token_pairs:
-            warm_tasks.append(self.preparer.warm_clob_connection(yes_token))
-            warm_tasks.append(self.preparer.warm_clob_connection(no_token))
-
-        if warm_tasks:
-            await asyncio.gather(*warm_tasks, return_exceptions=True)
+        # F-037: Push detector watches this cycle's pairs (armed in SNIPE)
+        self._push_detector.stop()
+        self._push_detector.set_pairs(self._active_token_pairs)
+        self._push_paired_seen.clear()
 
-        # Phase 5 (F-021): Calculate fair values for all markets
-        await self._calculate_fair_values(markets)
+        # F-036: Point the sharded WS feed at this cycle's tokens (diff only)
+        if self._ws_manager is not None:
+            try:
+                await self._ws_manager.set_subscriptions(
+                    token for pair in self._active_token_pairs for token in pair
+                )
+            except Exception as exc:
+                logger.warning("PRE_OPEN: WS subscription update failed: %s", exc)
+
+        # F-043: Seed the orderbook cache (this also warms the pooled CLOB
+        # connection) while fair values are calculated (Binance/Odds API)
+        tokens = [token for pair in self._active_token_pairs for token in pair]
+        seed_result, fair_result = await asyncio.gather(
+            self._seed_orderbooks(tokens),
+            # Phase 5 (F-021): Calculate fair values for all markets
+            self._calculate_fair_values(markets),
+            return_exceptions=True,
+        )
+        if isinstance(seed_result, BaseException):
+            logger.warning("PRE_OPEN: Orderbook seeding failed: %s", seed_result)
+        # Trading without fair values is not an option — fail like before F-043
+        if isinstance(fair_result, BaseException):
+            raise fair_result
+        if isinstance(seed_result, int) and seed_result:
+            logger.info("PRE_OPEN: Seeded %d/%d orderbooks", seed_result, len(tokens))
+        # F-046: One slot per market (liquidity, dynamic threshold, fair value)
+        self._sync_market_table(force=True)
 
         # Wait for market open (skip if already past open)
-        now = datetime.now(tz=timezone.utc)
-        if self.schedule.is_snipe_window(now) or self.schedule.is_snipe_window(now, window_secs=120):
+        now = self._clock.now_datetime()
+        if (
+            self.schedule.is_snipe_window(now)
+            or self.schedule.is_snipe_window(now, window_secs=120)
+        ):
             logger.info(
                 "PRE_OPEN: Fair value calc finished after market open — proceeding to SNIPE"
             )
             return
         sleep_time = self.schedule.seconds_until_open(now)
+        if sleep_time > self.PRE_OPEN_REFRESH_LEAD and self._can_seed_orderbooks():
+            # F-043: Just before open, re-fetch only books that would be stale
+            # at the first SNIPE tick (WS-updated books are skipped)
+            await asyncio.sleep(sleep_time - self.PRE_OPEN_REFRESH_LEAD)
+            stale = self._price_cache.stale_tokens(
+                tokens, self.WS_CACHE_MAX_AGE - self.PRE_OPEN_REFRESH_LEAD,
+            )
+            if stale:
+                refreshed = await self._seed_orderbooks(stale)
+                logger.info(
+                    "PRE_OPEN: Refreshed %d/%d stale orderbooks before open",
+                    refreshed, len(stale),
+                )
+            sleep_time = self.schedule.seconds_until_open(self._clock.now_datetime())
         if sleep_time > 0:
             logger.info("PRE_OPEN: Waiting %ds for market open", int(sleep_time))
-            await asyncio.sleep(sleep_time)
+            # F-044: Drift-compensated call_at deadline at XX:00:00 exchange time
+            jitter = await self._timer.sleep(sleep_time)
+            logger.info(
+                "PRE_OPEN: Woke at open (jitter %+.1fms, clock offset %+.1fms)",
+                jitter * 1000, self._clock.offset * 1000,
+            )
+
+    def _can_seed_orderbooks(self) -> bool:
+        return isinstance(getattr(self.poller, "clob_fetcher", None), ClobOrderbookFetcher)
+
+    async def _seed_orderbooks(self, tokens: list[str]) -> int:
+        """F-043: Fetch books in batches and seed PriceCache (L2 + top-of-book).
+
+        Each seeded token's cache timestamp is its known-good time, so the
+        first SNIPE tick only re-fetches tokens whose snapshot went stale.
+        Pollers without a ClobOrderbookFetcher just warm the connection.
+        Returns the number of seeded tokens.
+        """
+        if not tokens:
+            return 0
+        if not self._can_seed_orderbooks():
+            await asyncio.gather(
+                *(self.preparer.warm_clob_connection(t) for t in tokens),
+                return_exceptions=True,
+            )
+            return 0
+
+        try:
+            summaries = await self.poller.clob_fetcher.fetch_orderbooks(tokens)
+        except Exception as exc:
+            logger.warning("PRE_OPEN: Orderbook seeding failed: %s", exc)
+            return 0
+
+        seeded = 0
+        for token_id, summary in summaries.items():
+            if summary.best_ask is None or not summary.asks:
+                continue
+            self._price_cache.apply_book_snapshot(token_id, summary.asks, summary.bids)
+            seeded += 1
+        return seeded
 
     # Tiered polling intervals (seconds) — aligned with polymarket_trader
     SNIPE_ULTRA_EARLY_SECS = 10.0   # first 10s after open
@@ -587,6 +848,11 @@ class EventDrivenLoop:
     SNIPE_EARLY_INTERVAL = 0.5       # 500ms
     SNIPE_NORMAL_INTERVAL = 1.0      # 30-60s: 1s
     COOLDOWN_INTERVAL = 5.0          # cooldown: 5s
+    # F-043: Cache freshness for SNIPE and the pre-open stale-book refresh
+    WS_CACHE_MAX_AGE = 5.0
+    PRE_OPEN_REFRESH_LEAD = 2.0      # refresh stale books 2s before open
+    # F-024: Minimum edge for SNIPE entries (NBA 0% fees)
+    MIN_ENTRY_EDGE = 0.03
 
     def _snipe_interval(self, seconds_since_open: float) -> float:
         """Tiered polling interval based on time since market open."""
@@ -628,11 +894,9 @@ class EventDrivenLoop:
         crypto_markets = [m for m in markets if m.source == MarketSource.HOURLY_CRYPTO]
         symbols_needed: set[str] = set()
         for m in crypto_markets:
-            q = m.question.lower()
-            for coin in ["btc", "eth", "sol", "xrp", "doge", "bnb"]:
-                if coin in q:
-                    symbols_needed.add(f"{coin.upper()}USDT")
-                    break
+            asset = market_metadata(m).asset
+            if asset in OHLCV_ASSETS:
+                symbols_needed.add(f"{asset}USDT")
 
         if symbols_needed:
             fetch_tasks = []
@@ -694,15 +958,9 @@ class EventDrivenLoop:
         Uses momentum + volume as primary signals, RSI/BB as secondary.
         P1-1: ETH gets a decoupling penalty when diverging from BTC.
         """
-        # Extract asset from question (e.g., "Will BTC go up..." -> "BTC")
-        question_lower = market.question.lower()
-        asset = None
-        for coin in ["btc", "eth", "sol", "xrp", "doge", "bnb"]:
-            if coin in question_lower:
-                asset = coin.upper()
-                break
-
-        if not asset:
+        # Asset parsed from question (e.g., "Will BTC go up..." -> "BTC")
+        asset = market_metadata(market).asset
+        if asset not in OHLCV_ASSETS:
             return 0.50  # Unknown crypto, neutral
 
         symbol = f"{asset}USDT"
@@ -801,7 +1059,9 @@ class EventDrivenLoop:
                 return fair_prob
 
         # Fallback: static win rates (F-021 original)
-        team_a, team_b = self._nba_team_parser.parse_teams(market.question)
+        team_a, team_b = market_metadata(market).memo(
+            "nba_teams", lambda: self._nba_team_parser.parse_teams(market.question),
+        )
 
         if not team_a:
             logger.debug("NBA: No teams found in '%s'", market.question[:50])
@@ -853,20 +1113,29 @@ class EventDrivenLoop:
             # Fallback to simple threshold check
             return price < (0.50 - margin)
 
-    # Max concurrent HTTP requests to CLOB API to avoid 429 rate limits
-    MAX_CONCURRENT_POLLS = 10
-
     async def _poll_all_pairs(
-        self, threshold: float, phase_label: str = "SNIPE",
+        self,
+        threshold: float,
+        phase_label: str = "SNIPE",
+        stale_only: bool = False,
+        entry_filter: bool = False,
     ) -> list[tuple[SniperOpportunity, tuple[str, str]]]:
-        """Poll all active token pairs with concurrency control.
+        """Poll all active token pairs.
 
         Phase 3: WS-cache-first approach. If WS cache has fresh prices,
         use them directly (saves ~200ms HTTP latency). Otherwise fall back
         to HTTP polling.
 
-        F-020: Semaphore limits concurrent HTTP requests to avoid CLOB 429.
-        
+        F-033: All cache-miss pairs are fetched with ONE batched poll
+        (``RapidOrderbookPoller.poll_many``) instead of two GETs per pair.
+
+        F-037: ``stale_only=True`` skips pairs with a fresh WS cache entirely —
+        those are evaluated by the push detector on each update.
+
+        F-046: ``entry_filter=True`` also applies the SNIPE entry filters
+        (crypto skip, dynamic threshold, edge) in the batch table pass, so
+        only pairs that can be entered reach ``detect_opportunity``.
+
         Returns:
             List of (opportunity, (yes_token, no_token)) tuples.
             This allows caller to identify which market the opportunity belongs to.
@@ -874,40 +1143,78 @@ class EventDrivenLoop:
         if not self._active_token_pairs:
             return []
 
-        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_POLLS)
+        snapshots: list[OrderbookSnapshot | None] = []
+        http_indices: list[int] = []
 
-        async def _poll_one(yes_token: str, no_token: str) -> tuple[SniperOpportunity, tuple[str, str]] | None:
+        for yes_token, no_token in self._active_token_pairs:
+            # Phase 3: Try WS cache first for lower latency
+            snapshot = self._try_ws_cache(yes_token, no_token)
+            if snapshot is None:
+                http_indices.append(len(snapshots))
+            else:
+                self._ws_cache_hits += 1
+                if stale_only:
+                    snapshot = None  # F-037: handled by push detector
+            snapshots.append(snapshot)
+
+        if http_indices:
+            # Fallback to batched HTTP polling
+            http_pairs = [self._active_token_pairs[i] for i in http_indices]
+            self._http_fallback_count += len(http_pairs)
             try:
-                # Phase 3: Try WS cache first for lower latency (no semaphore needed)
-                snapshot = self._try_ws_cache(yes_token, no_token)
-                if snapshot is not None:
-                    self._ws_cache_hits += 1
-                    opp = self.poller.detect_opportunity(snapshot, threshold)
-                    return (opp, (yes_token, no_token)) if opp else None
-
-                # Fallback to HTTP polling (rate-limited)
-                async with semaphore:
-                    self._http_fallback_count += 1
-                    snapshot = await self.poller.poll_once(yes_token, no_token)
-                    opp = self.poller.detect_opportunity(snapshot, threshold)
-                    return (opp, (yes_token, no_token)) if opp else None
+                polled = await self.poller.poll_many(http_pairs)
             except Exception as exc:
-                logger.error("[%s] Error polling %s/%s: %s", phase_label, yes_token, no_token, exc)
-                return None
-
-        results = await asyncio.gather(
-            *[_poll_one(yt, nt) for yt, nt in self._active_token_pairs],
-            return_exceptions=True,
+                logger.error(
+                    "[%s] Error polling %d pairs: %s", phase_label, len(http_pairs), exc,
+                )
+                polled = []
+            for i, snapshot in zip(http_indices, polled):
+                snapshots[i] = snapshot
+
+        # F-046: One batch threshold pass picks candidate slots;
+        # detect_opportunity only runs for those
+        table = self._sync_market_table()
+        table.set_asks(
+            [s.yes_best_ask if s is not None else None for s in snapshots],
+            [s.no_best_ask if s is not None else None for s in snapshots],
         )
-        return [r for r in results if isinstance(r, tuple) and r[0] is not None]
+        min_price = RapidOrderbookPoller.MIN_MEANINGFUL_PRICE
+        if entry_filter:
+            table.set_fair_values(self._market_fair_values)
+            slots = table.entry_slots(
+                threshold, min_price, self.MIN_ENTRY_EDGE, skip_crypto=True,
+            )
+        else:
+            slots = table.sniper_slots(threshold, min_price)
+        results: list[tuple[SniperOpportunity, tuple[str, str]]] = []
+        for slot in slots:
+            opp = self.poller.detect_opportunity(snapshots[slot], threshold)
+            if opp is not None:
+                results.append((opp, self._active_token_pairs[slot]))
+        return results
+
+    def _sync_market_table(self, force: bool = False) -> MarketStateTable:
+        """F-046: Rebuild the state table when the active pair list changed."""
+        table = self._market_table
+        if force or not table.built_from(self._active_token_pairs):
+            table.load(
+                self._active_token_pairs,
+                self._active_markets,
+                threshold_for=self._dynamic_threshold.get_threshold,
+                fair_values=self._market_fair_values,
+            )
+        return table
 
     def _try_ws_cache(
-        self, yes_token: str, no_token: str, max_age: float = 5.0,
+        self, yes_token: str, no_token: str, max_age: float | None = None,
     ) -> OrderbookSnapshot | None:
         """Try to build OrderbookSnapshot from WebSocket price cache.
 
         Returns None if either side's cache is stale or missing.
+        F-043: Books seeded in PRE_OPEN count as cached too.
         """
+        if max_age is None:
+            max_age = self.WS_CACHE_MAX_AGE
         # Check freshness of both sides
         if not self._price_cache.is_orderbook_fresh(yes_token, max_age):
             return None
@@ -922,11 +1229,17 @@ class EventDrivenLoop:
 
         spread = yes_ask + no_ask
 
+        # F-035: True depth straight from the WS-maintained L2 books
+        yes_book = self._price_cache.get_book(yes_token)
+        no_book = self._price_cache.get_book(no_token)
+
         return OrderbookSnapshot(
             yes_best_ask=yes_ask,
             no_best_ask=no_ask,
             spread=spread,
             timestamp=datetime.now(tz=timezone.utc),
+            yes_ask_depth_usd=yes_book.ask_depth_usd() if yes_book else 0.0,
+            no_ask_depth_usd=no_book.ask_depth_usd() if no_book else 0.0,
         )
 
     def _should_use_paired_entry(self, market: Market, yes_ask: float, no_ask: float) -> bool:
@@ -944,13 +1257,10 @@ class EventDrivenLoop:
         if strategy_type != StrategyType.PAIRED_ENTRY:
             return False
         
-        # Check fee-adjusted profitability
-        yes_dec = Decimal(str(yes_ask))
-        no_dec = Decimal(str(no_ask))
-        
-        return is_profitable_after_fees(
-            yes_price=yes_dec,
-            no_price=no_dec,
+        # Check fee-adjusted profitability (F-047: per-tick table, no Decimal)
+        return is_profitable_after_fees_fast(
+            yes_price=yes_ask,
+            no_price=no_ask,
             min_margin=self._hybrid_config.min_profit_margin,
             use_taker=True,
         )
@@ -970,89 +1280,124 @@ class EventDrivenLoop:
         """
         paired_results = []
 
-        for i, (yes_token, no_token) in enumerate(self._active_token_pairs):
-            market = self._active_markets[i] if i < len(self._active_markets) else None
-            if market is None:
-                continue
-
-            # Phase 6: Skip non-Crypto markets for paired entry
-            if self._hybrid_mode_enabled and market.source != MarketSource.HOURLY_CRYPTO:
+        # F-046: Batch CPP pass over cached asks → candidate slots only
+        table = self._sync_market_table()
+        table.refresh_from_cache(self._price_cache)
+        candidates = table.paired_slots(
+            self._paired_detector.max_combined_cost,
+            self._paired_detector.min_price,
+            crypto_only=self._hybrid_mode_enabled,
+        )
+        for slot in candidates:
+            market = table.markets[slot]
+            yes_token, no_token = table.pairs[slot]
+            detected = self._detect_paired_for_pair(market, yes_token, no_token)
+            if detected is None:
                 continue
+            paired_opp, source = detected
+            paired_results.append(
+                self._record_paired_entry(paired_opp, market, source, phase_label)
+            )
 
-            # Get best asks (try WS cache first, then use last poll data)
-            yes_ask = self._price_cache.get_best_ask(yes_token)
-            no_ask = self._price_cache.get_best_ask(no_token)
-
-            if yes_ask is None or no_ask is None:
-                continue
+        return paired_results
 
-            # Phase 6: Use fee-adjusted threshold instead of simple $1.00
-            if not self._should_use_paired_entry(market, yes_ask, no_ask):
-                continue
+    def _detect_paired_for_pair(
+        self, market: Market, yes_token: str, no_token: str,
+    ) -> tuple[PairedEntryOpportunity, str] | None:
+        """Paired CPP check for one market from cached best asks.
 
-            # Determine detection source
-            source = "ws_cache"
-            if not self._price_cache.is_orderbook_fresh(yes_token, 5.0):
-                source = "http_poll"
-
-            # Get sizes from orderbook entries if available
-            yes_entry = self._price_cache.get_orderbook_entry(yes_token)
-            no_entry = self._price_cache.get_orderbook_entry(no_token)
-            yes_size = yes_entry.ask_size if yes_entry else 0.0
-            no_size = no_entry.ask_size if no_entry else 0.0
-
-            # Check for paired opportunity (legacy detector for paper trade)
-            paired_opp = self._paired_detector.detect(
-                market=market,
-                yes_ask=yes_ask,
-                no_ask=no_ask,
-                yes_size=yes_size,
-                no_size=no_size,
-                source=source,
-            )
+        Returns (opportunity, detection_source) or None. No side effects.
+        """
+        # Phase 6: Skip non-Crypto markets for paired entry
+        if self._hybrid_mode_enabled and market.source != MarketSource.HOURLY_CRYPTO:
+            return None
 
-            if paired_opp is not None:
-                # Simulate paper trade
-                paper = self._paired_simulator.simulate_trade(paired_opp)
+        # Get best asks (try WS cache first, then use last poll data)
+        yes_ask = self._price_cache.get_best_ask(yes_token)
+        no_ask = self._price_cache.get_best_ask(no_token)
 
-                # Log detailed opportunity
-                now = datetime.now(tz=timezone.utc)
-                open_time = now.replace(minute=0, second=0, microsecond=0)
-                secs_since_open = (now - open_time).total_seconds()
+        if yes_ask is None or no_ask is None:
+            return None
 
-                self._market_logger.record(
-                    market_id=market.id,
-                    market_question=market.question,
-                    market_source=market.source.value,
-                    trigger_side="PAIRED",
-                    trigger_price=paired_opp.total_cost,
-                    spread=paired_opp.spread,
-                    seconds_since_open=secs_since_open,
-                    detection_source=source,
-                    is_paired=True,
-                )
+        # Phase 6: Use fee-adjusted threshold instead of simple $1.00
+        if not self._should_use_paired_entry(market, yes_ask, no_ask):
+            return None
 
-                # Create a synthetic SniperOpportunity for the batch alert system
-                synth_opp = SniperOpportunity(
-                    trigger_price=paired_opp.total_cost,
-                    trigger_side="PAIRED",
-                    spread=paired_opp.spread,
-                    timestamp=now,
-                )
+        # Determine detection source
+        source = "ws_cache"
+        if not self._price_cache.is_orderbook_fresh(yes_token, 5.0):
+            source = "http_poll"
+
+        # Get sizes from orderbook entries if available
+        yes_entry = self._price_cache.get_orderbook_entry(yes_token)
+        no_entry = self._price_cache.get_orderbook_entry(no_token)
+        yes_size = yes_entry.ask_size if yes_entry else 0.0
+        no_size = no_entry.ask_size if no_entry else 0.0
+
+        # Check for paired opportunity (legacy detector for paper trade)
+        # F-048: With both L2 books cached, size by walking both ask ladders
+        paired_opp = self._paired_detector.detect(
+            market=market,
+            yes_ask=yes_ask,
+            no_ask=no_ask,
+            yes_size=yes_size,
+            no_size=no_size,
+            source=source,
+            yes_levels=self._price_cache.get_book(yes_token),
+            no_levels=self._price_cache.get_book(no_token),
+            max_usd=self._paired_simulator.paper_size_usd,
+        )
+        if paired_opp is None:
+            return None
+        return paired_opp, source
 
-                paired_results.append((synth_opp, market, paper.to_dict()))
+    def _record_paired_entry(
+        self,
+        paired_opp: PairedEntryOpportunity,
+        market: Market,
+        source: str,
+        phase_label: str,
+    ) -> tuple[SniperOpportunity, Market | None, dict]:
+        """Simulate + log a detected paired entry. Returns (opp, market, paper)."""
+        # Simulate paper trade
+        paper = self._paired_simulator.simulate_trade(paired_opp)
+
+        # Log detailed opportunity
+        now = datetime.now(tz=timezone.utc)
+        open_time = now.replace(minute=0, second=0, microsecond=0)
+        secs_since_open = (now - open_time).total_seconds()
+
+        self._market_logger.record(
+            market_id=market.id,
+            market_question=market.question,
+            market_source=market.source.value,
+            asset_symbol=market_metadata(market).asset,
+            trigger_side="PAIRED",
+            trigger_price=paired_opp.total_cost,
+            spread=paired_opp.spread,
+            seconds_since_open=secs_since_open,
+            detection_source=source,
+            is_paired=True,
+        )
 
-                logger.info(
-                    "🔗 [%s] PAIRED ENTRY: %s | Y=$%.4f+N=$%.4f=$%.4f | "
-                    "profit=$%.4f (%.2f%%) | %s",
-                    phase_label, market.question[:50],
-                    paired_opp.yes_ask, paired_opp.no_ask,
-                    paired_opp.total_cost,
-                    paired_opp.spread, paired_opp.roi_pct,
-                    source,
-                )
+        # Create a synthetic SniperOpportunity for the batch alert system
+        synth_opp = SniperOpportunity(
+            trigger_price=paired_opp.total_cost,
+            trigger_side="PAIRED",
+            spread=paired_opp.spread,
+            timestamp=now,
+        )
 
-        return paired_results
+        logger.info(
+            "🔗 [%s] PAIRED ENTRY: %s | Y=$%.4f+N=$%.4f=$%.4f | "
+            "profit=$%.4f (%.2f%%) | %s",
+            phase_label, market.question[:50],
+            paired_opp.yes_ask, paired_opp.no_ask,
+            paired_opp.total_cost,
+            paired_opp.spread, paired_opp.roi_pct,
+            source,
+        )
+        return (synth_opp, market, paper.to_dict())
 
     def _find_market_for_tokens(self, yes_token: str, no_token: str) -> Market | None:
         """F-019: Find the Market object for given token pair.
@@ -1168,7 +1513,7 @@ class EventDrivenLoop:
             )
 
         # Persist position manager state
-        self._position_manager.save_state(Path("data/position_manager_state.json"))
+        self._position_manager.save_state(self._state_path)
 
         return trade
 
@@ -1181,7 +1526,8 @@ class EventDrivenLoop:
         Phase 2: Dynamic threshold per market, cycle stats tracking.
         """
         # F-023 #2: Reset cycle entry counter when first entering SNIPE phase
-        if self._previous_phase != Phase.SNIPE:
+        first_tick = self._previous_phase != Phase.SNIPE
+        if first_tick:
             self._position_manager.reset_cycle_entries()
             logger.info("SNIPE: Reset cycle entry counter")
         self._previous_phase = Phase.SNIPE
@@ -1191,7 +1537,7 @@ class EventDrivenLoop:
             return
 
         # Estimate seconds since market open (top of current hour)
-        now = datetime.now(tz=timezone.utc)
+        now = self._clock.now_datetime()
         open_time = now.replace(minute=0, second=0, microsecond=0)
         seconds_since_open = (now - open_time).total_seconds()
         interval = self._snipe_interval(seconds_since_open)
@@ -1205,7 +1551,20 @@ class EventDrivenLoop:
         # Phase 2: Record poll in cycle stats
         self._cycle_stats.record_poll()
 
-        opportunities = await self._poll_all_pairs(config.sniper_threshold, "SNIPE")
+        # F-037: With a live WS feed, fresh pairs are pushed; poll only stale ones
+        push_mode = self._ws_manager is not None
+        if push_mode:
+            self._push_threshold = config.sniper_threshold
+            self._push_detector.start()
+
+        # F-040: SNIPE fetches jump ahead of background sports scans
+        with priority_scope(PRIORITY_SNIPE):
+            # F-043: First tick evaluates the PRE_OPEN-seeded books too —
+            # they never went through the push detector
+            opportunities = await self._poll_all_pairs(
+                config.sniper_threshold, "SNIPE",
+                stale_only=push_mode and not first_tick, entry_filter=True,
+            )
 
         # Phase 2: Track raw signals
         self._cycle_stats.raw_signals += len(opportunities)
@@ -1213,119 +1572,251 @@ class EventDrivenLoop:
         for opp, (yes_token, no_token) in opportunities:
             # F-019: Find market using token mapping
             market = self._find_market_for_tokens(yes_token, no_token)
-
-            # F-024 Phase 3: Skip crypto directional betting entirely
-            if market and should_skip_crypto_directional(market.source):
-                logger.debug(
-                    "F-024: Skipped crypto directional: %s",
-                    market.question[:40],
-                )
+            if not self._passes_entry_filters(opp, market):
                 continue
+            self._enter_snipe_opportunity(
+                opp, market, seconds_since_open,
+                detection_source=(
+                    "ws_cache"
+                    if self._price_cache.get_best_ask(
+                        self._active_token_pairs[0][0]
+                        if self._active_token_pairs else ""
+                    ) is not None
+                    else "http_poll"
+                ),
+            )
 
-            # Phase 2: Apply dynamic threshold based on liquidity
-            if market:
-                dynamic_thresh = self._dynamic_threshold.get_threshold(
-                    market.liquidity_usd
-                )
-                # Re-check against dynamic threshold
-                if opp.trigger_price > dynamic_thresh:
-                    logger.debug(
-                        "SNIPE: Skipped %s (price $%.4f > dynamic threshold $%.4f, liq=$%.0f)",
-                        market.question[:40] if market else "?",
-                        opp.trigger_price, dynamic_thresh, market.liquidity_usd,
-                    )
-                    continue
+        # Phase 3: Check for paired entry opportunities
+        # F-037: In push mode fresh pairs are evaluated on each WS update instead
+        if not push_mode:
+            paired_results = await self._check_paired_entries(
+                config.sniper_threshold, "SNIPE",
+            )
+            for synth_opp, market, paper_dict in paired_results:
+                self._accept_paired_result(synth_opp, market, paper_dict)
 
-                # F-024: Edge-based entry filter (replaces fixed 5% margin)
-                fair_prob = self._market_fair_values.get(market.id, 0.50)
-                # For NO side, flip the fair probability
-                side_fair_prob = fair_prob if opp.trigger_side == "YES" else (1.0 - fair_prob)
-                edge = calculate_edge(opp.trigger_price, side_fair_prob)
-                min_edge = 0.03  # 3% minimum edge (NBA 0% fees)
-                if edge < min_edge:
-                    logger.debug(
-                        "F-024: Skipped %s (edge=%.3f < %.3f: price=$%.4f, fair=%.3f) | %s",
-                        opp.trigger_side, edge, min_edge,
-                        opp.trigger_price, side_fair_prob,
-                        market.question[:40],
-                    )
-                    continue
-                # Store edge for Kelly sizing
-                self._market_edges[market.id] = edge
-                logger.info(
-                    "F-024: Edge detected: %s %.1f%% (price=$%.3f, fair=%.3f) | %s",
-                    opp.trigger_side, edge * 100,
-                    opp.trigger_price, side_fair_prob,
-                    market.question[:40],
-                )
+        # F-020: Flush batch if interval elapsed
+        await self._flush_batch_alerts()
 
-            # F-019: Record paper trade (returns {} if position already exists)
-            paper = self._record_paper_trade(opp, market)
-            
-            # Only process if we actually entered a position
-            if not paper:
-                continue
-                
-            # Phase 2: Record as filtered signal in cycle stats + settlement tracker
-            self._cycle_stats.record_filtered_signal(
-                market_question=market.question if market else "Unknown",
-                market_source=market.source.value if market else "unknown",
-                trigger_price=opp.trigger_price,
-                trigger_side=opp.trigger_side,
-                paper_size_usd=paper.get("paper_size_usd", 10.0),
+        if push_mode:
+            # F-037: Consume pushed signals until the next stale-pair HTTP poll
+            await self._consume_push_signals(interval, seconds_since_open)
+        else:
+            await asyncio.sleep(interval)
+
+    def _passes_entry_filters(
+        self, opp: SniperOpportunity, market: Market | None,
+    ) -> bool:
+        """SNIPE entry filters: crypto-directional skip, dynamic threshold, edge.
+
+        Stores the edge in ``_market_edges`` for Kelly sizing when it passes.
+        """
+        passes, edge = self._entry_filter_edge(opp, market)
+        if not passes:
+            logger.debug(
+                "SNIPE: Skipped %s $%.4f (crypto directional / dynamic threshold / edge) | %s",
+                opp.trigger_side, opp.trigger_price,
+                market.question[:40] if market else "?",
             )
+            return False
+        if market is not None and edge is not None:
+            self._record_entry_edge(opp, market, edge)
+        return True
 
-            # Settlement tracking now consolidated in _record_paper_trade()
+    def _entry_filter_edge(
+        self, opp: SniperOpportunity, market: Market | None,
+    ) -> tuple[bool, float | None]:
+        """Pure SNIPE entry-filter predicate → (passes, edge).
 
-            if market:
-                # Phase 5: Include fair value in log
-                fair_prob = self._market_fair_values.get(market.id, 0.50) if market else 0.50
-                logger.info(
-                    "🎯 OPPORTUNITY: %s side at $%.4f | fair=%.2f | spread=%.4f | %s",
-                    opp.trigger_side, opp.trigger_price, fair_prob, opp.spread,
-                    market.question[:60] if market else "unknown",
-                )
+        No state changes and no logging, so the F-037 push path can run it on
+        every book update. Without a market only the sniper filter applies and
+        the edge is None.
+        """
+        # F-024 Phase 3: Skip crypto directional betting entirely
+        if market and should_skip_crypto_directional(market.source):
+            return False, None
+        if not market:
+            return True, None
+
+        # Phase 2: Apply dynamic threshold based on liquidity
+        dynamic_thresh = self._dynamic_threshold.get_threshold(
+            market.liquidity_usd
+        )
+        if opp.trigger_price > dynamic_thresh:
+            return False, None
 
-                # Phase 3: Log to market logger
-                self._market_logger.record(
-                    market_id=market.id if market else "",
-                    market_question=market.question if market else "Unknown",
-                    market_source=market.source.value if market else "unknown",
-                    trigger_side=opp.trigger_side,
-                    trigger_price=opp.trigger_price,
-                    spread=opp.spread,
-                    seconds_since_open=seconds_since_open,
-                    detection_source=(
-                        "ws_cache"
-                        if self._price_cache.get_best_ask(
-                            self._active_token_pairs[0][0]
-                            if self._active_token_pairs else ""
-                        ) is not None
-                        else "http_poll"
-                    ),
-                    is_paired=False,
-                )
+        # F-024: Edge-based entry filter (replaces fixed 5% margin)
+        edge = calculate_edge(opp.trigger_price, self._side_fair_prob(opp, market))
+        if edge < self.MIN_ENTRY_EDGE:
+            return False, edge
+        return True, edge
 
-            # F-020: Accumulate for batch alert instead of individual alert
-            self._pending_opps.append((opp, market, paper))
+    def _side_fair_prob(self, opp: SniperOpportunity, market: Market) -> float:
+        """Fair probability of the triggered side (NO flips the YES fair value)."""
+        fair_prob = self._market_fair_values.get(market.id, 0.50)
+        return fair_prob if opp.trigger_side == "YES" else (1.0 - fair_prob)
 
-        # Phase 3: Check for paired entry opportunities
-        paired_results = await self._check_paired_entries(
-            config.sniper_threshold, "SNIPE",
+    def _record_entry_edge(
+        self, opp: SniperOpportunity, market: Market, edge: float,
+    ) -> None:
+        """Store an accepted entry's edge for Kelly sizing and log it."""
+        self._market_edges[market.id] = edge
+        logger.info(
+            "F-024: Edge detected: %s %.1f%% (price=$%.3f, fair=%.3f) | %s",
+            opp.trigger_side, edge * 100,
+            opp.trigger_price, self._side_fair_prob(opp, market),
+            market.question[:40],
         )
-        for synth_opp, market, paper_dict in paired_results:
-            self._pending_opps.append((synth_opp, market, paper_dict))
-            self._cycle_stats.record_filtered_signal(
+
+    def _enter_snipe_opportunity(
+        self,
+        opp: SniperOpportunity,
+        market: Market | None,
+        seconds_since_open: float,
+        detection_source: str,
+    ) -> bool:
+        """Record paper trade, cycle stats, market log and batch alert.
+
+        Returns False if no position was entered (already held, limits).
+        """
+        # F-019: Record paper trade (returns {} if position already exists)
+        paper = self._record_paper_trade(opp, market)
+
+        # Only process if we actually entered a position
+        if not paper:
+            return False
+
+        # Phase 2: Record as filtered signal in cycle stats + settlement tracker
+        self._cycle_stats.record_filtered_signal(
+            market_question=market.question if market else "Unknown",
+            market_source=market.source.value if market else "unknown",
+            trigger_price=opp.trigger_price,
+            trigger_side=opp.trigger_side,
+            paper_size_usd=paper.get("paper_size_usd", 10.0),
+        )
+
+        # Settlement tracking now consolidated in _record_paper_trade()
+
+        if market:
+            # Phase 5: Include fair value in log
+            fair_prob = self._market_fair_values.get(market.id, 0.50) if market else 0.50
+            logger.info(
+                "🎯 OPPORTUNITY: %s side at $%.4f | fair=%.2f | spread=%.4f | %s",
+                opp.trigger_side, opp.trigger_price, fair_prob, opp.spread,
+                market.question[:60] if market else "unknown",
+            )
+
+            # Phase 3: Log to market logger
+            self._market_logger.record(
+                market_id=market.id if market else "",
                 market_question=market.question if market else "Unknown",
                 market_source=market.source.value if market else "unknown",
-                trigger_price=synth_opp.trigger_price,
-                trigger_side="PAIRED",
+                asset_symbol=market_metadata(market).asset if market else "",
+                trigger_side=opp.trigger_side,
+                trigger_price=opp.trigger_price,
+                spread=opp.spread,
+                seconds_since_open=seconds_since_open,
+                detection_source=detection_source,
+                is_paired=False,
             )
 
-        # F-020: Flush batch if interval elapsed
-        await self._flush_batch_alerts()
+        # F-020: Accumulate for batch alert instead of individual alert
+        self._pending_opps.append((opp, market, paper))
+        return True
+
+    def _accept_paired_result(
+        self, synth_opp: SniperOpportunity, market: Market | None, paper_dict: dict,
+    ) -> None:
+        """Queue a recorded paired entry for the batch alert + cycle stats."""
+        self._pending_opps.append((synth_opp, market, paper_dict))
+        self._cycle_stats.record_filtered_signal(
+            market_question=market.question if market else "Unknown",
+            market_source=market.source.value if market else "unknown",
+            trigger_price=synth_opp.trigger_price,
+            trigger_side="PAIRED",
+        )
 
-        await asyncio.sleep(interval)
+    # ------------------------------------------------------------------
+    # F-037: Push-based detection (WS update → evaluate one market → queue)
+    # ------------------------------------------------------------------
+
+    def _evaluate_pair_push(self, yes_token: str, no_token: str) -> list[PushSignal]:
+        """Evaluate only the market whose book just changed.
+
+        Runs the same checks as the polling path: quality filter
+        (``detect_opportunity``), entry filters (dynamic threshold + edge)
+        and the paired CPP check. Side effects (edge bookkeeping, paper
+        trades, logs) are left to the queue consumer.
+        """
+        snapshot = self._try_ws_cache(yes_token, no_token)
+        if snapshot is None:
+            return []
+        market = self._token_to_market.get(yes_token) or self._token_to_market.get(no_token)
+        signals: list[PushSignal] = []
+
+        if self._push_threshold is not None:
+            opp = self.poller.detect_opportunity(snapshot, self._push_threshold)
+            passes, edge = (
+                self._entry_filter_edge(opp, market) if opp is not None else (False, None)
+            )
+            if passes:
+                signals.append(PushSignal(
+                    kind="snipe", pair=(yes_token, no_token),
+                    market=market, opportunity=opp, edge=edge,
+                ))
+
+        if market is not None and market.id not in self._push_paired_seen:
+            detected = self._detect_paired_for_pair(market, yes_token, no_token)
+            if detected is not None:
+                paired_opp, source = detected
+                self._push_paired_seen.add(market.id)
+                signals.append(PushSignal(
+                    kind="paired", pair=(yes_token, no_token),
+                    market=market, opportunity=paired_opp, source=source,
+                ))
+        return signals
+
+    async def _consume_push_signals(
+        self, duration: float, seconds_since_open: float,
+    ) -> int:
+        """Consume pushed signals for up to ``duration`` seconds.
+
+        Returns number of signals processed.
+        """
+        queue = self._push_detector.queue
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration
+        processed = 0
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                signal = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            processed += 1
+            self._push_signals_consumed += 1
+            latency_ms = (time.monotonic() - signal.detected_at) * 1000
+            self._push_latency_ms_max = max(self._push_latency_ms_max, latency_ms)
+            self._cycle_stats.raw_signals += 1
+
+            if signal.kind == "paired":
+                self._accept_paired_result(*self._record_paired_entry(
+                    signal.opportunity, signal.market, signal.source, "SNIPE",
+                ))
+            else:
+                if signal.market is not None and signal.edge is not None:
+                    self._record_entry_edge(signal.opportunity, signal.market, signal.edge)
+                self._enter_snipe_opportunity(
+                    signal.opportunity, signal.market, seconds_since_open,
+                    detection_source=signal.source,
+                )
+            logger.debug(
+                "PUSH: %s %s processed (queue latency %.1fms)",
+                signal.kind, signal.pair[0][:16], latency_ms,
+            )
+        return processed
 
     async def _handle_cooldown_phase(self, config) -> None:
         """Handle COOLDOWN phase: moderate parallel polling.
@@ -1334,6 +1825,7 @@ class EventDrivenLoop:
         Phase 2: Dynamic threshold, cycle stats tracking.
         """
         self._previous_phase = Phase.COOLDOWN
+        self._push_detector.stop()  # F-037: cooldown goes back to polling
         if not self._active_token_pairs:
             await asyncio.sleep(self.COOLDOWN_INTERVAL)
             return
@@ -1343,7 +1835,9 @@ class EventDrivenLoop:
         # Phase 2: Record poll
         self._cycle_stats.record_poll()
 
-        opportunities = await self._poll_all_pairs(config.sniper_threshold, "COOLDOWN")
+        opportunities = await self._poll_all_pairs(
+            config.sniper_threshold, "COOLDOWN", entry_filter=True,
+        )
         self._cycle_stats.raw_signals += len(opportunities)
 
         for opp, (yes_token, no_token) in opportunities:
@@ -1365,7 +1859,7 @@ class EventDrivenLoop:
                 fair_prob = self._market_fair_values.get(market.id, 0.50)
                 side_fair_prob = fair_prob if opp.trigger_side == "YES" else (1.0 - fair_prob)
                 edge = calculate_edge(opp.trigger_price, side_fair_prob)
-                if edge < 0.03:
+                if edge < self.MIN_ENTRY_EDGE:
                     continue
                 self._market_edges[market.id] = edge
 
@@ -1400,6 +1894,7 @@ class EventDrivenLoop:
                     market_id=market.id if market else "",
                     market_question=market.question if market else "Unknown",
                     market_source=market.source.value if market else "unknown",
+                    asset_symbol=market_metadata(market).asset if market else "",
                     trigger_side=opp.trigger_side,
                     trigger_price=opp.trigger_price,
                     spread=opp.spread,
@@ -1483,10 +1978,13 @@ class EventDrivenLoop:
         self._last_batch_alert = now
 
     def get_paper_trading_summary(self) -> dict:
-        """F-019: Get paper trading P&L summary."""
+        """F-019: Get paper trading P&L summary.
+
+        F-057: ``last_7d`` comes from the daily rollups (O(days)).
+        """
         open_trades = [t for t in self._paper_trades if t["status"] == "open"]
         total_paper_invested = sum(t["paper_size_usd"] for t in self._paper_trades)
-        return {
+        summary = {
             "total_trades": len(self._paper_trades),
             "open_trades": len(open_trades),
             "total_invested": total_paper_invested,
@@ -1494,6 +1992,29 @@ class EventDrivenLoop:
             "wins": self._paper_wins,
             "losses": self._paper_losses,
         }
+        recent = self._recent_rollup(days=7)
+        if recent is not None:
+            s = recent.single
+            summary["last_7d"] = {
+                "trades": s.total_trades,
+                "open_trades": s.open_trades,
+                "pnl": s.total_pnl,
+                "wins": s.wins,
+                "losses": s.losses,
+            }
+        return summary
+
+    def _recent_rollup(self, days: int) -> TradeAggregate | None:
+        """F-057: Last ``days`` of paper trading from the daily rollups (None on error)."""
+        try:
+            if self._rollups is None:
+                self._rollups = DailyRollups(
+                    self._paper_trade_dir, self._settlement_tracker.store,
+                )
+            return self._rollups.recent(days)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Daily rollups unavailable: %s", e)
+            return None
 
     # ------------------------------------------------------------------
     # Phase 2: Cycle report + settlement
@@ -1525,6 +2046,53 @@ class EventDrivenLoop:
                 f"{cache_stats['orderbooks_cached']} orderbooks"
             )
 
+        # F-039: Calls saved by single-flight + orderbook cache
+        clob_fetcher = getattr(self.poller, "clob_fetcher", None)
+        if isinstance(clob_fetcher, ClobOrderbookFetcher):
+            coalesce = clob_fetcher.coalesce_stats()
+            if coalesce["saved"] > 0:
+                extra_lines.append(
+                    f"\n<b>F-039: CLOB Coalescing</b>\n"
+                    f"  Token lookups: {coalesce['calls']} | fetched: {coalesce['executed']}\n"
+                    f"  Saved: {coalesce['saved']} "
+                    f"(in-flight {coalesce['coalesced']}, cache {coalesce['cache_hits']})"
+                )
+
+        # F-044: Open-deadline wake-up accuracy
+        timer_stats = self._timer.stats()
+        if timer_stats["wakeups"] > 0:
+            clock_stats = timer_stats["clock"]
+            uncertainty = clock_stats["uncertainty_ms"]
+            extra_lines.append(
+                f"\n<b>F-044: Open Timer</b>\n"
+                f"  Last jitter: {timer_stats['last_jitter_ms']:+.1f}ms | "
+                f"max: {timer_stats['max_abs_jitter_ms']:.1f}ms\n"
+                f"  Clock offset: {clock_stats['offset_ms']:+.1f}ms "
+                f"(±{'?' if uncertainty is None else f'{uncertainty:.0f}'}ms, "
+                f"{clock_stats['samples']} samples)"
+            )
+
+        push_stats = self._push_detector.stats()
+        if push_stats["updates"] > 0:
+            extra_lines.append(
+                f"\n<b>F-037: Push Detection</b>\n"
+                f"  Updates: {push_stats['updates']} | Evals: {push_stats['evaluations']}\n"
+                f"  Signals: {self._push_signals_consumed} "
+                f"(dropped {push_stats['dropped']}) | "
+                f"max queue latency: {self._push_latency_ms_max:.1f}ms"
+            )
+
+        # F-057: Rolling paper P&L (rollups; only stale days are rebuilt)
+        recent = await asyncio.to_thread(self._recent_rollup, 7)
+        if recent is not None and recent.single.total_trades > 0:
+            s = recent.single
+            extra_lines.append(
+                f"\n<b>Paper P&L (7d)</b>\n"
+                f"  Trades: {s.total_trades} (open {s.open_trades})\n"
+                f"  W/L: {s.wins}/{s.losses} ({s.win_rate * 100:.0f}%) | "
+                f"P&L: ${s.total_pnl:+.2f}"
+            )
+
         if paired_summary["total_trades"] > 0:
             extra_lines.append(
                 f"\n<b>Phase 3: Paired Entry</b>\n"
@@ -1559,30 +2127,33 @@ class EventDrivenLoop:
         """Phase 2: Check pending paper trades for settlement."""
         try:
             summary = await self._settlement_tracker.check_and_settle()
-            if summary.newly_settled > 0:
-                report = self._settlement_tracker.format_settlement_report(summary)
-                logger.info(
-                    "SETTLEMENT: %d newly settled | P&L: $%.2f",
-                    summary.newly_settled, summary.cumulative_pnl,
-                )
-                # 정산 리포트는 로그에만 기록, 텔레그램 알림 비활성화
-
-                # Update internal P&L tracking
-                self._paper_pnl = summary.cumulative_pnl
-                self._paper_wins = summary.wins
-                self._paper_losses = summary.losses
-                
-                # Also update position manager and save state
-                # Note: settlement_tracker handles actual settlement logic
-                self._position_manager.save_state(Path("data/position_manager_state.json"))
-            else:
-                logger.info(
-                    "SETTLEMENT: No new settlements (open=%d, expired=%d)",
-                    summary.total_open, summary.total_expired,
-                )
+            self._apply_settlement_summary(summary)
         except Exception:
             logger.exception("Error during settlement check")
 
+    def _apply_settlement_summary(self, summary) -> None:
+        """Log a settlement pass and mirror its P&L totals."""
+        if summary.newly_settled > 0:
+            logger.info(
+                "SETTLEMENT: %d newly settled | P&L: $%.2f",
+                summary.newly_settled, summary.cumulative_pnl,
+            )
+            # 정산 리포트는 로그에만 기록, 텔레그램 알림 비활성화
+
+            # Update internal P&L tracking
+            self._paper_pnl = summary.cumulative_pnl
+            self._paper_wins = summary.wins
+            self._paper_losses = summary.losses
+
+            # Also update position manager and save state
+            # Note: settlement_tracker handles actual settlement logic
+            self._position_manager.save_state(self._state_path)
+        else:
+            logger.info(
+                "SETTLEMENT: No new settlements (open=%d, expired=%d)",
+                summary.total_open, summary.total_expired,
+            )
+
     # ------------------------------------------------------------------
     # F-022: NBA Market Discovery with Verification
     # ------------------------------------------------------------------
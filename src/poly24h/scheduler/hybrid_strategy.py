@@ -22,6 +22,8 @@ from poly24h.models.market import Market, MarketSource
 from poly24h.strategy.fee_calculator import (
     calculate_paired_cpp,
     is_profitable_after_fees,
+    is_profitable_after_fees_fast,
+    price_to_tick,
 )
 
 logger = logging.getLogger(__name__)
@@ -114,6 +116,19 @@ class HybridStrategy:
         Returns:
             True if eligible for paired entry
         """
+        # F-047: On-grid prices use integer ticks + the precomputed fee table
+        yes_tick = price_to_tick(market.yes_price)
+        no_tick = price_to_tick(market.no_price)
+        max_cpp_tick = price_to_tick(float(self.config.paired_max_cpp))
+        if yes_tick is not None and no_tick is not None and max_cpp_tick is not None:
+            if yes_tick + no_tick >= max_cpp_tick:
+                return False
+            return is_profitable_after_fees_fast(
+                market.yes_price, market.no_price,
+                min_margin=self.config.min_profit_margin,
+                use_taker=True,
+            )
+
         yes_price = Decimal(str(market.yes_price))
         no_price = Decimal(str(market.no_price))
         
@@ -0,0 +1,233 @@
+"""F-046: Struct-of-arrays market state table for batch detection.
+
+``EventDrivenLoop``은 ``_active_token_pairs``/``_active_markets`` 병렬 리스트와
+``_market_fair_values`` 등 dict를 페어마다 파이썬으로 순회하며 검사했다.
+이 테이블은 마켓당 슬롯 1개, 컬럼당 배열 1개로 상태를 들고 있고
+스나이퍼 threshold / paired CPP / edge 검사를 한 번의 배열 연산으로 수행해
+후보 슬롯만 반환한다. 세부 판정(기존 ``detect_opportunity`` 등)은 후보에만 실행.
+
+- NumPy가 있으면 float64 배열 + 벡터 연산, 없으면 같은 API의 리스트 구현
+  (``pip install poly24h[fast]``)
+- 값이 없는 칸은 NaN — NaN 비교는 항상 False라 별도 마스크가 필요 없다
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, Iterable, Mapping, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+from poly24h.models.market import Market, MarketSource
+
+NAN = float("nan")
+DEFAULT_FAIR_PROB = 0.50
+
+COLUMNS = (
+    "yes_ask", "no_ask", "yes_size", "no_size",
+    "fair_prob", "liquidity", "threshold", "updated_at",
+)
+
+
+def _f(value: float | None) -> float:
+    return NAN if value is None else float(value)
+
+
+class MarketStateTable:
+    """Columnar per-market state; slot ``i`` ↔ ``pairs[i]`` ↔ ``markets[i]``.
+
+    Columns (NaN = unknown): yes_ask, no_ask, yes_size, no_size,
+    fair_prob, liquidity, threshold (dynamic, by liquidity), updated_at.
+    Masks: has_market, is_crypto.
+    """
+
+    def __init__(self) -> None:
+        self.pairs: list[tuple[str, str]] = []
+        self.markets: list[Market | None] = []
+        self.slot_of: dict[str, int] = {}  # token_id → slot
+        self._source: object | None = None  # list the table was built from
+        self._alloc(0)
+
+    @property
+    def size(self) -> int:
+        return len(self.pairs)
+
+    @property
+    def vectorized(self) -> bool:
+        return np is not None
+
+    def built_from(self, pairs: list[tuple[str, str]]) -> bool:
+        """True if the table mirrors this pair list (same object, same length)."""
+        return self._source is pairs and self.size == len(pairs)
+
+    # ------------------------------------------------------------------
+    # Loading / updates
+    # ------------------------------------------------------------------
+
+    def load(
+        self,
+        pairs: list[tuple[str, str]],
+        markets: Sequence[Market | None],
+        threshold_for: Callable[[float], float] | None = None,
+        fair_values: Mapping[str, float] | None = None,
+    ) -> None:
+        """Rebuild slots from index-aligned pairs/markets (markets may be shorter)."""
+        self._source = pairs
+        self.pairs = list(pairs)
+        n = len(self.pairs)
+        self.markets = [markets[i] if i < len(markets) else None for i in range(n)]
+        self.slot_of = {}
+        for slot, (yes_token, no_token) in enumerate(self.pairs):
+            self.slot_of[yes_token] = slot
+            self.slot_of[no_token] = slot
+
+        self._alloc(n)
+        liquidity = [float(m.liquidity_usd) if m else NAN for m in self.markets]
+        self.liquidity = self._col(liquidity)
+        if threshold_for is not None:
+            self.threshold = self._col(
+                NAN if math.isnan(liq) else threshold_for(liq) for liq in liquidity
+            )
+        self.has_market = self._mask(m is not None for m in self.markets)
+        self.is_crypto = self._mask(
+            m is not None and m.source == MarketSource.HOURLY_CRYPTO for m in self.markets
+        )
+        self.set_fair_values(fair_values or {})
+
+    def set_fair_values(self, fair_values: Mapping[str, float]) -> None:
+        self.fair_prob = self._col(
+            fair_values.get(m.id, DEFAULT_FAIR_PROB) if m else DEFAULT_FAIR_PROB
+            for m in self.markets
+        )
+
+    def set_asks(
+        self,
+        yes_asks: Iterable[float | None],
+        no_asks: Iterable[float | None],
+        now: float | None = None,
+    ) -> None:
+        """Replace both ask columns at once (``None`` → NaN)."""
+        self.yes_ask = self._col(_f(a) for a in yes_asks)
+        self.no_ask = self._col(_f(a) for a in no_asks)
+        self.updated_at = self._col([time.time() if now is None else now] * self.size)
+
+    def refresh_from_cache(self, price_cache) -> None:
+        """Pull best asks + sizes for every slot from a ``PriceCache``."""
+        yes_asks, no_asks, yes_sizes, no_sizes, stamps = [], [], [], [], []
+        for yes_token, no_token in self.pairs:
+            yes_asks.append(_f(price_cache.get_best_ask(yes_token)))
+            no_asks.append(_f(price_cache.get_best_ask(no_token)))
+            yes_entry = price_cache.get_orderbook_entry(yes_token)
+            no_entry = price_cache.get_orderbook_entry(no_token)
+            yes_sizes.append(yes_entry.ask_size if yes_entry else NAN)
+            no_sizes.append(no_entry.ask_size if no_entry else NAN)
+            stamps.append(
+                min(yes_entry.timestamp, no_entry.timestamp)
+                if yes_entry and no_entry else NAN
+            )
+        self.yes_ask = self._col(yes_asks)
+        self.no_ask = self._col(no_asks)
+        self.yes_size = self._col(yes_sizes)
+        self.no_size = self._col(no_sizes)
+        self.updated_at = self._col(stamps)
+
+    # ------------------------------------------------------------------
+    # Batch passes → candidate slots
+    # ------------------------------------------------------------------
+
+    def sniper_slots(self, threshold: float, min_price: float) -> list[int]:
+        """Slots where either side's ask is in ``[min_price, threshold]``.
+
+        Same quality filter as ``RapidOrderbookPoller.detect_opportunity``.
+        """
+        if np is not None:
+            y, n = self.yes_ask, self.no_ask
+            hit = ((y >= min_price) & (y <= threshold)) | ((n >= min_price) & (n <= threshold))
+            return np.flatnonzero(hit).tolist()
+        return [
+            i for i, (y, n) in enumerate(zip(self.yes_ask, self.no_ask))
+            if min_price <= y <= threshold or min_price <= n <= threshold
+        ]
+
+    def paired_slots(
+        self, max_cpp: float, min_price: float, crypto_only: bool = False,
+    ) -> list[int]:
+        """Slots with a market where both asks ≥ ``min_price`` and YES+NO < ``max_cpp``."""
+        mask = self.is_crypto if crypto_only else self.has_market
+        if np is not None:
+            y, n = self.yes_ask, self.no_ask
+            hit = mask & (y >= min_price) & (n >= min_price) & (y + n < max_cpp)
+            return np.flatnonzero(hit).tolist()
+        return [
+            i for i, (ok, y, n) in enumerate(zip(mask, self.yes_ask, self.no_ask))
+            if ok and y >= min_price and n >= min_price and y + n < max_cpp
+        ]
+
+    def entry_slots(
+        self, threshold: float, min_price: float, min_edge: float,
+        skip_crypto: bool = False,
+    ) -> list[int]:
+        """Sniper slots whose cheapest valid side also passes the per-market
+        dynamic threshold and ``fair - price >= min_edge`` (F-024 edge).
+
+        Slots without a market only need the sniper filter (like
+        ``_passes_entry_filters``). ``skip_crypto`` drops hourly crypto slots
+        (F-024 Phase 3 directional skip).
+        """
+        if np is not None:
+            y, n = self.yes_ask, self.no_ask
+            yv = (y >= min_price) & (y <= threshold)
+            nv = (n >= min_price) & (n <= threshold)
+            take_yes = yv & (~nv | (y <= n))
+            price = np.where(take_yes, y, n)
+            side_fair = np.where(take_yes, self.fair_prob, 1.0 - self.fair_prob)
+            dyn_ok = np.isnan(self.threshold) | (price <= self.threshold)
+            edge_ok = (side_fair - price) >= min_edge
+            hit = (yv | nv) & (~self.has_market | (dyn_ok & edge_ok))
+            if skip_crypto:
+                hit &= ~self.is_crypto
+            return np.flatnonzero(hit).tolist()
+
+        slots = []
+        for i in self.sniper_slots(threshold, min_price):
+            if skip_crypto and self.is_crypto[i]:
+                continue
+            y, n = self.yes_ask[i], self.no_ask[i]
+            yv = min_price <= y <= threshold
+            nv = min_price <= n <= threshold
+            take_yes = yv and (not nv or y <= n)
+            price = y if take_yes else n
+            if not self.has_market[i]:
+                slots.append(i)
+                continue
+            fair = self.fair_prob[i] if take_yes else 1.0 - self.fair_prob[i]
+            dyn = self.threshold[i]
+            if (math.isnan(dyn) or price <= dyn) and fair - price >= min_edge:
+                slots.append(i)
+        return slots
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _alloc(self, n: int) -> None:
+        for name in COLUMNS:
+            setattr(self, name, self._col([NAN] * n))
+        self.has_market = self._mask([False] * n)
+        self.is_crypto = self._mask([False] * n)
+
+    @staticmethod
+    def _col(values: Iterable[float]):
+        if np is not None:
+            return np.fromiter(values, dtype=np.float64)
+        return list(values)
+
+    @staticmethod
+    def _mask(values: Iterable[bool]):
+        if np is not None:
+            return np.fromiter(values, dtype=bool)
+        return list(values)
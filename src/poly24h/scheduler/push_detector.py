@@ -0,0 +1,161 @@
+"""F-037: Push-based opportunity detection from the WebSocket feed.
+
+PriceCache 업데이트마다 해당 토큰이 속한 마켓만 평가하고, 진입 후보를
+asyncio.Queue로 밀어 넣는다. 전체 페어를 주기적으로 재폴링하는 대신
+업데이트 수에 비례해 CPU를 쓰고, 감지 지연은 폴링 간격(초)이 아닌
+이벤트 루프 한 틱(ms) 수준이 된다.
+
+같은 틱 안에서 같은 마켓에 여러 업데이트가 오면 (YES/NO 양쪽 book 등)
+한 번만 평가한다 (dirty set + ``loop.call_soon``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from poly24h.models.market import Market
+from poly24h.websocket.price_cache import PriceCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 1000
+
+
+@dataclass
+class PushSignal:
+    """Entry candidate produced by a cache update.
+
+    Attributes:
+        kind: "snipe" (single-side) or "paired" (CPP arb).
+        pair: (yes_token, no_token).
+        market: Market for the pair (None if unknown).
+        opportunity: SniperOpportunity or PairedEntryOpportunity.
+        source: Detection source label for logging.
+        edge: F-024 edge of a snipe candidate (None if no market/edge).
+        detected_at: time.monotonic() at evaluation (latency tracking).
+    """
+
+    kind: str
+    pair: tuple[str, str]
+    market: Market | None
+    opportunity: Any
+    source: str = "ws_push"
+    edge: float | None = None
+    detected_at: float = field(default_factory=time.monotonic)
+
+
+class PushDetector:
+    """PriceCache listener → coalesced per-market evaluation → queue.
+
+    Args:
+        cache: 구독할 PriceCache.
+        evaluate: ``(yes_token, no_token) → list[PushSignal]`` 평가 함수.
+        maxsize: 큐 최대 크기. 가득 차면 가장 오래된 신호를 버린다.
+    """
+
+    def __init__(
+        self,
+        cache: PriceCache,
+        evaluate: Callable[[str, str], list[PushSignal]],
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+    ):
+        self._cache = cache
+        self._evaluate = evaluate
+        self._maxsize = maxsize
+        self._queue: asyncio.Queue[PushSignal] | None = None
+        self._token_pairs: dict[str, tuple[str, str]] = {}
+        self._dirty: dict[tuple[str, str], None] = {}  # insertion-ordered set
+        self._drain_scheduled = False
+        self._active = False
+        # Stats
+        self.updates_seen = 0
+        self.evaluations = 0
+        self.signals_emitted = 0
+        self.signals_dropped = 0
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @property
+    def queue(self) -> asyncio.Queue[PushSignal]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._maxsize)
+        return self._queue
+
+    def set_pairs(self, pairs: list[tuple[str, str]]) -> None:
+        """감시 대상 (yes, no) 페어 교체."""
+        self._token_pairs = {}
+        for pair in pairs:
+            yes_token, no_token = pair
+            self._token_pairs[yes_token] = pair
+            self._token_pairs[no_token] = pair
+        self._dirty.clear()
+
+    def start(self) -> None:
+        """캐시 리스너 등록."""
+        if not self._active:
+            self._cache.add_listener(self._on_update)
+            self._active = True
+
+    def stop(self) -> None:
+        """리스너 해제 + 대기 중인 신호 폐기."""
+        if self._active:
+            self._cache.remove_listener(self._on_update)
+            self._active = False
+        self._dirty.clear()
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
+    def stats(self) -> dict:
+        return {
+            "updates": self.updates_seen,
+            "evaluations": self.evaluations,
+            "signals": self.signals_emitted,
+            "dropped": self.signals_dropped,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _on_update(self, token_id: str) -> None:
+        pair = self._token_pairs.get(token_id)
+        if pair is None:
+            return
+        self.updates_seen += 1
+        self._dirty[pair] = None
+        if not self._drain_scheduled:
+            try:
+                asyncio.get_running_loop().call_soon(self._drain)
+                self._drain_scheduled = True
+            except RuntimeError:
+                # 루프 밖 (동기 테스트 등) — 즉시 평가
+                self._drain()
+
+    def _drain(self) -> None:
+        self._drain_scheduled = False
+        dirty, self._dirty = self._dirty, {}
+        for yes_token, no_token in dirty:
+            self.evaluations += 1
+            try:
+                signals = self._evaluate(yes_token, no_token)
+            except Exception as exc:
+                logger.warning("Push evaluation failed for %s: %s", yes_token[:16], exc)
+                continue
+            for signal in signals:
+                self._put(signal)
+
+    def _put(self, signal: PushSignal) -> None:
+        queue = self.queue
+        if queue.full():
+            queue.get_nowait()
+            self.signals_dropped += 1
+        queue.put_nowait(signal)
+        self.signals_emitted += 1
@@ -0,0 +1,238 @@
+"""F-039: Single-flight request coalescing + short-TTL read-through cache.
+
+SportsMonitor 태스크들, SportsPairedScanner, EventDrivenLoop이 같은 토큰/엔드포인트를
+동시에 조회하는 경우가 많다. 같은 키의 요청이 이미 진행 중이면 새 요청을 보내지 않고
+진행 중인 Future를 함께 기다리며, 결과는 ``ttl`` 동안 캐시해 직후 중복 조회도 없앤다.
+
+Usage:
+    coalescer = RequestCoalescer(ttl=0.5)
+    data = await coalescer.do(("GET", url, params_key), lambda: fetch(url))
+    books = await coalescer.do_many(token_ids, fetch_many)   # 배치 API용
+
+``saved`` = 캐시 적중 + in-flight 합류 → 실제로 아낀 HTTP 호출 수.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class _OwnerCancelledError(Exception):
+    """Set on a shared future when the task running the call was cancelled.
+
+    합류한 대기자들은 취소되지 않았으므로 CancelledError 대신 이 예외를 받고
+    호출을 직접 다시 실행한다.
+    """
+
+
+class RequestCoalescer:
+    """Per-key single-flight with an optional TTL cache.
+
+    Args:
+        ttl: 결과 캐시 시간 (초). 0이면 캐시 없이 single-flight만.
+        cacheable: 결과를 캐시할지 판단 (실패/빈 응답은 캐시하지 않도록).
+        max_entries: 캐시 최대 항목 수 (초과 시 만료 항목 → 오래된 항목 순 제거).
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0.0,
+        cacheable: Callable[[Any], bool] | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self._cacheable = cacheable or (lambda value: value is not None)
+        self._max_entries = max_entries
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._cache: dict[Hashable, tuple[float, Any]] = {}
+
+        # Metrics
+        self.calls = 0          # 요청된 키 수
+        self.executed = 0       # 실제 수행된 키 수
+        self.coalesced = 0      # 진행 중 요청에 합류
+        self.cache_hits = 0     # TTL 캐시 적중
+
+    @property
+    def saved(self) -> int:
+        return self.coalesced + self.cache_hits
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "cache_hits": self.cache_hits,
+            "saved": self.saved,
+            "inflight": len(self._inflight),
+            "cached": len(self._cache),
+        }
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """캐시 항목 제거 (key=None이면 전체)."""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Single key
+    # ------------------------------------------------------------------
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """``key``에 대해 fn()을 최대 한 번만 실행하고 결과를 공유.
+
+        실행 중인 태스크가 취소되면 합류한 대기자는 fn()을 직접 다시 실행한다.
+        """
+        self.calls += 1
+        ttl = self.ttl if ttl is None else ttl
+
+        while True:
+            cached = self._cache_get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached[0]
+
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except _OwnerCancelledError:
+                self.coalesced -= 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.executed += 1
+        try:
+            result = await fn()
+        except BaseException as exc:
+            self._fail(future, exc)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self._store(key, result, ttl)
+        future.set_result(result)
+        return result
+
+    # ------------------------------------------------------------------
+    # Batched keys
+    # ------------------------------------------------------------------
+
+    async def do_many(
+        self,
+        keys: Iterable[Hashable],
+        fetch_many: Callable[[list], Awaitable[dict]],
+        ttl: float | None = None,
+    ) -> dict:
+        """여러 키를 한 번에 조회 — 캐시/진행 중인 키는 빼고 나머지만 ``fetch_many``.
+
+        ``fetch_many(missing_keys) → {key: value}``. 결과에 없는 키는 값이 None.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        results: dict = {}
+        waiting: dict[Hashable, asyncio.Future] = {}
+        owned: list = []
+
+        for key in dict.fromkeys(keys):
+            self.calls += 1
+            cached = self._cache_get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                results[key] = cached[0]
+                continue
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                waiting[key] = future
+                continue
+            owned.append(key)
+
+        if owned:
+            loop = asyncio.get_running_loop()
+            futures = {key: loop.create_future() for key in owned}
+            self._inflight.update(futures)
+            self.executed += len(owned)
+            try:
+                fetched = await fetch_many(owned)
+            except BaseException as exc:
+                for future in futures.values():
+                    self._fail(future, exc)
+                raise
+            finally:
+                for key in owned:
+                    if self._inflight.get(key) is futures[key]:
+                        del self._inflight[key]
+            for key in owned:
+                value = fetched.get(key)
+                self._store(key, value, ttl)
+                futures[key].set_result(value)
+                results[key] = value
+
+        retry: list = []
+        for key, future in waiting.items():
+            try:
+                results[key] = await asyncio.shield(future)
+            except _OwnerCancelledError:
+                self.coalesced -= 1
+                self.calls -= 1
+                retry.append(key)
+        if retry:
+            results.update(await self.do_many(retry, fetch_many, ttl))
+
+        return results
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _cache_get(self, key: Hashable) -> tuple[Any] | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        return (value,)
+
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        if ttl <= 0 or not self._cacheable(value):
+            return
+        if len(self._cache) >= self._max_entries:
+            self._evict()
+        self._cache[key] = (time.monotonic() + ttl, value)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        expired = [k for k, (exp, _) in self._cache.items() if exp <= now]
+        for key in expired:
+            del self._cache[key]
+        # 여전히 가득 차면 가장 오래 전에 넣은 항목부터 (dict 삽입 순서)
+        while len(self._cache) >= self._max_entries:
+            del self._cache[next(iter(self._cache))]
+
+    @staticmethod
+    def _fail(future: asyncio.Future, exc: BaseException) -> None:
+        if future.done():
+            return
+        if isinstance(exc, asyncio.CancelledError):
+            future.set_exception(_OwnerCancelledError())
+        else:
+            future.set_exception(exc)
+        # 기다리는 쪽이 없어도 "exception was never retrieved" 경고가 나지 않게
+        future.add_done_callback(
+            lambda f: f.cancelled() or f.exception()
+        )
@@ -16,6 +16,8 @@ from typing import List, Tuple
 
 import aiohttp
 
+from poly24h.http_transport import HttpTransport, get_default_transport
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +47,10 @@ class CryptoFairValueCalculator:
     
     BINANCE_KLINES_URL = "https://api.binance.com/api/v3/klines"
     
+    def __init__(self, transport: HttpTransport | None = None):
+        # F-034: 공유 커넥션 풀 (호출마다 세션 생성하지 않음)
+        self._transport = transport or get_default_transport()
+    
     async def fetch_binance_ohlcv(
         self,
         symbol: str,
@@ -62,40 +68,39 @@ class CryptoFairValueCalculator:
             List of dicts with keys: open, high, low, close, volume, timestamp
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "symbol": symbol.upper(),
-                    "interval": interval,
-                    "limit": limit,
-                }
-                async with session.get(
-                    self.BINANCE_KLINES_URL,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as response:
-                    if response.status != 200:
-                        logger.warning(
-                            "Binance API error: %s %s",
-                            response.status, await response.text()
-                        )
-                        return []
-                    
-                    raw = await response.json()
-                    
-                    # Binance klines format:
-                    # [open_time, open, high, low, close, volume, close_time, ...]
-                    result = []
-                    for candle in raw:
-                        result.append({
-                            "timestamp": candle[0],
-                            "open": float(candle[1]),
-                            "high": float(candle[2]),
-                            "low": float(candle[3]),
-                            "close": float(candle[4]),
-                            "volume": float(candle[5]),
-                        })
-                    return result
-                    
+            params = {
+                "symbol": symbol.upper(),
+                "interval": interval,
+                "limit": limit,
+            }
+            async with self._transport.get(
+                self.BINANCE_KLINES_URL,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                if response.status != 200:
+                    logger.warning(
+                        "Binance API error: %s %s",
+                        response.status, await response.text()
+                    )
+                    return []
+                
+                raw = await response.json()
+                
+                # Binance klines format:
+                # [open_time, open, high, low, close, volume, close_time, ...]
+                result = []
+                for candle in raw:
+                    result.append({
+                        "timestamp": candle[0],
+                        "open": float(candle[1]),
+                        "high": float(candle[2]),
+                        "low": float(candle[3]),
+                        "close": float(candle[4]),
+                        "volume": float(candle[5]),
+                    })
+                return result
+                
         except Exception as e:
             logger.error("Failed to fetch Binance OHLCV for %s: %s", symbol, e)
             return []
@@ -5,11 +5,18 @@ Implements Polymarket's dynamic fee structure:
 - Maker Rebate: 80% of Taker Fee
 
 Used for Paired Entry profitability calculations.
+
+F-047: Hot paths use the precomputed per-tick tables at the bottom of this
+module (``is_profitable_after_fees_fast``, ``max_counter_price``); the
+``Decimal`` functions are the reference implementation.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from decimal import Decimal, ROUND_DOWN
+from functools import lru_cache
+from typing import Iterable
 
 # Fee constants
 TAKER_FEE_MAX_RATE = Decimal("0.0315")  # 3.15% at 50% probability
@@ -180,3 +187,108 @@ def calculate_expected_profit(
     
     margin_per_pair = Decimal("1.0") - cpp
     return shares * margin_per_pair
+
+
+# ---------------------------------------------------------------------------
+# F-047: Precomputed fee tables (float/int fast path)
+# ---------------------------------------------------------------------------
+#
+# 가격은 틱 그리드(0.001) 위에 있으므로 틱별 real cost를 한 번만 Decimal로
+# 계산해 정수 테이블로 둔다. 단위는 1e-6 (taker fee는 0.00001 단위로 절사,
+# maker rebate는 그 80% → 1e-6 단위에서 모두 정확한 정수).
+# 위의 Decimal 함수가 기준 구현이고, fast path는 그 결과와 동일해야 한다.
+
+TICKS_PER_UNIT = 1000           # 0.001 price grid (covers 0.01 tick markets)
+COST_UNITS = 1_000_000          # real cost unit = 1e-6
+_TICK_EPS = 1e-9
+
+
+def _cost_table(is_maker: bool) -> tuple[int, ...]:
+    return tuple(
+        int(calculate_real_cost(Decimal(t) / TICKS_PER_UNIT, is_maker) * COST_UNITS)
+        for t in range(TICKS_PER_UNIT + 1)
+    )
+
+
+TAKER_COST_TABLE = _cost_table(is_maker=False)  # tick → real cost (1e-6)
+MAKER_COST_TABLE = _cost_table(is_maker=True)
+
+
+def price_to_tick(price: float) -> int | None:
+    """Float price → grid tick, or None if off-grid / outside [0, 1]."""
+    scaled = price * TICKS_PER_UNIT
+    tick = round(scaled)
+    if 0 <= tick <= TICKS_PER_UNIT and abs(tick - scaled) < _TICK_EPS * TICKS_PER_UNIT:
+        return tick
+    return None
+
+
+def _margin_units(min_margin: float | Decimal) -> int:
+    return round(float(min_margin) * COST_UNITS)
+
+
+def real_cost_fast(price: float, is_maker: bool = False) -> float:
+    """Table lookup version of :func:`calculate_real_cost` (float in/out)."""
+    tick = price_to_tick(price)
+    if tick is None:
+        return float(calculate_real_cost(Decimal(str(price)), is_maker))
+    table = MAKER_COST_TABLE if is_maker else TAKER_COST_TABLE
+    return table[tick] / COST_UNITS
+
+
+def is_profitable_after_fees_fast(
+    yes_price: float,
+    no_price: float,
+    min_margin: float | Decimal = 0.01,
+    use_taker: bool = True,
+) -> bool:
+    """Integer-table version of :func:`is_profitable_after_fees`.
+
+    On-grid prices never touch ``Decimal``; off-grid prices fall back to the
+    reference implementation. ``min_margin`` is taken at 1e-6 precision.
+    """
+    yes_tick = price_to_tick(yes_price)
+    no_tick = price_to_tick(no_price)
+    if yes_tick is None or no_tick is None:
+        return is_profitable_after_fees(
+            Decimal(str(yes_price)), Decimal(str(no_price)),
+            min_margin=Decimal(str(min_margin)), use_taker=use_taker,
+        )
+    table = TAKER_COST_TABLE if use_taker else MAKER_COST_TABLE
+    return table[yes_tick] + table[no_tick] < COST_UNITS - _margin_units(min_margin)
+
+
+@lru_cache(maxsize=32)
+def max_counter_tick_table(margin_units: int, use_taker: bool = True) -> tuple[int, ...]:
+    """tick → highest counter-side tick that keeps CPP < 1 - margin (-1 if none).
+
+    Real cost is strictly increasing in price, so each entry is one bisect
+    over the cost table. Cached per (margin, fee side).
+    """
+    table = TAKER_COST_TABLE if use_taker else MAKER_COST_TABLE
+    budget = COST_UNITS - margin_units
+    return tuple(bisect_left(table, budget - cost) - 1 for cost in table)
+
+
+def max_counter_price(
+    price: float, min_margin: float | Decimal = 0.01, use_taker: bool = True,
+) -> float | None:
+    """Highest counter-side price that keeps the pair profitable after fees.
+
+    E.g. YES ask $0.45 → the NO ask must be ≤ the returned price.
+    None if no counter price works (or ``price`` is off-grid).
+    """
+    return max_counter_prices([price], min_margin, use_taker)[0]
+
+
+def max_counter_prices(
+    prices: Iterable[float], min_margin: float | Decimal = 0.01, use_taker: bool = True,
+) -> list[float | None]:
+    """Batch :func:`max_counter_price` — one table lookup per price."""
+    lookup = max_counter_tick_table(_margin_units(min_margin), use_taker)
+    result: list[float | None] = []
+    for price in prices:
+        tick = price_to_tick(price)
+        counter = lookup[tick] if tick is not None else -1
+        result.append(counter / TICKS_PER_UNIT if counter >= 0 else None)
+    return result
@@ -16,6 +16,8 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+from poly24h.jsonl_writer import JsonlWriter, get_default_writer
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_HISTORY_FILE = "data/moneyline_validation_history.json"
@@ -28,8 +30,13 @@ class MoneylineValidationGate:
     MIN_WIN_RATE = 0.48
     MIN_ROI = 0.0  # Must be non-negative
 
-    def __init__(self, history_file: str = DEFAULT_HISTORY_FILE):
+    def __init__(
+        self,
+        history_file: str = DEFAULT_HISTORY_FILE,
+        writer: Optional[JsonlWriter] = None,
+    ):
         self._history_file = Path(history_file)
+        self._writer = writer or get_default_writer()  # F-055
         self._trades: list[dict] = []
         self._load()
 
@@ -44,10 +51,10 @@ class MoneylineValidationGate:
                 self._trades = []
 
     def _save(self) -> None:
-        """Save trade history to JSON file."""
-        self._history_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._history_file, "w") as f:
-            json.dump(self._trades, f, indent=2)
+        """Save trade history to JSON file (F-055: snapshot written in background)."""
+        self._writer.replace(
+            self._history_file, json.dumps(self._trades, indent=2), fsync=True,
+        )
 
     def record_trade(self, won: bool, pnl: float, market_id: str = "") -> None:
         """Record a completed moneyline trade result."""
@@ -11,6 +11,8 @@ import asyncio
 import logging
 from collections import defaultdict
 
+from poly24h.rate_limiter import PRIORITY_BACKGROUND, request_priority
+
 logger = logging.getLogger(__name__)
 
 # Defaults
@@ -57,6 +59,8 @@ class NBAMonitor:
 
     async def run_forever(self) -> None:
         """5-min scan loop — runs as background asyncio task."""
+        # F-040: This task's HTTP calls yield to SNIPE-phase fetches
+        request_priority.set(PRIORITY_BACKGROUND)
         logger.info("NBA Monitor started (interval=%ds, min_edge=%.1f%%)",
                      self._scan_interval, self._min_edge * 100)
         while True:
@@ -12,14 +12,15 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 import time
 from dataclasses import dataclass
 from typing import Optional
 
 import aiohttp
 
+from poly24h.http_transport import HttpTransport, get_default_transport
 from poly24h.models.market import MarketSource
+from poly24h.models.market_metadata import detect_market_type, market_metadata
 
 logger = logging.getLogger(__name__)
 
@@ -260,6 +261,51 @@ def find_teams_in_text_generic(text: str, lookup: dict[str, str]) -> list[str]:
     return found
 
 
+class TeamMatcher:
+    """F-052: Precompiled team matcher for one sport.
+
+    ``find_teams_in_text_generic``/``normalize_team_generic``와 같은 결과지만
+    alias 정렬을 생성 시 한 번만 하고, sportsbook 팀 이름 정규화 결과를 캐시한다.
+    """
+
+    def __init__(self, team_names: dict[str, list[str]]):
+        self.team_names = team_names
+        self.lookup = build_team_lookup(team_names)
+        self._entries = sorted(self.lookup.items(), key=lambda x: len(x[0]), reverse=True)
+        self._normalized: dict[str, Optional[str]] = {}
+
+    def find_teams(self, text: str) -> list[str]:
+        text_lower = text.lower()
+        found = []
+        for full_name, canonical in self._entries:
+            if full_name in text_lower and canonical not in found:
+                found.append(canonical)
+        return found
+
+    def normalize(self, name: str) -> Optional[str]:
+        try:
+            return self._normalized[name]
+        except KeyError:
+            canonical = self._normalized[name] = normalize_team_generic(name, self.lookup)
+            return canonical
+
+    def teams_in(self, market) -> list[str]:
+        """Teams in the market question — computed once per market per matcher."""
+        meta = market_metadata(market)
+        return meta.memo(self, lambda: self.find_teams(meta.question_lower))
+
+
+_TEAM_MATCHERS: dict[str, TeamMatcher] = {}
+
+
+def team_matcher(sport_config) -> TeamMatcher:
+    """Cached ``TeamMatcher`` per sport config (rebuilt if its team_names change)."""
+    matcher = _TEAM_MATCHERS.get(sport_config.name)
+    if matcher is None or matcher.team_names is not sport_config.team_names:
+        matcher = _TEAM_MATCHERS[sport_config.name] = TeamMatcher(sport_config.team_names)
+    return matcher
+
+
 def calculate_edge(market_price: float, fair_prob: float) -> float:
     """Calculate edge: fair_prob - market_price.
 
@@ -278,28 +324,19 @@ def should_skip_crypto_directional(source: MarketSource) -> bool:
     return source == MarketSource.HOURLY_CRYPTO
 
 
+# Legacy NBA path (no sport_config) — same aliases as _FULL_TO_CANONICAL
+_NBA_MATCHER = TeamMatcher(NBA_TEAM_NAMES)
+
+
 def _normalize_team(name: str) -> Optional[str]:
     """Normalize a team name to canonical short form."""
-    name_lower = name.lower().strip()
-    if name_lower in _FULL_TO_CANONICAL:
-        return _FULL_TO_CANONICAL[name_lower]
-    # Try substring match for partial names
-    for full_name, canonical in _FULL_TO_CANONICAL.items():
-        if full_name in name_lower or name_lower in full_name:
-            return canonical
-    return None
+    return _NBA_MATCHER.normalize(name)
 
 
 def _find_teams_in_text(text: str) -> list[str]:
     """Find all NBA team canonical names mentioned in text."""
-    text_lower = text.lower()
-    found = []
-    # Check full names first (longest first for proper matching)
-    entries = sorted(_FULL_TO_CANONICAL.items(), key=lambda x: len(x[0]), reverse=True)
-    for full_name, canonical in entries:
-        if full_name in text_lower and canonical not in found:
-            found.append(canonical)
-    return found
+    # Full names first (longest first for proper matching)
+    return _NBA_MATCHER.find_teams(text)
 
 
 @dataclass
@@ -343,8 +380,11 @@ class OddsAPIClient:
         self,
         api_key: str = "",
         cache_ttl: int = 300,
+        transport: Optional[HttpTransport] = None,
     ):
         self._api_key = api_key or os.environ.get("ODDS_API_KEY", "")
+        # F-034: 공유 커넥션 풀
+        self._transport = transport or get_default_transport()
         self._cache_ttl = cache_ttl
         # Legacy single cache (NBA backward compat)
         self._cache: Optional[list[GameOdds]] = None
@@ -357,25 +397,24 @@ class OddsAPIClient:
     async def _fetch_json(self, url: str, params: dict) -> list[dict]:
         """Fetch JSON from API endpoint."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, params=params,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as resp:
-                    if resp.status != 200:
-                        logger.warning(
-                            "Odds API error: %s %s",
-                            resp.status, await resp.text(),
-                        )
-                        return []
-                    data = await resp.json()
-                    remaining = resp.headers.get("x-requests-remaining", "?")
-                    logger.info("Odds API: %d games, requests remaining: %s", len(data), remaining)
-                    try:
-                        self._last_remaining = int(remaining)
-                    except (ValueError, TypeError):
-                        pass
-                    return data
+            async with self._transport.get(
+                url, params=params,
+                timeout=aiohttp.ClientTimeout(total=15),
+            ) as resp:
+                if resp.status != 200:
+                    logger.warning(
+                        "Odds API error: %s %s",
+                        resp.status, await resp.text(),
+                    )
+                    return []
+                data = await resp.json()
+                remaining = resp.headers.get("x-requests-remaining", "?")
+                logger.info("Odds API: %d games, requests remaining: %s", len(data), remaining)
+                try:
+                    self._last_remaining = int(remaining)
+                except (ValueError, TypeError):
+                    pass
+                return data
         except Exception as e:
             logger.error("Odds API fetch failed: %s", e)
             return []
@@ -547,21 +586,21 @@ class OddsAPIClient:
 
         matched = []
         for market in markets:
-            q = market.question.lower()
-            teams_in_q = _find_teams_in_text(q)
+            meta = market_metadata(market)
+            teams_in_q = _NBA_MATCHER.teams_in(market)
 
             # Must have at least one team from this game
             if home_canonical not in teams_in_q and away_canonical not in teams_in_q:
                 continue
 
-            # Determine market type
-            market_type = self._detect_polymarket_type(q)
+            # Determine market type (F-052: parsed once per market)
+            market_type = meta.market_type
             if market_type is None:
                 continue  # Unsupported market type (e.g., BTTS)
 
             if market_type == "moneyline" and game.h2h:
                 fair_prob = self._calc_h2h_fair_prob(
-                    game.h2h, game.home_team, home_canonical, away_canonical, q,
+                    game.h2h, game.home_team, home_canonical, away_canonical, teams_in_q,
                 )
                 if fair_prob is not None:
                     matched.append(MatchedOdds(
@@ -573,7 +612,7 @@ class OddsAPIClient:
 
             elif market_type == "spread" and game.spreads:
                 fair_prob = self._calc_spread_fair_prob(
-                    game.spreads, game.home_team, home_canonical, away_canonical, q,
+                    game.spreads, game.home_team, home_canonical, away_canonical, teams_in_q,
                 )
                 if fair_prob is not None:
                     matched.append(MatchedOdds(
@@ -584,7 +623,7 @@ class OddsAPIClient:
                     ))
 
             elif market_type == "totals" and game.totals:
-                fair_prob = self._calc_totals_fair_prob(game.totals, q)
+                fair_prob = self._calc_totals_fair_prob(game.totals, meta.line)
                 if fair_prob is not None:
                     matched.append(MatchedOdds(
                         market_id=market.id,
@@ -600,15 +639,9 @@ class OddsAPIClient:
         """Detect Polymarket market type from question text.
 
         Returns None for market types we can't price (e.g., BTTS).
+        F-052: Markets carry this as ``market.metadata.market_type``.
         """
-        if "o/u" in question_lower or "over/under" in question_lower or "total" in question_lower:
-            return "totals"
-        if "spread" in question_lower:
-            return "spread"
-        # BTTS (Both Teams to Score) — Odds API doesn't return these in standard query
-        if "both teams" in question_lower or "btts" in question_lower:
-            return None
-        return "moneyline"
+        return detect_market_type(question_lower)
 
     def _calc_h2h_fair_prob(
         self,
@@ -616,7 +649,7 @@ class OddsAPIClient:
         home_full: str,
         home_canonical: str,
         away_canonical: str,
-        question_lower: str,
+        teams_in_q: list[str],
     ) -> Optional[float]:
         """Calculate devigged probability for moneyline market.
 
@@ -632,7 +665,6 @@ class OddsAPIClient:
         fair_a, fair_b = devig(prob_a, prob_b)
 
         # Determine which outcome maps to YES (first team in question)
-        teams_in_q = _find_teams_in_text(question_lower)
         if not teams_in_q:
             return None
 
@@ -654,24 +686,17 @@ class OddsAPIClient:
         home_full: str,
         home_canonical: str,
         away_canonical: str,
-        question_lower: str,
+        teams_in_q: list[str],
     ) -> Optional[float]:
         """Calculate devigged probability for spread market."""
         if len(spreads.outcomes) < 2:
             return None
 
-        # Extract line from question (e.g., "(-3.5)" or "(-7)")
-        line_match = re.search(r'\(([+-]?\d+\.?\d*)\)', question_lower)
-        if not line_match:
-            # Try without parens
-            line_match = re.search(r'[+-]\d+\.?\d*', question_lower)
-
         prob_a = american_to_prob(spreads.outcomes[0]["price"])
         prob_b = american_to_prob(spreads.outcomes[1]["price"])
         fair_a, fair_b = devig(prob_a, prob_b)
 
         # Find which team's spread is referenced
-        teams_in_q = _find_teams_in_text(question_lower)
         if not teams_in_q:
             return fair_a
 
@@ -688,22 +713,17 @@ class OddsAPIClient:
     def _calc_totals_fair_prob(
         self,
         totals: MarketOdds,
-        question_lower: str,
+        poly_line: Optional[float],
     ) -> Optional[float]:
         """Calculate devigged probability for totals (O/U) market.
 
         YES side = Over for Polymarket O/U markets.
         Verifies the line (point value) matches between Polymarket and Odds API.
+        ``poly_line`` is the question's line (``market.metadata.line``, e.g. "O/U 2.5" → 2.5).
         """
         if len(totals.outcomes) < 2:
             return None
 
-        # Extract Polymarket line from question (e.g., "O/U 2.5" → 2.5)
-        line_match = re.search(r'o/u\s+(\d+\.?\d*)', question_lower)
-        if not line_match:
-            line_match = re.search(r'over/under\s+(\d+\.?\d*)', question_lower)
-        poly_line = float(line_match.group(1)) if line_match else None
-
         # Find Over/Under outcomes
         over_prob = None
         under_prob = None
@@ -773,10 +793,11 @@ class OddsAPIClient:
             return self._get_fair_prob_three_way(market, games, sport_config)
 
         # 2-way sport (NHL, NBA with sport_config)
-        lookup = build_team_lookup(sport_config.team_names)
-        q = market.question.lower()
-        teams_in_q = find_teams_in_text_generic(q, lookup)
-        market_type = self._detect_polymarket_type(q)
+        matcher = team_matcher(sport_config)
+        meta = market_metadata(market)
+        q = meta.question_lower
+        teams_in_q = matcher.teams_in(market)
+        market_type = meta.market_type
         if market_type is None:
             return None  # Unsupported market type (e.g., BTTS)
 
@@ -786,8 +807,8 @@ class OddsAPIClient:
             return None
 
         for game in games:
-            home_canonical = normalize_team_generic(game.home_team, lookup)
-            away_canonical = normalize_team_generic(game.away_team, lookup)
+            home_canonical = matcher.normalize(game.home_team)
+            away_canonical = matcher.normalize(game.away_team)
 
             if not home_canonical or not away_canonical:
                 continue
@@ -798,13 +819,14 @@ class OddsAPIClient:
             if market_type == "spread":
                 if game.spreads:
                     return self._calc_spread_fair_prob_generic(
-                        game.spreads, home_canonical, away_canonical, q, lookup,
+                        game.spreads, home_canonical, away_canonical, meta.line,
+                        teams_in_q, matcher,
                     )
                 continue  # Don't fall through to moneyline for spread markets
 
             if market_type == "totals":
                 if game.totals:
-                    return self._calc_totals_fair_prob(game.totals, q)
+                    return self._calc_totals_fair_prob(game.totals, meta.line)
                 continue  # Don't fall through to moneyline for O/U markets
 
             # Moneyline (2-way) — only reached when market_type == "moneyline"
@@ -815,8 +837,8 @@ class OddsAPIClient:
             prob_b = american_to_prob(game.h2h.outcomes[1]["price"])
             fair_a, fair_b = devig(prob_a, prob_b)
 
-            home_name = normalize_team_generic(game.h2h.outcomes[0]["name"], lookup)
-            away_name = normalize_team_generic(game.h2h.outcomes[1]["name"], lookup)
+            home_name = matcher.normalize(game.h2h.outcomes[0]["name"])
+            away_name = matcher.normalize(game.h2h.outcomes[1]["name"])
 
             if teams_in_q:
                 first_team = teams_in_q[0]
@@ -841,12 +863,13 @@ class OddsAPIClient:
         Only moneyline uses 3-way devig; spread/totals use standard 2-way.
         F-032a: Returns None for spread/totals.
         """
-        lookup = build_team_lookup(sport_config.team_names)
-        q = market.question.lower()
-        teams_in_q = find_teams_in_text_generic(q, lookup)
+        matcher = team_matcher(sport_config)
+        meta = market_metadata(market)
+        q = meta.question_lower
+        teams_in_q = matcher.teams_in(market)
 
         # Detect market type first
-        market_type = self._detect_polymarket_type(q)
+        market_type = meta.market_type
         if market_type is None:
             return None  # Unsupported market type (e.g., BTTS)
 
@@ -856,8 +879,8 @@ class OddsAPIClient:
             return None
 
         for game in games:
-            home_canonical = normalize_team_generic(game.home_team, lookup)
-            away_canonical = normalize_team_generic(game.away_team, lookup)
+            home_canonical = matcher.normalize(game.home_team)
+            away_canonical = matcher.normalize(game.away_team)
 
             if not home_canonical or not away_canonical:
                 continue
@@ -870,14 +893,15 @@ class OddsAPIClient:
             if market_type == "spread":
                 if game.spreads:
                     return self._calc_spread_fair_prob_generic(
-                        game.spreads, home_canonical, away_canonical, q, lookup,
+                        game.spreads, home_canonical, away_canonical, meta.line,
+                        teams_in_q, matcher,
                     )
                 continue  # Don't fall through to moneyline for spread markets
 
             # Totals (O/U) markets → use standard 2-way devig
             if market_type == "totals":
                 if game.totals:
-                    return self._calc_totals_fair_prob(game.totals, q)
+                    return self._calc_totals_fair_prob(game.totals, meta.line)
                 continue  # Don't fall through to moneyline for O/U markets
 
             # Moneyline / Draw → 3-way devig (only reached when market_type == "moneyline")
@@ -895,12 +919,11 @@ class OddsAPIClient:
                     prob_home, prob_draw, prob_away,
                 )
 
-                is_draw = "draw" in q
-                if is_draw:
+                if meta.is_draw:
                     return fair_draw
 
-                home_name = normalize_team_generic(outcomes[0]["name"], lookup)
-                away_name = normalize_team_generic(outcomes[2]["name"], lookup)
+                home_name = matcher.normalize(outcomes[0]["name"])
+                away_name = matcher.normalize(outcomes[2]["name"])
 
                 if teams_in_q:
                     first_team = teams_in_q[0]
@@ -915,7 +938,6 @@ class OddsAPIClient:
                 prob_b = american_to_prob(outcomes[1]["price"])
                 fair_a, fair_b = devig(prob_a, prob_b)
 
-                home_name = normalize_team_generic(outcomes[0]["name"], lookup)
                 if teams_in_q and teams_in_q[0] == away_canonical:
                     return fair_b
                 return fair_a
@@ -927,20 +949,18 @@ class OddsAPIClient:
         spreads: MarketOdds,
         home_canonical: str,
         away_canonical: str,
-        question_lower: str,
-        lookup: dict[str, str],
+        poly_line: Optional[float],
+        teams_in_q: list[str],
+        matcher: TeamMatcher,
     ) -> Optional[float]:
         """Calculate spread fair prob using generic team lookup.
 
         Verifies the spread line matches between Polymarket and Odds API.
+        ``poly_line`` is the question's line (``market.metadata.line``, e.g. "(-3.5)").
         """
         if len(spreads.outcomes) < 2:
             return None
 
-        # Extract Polymarket spread line from question (e.g., "(-3.5)" or "(+7)")
-        line_match = re.search(r'\(([+-]?\d+\.?\d*)\)', question_lower)
-        poly_line = float(line_match.group(1)) if line_match else None
-
         # Check Odds API spread line
         odds_api_line = spreads.outcomes[0].get("point")
         if poly_line is not None and odds_api_line is not None:
@@ -955,13 +975,12 @@ class OddsAPIClient:
         prob_b = american_to_prob(spreads.outcomes[1]["price"])
         fair_a, fair_b = devig(prob_a, prob_b)
 
-        teams_in_q = find_teams_in_text_generic(question_lower, lookup)
         if not teams_in_q:
             return fair_a
 
         first_team = teams_in_q[0]
-        spread_team_0 = normalize_team_generic(spreads.outcomes[0].get("name", ""), lookup)
-        spread_team_1 = normalize_team_generic(spreads.outcomes[1].get("name", ""), lookup)
+        spread_team_0 = matcher.normalize(spreads.outcomes[0].get("name", ""))
+        spread_team_1 = matcher.normalize(spreads.outcomes[1].get("name", ""))
 
         if first_team == spread_team_0:
             return fair_a
@@ -7,6 +7,14 @@ F-019 개선:
 - 최소 가격 필터링 (NO@$0.001 같은 쓰레기 시그널 제거)
 - 오더북 깊이(depth) 조회 → 유동성 없는 호가 필터링
 - best ask 뿐 아니라 해당 가격의 available size도 반환
+
+F-033 개선:
+- POST /books 배치 조회 (N개 토큰 → ceil(N/batch_size) 요청)
+- 배치 불가 시 토큰별 GET /book 동시 요청으로 폴백
+
+F-039 개선:
+- 같은 토큰의 동시 조회는 하나의 in-flight 요청을 공유 (single-flight)
+- 짧은 TTL read-through 캐시 (기본 0.1초) — 절약된 호출 수는 coalesce_stats()
 """
 
 from __future__ import annotations
@@ -19,14 +27,25 @@ from typing import Optional
 
 import aiohttp
 
+from poly24h.http_transport import HttpTransport, get_default_transport
 from poly24h.models.market import Market
 from poly24h.models.opportunity import ArbType, Opportunity
+from poly24h.singleflight import RequestCoalescer
 
 logger = logging.getLogger(__name__)
 
 CLOB_BOOK_URL = "https://clob.polymarket.com/book"
+CLOB_BOOKS_URL = "https://clob.polymarket.com/books"
 DEFAULT_TIMEOUT = 10  # seconds
 
+# F-033: 배치 조회 설정
+MAX_BATCH_TOKENS = 50        # POST /books 요청당 최대 토큰 수
+FALLBACK_CONCURRENCY = 10    # 폴백 GET /book 동시 요청 수
+
+# F-039: 오더북 read-through 캐시 TTL (seconds). SNIPE 최단 폴링 간격(0.2초)보다
+# 짧아야 매 폴링이 새 오더북을 본다 — 캐시는 같은 폴링 안의 중복 조회만 흡수
+DEFAULT_BOOK_CACHE_TTL = 0.1
+
 # F-019: 시그널 품질 필터
 MIN_MEANINGFUL_PRICE = 0.02   # $0.02 미만 = 사실상 유동성 없는 쓰레기
 MIN_ASK_SIZE_USD = 5.0        # best ask에 최소 $5 이상의 물량이 있어야 함
@@ -51,25 +70,46 @@ class OrderbookSummary:
     best_ask_size: float = 0.0   # shares at best ask
     total_ask_depth_usd: float = 0.0  # 전체 ask 깊이 (달러)
     ask_levels: int = 0  # ask 레벨 수
+    # F-043: 전체 (price, size) 레벨 — PRE_OPEN에서 L2 캐시 시딩용
+    asks: tuple[tuple[float, float], ...] = ()
+    bids: tuple[tuple[float, float], ...] = ()
 
 
 class ClobOrderbookFetcher:
-    """Fetch orderbooks from CLOB API (https://clob.polymarket.com/book)."""
+    """Fetch orderbooks from CLOB API (https://clob.polymarket.com/book).
+
+    F-033: Multi-token requests go through ``POST /books`` in chunks of
+    ``batch_size``. Tokens the batch endpoint does not return are fetched
+    with concurrent per-token ``GET /book`` requests.
+
+    F-039: Tokens already being fetched by another caller join that
+    request; non-empty books are cached for ``cache_ttl`` seconds.
+    """
 
     def __init__(
         self,
-        session: aiohttp.ClientSession | None = None,
+        transport: HttpTransport | None = None,
         timeout: int = DEFAULT_TIMEOUT,
+        batch_size: int = MAX_BATCH_TOKENS,
+        fallback_concurrency: int = FALLBACK_CONCURRENCY,
+        cache_ttl: float = DEFAULT_BOOK_CACHE_TTL,
     ):
-        self._session = session
-        self._owns_session = session is None
+        # F-034: 공유 커넥션 풀 (429 백오프 포함)
+        self._transport = transport or get_default_transport()
         self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._batch_size = max(1, batch_size)
+        self._fallback_semaphore = asyncio.Semaphore(fallback_concurrency)
+        # F-033: Disabled for the fetcher's lifetime once /books is unavailable
+        self._batch_supported = True
+        # F-039: 실패/빈 오더북은 캐시하지 않음
+        self._coalescer = RequestCoalescer(
+            ttl=cache_ttl,
+            cacheable=lambda s: s is not None and s.best_ask is not None,
+        )
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
-            self._owns_session = True
-        return self._session
+    def coalesce_stats(self) -> dict:
+        """F-039: single-flight/캐시로 절약한 토큰 조회 수."""
+        return self._coalescer.stats()
 
     async def fetch_best_asks(
         self, yes_token: str, no_token: str,
@@ -78,9 +118,11 @@ class ClobOrderbookFetcher:
 
         Returns (yes_best_ask, no_best_ask). None for either side on failure.
         """
-        yes_ask = await self._fetch_single_best_ask(yes_token)
-        no_ask = await self._fetch_single_best_ask(no_token)
-        return yes_ask, no_ask
+        summaries = await self.fetch_orderbooks([yes_token, no_token])
+        return (
+            summaries.get(yes_token, OrderbookSummary()).best_ask,
+            summaries.get(no_token, OrderbookSummary()).best_ask,
+        )
 
     async def fetch_orderbook_summaries(
         self, yes_token: str, no_token: str,
@@ -89,99 +131,170 @@ class ClobOrderbookFetcher:
 
         Returns (yes_summary, no_summary) with depth info.
         """
-        yes_summary = await self._fetch_orderbook_summary(yes_token)
-        no_summary = await self._fetch_orderbook_summary(no_token)
-        return yes_summary, no_summary
-
-    # Retry config for 429 errors
-    MAX_RETRIES = 3
-    BACKOFF_BASE = 0.5  # seconds
-
-    async def _fetch_single_best_ask(self, token_id: str) -> float | None:
-        """단일 토큰의 best ask 가격 조회. 429시 지수 백오프 재시도. 실패 시 None."""
-        for attempt in range(1, self.MAX_RETRIES + 1):
-            try:
-                session = await self._ensure_session()
-                async with session.get(
-                    CLOB_BOOK_URL, params={"token_id": token_id},
-                ) as resp:
-                    if resp.status == 429:
-                        wait = self.BACKOFF_BASE * (2 ** (attempt - 1))
-                        logger.warning(
-                            "CLOB API 429 for token %s (attempt %d/%d), backing off %.1fs",
-                            token_id, attempt, self.MAX_RETRIES, wait,
-                        )
-                        await asyncio.sleep(wait)
-                        continue
-                    if resp.status != 200:
-                        logger.warning(
-                            "CLOB API returned %d for token %s", resp.status, token_id,
-                        )
-                        return None
-                    data = await resp.json()
-                    asks = data.get("asks", [])
-                    if not asks:
-                        return None
-                    # asks may not be sorted — find min
-                    return min(float(a["price"]) for a in asks)
-            except Exception as exc:
-                logger.warning("CLOB fetch error for token %s: %s", token_id, exc)
-                return None
-        logger.warning("CLOB API exhausted retries for token %s", token_id)
-        return None
+        summaries = await self.fetch_orderbooks([yes_token, no_token])
+        return (
+            summaries.get(yes_token, OrderbookSummary()),
+            summaries.get(no_token, OrderbookSummary()),
+        )
+
+    # ------------------------------------------------------------------
+    # F-033: Batched multi-token fetching
+    # ------------------------------------------------------------------
+
+    async def fetch_best_asks_batch(
+        self, token_ids: list[str],
+    ) -> dict[str, float | None]:
+        """Fetch best asks for many tokens at once.
+
+        Returns token_id → best ask (None when the book is empty or failed).
+        """
+        summaries = await self.fetch_orderbooks(token_ids)
+        return {token_id: summary.best_ask for token_id, summary in summaries.items()}
+
+    async def fetch_orderbooks(
+        self, token_ids: list[str],
+    ) -> dict[str, OrderbookSummary]:
+        """Fetch orderbook summaries for many tokens in as few requests as possible.
+
+        1. ``POST /books`` per chunk of ``batch_size`` tokens (chunks run concurrently)
+        2. Tokens missing from the batch responses → concurrent ``GET /book``
+
+        Returns token_id → OrderbookSummary for every requested token.
+        Failed tokens map to an empty OrderbookSummary (best_ask=None).
+
+        F-039: Cached or in-flight tokens are not requested again.
+        """
+        unique = list(dict.fromkeys(t for t in token_ids if t))
+        if not unique:
+            return {}
+
+        summaries = await self._coalescer.do_many(unique, self._fetch_orderbooks_uncached)
+        return {t: summaries.get(t) or OrderbookSummary() for t in unique}
+
+    async def _fetch_orderbooks_uncached(
+        self, unique: list[str],
+    ) -> dict[str, OrderbookSummary]:
+        results: dict[str, OrderbookSummary] = {}
+
+        if self._batch_supported:
+            chunks = [
+                unique[i:i + self._batch_size]
+                for i in range(0, len(unique), self._batch_size)
+            ]
+            batches = await asyncio.gather(
+                *[self._fetch_books_batch(chunk) for chunk in chunks],
+            )
+            for batch in batches:
+                results.update(batch)
+
+        missing = [t for t in unique if t not in results]
+        if missing:
+            summaries = await asyncio.gather(
+                *[self._fetch_orderbook_summary_limited(t) for t in missing],
+            )
+            results.update(zip(missing, summaries))
+
+        return results
+
+    async def _fetch_books_batch(
+        self, token_ids: list[str],
+    ) -> dict[str, OrderbookSummary]:
+        """단일 POST /books 요청. 429 백오프는 transport 담당. 실패 시 빈 dict (→ 폴백)."""
+        wanted = set(token_ids)
+        payload = [{"token_id": t} for t in token_ids]
+        try:
+            async with self._transport.post(
+                CLOB_BOOKS_URL, json=payload, timeout=self._timeout,
+            ) as resp:
+                if resp.status in (404, 405):
+                    logger.info(
+                        "CLOB batch endpoint unavailable (%d) — using per-token requests",
+                        resp.status,
+                    )
+                    self._batch_supported = False
+                    return {}
+                if resp.status != 200:
+                    logger.warning(
+                        "CLOB batch returned %d for %d tokens", resp.status, len(token_ids),
+                    )
+                    return {}
+                data = await resp.json()
+        except Exception as exc:
+            logger.debug("CLOB batch fetch error (%d tokens): %s", len(token_ids), exc)
+            return {}
+
+        if not isinstance(data, list):
+            return {}
+
+        results: dict[str, OrderbookSummary] = {}
+        for book in data:
+            if not isinstance(book, dict):
+                continue
+            token_id = str(book.get("asset_id", ""))
+            if token_id in wanted:
+                results[token_id] = self._parse_summary(book)
+        return results
+
+    async def _fetch_orderbook_summary_limited(self, token_id: str) -> OrderbookSummary:
+        """Semaphore-limited per-token fallback."""
+        async with self._fallback_semaphore:
+            return await self._fetch_orderbook_summary(token_id)
+
+    @staticmethod
+    def _parse_summary(data: dict) -> OrderbookSummary:
+        """CLOB 오더북 응답 → OrderbookSummary. asks 정렬 여부와 무관."""
+        asks = data.get("asks", [])
+        if not asks:
+            return OrderbookSummary()
+
+        try:
+            levels = [
+                OrderbookLevel(price=float(a["price"]), size=float(a.get("size", 0)))
+                for a in asks
+            ]
+        except (KeyError, TypeError, ValueError):
+            return OrderbookSummary()
+
+        # Sort by price ascending (best ask first)
+        levels.sort(key=lambda lv: lv.price)
+
+        try:
+            bids = tuple(
+                (float(b["price"]), float(b.get("size", 0)))
+                for b in data.get("bids", [])
+            )
+        except (KeyError, TypeError, ValueError):
+            bids = ()
+
+        best = levels[0]
+        return OrderbookSummary(
+            best_ask=best.price,
+            best_ask_size=best.size,
+            total_ask_depth_usd=sum(lv.value_usd for lv in levels),
+            ask_levels=len(levels),
+            asks=tuple((lv.price, lv.size) for lv in levels),
+            bids=bids,
+        )
 
     async def _fetch_orderbook_summary(self, token_id: str) -> OrderbookSummary:
-        """단일 토큰의 오더북 요약 조회. 429시 지수 백오프."""
-        for attempt in range(1, self.MAX_RETRIES + 1):
-            try:
-                session = await self._ensure_session()
-                async with session.get(
-                    CLOB_BOOK_URL, params={"token_id": token_id},
-                ) as resp:
-                    if resp.status == 429:
-                        wait = self.BACKOFF_BASE * (2 ** (attempt - 1))
-                        logger.warning(
-                            "CLOB API 429 for summary %s (attempt %d/%d), backing off %.1fs",
-                            token_id, attempt, self.MAX_RETRIES, wait,
-                        )
-                        await asyncio.sleep(wait)
-                        continue
-                    if resp.status != 200:
-                        return OrderbookSummary()
-                    data = await resp.json()
-                    asks = data.get("asks", [])
-                    if not asks:
-                        return OrderbookSummary()
-
-                    # Parse all ask levels
-                    levels = []
-                    for a in asks:
-                        price = float(a["price"])
-                        size = float(a.get("size", 0))
-                        levels.append(OrderbookLevel(price=price, size=size))
-
-                    # Sort by price ascending (best ask first)
-                    levels.sort(key=lambda lv: lv.price)
-
-                    best = levels[0]
-                    total_depth = sum(lv.value_usd for lv in levels)
-
-                    return OrderbookSummary(
-                        best_ask=best.price,
-                        best_ask_size=best.size,
-                        total_ask_depth_usd=total_depth,
-                        ask_levels=len(levels),
+        """단일 토큰의 오더북 요약 조회. 429 백오프는 transport 담당."""
+        try:
+            async with self._transport.get(
+                CLOB_BOOK_URL, params={"token_id": token_id}, timeout=self._timeout,
+            ) as resp:
+                if resp.status != 200:
+                    logger.warning(
+                        "CLOB API returned %d for token %s", resp.status, token_id,
                     )
-            except Exception as exc:
-                logger.warning("CLOB fetch error for token %s: %s", token_id, exc)
-                return OrderbookSummary()
-        return OrderbookSummary()
+                    return OrderbookSummary()
+                data = await resp.json()
+                return self._parse_summary(data)
+        except Exception as exc:
+            logger.warning("CLOB fetch error for token %s: %s", token_id, exc)
+            return OrderbookSummary()
 
     async def close(self) -> None:
-        """Close owned aiohttp session."""
-        if self._owns_session and self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """No-op: the pooled session is owned by the shared transport."""
 
 
 class OrderbookArbDetector:
@@ -228,7 +341,12 @@ class OrderbookArbDetector:
 
 
 class OrderbookBatchScanner:
-    """Batch scan markets for orderbook arb with concurrency control."""
+    """Batch scan markets for orderbook arb.
+
+    F-033: All YES/NO tokens are fetched through one batched
+    ``fetch_best_asks_batch`` call instead of two requests per market.
+    ``concurrency`` bounds how many scans may hold the fetcher at once.
+    """
 
     def __init__(
         self,
@@ -245,34 +363,32 @@ class OrderbookBatchScanner:
         markets: list[Market],
         min_spread: float = 0.015,
     ) -> list[Opportunity]:
-        """Scan all markets concurrently (semaphore-limited). Returns ranked opportunities."""
+        """Scan all markets with one batched orderbook fetch. Returns ranked opportunities."""
         if not markets:
             return []
 
-        tasks = [
-            self._scan_one(market, min_spread) for market in markets
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        token_ids: list[str] = []
+        for market in markets:
+            token_ids.append(market.yes_token_id)
+            token_ids.append(market.no_token_id)
+
+        try:
+            async with self._semaphore:
+                asks = await self.fetcher.fetch_best_asks_batch(token_ids)
+        except Exception as exc:
+            logger.warning("Orderbook batch scan error: %s", exc)
+            return []
 
         opportunities: list[Opportunity] = []
-        for result in results:
-            if isinstance(result, Opportunity):
-                opportunities.append(result)
-            elif isinstance(result, Exception):
-                logger.warning("Orderbook scan error: %s", result)
+        for market in markets:
+            yes_ask = asks.get(market.yes_token_id)
+            no_ask = asks.get(market.no_token_id)
+            if yes_ask is None or no_ask is None:
+                continue
+            opp = self.detector.detect(market, yes_ask, no_ask, min_spread)
+            if opp is not None:
+                opportunities.append(opp)
 
         # ROI 내림차순 정렬
         opportunities.sort(key=lambda o: o.roi_pct, reverse=True)
         return opportunities
-
-    async def _scan_one(
-        self, market: Market, min_spread: float,
-    ) -> Optional[Opportunity]:
-        """Semaphore-limited single market scan."""
-        async with self._semaphore:
-            yes_ask, no_ask = await self.fetcher.fetch_best_asks(
-                market.yes_token_id, market.no_token_id,
-            )
-            if yes_ask is None or no_ask is None:
-                return None
-            return self.detector.detect(market, yes_ask, no_ask, min_spread)
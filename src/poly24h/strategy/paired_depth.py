@@ -0,0 +1,174 @@
+"""F-048: Depth-aware VWAP evaluator for paired entries.
+
+Top-of-book만 보면 ``yes_ask + no_ask < threshold``여도 $20–$300 티켓은
+여러 레벨을 먹으면서 VWAP CPP가 올라가 수수료 후 기회가 사라진다.
+
+두 ask 사다리를 동시에 걸으며(한 페어 = YES 1주 + NO 1주), 수수료 포함
+VWAP CPP가 ``max_cpp`` 이하이고 예산(``max_usd``) 안에 드는 최대 수량을 찾는다.
+
+- 페어당 한계비용 = real_cost(YES 레벨) + real_cost(NO 레벨) — 사다리가 오름차순이라
+  한계비용은 단조 증가, 평균 CPP도 단조 증가 → 넘는 지점에서 선형식으로 잘라 끝낸다
+- 레벨별 real cost(F-047 틱 테이블)는 ``L2Book.updates`` 버전마다 한 번만 계산해 캐시
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence, Union
+
+from poly24h.strategy.fee_calculator import real_cost_fast
+from poly24h.websocket.orderbook import ASK, L2Book
+
+Levels = Sequence[tuple[float, float]]
+LadderSource = Union[L2Book, Levels]
+
+_EPS = 1e-9
+MAX_CACHED_BOOKS = 4096
+
+
+@dataclass(frozen=True)
+class AskLadder:
+    """Best-first ask levels with per-level fee-inclusive cost per share."""
+
+    prices: tuple[float, ...]
+    sizes: tuple[float, ...]
+    real_costs: tuple[float, ...]
+
+    @classmethod
+    def from_levels(cls, levels: Levels, taker_fees: bool = True) -> AskLadder:
+        levels = [(p, s) for p, s in levels if p > 0 and s > 0]
+        levels.sort()
+        prices = tuple(p for p, _ in levels)
+        return cls(
+            prices=prices,
+            sizes=tuple(s for _, s in levels),
+            real_costs=tuple(real_cost_fast(p) for p in prices) if taker_fees else prices,
+        )
+
+
+@dataclass
+class PairedFill:
+    """Result of walking both ladders: ``shares`` pairs and their cost."""
+
+    shares: float = 0.0
+    yes_cost: float = 0.0   # Σ price × shares (before fees)
+    no_cost: float = 0.0
+    fees: float = 0.0
+    yes_levels: int = 0     # ask levels touched
+    no_levels: int = 0
+
+    @property
+    def cost_usd(self) -> float:
+        return self.yes_cost + self.no_cost + self.fees
+
+    @property
+    def yes_vwap(self) -> float:
+        return self.yes_cost / self.shares if self.shares > 0 else 0.0
+
+    @property
+    def no_vwap(self) -> float:
+        return self.no_cost / self.shares if self.shares > 0 else 0.0
+
+    @property
+    def vwap_cpp(self) -> float:
+        """VWAP YES + VWAP NO (before fees)."""
+        return self.yes_vwap + self.no_vwap
+
+    @property
+    def cpp_after_fees(self) -> float:
+        return self.cost_usd / self.shares if self.shares > 0 else 0.0
+
+    @property
+    def profit_usd(self) -> float:
+        """Guaranteed profit at settlement ($1 per pair)."""
+        return self.shares - self.cost_usd
+
+
+def walk_ladders(
+    yes: AskLadder,
+    no: AskLadder,
+    max_cpp: float,
+    max_usd: float | None = None,
+) -> PairedFill:
+    """Largest pair quantity with fee-inclusive VWAP CPP ≤ ``max_cpp``
+    (and total cost ≤ ``max_usd``)."""
+    fill = PairedFill()
+    i = j = 0
+    rem_y = yes.sizes[0] if yes.sizes else 0.0
+    rem_n = no.sizes[0] if no.sizes else 0.0
+    cost = 0.0  # fee-inclusive
+
+    while i < len(yes.prices) and j < len(no.prices):
+        marginal = yes.real_costs[i] + no.real_costs[j]
+        x = min(rem_y, rem_n)
+        last = False
+        if marginal > max_cpp:
+            # 평균이 max_cpp에 닿는 지점까지만: (cost + m·x) / (Q + x) = max_cpp
+            x = min(x, (max_cpp * fill.shares - cost) / (marginal - max_cpp))
+            last = True
+        if max_usd is not None and cost + marginal * x > max_usd:
+            x = min(x, (max_usd - cost) / marginal)
+            last = True
+        if x <= _EPS:
+            break
+
+        py, pn = yes.prices[i], no.prices[j]
+        fill.shares += x
+        fill.yes_cost += py * x
+        fill.no_cost += pn * x
+        fill.fees += (marginal - py - pn) * x
+        cost += marginal * x
+        fill.yes_levels = i + 1
+        fill.no_levels = j + 1
+        if last:
+            break
+
+        rem_y -= x
+        rem_n -= x
+        if rem_y <= _EPS:
+            i += 1
+            rem_y = yes.sizes[i] if i < len(yes.sizes) else 0.0
+        if rem_n <= _EPS:
+            j += 1
+            rem_n = no.sizes[j] if j < len(no.sizes) else 0.0
+    return fill
+
+
+class PairedDepthEvaluator:
+    """Evaluate paired fills against L2 books or raw level lists.
+
+    Ladders built from an ``L2Book`` are cached per book version
+    (``L2Book.updates``), so evaluating on every WS update only rebuilds
+    the side that changed.
+
+    Args:
+        taker_fees: Include the taker fee per level (crypto). False = fee-free.
+    """
+
+    def __init__(self, taker_fees: bool = True):
+        self.taker_fees = taker_fees
+        self._ladders: dict[int, tuple[L2Book, int, AskLadder]] = {}
+        self.ladder_builds = 0
+
+    def ladder(self, source: LadderSource) -> AskLadder:
+        if not isinstance(source, L2Book):
+            self.ladder_builds += 1
+            return AskLadder.from_levels(source, self.taker_fees)
+        cached = self._ladders.get(id(source))
+        if cached is not None and cached[0] is source and cached[1] == source.updates:
+            return cached[2]
+        if len(self._ladders) >= MAX_CACHED_BOOKS:
+            self._ladders.clear()
+        self.ladder_builds += 1
+        ladder = AskLadder.from_levels(source.levels(ASK), self.taker_fees)
+        self._ladders[id(source)] = (source, source.updates, ladder)
+        return ladder
+
+    def evaluate(
+        self,
+        yes: LadderSource,
+        no: LadderSource,
+        max_cpp: float,
+        max_usd: float | None = None,
+    ) -> PairedFill:
+        return walk_ladders(self.ladder(yes), self.ladder(no), max_cpp, max_usd)
@@ -25,7 +25,9 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from poly24h.jsonl_writer import JsonlWriter, get_default_writer
 from poly24h.models.market import Market
+from poly24h.strategy.paired_depth import LadderSource, PairedDepthEvaluator, PairedFill
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +48,8 @@ class PairedEntryOpportunity:
         max_shares: Min of available shares on both sides.
         detected_at: Timestamp of detection.
         source: How this was detected ('ws_cache', 'http_poll', 'orderbook').
+        vwap_cpp: F-048 VWAP YES + VWAP NO over ``max_shares`` (0 = top only).
+        cpp_after_fees: F-048 fee-inclusive VWAP CPP over ``max_shares``.
     """
 
     market: Market
@@ -59,6 +63,8 @@ class PairedEntryOpportunity:
     max_shares: float = 0.0
     detected_at: datetime = None  # type: ignore[assignment]
     source: str = "http_poll"
+    vwap_cpp: float = 0.0
+    cpp_after_fees: float = 0.0
 
     def __post_init__(self):
         if self.detected_at is None:
@@ -87,6 +93,8 @@ class PairedEntryOpportunity:
             "potential_profit_usd": self.potential_profit_usd,
             "source": self.source,
             "detected_at": self.detected_at.isoformat(),
+            "vwap_cpp": self.vwap_cpp,
+            "cpp_after_fees": self.cpp_after_fees,
         }
 
 
@@ -101,19 +109,32 @@ class PairedEntryDetector:
         min_price: Minimum price for either side (filters $0.001 garbage).
         min_spread: Minimum spread (margin) required.
         min_size_usd: Minimum liquidity (shares × price) on each side.
+        max_cpp_after_fees: F-048 fee-inclusive VWAP CPP cap when ask
+            ladders are given to ``detect``. Defaults to
+            ``max_combined_cost + FEE_ALLOWANCE`` so the two caps move together.
+        taker_fees: F-048 charge the taker fee per level (crypto markets).
     """
 
+    # F-048: Fee budget a depth fill may add on top of the raw CPP cap
+    FEE_ALLOWANCE = 0.015
+
     def __init__(
         self,
         max_combined_cost: float = 0.98,
         min_price: float = 0.02,
         min_spread: float = 0.015,
         min_size_usd: float = 5.0,
+        max_cpp_after_fees: float | None = None,
+        taker_fees: bool = True,
     ):
         self.max_combined_cost = max_combined_cost
         self.min_price = min_price
         self.min_spread = min_spread
         self.min_size_usd = min_size_usd
+        if max_cpp_after_fees is None:
+            max_cpp_after_fees = min(1.0, max_combined_cost + self.FEE_ALLOWANCE)
+        self.max_cpp_after_fees = max_cpp_after_fees
+        self._depth = PairedDepthEvaluator(taker_fees=taker_fees)
 
     def detect(
         self,
@@ -123,6 +144,9 @@ class PairedEntryDetector:
         yes_size: float = 0.0,
         no_size: float = 0.0,
         source: str = "http_poll",
+        yes_levels: LadderSource | None = None,
+        no_levels: LadderSource | None = None,
+        max_usd: float | None = None,
     ) -> PairedEntryOpportunity | None:
         """Check if paired entry opportunity exists.
 
@@ -133,6 +157,11 @@ class PairedEntryDetector:
             yes_size: Shares at YES best ask.
             no_size: Shares at NO best ask.
             source: Detection source for logging.
+            yes_levels / no_levels: F-048 ask ladders (``L2Book`` or
+                (price, size) levels). With both, ``max_shares`` is the
+                largest quantity (up to ``max_usd``) whose fee-inclusive
+                VWAP CPP stays ≤ ``max_cpp_after_fees``.
+            max_usd: F-048 ticket size cap for the depth walk.
 
         Returns:
             PairedEntryOpportunity if found, None otherwise.
@@ -159,6 +188,14 @@ class PairedEntryDetector:
         # Calculate ROI
         roi_pct = (spread / total_cost) * 100.0
 
+        if yes_levels is not None and no_levels is not None:
+            fill = self._depth.evaluate(
+                yes_levels, no_levels, self.max_cpp_after_fees, max_usd,
+            )
+            return self._depth_opportunity(
+                market, yes_ask, no_ask, yes_size, no_size, source, fill,
+            )
+
         # Determine max executable shares
         max_shares = 0.0
         if yes_size > 0 and no_size > 0:
@@ -184,6 +221,39 @@ class PairedEntryDetector:
         )
 
 
+    def _depth_opportunity(
+        self,
+        market: Market,
+        yes_ask: float,
+        no_ask: float,
+        yes_size: float,
+        no_size: float,
+        source: str,
+        fill: PairedFill,
+    ) -> PairedEntryOpportunity | None:
+        """F-048: Opportunity sized by the two-ladder walk (None if too thin)."""
+        if fill.shares <= 0:
+            return None
+        if fill.yes_cost < self.min_size_usd or fill.no_cost < self.min_size_usd:
+            return None
+        total_cost = yes_ask + no_ask
+        spread = 1.0 - total_cost
+        return PairedEntryOpportunity(
+            market=market,
+            yes_ask=yes_ask,
+            no_ask=no_ask,
+            total_cost=total_cost,
+            spread=spread,
+            roi_pct=(spread / total_cost) * 100.0,
+            yes_size=yes_size,
+            no_size=no_size,
+            max_shares=fill.shares,
+            source=source,
+            vwap_cpp=fill.vwap_cpp,
+            cpp_after_fees=fill.cpp_after_fees,
+        )
+
+
 @dataclass
 class PairedPaperTrade:
     """Paper trade record for paired entry simulation."""
@@ -243,9 +313,11 @@ class PairedEntrySimulator:
         self,
         paper_size_usd: float = 20.0,
         data_dir: str = "data/paper_trades",
+        writer: JsonlWriter | None = None,
     ):
         self.paper_size_usd = paper_size_usd
         self.data_dir = Path(data_dir)
+        self._writer = writer or get_default_writer()  # F-055
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self._trades: list[PairedPaperTrade] = []
         self._total_cost: float = 0.0
@@ -266,6 +338,11 @@ class PairedEntrySimulator:
         shares = self.paper_size_usd / opp.total_cost
         cost = self.paper_size_usd
         guaranteed_profit = opp.spread * shares
+        if opp.cpp_after_fees > 0:
+            # F-048: Depth-walked fill (already capped at the ticket size)
+            shares = min(shares, opp.max_shares)
+            cost = shares * opp.cpp_after_fees
+            guaranteed_profit = shares - cost
 
         trade = PairedPaperTrade(
             market_id=opp.market.id,
@@ -305,8 +382,7 @@ class PairedEntrySimulator:
         """Append trade to today's JSONL file."""
         now = datetime.now(tz=timezone.utc)
         file_path = self.data_dir / f"paired_{now.strftime('%Y-%m-%d')}.jsonl"
-        with open(file_path, "a") as f:
-            f.write(json.dumps(trade.to_dict()) + "\n")
+        self._writer.append(file_path, json.dumps(trade.to_dict()))
 
     def get_summary(self) -> dict:
         """Get paper trading summary."""
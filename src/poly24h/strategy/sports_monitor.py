@@ -3,19 +3,51 @@
 SportsMonitor generalizes NBAMonitor to support any sport.
 Each instance monitors one sport/league with its own scan interval,
 edge threshold, and team matching configuration.
+
+F-051: scan_and_trade is a staged pipeline — quotes for every prefiltered
+market are fetched concurrently, then entries are decided in ranked order.
+
+F-050: In live mode the candidates' signing metadata is fetched alongside the
+quotes, and the ranked entries' exact orders are pre-signed while earlier
+entries are being submitted.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from poly24h.discovery.gamma_client import filter_stale_markets
+from poly24h.models.market_metadata import market_metadata
+from poly24h.rate_limiter import PRIORITY_BACKGROUND, request_priority
 from poly24h.strategy.sport_config import SportConfig
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_STATE_PATH = Path("data/position_manager_state.json")
+
+
+class _StageTimer:
+    """``with timer("stage"):`` → wall time in ms accumulated into ``into``."""
+
+    def __init__(self, into: dict[str, float]):
+        self._into = into
+
+    def __call__(self, stage: str) -> _StageTimer:
+        self._stage = stage
+        return self
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        elapsed = (time.perf_counter() - self._started) * 1000
+        self._into[self._stage] = round(self._into.get(self._stage, 0.0) + elapsed, 2)
+
 
 class SportsMonitor:
     """Generic sports monitor — sportsbook line vs Polymarket arbitrage."""
@@ -33,6 +65,8 @@ class SportsMonitor:
         enable_settlement_sniper: bool = False,
         sport_executor=None,
         moneyline_gate=None,
+        max_quote_concurrency: int = 0,
+        state_path: Path | str = DEFAULT_STATE_PATH,
     ):
         self._config = sport_config
         self._odds_client = odds_client
@@ -42,6 +76,9 @@ class SportsMonitor:
         self._rate_limiter = rate_limiter
         self._executor = sport_executor  # F-030: live order execution
         self._moneyline_gate = moneyline_gate  # F-032c: validation gate
+        self._max_quote_concurrency = max_quote_concurrency or self.MAX_QUOTE_CONCURRENCY
+        self._state_path = Path(state_path)  # position manager snapshot after entries
+        self.last_stage_ms: dict[str, float] = {}
 
         # Use config values
         self._scan_interval = sport_config.scan_interval
@@ -71,6 +108,8 @@ class SportsMonitor:
 
     async def run_forever(self) -> None:
         """Scan loop — runs as background asyncio task."""
+        # F-040: This task's HTTP calls yield to SNIPE-phase fetches
+        request_priority.set(PRIORITY_BACKGROUND)
         logger.info("%s Monitor started (interval=%ds, min_edge=%.1f%%)",
                      self._config.display_name,
                      self._scan_interval, self._min_edge * 100)
@@ -78,10 +117,11 @@ class SportsMonitor:
             try:
                 stats = await self.scan_and_trade()
                 logger.info(
-                    "%s SCAN: %d markets | %d matched | %d edges | %d trades",
+                    "%s SCAN: %d markets | %d matched | %d edges | %d trades | %s",
                     self._config.display_name,
                     stats["markets_found"], stats.get("matched", 0),
                     stats["edges_found"], stats["trades_entered"],
+                    " ".join(f"{k}={v:.0f}ms" for k, v in stats.get("stage_ms", {}).items()),
                 )
             except Exception:
                 logger.exception("%s Monitor scan error", self._config.display_name)
@@ -92,7 +132,20 @@ class SportsMonitor:
     # ------------------------------------------------------------------
 
     async def scan_and_trade(self) -> dict:
-        """One cycle: discover → odds compare → enter."""
+        """One cycle: discover → odds → prefilter → quotes → rank → enter.
+
+        F-051: Pipeline stages —
+        1. discover + stale filter (end_date < now + 1H)
+        2. sportsbook odds (rate limited)
+        3. prefilter: fair prob available + moneyline gate (no HTTP)
+        4. quotes: batched orderbook fetches, ``QUOTE_CHUNK_MARKETS`` markets per
+           request, at most ``max_quote_concurrency`` in flight
+        5. rank: all quotes in → edges → settlement tier (F-028), edge desc
+        6. enter in ranked order (position/daily caps apply in that order)
+
+        Per-stage wall times (ms) are in ``stats["stage_ms"]`` and
+        ``last_stage_ms``.
+        """
         # Reset cycle budget so each sport scan has fresh allocation
         self._pm.reset_cycle_entries()
 
@@ -101,36 +154,29 @@ class SportsMonitor:
             "matched": 0,
             "edges_found": 0,
             "trades_entered": 0,
+            "stage_ms": {},
         }
+        timer = _StageTimer(stats["stage_ms"])
+        self.last_stage_ms = stats["stage_ms"]
 
         # 0. Ensure GammaClient session is open
         if hasattr(self._scanner, 'client'):
             await self._scanner.client.open()
 
         # 1. Discover markets for this sport
-        markets = await self._scanner.discover_sport_markets(self._config)
-        stats["markets_found"] = len(markets)
+        with timer("discover"):
+            markets = await self._scanner.discover_sport_markets(self._config)
+            stats["markets_found"] = len(markets)
 
-        # 1.5. Filter stale markets (end_date < now + 1H)
-        from poly24h.discovery.gamma_client import filter_stale_markets
-        markets = filter_stale_markets(markets, buffer_hours=1.0)
+            # 1.5. Filter stale markets (end_date < now + 1H)
+            markets = filter_stale_markets(markets, buffer_hours=1.0)
 
-        # F-028: Sort by end_date ascending — 24H settlement markets get capital first
-        markets.sort(key=lambda m: m.end_date)
+            # F-028: Sort by end_date ascending — 24H settlement markets get capital first
+            markets.sort(key=lambda m: m.end_date)
 
         if not markets:
             return stats
 
-        # 1.6. Filter by orderbook liquidity (optional, can be disabled)
-        # from poly24h.strategy.orderbook_scanner import filter_by_liquidity_async
-        # markets = await filter_by_liquidity_async(
-        #     markets, self._fetcher,
-        #     max_spread=0.03, min_depth=200.0, max_impact=0.02
-        # )
-
-        # if not markets:
-        #     return stats
-
         # 2. Rate limiter check
         if self._rate_limiter and not self._rate_limiter.can_fetch(self._config.name):
             logger.info("%s: Rate limited, skipping odds fetch",
@@ -138,7 +184,8 @@ class SportsMonitor:
             return stats
 
         # 3. Fetch sportsbook odds
-        games = await self._odds_client.fetch_odds(self._config)
+        with timer("odds"):
+            games = await self._odds_client.fetch_odds(self._config)
 
         # Record the fetch with rate limiter
         if self._rate_limiter:
@@ -149,15 +196,60 @@ class SportsMonitor:
 
         # 3.5. Settlement sniper check (if enabled)
         if self._settlement_sniper:
-            sniper_opportunities = await self._settlement_sniper.scan_settling_markets(
-                markets, self._config
+            with timer("sniper"):
+                sniper_opportunities = await self._settlement_sniper.scan_settling_markets(
+                    markets, self._config
+                )
+                for market, side, price, edge in sniper_opportunities:
+                    result = await self._settlement_sniper.try_enter(market, side, price, edge)
+                    if result is not None:
+                        stats["trades_entered"] += 1
+
+        # 4. Prefilter before any orderbook fetch (no HTTP)
+        with timer("prefilter"):
+            candidates = self._prefilter(markets, games)
+            stats["matched"] = len(candidates)
+
+        if not candidates:
+            return stats
+
+        # 5. Get CLOB prices — all candidates' quotes concurrently
+        #    (F-050: live executor warms the same tokens' signing metadata)
+        with timer("quotes"):
+            candidate_markets = [market for market, _ in candidates]
+            asks, _ = await asyncio.gather(
+                self._fetch_quotes(candidate_markets),
+                self._warm_order_tokens(candidate_markets),
             )
-            for market, side, price, edge in sniper_opportunities:
-                result = await self._settlement_sniper.try_enter(market, side, price, edge)
+
+        # 6. Rank once every quote is in
+        with timer("rank"):
+            ranked = self._rank_entries(candidates, asks)
+            stats["edges_found"] = len(ranked)
+
+        # 7. Enter best-first (F-050: later entries' orders signed meanwhile)
+        with timer("enter"):
+            presign = self._start_presign(ranked[1:])
+            for market, side, price, edge in ranked:
+                result = await self.try_enter(market, side, price, edge)
                 if result is not None:
                     stats["trades_entered"] += 1
+            if presign is not None:
+                await presign
 
-        # 4. For each market, find fair value and check edge
+        return stats
+
+    # ------------------------------------------------------------------
+    # Pipeline stages
+    # ------------------------------------------------------------------
+
+    QUOTE_CHUNK_MARKETS = 50     # markets (2 tokens each) per batched fetch
+    MAX_QUOTE_CONCURRENCY = 4    # batched fetches in flight
+    SETTLEMENT_PRIORITY_HOURS = 24.0  # F-028 tier for ranking
+
+    def _prefilter(self, markets: list, games: list) -> list[tuple]:
+        """Markets with a sportsbook fair prob that pass the moneyline gate."""
+        candidates: list[tuple] = []
         for market in markets:
             # Skip if already entered via settlement sniper
             if market.id in self._pm._positions:
@@ -170,43 +262,96 @@ class SportsMonitor:
                 continue
 
             # F-032c: Moneyline gate — block unvalidated moneyline entries
-            q = market.question.lower()
-            market_type = self._odds_client._detect_polymarket_type(q)
-            if market_type == "moneyline" and self._moneyline_gate:
+            meta = market_metadata(market)
+            if meta.market_type == "moneyline" and self._moneyline_gate:
                 if not self._moneyline_gate.is_validated():
                     logger.debug(
                         "F-032c: Moneyline gate blocked: %s (need %d more trades)",
-                        q[:40], self._moneyline_gate.stats.get("remaining", "?"),
+                        meta.question_lower[:40], self._moneyline_gate.stats.get("remaining", "?"),
                     )
                     continue
 
-            stats["matched"] += 1
-
-            # 5. Get CLOB prices
-            yes_ask, no_ask = await self._fetcher.fetch_best_asks(
-                market.yes_token_id, market.no_token_id,
-            )
+            candidates.append((market, fair_prob))
+        return candidates
+
+    async def _fetch_quotes(self, markets: list) -> dict[str, float | None]:
+        """Best asks for both tokens of every market (F-033 batched fetches,
+        chunks run concurrently under a bound). Failed chunks are skipped."""
+        chunks = [
+            markets[i:i + self.QUOTE_CHUNK_MARKETS]
+            for i in range(0, len(markets), self.QUOTE_CHUNK_MARKETS)
+        ]
+        slots = asyncio.Semaphore(self._max_quote_concurrency)
+
+        async def fetch_chunk(chunk: list) -> dict[str, float | None]:
+            token_ids: list[str] = []
+            for market in chunk:
+                token_ids.append(market.yes_token_id)
+                token_ids.append(market.no_token_id)
+            async with slots:
+                try:
+                    return await self._fetcher.fetch_best_asks_batch(token_ids)
+                except Exception as exc:
+                    logger.warning("%s: Quote fetch failed for %d markets: %s",
+                                   self._config.display_name, len(chunk), exc)
+                    return {}
+
+        asks: dict[str, float | None] = {}
+        for result in await asyncio.gather(*(fetch_chunk(c) for c in chunks)):
+            asks.update(result)
+        return asks
+
+    def _rank_entries(self, candidates: list[tuple], asks: dict) -> list[tuple]:
+        """(market, side, price, edge) for every candidate with an edge,
+        best first: settles within 24H (F-028), then edge desc, then end date."""
+        entries: list[tuple] = []
+        for market, fair_prob in candidates:
+            yes_ask = asks.get(market.yes_token_id)
+            no_ask = asks.get(market.no_token_id)
             if yes_ask is None or no_ask is None:
                 continue
 
-            # 6. Calculate edges
             edge_yes, edge_no = self.calculate_edges(fair_prob, yes_ask, no_ask)
+            if edge_yes >= edge_no and edge_yes >= self._min_edge:
+                entries.append((market, "YES", yes_ask, edge_yes))
+            elif edge_no >= self._min_edge:
+                entries.append((market, "NO", no_ask, edge_no))
 
-            # 7. Check if either side has edge
-            if edge_yes >= self._min_edge or edge_no >= self._min_edge:
-                stats["edges_found"] += 1
-
-                if edge_yes >= edge_no and edge_yes >= self._min_edge:
-                    result = await self.try_enter(market, "YES", yes_ask, edge_yes)
-                elif edge_no >= self._min_edge:
-                    result = await self.try_enter(market, "NO", no_ask, edge_no)
-                else:
-                    result = None
-
-                if result is not None:
-                    stats["trades_entered"] += 1
+        priority_cutoff = datetime.now(tz=timezone.utc) + timedelta(
+            hours=self.SETTLEMENT_PRIORITY_HOURS,
+        )
+        entries.sort(key=lambda e: (e[0].end_date > priority_cutoff, -e[3], e[0].end_date))
+        return entries
+
+    def _live_executor(self):
+        if self._executor is not None and not self._executor.dry_run:
+            return self._executor
+        return None
+
+    async def _warm_order_tokens(self, markets: list) -> None:
+        """F-050: Signing metadata for every token ``try_enter`` may buy."""
+        executor = self._live_executor()
+        if executor is None:
+            return
+        await executor.warm_tokens(
+            token for m in markets for token in (m.yes_token_id, m.no_token_id)
+        )
 
-        return stats
+    def _start_presign(self, entries: list[tuple]) -> asyncio.Task | None:
+        """F-050: Pre-sign the orders ``try_enter`` would submit for ``entries``
+        at the current bankroll. Sizes that change after earlier fills simply
+        miss the pool and are signed inline."""
+        executor = self._live_executor()
+        if executor is None:
+            return None
+        orders = []
+        for market, side, price, edge in entries:
+            size = self._entry_size(market, price, edge)
+            if size > 0:
+                orders.append((self._entry_token(market, side), "BUY", price, size / price))
+        if not orders:
+            return None
+        return asyncio.create_task(executor.presign(orders))
 
     # ------------------------------------------------------------------
     # Edge calculation
@@ -241,15 +386,10 @@ class SportsMonitor:
                         self._daily_pnl, self._daily_loss_limit)
             return None
 
-        size = self.get_kelly_size(edge, price)
+        size = self._entry_size(market, price, edge)
         if size <= 0:
             return None
-
         event_id = getattr(market, "event_id", "")
-        if event_id:
-            size = self.cap_for_game(event_id, size)
-            if size <= 0:
-                return None
 
         end_date = ""
         if hasattr(market, "end_date"):
@@ -258,15 +398,26 @@ class SportsMonitor:
         # F-031: Live mode — submit order BEFORE recording position
         actual_price = price
         if self._executor and not self._executor.dry_run:
-            token_id = market.yes_token_id if side == "YES" else market.no_token_id
+            # F-041: Hold the slot + bankroll while the order is in flight so
+            # concurrent entries can't overcommit and a fill always gets tracked
+            size = self._pm.reserve(market.id, size)
+            if size <= 0:
+                return None
+            token_id = self._entry_token(market, side)
             shares_estimate = size / price if price > 0 else 0
-            order_result = self._executor.submit_order(
-                token_id=token_id,
-                side="BUY",
-                price=price,
-                size=shares_estimate,
-            )
+            # F-041: async path — never blocks the event loop while polling fills
+            try:
+                order_result = await self._executor.submit_order_async(
+                    token_id=token_id,
+                    side="BUY",
+                    price=price,
+                    size=shares_estimate,
+                )
+            except BaseException:
+                self._pm.release(market.id)
+                raise
             if not order_result.get("success"):
+                self._pm.release(market.id)
                 logger.warning(
                     "%s LIVE ORDER FAILED: %s | %s",
                     self._config.display_name,
@@ -299,10 +450,24 @@ class SportsMonitor:
                 side, market.question[:50], actual_price, edge * 100,
                 position.size_usd,
             )
-            self._pm.save_state(Path("data/position_manager_state.json"))
+            self._pm.save_state(self._state_path)
 
         return position
 
+    def _entry_size(self, market, price: float, edge: float) -> float:
+        """USD size ``try_enter`` uses: Kelly, capped per game."""
+        size = self.get_kelly_size(edge, price)
+        if size <= 0:
+            return 0.0
+        event_id = getattr(market, "event_id", "")
+        if event_id:
+            size = self.cap_for_game(event_id, size)
+        return max(size, 0.0)
+
+    @staticmethod
+    def _entry_token(market, side: str) -> str:
+        return market.yes_token_id if side == "YES" else market.no_token_id
+
     # ------------------------------------------------------------------
     # Per-game limit
     # ------------------------------------------------------------------
@@ -7,6 +7,8 @@ When YES best ask + NO best ask < threshold (e.g., 0.96), buying both sides
 guarantees a profit at settlement regardless of outcome.
 
 F-032d: run_forever() loop, 24H settlement filter, paired position tracking.
+F-048: With a ClobOrderbookFetcher, candidates are sized by walking both ask
+ladders — the ticket's VWAP CPP (not just top-of-book) must stay < threshold.
 """
 
 from __future__ import annotations
@@ -17,6 +19,11 @@ import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from poly24h.jsonl_writer import JsonlWriter, get_default_writer
+from poly24h.rate_limiter import PRIORITY_BACKGROUND, request_priority
+from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher, OrderbookSummary
+from poly24h.strategy.paired_depth import PairedDepthEvaluator
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_PAPER_TRADE_DIR = "data/paper_trades"
@@ -42,8 +49,10 @@ class SportsPairedScanner:
         scan_interval: float = 300.0,
         paper_trade_dir: str = DEFAULT_PAPER_TRADE_DIR,
         paper_size_usd: float = 20.0,
+        writer: JsonlWriter | None = None,
     ):
         self._fetcher = orderbook_fetcher
+        self._writer = writer or get_default_writer()  # F-055
         self._pm = position_manager
         self._cpp_threshold = cpp_threshold
         self._min_price = min_price
@@ -57,6 +66,8 @@ class SportsPairedScanner:
 
         # Internal paired position tracking (bypasses PositionManager 1-per-market limit)
         self.paired_positions: dict[str, dict] = {}
+        # F-048: Sports markets are fee-free in this model → raw VWAP CPP
+        self._depth = PairedDepthEvaluator(taker_fees=False)
 
     # ------------------------------------------------------------------
     # Main loop
@@ -64,6 +75,8 @@ class SportsPairedScanner:
 
     async def run_forever(self) -> None:
         """Continuous scan loop — discover markets, check CPP, enter paired."""
+        # F-040: This task's HTTP calls yield to SNIPE-phase fetches
+        request_priority.set(PRIORITY_BACKGROUND)
         logger.info(
             "SportsPairedScanner started (CPP<%.2f, settle=%d-%dH, interval=%ds)",
             self._cpp_threshold, self._min_hours, self._max_hours, self._scan_interval,
@@ -128,6 +141,7 @@ class SportsPairedScanner:
         opportunities: list[dict] = []
         now = datetime.now(timezone.utc)
 
+        candidates = []
         for market in markets:
             # Skip if already have paired position
             if market.id in self.paired_positions:
@@ -141,13 +155,30 @@ class SportsPairedScanner:
             if not self._is_within_settlement_window(market, now):
                 continue
 
-            try:
-                yes_ask, no_ask = await self._fetcher.fetch_best_asks(
-                    market.yes_token_id, market.no_token_id,
-                )
-            except Exception as e:
-                logger.debug("Orderbook fetch failed for %s: %s", market.id, e)
-                continue
+            candidates.append(market)
+
+        if not candidates:
+            return opportunities
+
+        # F-033: One batched orderbook fetch for every candidate market
+        token_ids: list[str] = []
+        for market in candidates:
+            token_ids.append(market.yes_token_id)
+            token_ids.append(market.no_token_id)
+        books: dict[str, OrderbookSummary] = {}
+        try:
+            if isinstance(self._fetcher, ClobOrderbookFetcher):
+                books = await self._fetcher.fetch_orderbooks(token_ids)
+                asks = {t: summary.best_ask for t, summary in books.items()}
+            else:
+                asks = await self._fetcher.fetch_best_asks_batch(token_ids)
+        except Exception as e:
+            logger.debug("Orderbook batch fetch failed (%d markets): %s", len(candidates), e)
+            return opportunities
+
+        for market in candidates:
+            yes_ask = asks.get(market.yes_token_id)
+            no_ask = asks.get(market.no_token_id)
 
             # Skip if either side has no liquidity
             if yes_ask is None or no_ask is None:
@@ -160,6 +191,25 @@ class SportsPairedScanner:
             cpp = yes_ask + no_ask
 
             if cpp < self._cpp_threshold:
+                depth: dict = {}
+                yes_book = books.get(market.yes_token_id)
+                no_book = books.get(market.no_token_id)
+                if yes_book is not None and no_book is not None:
+                    # F-048: Size the ticket on both ladders; thin books drop out
+                    fill = self._depth.evaluate(
+                        yes_book.asks, no_book.asks,
+                        # strict "< threshold" like the top-of-book check
+                        self._cpp_threshold - 1e-9, self._paper_size_usd,
+                    )
+                    if fill.shares <= 0:
+                        continue
+                    cpp = fill.vwap_cpp
+                    depth = {
+                        "yes_vwap": fill.yes_vwap,
+                        "no_vwap": fill.no_vwap,
+                        "max_shares": fill.shares,
+                    }
+
                 spread = 1.0 - cpp
                 roi_pct = (spread / cpp) * 100 if cpp > 0 else 0.0
 
@@ -177,6 +227,7 @@ class SportsPairedScanner:
                     "roi_pct": roi_pct,
                     "end_date": end_date,
                     "event_id": getattr(market, "event_id", ""),
+                    **depth,
                 }
                 opportunities.append(opp)
 
@@ -246,8 +297,11 @@ class SportsPairedScanner:
         # Calculate shares: buy equal number of shares on both sides
         # Total cost per share = cpp, so shares = size_usd / cpp
         shares = size_usd / cpp
-        yes_cost = shares * yes_ask
-        no_cost = shares * no_ask
+        if "max_shares" in opp:
+            # F-048: Never more than the ladders can fill below threshold
+            shares = min(shares, opp["max_shares"])
+        yes_cost = shares * opp.get("yes_vwap", yes_ask)
+        no_cost = shares * opp.get("no_vwap", no_ask)
         total_cost = yes_cost + no_cost
 
         # Guaranteed profit = shares * (1.0 - cpp) = shares * spread
@@ -289,10 +343,9 @@ class SportsPairedScanner:
     def _log_paper_trade(self, record: dict) -> None:
         """Append paper trade to JSONL file."""
         try:
-            self._paper_trade_dir.mkdir(parents=True, exist_ok=True)
             today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
             filepath = self._paper_trade_dir / f"paired_sports_{today}.jsonl"
-            with open(filepath, "a") as f:
-                f.write(json.dumps(record) + "\n")
+            # F-055: paired positions are real trades — fsync on flush
+            self._writer.append(filepath, json.dumps(record), fsync=True)
         except Exception as e:
             logger.warning("Failed to log paper trade: %s", e)
@@ -0,0 +1,415 @@
+"""F-053: Indexed embedded paper-trade store (SQLite, WAL mode).
+
+일별 JSONL(``data/paper_trades/YYYY-MM-DD.jsonl``)을 정산/동기화/분석이 각자 통째로
+다시 읽고, 정산 때마다 하루치 파일 전체를 다시 쓰던 것을 하나의 SQLite DB로 합친다.
+
+- ``trades``: 거래 1건 = 1행. ``(day, market_id)`` 유니크 (같은 날 같은 마켓 중복 기록 방지),
+  market_id / status / end_date 인덱스. ``day``는 기존 파일 날짜와 같은 의미
+- 정산 = 해당 행의 status/winner/payout/pnl in-place UPDATE
+- WAL 모드: 스케줄러(쓰기)와 분석(읽기)이 서로 막지 않음
+- JSONL은 얇은 어댑터: ``import_jsonl``/``import_dir``는 크기·mtime 지문으로 바뀐
+  파일만 가져오고 (기존 데이터/외부 도구 호환), ``export_jsonl``은 하루치를 파일로 내보낸다
+- F-057: 행이 추가/정산될 때마다 ``day_revisions``의 해당 day 리비전을 올린다
+  (일별 롤업이 바뀐 날만 다시 계산하는 기준)
+
+Usage:
+    store = TradeStore.for_dir("data/paper_trades")
+    store.insert(trade.to_dict(), day="2026-02-14")
+    store.update_settlements([settled.to_dict()])
+    for record in store.iter_trades(status="open"):
+        ...
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DB_NAME = "trades.db"
+
+# Trade day files only (market_stats_*/paired_* are separate sinks)
+DAY_FILE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+COLUMNS = (
+    "market_id", "market_question", "market_source", "side", "price", "shares",
+    "cost", "timestamp", "end_date", "status", "winner", "payout", "pnl",
+)
+_DEFAULTS = {
+    "market_id": "", "market_question": "", "market_source": "", "side": "",
+    "price": 0.0, "shares": 0.0, "cost": 0.0, "timestamp": "", "end_date": "",
+    "status": "open", "winner": "", "payout": 0.0, "pnl": 0.0,
+}
+# Scheduler-side trade dicts use paper_size_usd / paper_shares
+_LEGACY_ALIASES = {"cost": "paper_size_usd", "shares": "paper_shares"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    day TEXT NOT NULL,
+    market_id TEXT NOT NULL,
+    market_question TEXT NOT NULL DEFAULT '',
+    market_source TEXT NOT NULL DEFAULT '',
+    side TEXT NOT NULL DEFAULT '',
+    price REAL NOT NULL DEFAULT 0,
+    shares REAL NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    timestamp TEXT NOT NULL DEFAULT '',
+    end_date TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'open',
+    winner TEXT NOT NULL DEFAULT '',
+    payout REAL NOT NULL DEFAULT 0,
+    pnl REAL NOT NULL DEFAULT 0,
+    extra TEXT NOT NULL DEFAULT '{}',
+    UNIQUE (day, market_id)
+);
+CREATE INDEX IF NOT EXISTS idx_trades_market_id ON trades (market_id);
+CREATE INDEX IF NOT EXISTS idx_trades_status ON trades (status);
+CREATE INDEX IF NOT EXISTS idx_trades_end_date ON trades (end_date);
+CREATE TABLE IF NOT EXISTS imports (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS day_revisions (
+    day TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('store_id', lower(hex(randomblob(8))));
+INSERT OR IGNORE INTO day_revisions (day, revision) SELECT DISTINCT day, 1 FROM trades;
+"""
+# Day lookups use the (day, market_id) unique index.
+
+_BUMP_REVISION = (
+    "INSERT INTO day_revisions (day, revision) VALUES (?, 1) "
+    "ON CONFLICT (day) DO UPDATE SET revision = revision + 1"
+)
+
+_INSERT = (
+    f"INSERT OR IGNORE INTO trades (day, {', '.join(COLUMNS)}, extra) "
+    f"VALUES ({', '.join('?' * (len(COLUMNS) + 2))})"
+)
+
+
+def _to_row(record: dict, day: str) -> tuple:
+    values = []
+    for col in COLUMNS:
+        value = record.get(col)
+        if value is None and col in _LEGACY_ALIASES:
+            value = record.get(_LEGACY_ALIASES[col])
+        values.append(_DEFAULTS[col] if value is None else value)
+    extra = {k: v for k, v in record.items() if k not in _DEFAULTS and k != "day"}
+    return (day, *values, json.dumps(extra, separators=(",", ":")))
+
+
+def _to_record(row: sqlite3.Row) -> dict:
+    record = json.loads(row["extra"]) if row["extra"] not in ("", "{}") else {}
+    record.update({col: row[col] for col in COLUMNS})
+    record["day"] = row["day"]
+    return record
+
+
+class TradeStore:
+    """SQLite-backed paper trade store. All methods are thread-safe.
+
+    Args:
+        path: DB 파일 경로 (부모 디렉터리는 자동 생성).
+        timeout: 다른 커넥션이 쓰기 잠금을 잡고 있을 때 대기 시간(초).
+    """
+
+    BATCH_SIZE = 1000  # iter_trades page size
+
+    def __init__(self, path: Path | str, timeout: float = 5.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=timeout, check_same_thread=False,
+            isolation_level=None,  # explicit BEGIN/COMMIT below
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            # F-057: Distinguishes a recreated DB whose revisions restarted at 1
+            self.store_id: str = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'store_id'",
+            ).fetchone()[0]
+
+    @classmethod
+    def for_dir(cls, data_dir: Path | str) -> TradeStore:
+        """The store living next to the legacy day files in ``data_dir``."""
+        return cls(Path(data_dir) / DB_NAME)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def insert(self, record: dict, day: str) -> bool:
+        """Insert one trade. False if (day, market_id) already exists."""
+        row = _to_row(record, day)
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                added = self._conn.execute(_INSERT, row).rowcount == 1
+                if added:
+                    self._conn.execute(_BUMP_REVISION, (day,))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return added
+
+    def insert_many(self, records: Iterable[dict], day: str) -> int:
+        """Insert trades in one transaction. Returns the number added."""
+        rows = [_to_row(r, day) for r in records]
+        if not rows:
+            return 0
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(_INSERT, rows)
+                added = self._conn.total_changes - before
+                if added:
+                    self._conn.execute(_BUMP_REVISION, (day,))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return added
+
+    def update_settlements(self, records: Iterable[dict]) -> int:
+        """Write status/winner/payout/pnl in place for each record's market.
+
+        Every unsettled row of the market is updated (the same position may
+        appear under two days across midnight). Returns rows updated.
+        """
+        rows = [
+            (r.get("status", "settled"), r.get("winner", ""), r.get("payout", 0.0),
+             r.get("pnl", 0.0), r["market_id"])
+            for r in records
+        ]
+        if not rows:
+            return 0
+        market_ids = list({row[-1] for row in rows})
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                days = set()
+                for i in range(0, len(market_ids), self.BATCH_SIZE):
+                    chunk = market_ids[i:i + self.BATCH_SIZE]
+                    days.update(r[0] for r in self._conn.execute(
+                        f"SELECT DISTINCT day FROM trades WHERE status != 'settled' "
+                        f"AND market_id IN ({', '.join('?' * len(chunk))})",
+                        chunk,
+                    ))
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "UPDATE trades SET status = ?, winner = ?, payout = ?, pnl = ? "
+                    "WHERE market_id = ? AND status != 'settled'",
+                    rows,
+                )
+                updated = self._conn.total_changes - before
+                if updated:
+                    self._conn.executemany(_BUMP_REVISION, [(d,) for d in sorted(days)])
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return updated
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def iter_trades(
+        self,
+        days: Optional[Iterable[str]] = None,
+        status: Optional[str] = None,
+        start_day: Optional[str] = None,
+        end_day: Optional[str] = None,
+        after_id: int = 0,
+    ) -> Iterator[dict]:
+        """Stream matching trades in insertion order, ``BATCH_SIZE`` rows at a time.
+
+        The lock is held per page only, so writers are never blocked by a
+        long-running reader.
+        """
+        where, params = ["id > ?"], []
+        if days is not None:
+            day_list = list(days)
+            if not day_list:
+                return
+            where.append(f"day IN ({', '.join('?' * len(day_list))})")
+            params.extend(day_list)
+        if status is not None:
+            where.append("status = ?")
+            params.append(status)
+        if start_day is not None:
+            where.append("day >= ?")
+            params.append(start_day)
+        if end_day is not None:
+            where.append("day <= ?")
+            params.append(end_day)
+        sql = f"SELECT * FROM trades WHERE {' AND '.join(where)} ORDER BY id LIMIT ?"
+
+        last_id = after_id
+        while True:
+            with self._lock:
+                rows = self._conn.execute(sql, (last_id, *params, self.BATCH_SIZE)).fetchall()
+            for row in rows:
+                yield _to_record(row)
+            if len(rows) < self.BATCH_SIZE:
+                return
+            last_id = rows[-1]["id"]
+
+    def trades(self, **filters) -> list[dict]:
+        return list(self.iter_trades(**filters))
+
+    def open_trades_since(self, after_id: int = 0) -> tuple[list[dict], int]:
+        """Open trades inserted after ``after_id`` and the new high-water id."""
+        with self._lock:
+            high = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM trades").fetchone()[0]
+            rows = self._conn.execute(
+                "SELECT * FROM trades WHERE id > ? AND id <= ? AND status = 'open' ORDER BY id",
+                (after_id, high),
+            ).fetchall()
+        return [_to_record(r) for r in rows], max(high, after_id)
+
+    def settled_totals(self) -> tuple[int, int, int, float]:
+        """(settled markets, wins, losses, total P&L), one row per market."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(pnl > 0), 0), COALESCE(SUM(pnl < 0), 0), "
+                "COALESCE(SUM(pnl), 0.0) FROM ("
+                "SELECT market_id, MAX(pnl) AS pnl FROM trades "
+                "WHERE status = 'settled' GROUP BY market_id)",
+            ).fetchone()
+        return int(row[0]), int(row[1]), int(row[2]), float(row[3])
+
+    def day_revisions(
+        self,
+        start_day: Optional[str] = None,
+        end_day: Optional[str] = None,
+    ) -> dict[str, int]:
+        """F-057: {day: revision} — a day's revision changes whenever its rows do."""
+        where, params = ["1 = 1"], []
+        if start_day is not None:
+            where.append("day >= ?")
+            params.append(start_day)
+        if end_day is not None:
+            where.append("day <= ?")
+            params.append(end_day)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT day, revision FROM day_revisions WHERE {' AND '.join(where)}",
+                params,
+            ).fetchall()
+        return {r[0]: r[1] for r in rows}
+
+    def market_ids(self, day: str) -> set[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT market_id FROM trades WHERE day = ?", (day,),
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    # ------------------------------------------------------------------
+    # JSONL adapters
+    # ------------------------------------------------------------------
+
+    def import_jsonl(self, path: Path | str, day: Optional[str] = None) -> int:
+        """Import a legacy day file if it changed since the last import. Never raises.
+
+        Rows already in the store win (settlement happens here, not in the file).
+        Corrupt lines are skipped. Returns the number of trades added.
+        """
+        path = Path(path)
+        try:
+            st = path.stat()
+        except OSError:
+            return 0
+        with self._lock:
+            seen = self._conn.execute(
+                "SELECT size, mtime_ns FROM imports WHERE name = ?", (path.name,),
+            ).fetchone()
+        if seen is not None and tuple(seen) == (st.st_size, st.st_mtime_ns):
+            return 0
+
+        records = []
+        try:
+            with open(path) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("[TRADE-STORE] Skipping corrupt line in %s", path.name)
+                        continue
+                    if isinstance(record, dict):
+                        records.append(record)
+            added = self.insert_many(records, day or path.stem)
+            self._mark_imported(path.name, st.st_size, st.st_mtime_ns)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("[TRADE-STORE] Import failed for %s: %s", path, e)
+            return 0
+        if added:
+            logger.info("[TRADE-STORE] Imported %d trades from %s", added, path.name)
+        return added
+
+    def import_dir(self, data_dir: Path | str) -> int:
+        """Import every changed ``YYYY-MM-DD.jsonl`` in ``data_dir``."""
+        data_dir = Path(data_dir)
+        if not data_dir.exists():
+            return 0
+        return sum(
+            self.import_jsonl(f)
+            for f in sorted(data_dir.glob("*.jsonl"))
+            if DAY_FILE_PATTERN.match(f.stem)
+        )
+
+    def export_jsonl(self, day: str, path: Path | str) -> int:
+        """Write one day's trades to ``path`` (atomic rename). Never raises.
+
+        The exported file is fingerprinted so it is not re-imported.
+        """
+        path = Path(path)
+        tmp = path.with_suffix(".tmp")
+        count = 0
+        try:
+            with open(tmp, "w") as f:
+                for record in self.iter_trades(days=[day]):
+                    record.pop("day", None)
+                    f.write(json.dumps(record) + "\n")
+                    count += 1
+            tmp.replace(path)
+            st = path.stat()
+            self._mark_imported(path.name, st.st_size, st.st_mtime_ns)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("[TRADE-STORE] Export failed for %s: %s", path, e)
+            return 0
+        return count
+
+    def _mark_imported(self, name: str, size: int, mtime_ns: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO imports (name, size, mtime_ns) VALUES (?, ?, ?)",
+                (name, size, mtime_ns),
+            )
@@ -0,0 +1,212 @@
+"""F-035: Incremental local L2 orderbook.
+
+WebSocket ``book`` 스냅샷과 ``price_change`` 델타를 토큰별 L2 오더북에
+점진적으로 반영한다. 매 메시지마다 리스트를 다시 만들고 정렬하지 않는다.
+
+- 가격 레벨은 정렬된 리스트(bisect)로 유지 → best bid/ask O(1)
+- 깊이 질의("$X 매수 비용", "N주 매수 비용")는 누적합 배열 + bisect → O(log n)
+  (누적합은 변경 후 첫 질의 때 한 번만 재계산)
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable
+
+ASK = "ask"
+BID = "bid"
+
+# Polymarket WS side 표기 → 오더북 side
+_SIDE_ALIASES = {
+    "ask": ASK, "asks": ASK, "sell": ASK,
+    "bid": BID, "bids": BID, "buy": BID,
+}
+
+
+def normalize_side(side: str) -> str | None:
+    """'SELL'/'ask' → ASK, 'BUY'/'bid' → BID. 알 수 없으면 None."""
+    return _SIDE_ALIASES.get(str(side).lower())
+
+
+class L2Book:
+    """Sorted price-level book for a single token.
+
+    asks/bids는 price → size dict와 오름차순 가격 리스트로 관리한다.
+    best ask = asks[0], best bid = bids[-1].
+    """
+
+    __slots__ = (
+        "_sizes", "_prices", "_cum_shares", "_cum_cost",
+        "timestamp", "updates",
+    )
+
+    def __init__(self):
+        self._sizes: dict[str, dict[float, float]] = {ASK: {}, BID: {}}
+        self._prices: dict[str, list[float]] = {ASK: [], BID: []}
+        # Lazy ask-side prefix sums (None = dirty)
+        self._cum_shares: list[float] | None = None
+        self._cum_cost: list[float] | None = None
+        self.timestamp: float = 0.0
+        self.updates: int = 0
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def apply_snapshot(
+        self,
+        asks: Iterable[tuple[float, float | None]],
+        bids: Iterable[tuple[float, float | None]],
+    ) -> None:
+        """전체 스냅샷으로 교체. size <= 0 레벨은 무시.
+
+        size=None (수량 미상) 레벨은 가격 레벨로 유지하고 깊이는 0으로 본다.
+        """
+        for side, levels in ((ASK, asks), (BID, bids)):
+            sizes = {
+                p: (s if s is not None else 0.0)
+                for p, s in levels
+                if p > 0 and (s is None or s > 0)
+            }
+            self._sizes[side] = sizes
+            self._prices[side] = sorted(sizes)
+        self._touch()
+
+    def apply_delta(self, side: str, price: float, size: float) -> None:
+        """단일 레벨 갱신. size <= 0 이면 레벨 제거."""
+        side = normalize_side(side) or side
+        if side not in self._sizes or price <= 0:
+            return
+        sizes = self._sizes[side]
+        prices = self._prices[side]
+        if size <= 0:
+            if sizes.pop(price, None) is not None:
+                idx = bisect_left(prices, price)
+                if idx < len(prices) and prices[idx] == price:
+                    del prices[idx]
+        else:
+            if price not in sizes:
+                insort(prices, price)
+            sizes[price] = size
+        self._touch()
+
+    def clear(self) -> None:
+        self.apply_snapshot((), ())
+
+    def _touch(self) -> None:
+        self._cum_shares = None
+        self._cum_cost = None
+        self.timestamp = time.time()
+        self.updates += 1
+
+    # ------------------------------------------------------------------
+    # Top of book — O(1)
+    # ------------------------------------------------------------------
+
+    @property
+    def best_ask(self) -> float | None:
+        prices = self._prices[ASK]
+        return prices[0] if prices else None
+
+    @property
+    def best_bid(self) -> float | None:
+        prices = self._prices[BID]
+        return prices[-1] if prices else None
+
+    @property
+    def best_ask_size(self) -> float:
+        best = self.best_ask
+        return self._sizes[ASK][best] if best is not None else 0.0
+
+    @property
+    def best_bid_size(self) -> float:
+        best = self.best_bid
+        return self._sizes[BID][best] if best is not None else 0.0
+
+    @property
+    def ask_levels(self) -> int:
+        return len(self._prices[ASK])
+
+    @property
+    def bid_levels(self) -> int:
+        return len(self._prices[BID])
+
+    def levels(self, side: str, n: int | None = None) -> list[tuple[float, float]]:
+        """Best-first (price, size) 레벨 목록."""
+        side = normalize_side(side) or side
+        prices = self._prices[side]
+        ordered = prices if side == ASK else prices[::-1]
+        if n is not None:
+            ordered = ordered[:n]
+        sizes = self._sizes[side]
+        return [(p, sizes[p]) for p in ordered]
+
+    # ------------------------------------------------------------------
+    # Depth queries — O(log n) after prefix sums are built
+    # ------------------------------------------------------------------
+
+    def _ask_prefix(self) -> tuple[list[float], list[float]]:
+        if self._cum_shares is None or self._cum_cost is None:
+            sizes = self._sizes[ASK]
+            cum_shares: list[float] = []
+            cum_cost: list[float] = []
+            shares = cost = 0.0
+            for p in self._prices[ASK]:
+                s = sizes[p]
+                shares += s
+                cost += p * s
+                cum_shares.append(shares)
+                cum_cost.append(cost)
+            self._cum_shares = cum_shares
+            self._cum_cost = cum_cost
+        return self._cum_shares, self._cum_cost
+
+    def ask_depth_shares(self, max_price: float | None = None) -> float:
+        """max_price 이하 ask 총 수량 (None이면 전체)."""
+        cum_shares, _ = self._ask_prefix()
+        idx = len(cum_shares) if max_price is None else bisect_right(
+            self._prices[ASK], max_price,
+        )
+        return cum_shares[idx - 1] if idx > 0 else 0.0
+
+    def ask_depth_usd(self, max_price: float | None = None) -> float:
+        """max_price 이하 ask 총 금액 (None이면 전체)."""
+        _, cum_cost = self._ask_prefix()
+        idx = len(cum_cost) if max_price is None else bisect_right(
+            self._prices[ASK], max_price,
+        )
+        return cum_cost[idx - 1] if idx > 0 else 0.0
+
+    def cost_to_buy_shares(self, shares: float) -> float | None:
+        """N주 시장가 매수 비용. 깊이 부족 시 None."""
+        if shares <= 0:
+            return 0.0
+        cum_shares, cum_cost = self._ask_prefix()
+        if not cum_shares or cum_shares[-1] < shares:
+            return None
+        idx = bisect_left(cum_shares, shares)
+        prev_shares = cum_shares[idx - 1] if idx > 0 else 0.0
+        prev_cost = cum_cost[idx - 1] if idx > 0 else 0.0
+        return prev_cost + (shares - prev_shares) * self._prices[ASK][idx]
+
+    def shares_for_usd(self, usd: float) -> float:
+        """$X로 시장가 매수 가능한 수량 (깊이 부족 시 가능한 만큼)."""
+        if usd <= 0:
+            return 0.0
+        cum_shares, cum_cost = self._ask_prefix()
+        if not cum_cost:
+            return 0.0
+        if cum_cost[-1] <= usd:
+            return cum_shares[-1]
+        idx = bisect_left(cum_cost, usd)
+        prev_shares = cum_shares[idx - 1] if idx > 0 else 0.0
+        prev_cost = cum_cost[idx - 1] if idx > 0 else 0.0
+        return prev_shares + (usd - prev_cost) / self._prices[ASK][idx]
+
+    def vwap_for_usd(self, usd: float) -> float | None:
+        """$X 매수 시 평균 체결가. 깊이 부족 시 None."""
+        if usd <= 0 or self.ask_depth_usd() < usd:
+            return None
+        shares = self.shares_for_usd(usd)
+        return usd / shares if shares > 0 else None
@@ -6,12 +6,18 @@ Phase 3 enhancement:
 - Best ask/bid tracking (separate from mid-price)
 - Orderbook depth snapshot caching
 - Cache hit/miss statistics for latency monitoring
+
+F-035: Full L2 books (``L2Book``) per token, updated incrementally from
+WS snapshots/deltas. ``OrderbookEntry`` stays as the top-of-book view.
 """
 
 from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from poly24h.websocket.orderbook import L2Book
 
 
 @dataclass
@@ -39,12 +45,37 @@ class PriceCache:
         self._timestamps: dict[str, float] = {}
         # Phase 3: Orderbook cache
         self._orderbooks: dict[str, OrderbookEntry] = {}
+        # F-035: Incremental L2 books
+        self._books: dict[str, L2Book] = {}
         # Phase 3: Cache statistics
         self._hits: int = 0
         self._misses: int = 0
+        # F-037: Update listeners (token_id) — push-based detection
+        self._listeners: list[Callable[[str], None]] = []
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """Register ``callback(token_id)``, called synchronously on every update."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, token_id: str) -> None:
+        for callback in self._listeners:
+            try:
+                callback(token_id)
+            except Exception:
+                # 리스너 오류가 WS 수신 루프를 멈추면 안 됨
+                pass
 
     def update(self, token_id: str, price: float) -> None:
         """가격 업데이트. 타임스탬프 갱신."""
+        self._store_price(token_id, price)
+        self._notify(token_id)
+
+    def _store_price(self, token_id: str, price: float) -> None:
         self._prices[token_id] = price
         self._timestamps[token_id] = time.time()
 
@@ -79,6 +110,7 @@ class PriceCache:
         self._prices.clear()
         self._timestamps.clear()
         self._orderbooks.clear()
+        self._books.clear()
         self._hits = 0
         self._misses = 0
 
@@ -112,7 +144,8 @@ class PriceCache:
         )
         # Also update the simple price cache with best ask
         if best_ask is not None and best_ask > 0:
-            self.update(token_id, best_ask)
+            self._store_price(token_id, best_ask)
+        self._notify(token_id)
 
     def get_best_ask(self, token_id: str) -> float | None:
         """Get cached best ask for a token."""
@@ -146,10 +179,82 @@ class PriceCache:
             return False
         return (time.time() - entry.timestamp) <= max_age_secs
 
+    def orderbook_age(self, token_id: str) -> float | None:
+        """F-043: Seconds since the token's last known-good book (None if never)."""
+        entry = self._orderbooks.get(token_id)
+        if entry is None:
+            return None
+        return time.time() - entry.timestamp
+
+    def stale_tokens(
+        self, token_ids: Iterable[str], max_age_secs: float = 5.0,
+    ) -> list[str]:
+        """F-043: Tokens without a fresh cached book (keeps input order)."""
+        return [t for t in token_ids if not self.is_orderbook_fresh(t, max_age_secs)]
+
     def get_orderbook_entry(self, token_id: str) -> OrderbookEntry | None:
         """Get full orderbook entry for a token."""
         return self._orderbooks.get(token_id)
 
+    # ------------------------------------------------------------------
+    # F-035: L2 book methods
+    # ------------------------------------------------------------------
+
+    def apply_book_snapshot(
+        self,
+        token_id: str,
+        asks: Iterable[tuple[float, float | None]],
+        bids: Iterable[tuple[float, float | None]],
+    ) -> L2Book:
+        """Replace a token's L2 book with a full snapshot (size None = unknown)."""
+        book = self._books.get(token_id)
+        if book is None:
+            book = self._books[token_id] = L2Book()
+        book.apply_snapshot(asks, bids)
+        self._sync_top_of_book(token_id, book)
+        return book
+
+    def apply_price_change(
+        self, token_id: str, side: str, price: float, size: float,
+    ) -> L2Book:
+        """Apply a single level delta (size 0 removes the level)."""
+        book = self._books.get(token_id)
+        if book is None:
+            book = self._books[token_id] = L2Book()
+        book.apply_delta(side, price, size)
+        self._sync_top_of_book(token_id, book)
+        return book
+
+    def get_book(self, token_id: str) -> L2Book | None:
+        """Get the L2 book for a token (None if never received)."""
+        return self._books.get(token_id)
+
+    def cost_to_buy_usd(self, token_id: str, usd: float) -> float | None:
+        """VWAP for spending ``usd`` on a token's asks. None if unknown/thin."""
+        book = self._books.get(token_id)
+        if book is None:
+            return None
+        return book.vwap_for_usd(usd)
+
+    def _sync_top_of_book(self, token_id: str, book: L2Book) -> None:
+        """Mirror L2 best levels into OrderbookEntry.
+
+        asks가 비면 이전 best ask가 남지 않도록 top-of-book 캐시를 제거.
+        """
+        best_ask = book.best_ask
+        if best_ask is None:
+            if self._orderbooks.pop(token_id, None) is not None:
+                self._prices.pop(token_id, None)
+                self._timestamps.pop(token_id, None)
+            return
+        self.update_orderbook(
+            token_id,
+            best_ask=best_ask,
+            best_bid=book.best_bid,
+            ask_size=book.best_ask_size,
+            bid_size=book.best_bid_size,
+        )
+
     # ------------------------------------------------------------------
     # Phase 3: Cache statistics
     # ------------------------------------------------------------------
@@ -166,6 +271,7 @@ class PriceCache:
         return {
             "prices_cached": len(self._prices),
             "orderbooks_cached": len(self._orderbooks),
+            "l2_books": len(self._books),
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": round(self.hit_rate, 3),
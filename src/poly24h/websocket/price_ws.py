@@ -4,6 +4,8 @@ Polymarket CLOB WebSocket에 연결하여 실시간 가격 수신.
 Auto-reconnect: max 5 attempts, exponential backoff.
 
 Phase 3: Enhanced to populate orderbook cache with best ask/bid.
+F-035: book/price_change messages maintain incremental L2 books in PriceCache.
+F-044: Server ``timestamp`` fields calibrate the shared ExchangeClock.
 """
 
 from __future__ import annotations
@@ -11,12 +13,15 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
+from typing import Any, Awaitable, Callable
 
 try:
     import websockets
 except ImportError:
     websockets = None  # type: ignore
 
+from poly24h.precision_timer import ExchangeClock, get_default_clock
 from poly24h.websocket.price_cache import PriceCache
 
 logger = logging.getLogger(__name__)
@@ -30,24 +35,49 @@ class PriceWebSocket:
     Args:
         cache: PriceCache 인스턴스 (가격 저장).
         url: WebSocket 엔드포인트 URL.
+        connect_fn: F-036 ``url → websocket`` 팩토리 (기본: websockets.connect).
+            테스트에서는 로컬 stand-in을 주입한다.
+        clock: F-044 서버 timestamp를 넘길 ExchangeClock (기본: 프로세스 공용).
     """
 
-    def __init__(self, cache: PriceCache, url: str = WS_URL):
+    def __init__(
+        self,
+        cache: PriceCache,
+        url: str = WS_URL,
+        connect_fn: Callable[[str], Awaitable[Any]] | None = None,
+        clock: ExchangeClock | None = None,
+    ):
         self._cache = cache
+        self._clock = clock or get_default_clock()
         self._url = url
+        self._connect_fn = connect_fn
         self._ws = None
         self._connected = False
         self._max_reconnect = 5
         # Phase 3: Message counter for monitoring
         self._messages_received: int = 0
+        # F-036: Subscriptions replayed after reconnect + liveness
+        self._subscribed: set[str] = set()
+        self.last_message_at: float = 0.0  # time.monotonic()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def subscribed_tokens(self) -> set[str]:
+        return set(self._subscribed)
 
     async def connect(self) -> None:
         """WebSocket 연결."""
         try:
-            if websockets is None:
+            if self._connect_fn is not None:
+                self._ws = await self._connect_fn(self._url)
+            elif websockets is None:
                 logger.error("websockets not installed")
                 return
-            self._ws = await websockets.connect(self._url)
+            else:
+                self._ws = await websockets.connect(self._url)
             self._connected = True
             logger.info("Connected to %s", self._url)
         except Exception as exc:
@@ -55,9 +85,10 @@ class PriceWebSocket:
             self._connected = False
 
     async def subscribe(self, token_ids: list[str]) -> None:
-        """토큰 구독. 연결 안됐으면 무시."""
+        """토큰 구독. 연결 안됐으면 무시 (재연결 시 resubscribe로 재전송)."""
+        self._subscribed.update(token_ids)
         if not self._connected or self._ws is None:
-            logger.warning("Cannot subscribe: not connected")
+            logger.info("Not connected: %d tokens queued for next connect", len(token_ids))
             return
         msg = json.dumps({
             "type": "market",
@@ -68,6 +99,7 @@ class PriceWebSocket:
 
     async def unsubscribe(self, token_ids: list[str]) -> None:
         """토큰 구독 해제."""
+        self._subscribed.difference_update(token_ids)
         if not self._connected or self._ws is None:
             return
         msg = json.dumps({
@@ -77,20 +109,35 @@ class PriceWebSocket:
         await self._ws.send(msg)
         logger.info("Unsubscribed from %d tokens", len(token_ids))
 
-    async def listen(self) -> None:
+    async def resubscribe(self) -> None:
+        """F-036: 재연결 후 기존 구독 전체를 다시 전송."""
+        if self._subscribed:
+            await self.subscribe(sorted(self._subscribed))
+
+    async def listen(self, idle_timeout: float | None = None) -> None:
         """메인 수신 루프. 가격 업데이트를 캐시에 저장.
 
         CancelledError / ConnectionClosed 시 루프 종료.
+        F-036: ``idle_timeout`` 동안 메시지가 없으면 stall로 보고 종료
+        (상위 매니저가 재연결).
         """
         while self._connected and self._ws:
             try:
-                raw = await self._ws.recv()
+                if idle_timeout is not None:
+                    raw = await asyncio.wait_for(self._ws.recv(), timeout=idle_timeout)
+                else:
+                    raw = await self._ws.recv()
+                self.last_message_at = time.monotonic()
                 self._process_message(raw)
             except asyncio.CancelledError:
                 raise
+            except asyncio.TimeoutError:
+                logger.warning("WebSocket stalled: no message for %.0fs", idle_timeout)
+                break
             except Exception as exc:
                 logger.warning("Listen error: %s", exc)
                 break
+        self._connected = False
 
     async def close(self) -> None:
         """WebSocket 닫기."""
@@ -114,6 +161,7 @@ class PriceWebSocket:
 
         # 리스트 메시지 처리
         messages = data if isinstance(data, list) else [data]
+        self._observe_server_time(messages)
 
         for msg in messages:
             if not isinstance(msg, dict):
@@ -122,77 +170,95 @@ class PriceWebSocket:
             event_type = msg.get("event_type") or msg.get("type")
             asset_id = msg.get("asset_id", "")
 
-            if event_type == "price_change" and asset_id:
+            if event_type == "price_change":
+                self._process_price_change(msg, asset_id)
+
+            elif event_type == "book" and asset_id:
+                self._process_book(msg, asset_id)
+
+    def _observe_server_time(self, messages: list) -> None:
+        """F-044: 첫 ``timestamp``(ms) 필드로 거래소 시계 하한 샘플링."""
+        for msg in messages:
+            if isinstance(msg, dict) and msg.get("timestamp"):
+                try:
+                    server_ts = float(msg["timestamp"]) / 1000.0
+                except (TypeError, ValueError):
+                    return
+                self._clock.observe_server_timestamp(server_ts, time.time())
+                return
+
+    def _process_price_change(self, msg: dict, asset_id: str) -> None:
+        """price_change → L2 델타 적용.
+
+        F-035: ``changes`` (asset_id 공통) / ``price_changes`` (항목별 asset_id)
+        델타는 스냅샷을 받은 토큰의 L2 book에만 적용한다 (부분 book 방지).
+        레거시 단일 ``price`` 필드는 단순 가격 캐시만 갱신.
+        """
+        deltas: list[tuple[str, dict]] = []
+        for change in msg.get("changes") or []:
+            if isinstance(change, dict):
+                deltas.append((asset_id, change))
+        for change in msg.get("price_changes") or []:
+            if isinstance(change, dict):
+                deltas.append((change.get("asset_id") or asset_id, change))
+
+        if not deltas:
+            if asset_id:
                 try:
                     price = float(msg.get("price", 0))
                     if price > 0:
                         self._cache.update(asset_id, price)
                 except (ValueError, TypeError):
                     pass
+            return
 
-            elif event_type == "book" and asset_id:
-                self._process_book(msg, asset_id)
+        for token_id, change in deltas:
+            if not token_id or self._cache.get_book(token_id) is None:
+                continue
+            try:
+                price = float(change["price"])
+                size = float(change.get("size", 0))
+            except (KeyError, ValueError, TypeError):
+                continue
+            self._cache.apply_price_change(
+                token_id, str(change.get("side", "")), price, size,
+            )
 
     def _process_book(self, msg: dict, asset_id: str) -> None:
-        """오더북 스냅샷에서 best ask/bid 가격 추출 → 캐시.
+        """오더북 스냅샷 → L2 book 교체 (F-035).
 
-        Phase 3: Also populates orderbook cache with ask/bid size.
+        PriceCache가 best ask/bid + size를 OrderbookEntry로 동기화한다.
         """
-        asks = msg.get("asks", [])
-        bids = msg.get("bids", [])
+        asks = self._parse_levels(msg.get("asks", msg.get("sells", [])))
+        bids = self._parse_levels(msg.get("bids", msg.get("buys", [])))
+        self._cache.apply_book_snapshot(asset_id, asks, bids)
 
-        if isinstance(asks, dict):
-            asks = list(asks.values())
-        if isinstance(bids, dict):
-            bids = list(bids.values())
+    @staticmethod
+    def _parse_levels(levels) -> list[tuple[float, float | None]]:
+        """[{price, size}] / {k: {price, size}} / [[price, size]] → [(price, size)].
 
-        best_ask = None
-        ask_size = 0.0
-        best_bid = None
-        bid_size = 0.0
-
-        try:
-            if asks:
-                if isinstance(asks[0], dict) and "price" in asks[0]:
-                    ask_items = [
-                        (float(a["price"]), float(a.get("size", 0)))
-                        for a in asks if a.get("price")
-                    ]
-                    if ask_items:
-                        ask_items.sort(key=lambda x: x[0])
-                        best_ask, ask_size = ask_items[0]
-                elif asks:
-                    best_ask = float(asks[0][0]) if asks[0] else None
-        except (ValueError, TypeError, IndexError, KeyError):
-            pass
-
-        try:
-            if bids:
-                if isinstance(bids[0], dict) and "price" in bids[0]:
-                    bid_items = [
-                        (float(b["price"]), float(b.get("size", 0)))
-                        for b in bids if b.get("price")
-                    ]
-                    if bid_items:
-                        bid_items.sort(key=lambda x: x[0], reverse=True)
-                        best_bid, bid_size = bid_items[0]
-                elif bids:
-                    best_bid = float(bids[0][0]) if bids[0] else None
-        except (ValueError, TypeError, IndexError, KeyError):
-            pass
-
-        # Phase 3: Update orderbook cache with full info
-        if best_ask is not None and best_ask > 0:
-            self._cache.update_orderbook(
-                asset_id,
-                best_ask=best_ask,
-                best_bid=best_bid,
-                ask_size=ask_size,
-                bid_size=bid_size,
-            )
-        elif best_ask is not None and best_ask > 0:
-            # Fallback: just update simple price
-            self._cache.update(asset_id, best_ask)
+        size가 없는 레벨(레거시 ``[[price]]`` 등)은 size=None (수량 미상)으로
+        넘겨 best ask 후보로 유지한다.
+        """
+        if isinstance(levels, dict):
+            levels = list(levels.values())
+        parsed: list[tuple[float, float | None]] = []
+        for level in levels or []:
+            try:
+                if isinstance(level, dict):
+                    if not level.get("price"):
+                        continue
+                    size = level.get("size")
+                    parsed.append((
+                        float(level["price"]),
+                        float(size) if size is not None else None,
+                    ))
+                elif isinstance(level, (list, tuple)) and level:
+                    size = float(level[1]) if len(level) > 1 else None
+                    parsed.append((float(level[0]), size))
+            except (ValueError, TypeError, KeyError):
+                continue
+        return parsed
 
     @property
     def messages_received(self) -> int:
@@ -0,0 +1,282 @@
+"""F-036: Sharded, self-healing WebSocket manager.
+
+구독 토큰을 여러 ``PriceWebSocket`` 연결(shard)에 분산하고, 각 shard를
+독립적으로 감시/재연결한다. 하나의 소켓이 멈춰도 나머지 shard의 가격은
+계속 PriceCache로 들어오고, 멈춘 shard의 토큰은 캐시가 stale 처리되어
+EventDrivenLoop의 HTTP 폴백을 탄다.
+
+- shard당 최대 ``max_tokens_per_conn`` 토큰, 최대 ``max_connections`` 연결
+- 재연결: 지수 백오프 + jitter, 연결 직후 구독 replay
+- ``idle_timeout`` 동안 메시지가 없으면 stall로 간주하고 재연결
+- shard별 lag(마지막 메시지 이후 경과), 메시지 속도(msg/s) 추적
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Iterable
+
+from poly24h.websocket.price_cache import PriceCache
+from poly24h.websocket.price_ws import WS_URL, PriceWebSocket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TOKENS_PER_CONN = 100
+DEFAULT_MAX_CONNECTIONS = 8
+DEFAULT_BACKOFF_BASE = 0.5   # seconds
+DEFAULT_BACKOFF_MAX = 30.0   # seconds
+DEFAULT_IDLE_TIMEOUT = 60.0  # seconds without any message → stalled
+RATE_WINDOW_SECS = 10.0
+
+
+class _Shard:
+    """One supervised connection and its token set."""
+
+    def __init__(self, shard_id: int, ws: PriceWebSocket):
+        self.shard_id = shard_id
+        self.ws = ws
+        self.tokens: set[str] = set()
+        self.task: asyncio.Task | None = None
+        self.reconnects = 0
+        self.connected_at: float = 0.0
+        self._recent: deque[float] = deque()
+        self._last_count = 0
+
+    def lag(self, now: float) -> float | None:
+        """마지막 메시지 이후 경과 시간. 메시지가 없었으면 연결 이후 경과."""
+        last = self.ws.last_message_at or self.connected_at
+        return (now - last) if last else None
+
+    def message_rate(self, now: float) -> float:
+        """최근 RATE_WINDOW_SECS 동안의 msg/s."""
+        count = self.ws.messages_received
+        new = count - self._last_count
+        self._last_count = count
+        if new > 0:
+            self._recent.extend([now] * new)
+        while self._recent and now - self._recent[0] > RATE_WINDOW_SECS:
+            self._recent.popleft()
+        return len(self._recent) / RATE_WINDOW_SECS
+
+
+class WebSocketManager:
+    """Shard subscriptions across several supervised PriceWebSocket connections.
+
+    Usage:
+        manager = WebSocketManager(cache)
+        await manager.start()
+        await manager.set_subscriptions(token_ids)
+        ...
+        await manager.stop()
+
+    Args:
+        cache: 모든 shard가 공유하는 PriceCache.
+        url: WebSocket 엔드포인트.
+        connect_fn: ``url → websocket`` 팩토리 (테스트용 로컬 stand-in 주입).
+    """
+
+    def __init__(
+        self,
+        cache: PriceCache,
+        url: str = WS_URL,
+        connect_fn: Callable[[str], Awaitable[Any]] | None = None,
+        max_tokens_per_conn: int = DEFAULT_MAX_TOKENS_PER_CONN,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT,
+    ):
+        self._cache = cache
+        self._url = url
+        self._connect_fn = connect_fn
+        self.max_tokens_per_conn = max(1, max_tokens_per_conn)
+        self.max_connections = max(1, max_connections)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.idle_timeout = idle_timeout
+        self._shards: list[_Shard] = []
+        self._token_shard: dict[str, _Shard] = {}
+        self._running = False
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        """모든 shard 감시 태스크 시작 (이후 추가되는 shard도 자동 시작)."""
+        if self._running:
+            return
+        self._running = True
+        for shard in self._shards:
+            self._start_shard(shard)
+
+    async def stop(self) -> None:
+        """모든 연결 종료."""
+        self._running = False
+        tasks = [s.task for s in self._shards if s.task is not None]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for shard in self._shards:
+            shard.task = None
+            await shard.ws.close()
+
+    def _start_shard(self, shard: _Shard) -> None:
+        if shard.task is None or shard.task.done():
+            shard.task = asyncio.create_task(self._supervise(shard))
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    @property
+    def subscribed_tokens(self) -> set[str]:
+        return set(self._token_shard)
+
+    async def subscribe(self, token_ids: Iterable[str]) -> None:
+        """새 토큰을 가장 한가한 shard에 배정하고 구독."""
+        assignments: dict[int, list[str]] = {}
+        for token_id in token_ids:
+            if not token_id or token_id in self._token_shard:
+                continue
+            shard = self._pick_shard()
+            self._token_shard[token_id] = shard
+            shard.tokens.add(token_id)
+            assignments.setdefault(shard.shard_id, []).append(token_id)
+
+        for shard_id, tokens in assignments.items():
+            shard = self._shards[shard_id]
+            try:
+                # 미연결이면 기록만 되고 연결 시 replay됨
+                await shard.ws.subscribe(tokens)
+            except Exception as exc:
+                # 연결이 끊어지는 중 — 재연결 시 replay됨
+                logger.debug("Shard %d subscribe failed: %s", shard_id, exc)
+            if self._running:
+                self._start_shard(shard)
+
+    async def unsubscribe(self, token_ids: Iterable[str]) -> None:
+        """토큰 구독 해제."""
+        removals: dict[int, list[str]] = {}
+        for token_id in token_ids:
+            shard = self._token_shard.pop(token_id, None)
+            if shard is not None:
+                shard.tokens.discard(token_id)
+                removals.setdefault(shard.shard_id, []).append(token_id)
+
+        for shard_id, tokens in removals.items():
+            shard = self._shards[shard_id]
+            try:
+                await shard.ws.unsubscribe(tokens)
+            except Exception as exc:
+                logger.debug("Shard %d unsubscribe failed: %s", shard_id, exc)
+
+    async def set_subscriptions(self, token_ids: Iterable[str]) -> None:
+        """구독 집합을 ``token_ids``로 맞춤 (diff만 전송)."""
+        wanted = {t for t in token_ids if t}
+        current = set(self._token_shard)
+        stale = current - wanted
+        if stale:
+            await self.unsubscribe(stale)
+        new = [t for t in wanted if t not in current]
+        if new:
+            await self.subscribe(sorted(new))
+
+    def _pick_shard(self) -> _Shard:
+        open_shards = [
+            s for s in self._shards if len(s.tokens) < self.max_tokens_per_conn
+        ]
+        if open_shards:
+            return min(open_shards, key=lambda s: len(s.tokens))
+        if len(self._shards) < self.max_connections:
+            shard = _Shard(
+                len(self._shards),
+                PriceWebSocket(self._cache, self._url, connect_fn=self._connect_fn),
+            )
+            self._shards.append(shard)
+            return shard
+        # 모든 shard가 가득 참 — 가장 적은 곳에 초과 배정
+        return min(self._shards, key=lambda s: len(s.tokens))
+
+    # ------------------------------------------------------------------
+    # Supervision
+    # ------------------------------------------------------------------
+
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프 + equal jitter (동시 재연결 폭주 방지)."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _supervise(self, shard: _Shard) -> None:
+        """연결 → 구독 replay → 수신. 끊기거나 stall이면 백오프 후 재연결."""
+        attempt = 0
+        while self._running:
+            await shard.ws.connect()
+            if shard.ws.connected:
+                shard.connected_at = time.monotonic()
+                try:
+                    await shard.ws.resubscribe()
+                    logger.info(
+                        "WS shard %d connected (%d tokens, reconnects=%d)",
+                        shard.shard_id, len(shard.tokens), shard.reconnects,
+                    )
+                    messages_before = shard.ws.messages_received
+                    await shard.ws.listen(idle_timeout=self.idle_timeout)
+                    if shard.ws.messages_received > messages_before:
+                        attempt = 0  # 정상 수신 후 끊김 → 백오프 리셋
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    logger.warning("WS shard %d error: %s", shard.shard_id, exc)
+                finally:
+                    await shard.ws.close()
+
+            if not self._running:
+                break
+            shard.reconnects += 1
+            delay = self._backoff(attempt)
+            attempt += 1
+            logger.warning(
+                "WS shard %d disconnected — reconnecting in %.2fs", shard.shard_id, delay,
+            )
+            await asyncio.sleep(delay)
+
+    # ------------------------------------------------------------------
+    # Health
+    # ------------------------------------------------------------------
+
+    def stats(self) -> list[dict]:
+        """shard별 상태: 연결 여부, 토큰 수, lag, msg/s, 재연결 횟수."""
+        now = time.monotonic()
+        result = []
+        for shard in self._shards:
+            lag = shard.lag(now)
+            result.append({
+                "shard": shard.shard_id,
+                "connected": shard.ws.connected,
+                "tokens": len(shard.tokens),
+                "messages": shard.ws.messages_received,
+                "msg_rate": round(shard.message_rate(now), 2),
+                "lag_secs": round(lag, 3) if lag is not None else None,
+                "reconnects": shard.reconnects,
+            })
+        return result
+
+    def stalled_tokens(self, max_lag: float) -> set[str]:
+        """연결이 끊겼거나 ``max_lag``초 이상 조용한 shard의 토큰들."""
+        now = time.monotonic()
+        stalled: set[str] = set()
+        for shard in self._shards:
+            lag = shard.lag(now)
+            if not shard.ws.connected or lag is None or lag > max_lag:
+                stalled.update(shard.tokens)
+        return stalled
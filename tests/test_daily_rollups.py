@@ -0,0 +1,132 @@
+"""Tests for F-057: Materialized daily rollups with incremental refresh."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from poly24h.analysis.daily_rollups import DailyRollups
+from poly24h.analysis.paper_analyzer import PaperTradeAnalyzer
+from poly24h.trade_store import TradeStore
+
+NOW = datetime(2026, 2, 12, 12, 0, tzinfo=timezone.utc)
+
+
+def _trade(market_id: str, day: str, **kwargs) -> dict:
+    return {
+        "market_id": market_id, "market_source": "nba", "side": "YES", "price": 0.4,
+        "cost": 10.0, "status": "open", "timestamp": f"{day}T01:00:00+00:00", **kwargs,
+    }
+
+
+def _settled(market_id: str, pnl: float) -> dict:
+    return {"market_id": market_id, "status": "settled", "pnl": pnl, "payout": 10.0 + pnl}
+
+
+def _rollups(tmp_path, store, now=NOW) -> DailyRollups:
+    return DailyRollups(tmp_path, store, clock=lambda: now.timestamp())
+
+
+class TestRevisions:
+    def test_revision_bumps_on_insert_and_settlement_only(self, tmp_path):
+        store = TradeStore.for_dir(tmp_path)
+        store.insert(_trade("1", "2026-02-11"), "2026-02-11")
+        store.insert(_trade("1", "2026-02-11"), "2026-02-11")  # duplicate
+        store.insert_many([_trade("2", "2026-02-12")], "2026-02-12")
+        assert store.day_revisions() == {"2026-02-11": 1, "2026-02-12": 1}
+
+        assert store.update_settlements([_settled("1", 15.0)]) == 1
+        assert store.update_settlements([_settled("1", 15.0)]) == 0
+        assert store.day_revisions(start_day="2026-02-11", end_day="2026-02-11") == {
+            "2026-02-11": 2,
+        }
+
+    def test_trade_never_lands_without_its_revision_bump(self, tmp_path):
+        store = TradeStore.for_dir(tmp_path)
+        store.insert(_trade("1", "2026-02-12"), "2026-02-12")
+        rollups = _rollups(tmp_path, store)
+        assert rollups.aggregate().single.total_trades == 1
+
+        store._conn.execute(
+            "CREATE TRIGGER no_bump BEFORE UPDATE ON day_revisions "
+            "BEGIN SELECT RAISE(ABORT, 'bump failed'); END",
+        )
+        with pytest.raises(sqlite3.IntegrityError):
+            store.insert(_trade("2", "2026-02-12"), "2026-02-12")
+        assert store.market_ids("2026-02-12") == {"1"}  # rolled back with the bump
+
+        store._conn.execute("DROP TRIGGER no_bump")
+        store.insert(_trade("2", "2026-02-12"), "2026-02-12")
+        assert rollups.aggregate().single.total_trades == 2
+
+
+class TestRefresh:
+    def test_only_changed_days_rebuilt_and_closed_days_frozen(self, tmp_path):
+        store = TradeStore.for_dir(tmp_path)
+        store.insert(_trade("1", "2026-02-10"), "2026-02-10")
+        store.insert(_trade("2", "2026-02-11"), "2026-02-11")
+        store.insert(_trade("3", "2026-02-12"), "2026-02-12")
+        store.update_settlements([_settled("1", 15.0)])
+        rollups = _rollups(tmp_path, store)
+
+        days = rollups.refresh()
+        assert [r.frozen for r in days] == [True, False, False]  # 02-11 still open
+        assert rollups.rebuilt_days == 3
+
+        store.insert(_trade("4", "2026-02-12"), "2026-02-12")
+        assert rollups.aggregate().single.total_trades == 4
+        assert rollups.rebuilt_days == 4  # today only
+
+        store.update_settlements([_settled("2", -10.0)])
+        total = rollups.aggregate()
+        assert (total.single.wins, total.single.losses, total.single.total_pnl) == (1, 1, 5.0)
+        assert rollups.rebuilt_days == 5
+        assert rollups.refresh()[1].frozen
+
+    def test_rollups_persist_and_pick_up_file_changes(self, tmp_path):
+        store = TradeStore.for_dir(tmp_path)
+        store.insert(_trade("1", "2026-02-12"), "2026-02-12")
+        stats = tmp_path / "market_stats_2026-02-12.jsonl"
+        stats.write_text(json.dumps({"asset_symbol": "BTC", "trigger_price": 0.4}) + "\n")
+        _rollups(tmp_path, store).refresh()
+        assert (tmp_path / "rollups" / "2026-02-12.json").exists()
+
+        reloaded = _rollups(tmp_path, store)
+        assert reloaded.aggregate().by_asset["BTC"].total_signals == 1
+        assert reloaded.rebuilt_days == 0
+
+        with open(stats, "a") as f:
+            f.write(json.dumps({"asset_symbol": "BTC", "trigger_price": 0.5}) + "\n")
+        assert reloaded.aggregate().by_asset["BTC"].total_signals == 2
+        assert reloaded.rebuilt_days == 1
+
+    def test_recent_window(self, tmp_path):
+        store = TradeStore.for_dir(tmp_path)
+        for i, offset in enumerate((0, 3, 10)):
+            day = (NOW - timedelta(days=offset)).strftime("%Y-%m-%d")
+            store.insert(_trade(str(i), day), day)
+        assert _rollups(tmp_path, store).recent(7).single.total_trades == 2
+
+
+class TestAnalyzer:
+    def test_repeat_analysis_reuses_rollups(self, tmp_path):
+        (tmp_path / "2026-02-07.jsonl").write_text(
+            json.dumps(_trade("1", "2026-02-07", status="settled", pnl=15.0)) + "\n",
+        )
+        (tmp_path / "paired_2026-02-07.jsonl").write_text(
+            json.dumps({"cost_usd": 9.5, "guaranteed_profit": 0.5,
+                        "timestamp": "2026-02-07T03:00:00+00:00"}) + "\n",
+        )
+        analyzer = PaperTradeAnalyzer(data_dir=str(tmp_path))
+        first = analyzer.analyze()
+        rollup_file = tmp_path / "rollups" / "2026-02-07.json"
+        assert json.loads(rollup_file.read_text())["frozen"]
+
+        mtime = rollup_file.stat().st_mtime_ns
+        assert asdict(analyzer.analyze()) == asdict(first)
+        assert rollup_file.stat().st_mtime_ns == mtime
+        assert (first.overall.wins, first.paired.total_trades) == (1, 1)
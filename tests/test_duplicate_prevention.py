@@ -53,7 +53,7 @@ class TestDuplicateEntryPrevention:
         assert pos2 is None  # Should be rejected
         assert pm.active_position_count == 1  # Still 1 position
     
-    def test_record_paper_trade_respects_position_manager(self):
+    def test_record_paper_trade_respects_position_manager(self, tmp_path):
         """
         RED → GREEN: _record_paper_trade는 PositionManager의 제한을 존중해야 함
         """
@@ -64,7 +64,8 @@ class TestDuplicateEntryPrevention:
                     schedule=Mock(),
                     preparer=Mock(),
                     poller=Mock(),
-                    alerter=Mock()
+                    alerter=Mock(),
+                    data_dir=tmp_path,
                 )
         
         market = Market(
@@ -96,7 +97,7 @@ class TestDuplicateEntryPrevention:
         trade2 = loop._record_paper_trade(opp, market)
         assert trade2 == {}  # Should be empty (rejected)
     
-    def test_settlement_tracker_not_called_for_duplicate(self):
+    def test_settlement_tracker_not_called_for_duplicate(self, tmp_path):
         """
         RED → GREEN: 중복 진입 시도 시 settlement_tracker.record_trade가
         호출되지 않아야 함
@@ -107,7 +108,8 @@ class TestDuplicateEntryPrevention:
                     schedule=Mock(),
                     preparer=Mock(),
                     poller=Mock(),
-                    alerter=Mock()
+                    alerter=Mock(),
+                    data_dir=tmp_path,
                 )
 
         # Mock settlement tracker
@@ -148,7 +150,7 @@ class TestDuplicateEntryPrevention:
 class TestPaperTradesListNoDuplicates:
     """paper_trades 리스트에 중복이 없어야 함"""
 
-    def test_paper_trades_unique_by_market(self):
+    def test_paper_trades_unique_by_market(self, tmp_path):
         """
         RED: paper_trades에 동일 마켓이 2개 이상 있으면 안 됨
         """
@@ -158,7 +160,8 @@ class TestPaperTradesListNoDuplicates:
                     schedule=Mock(),
                     preparer=Mock(),
                     poller=Mock(),
-                    alerter=Mock()
+                    alerter=Mock(),
+                    data_dir=tmp_path,
                 )
         
         market = Market(
@@ -485,6 +485,25 @@ async def test_rapid_orderbook_poller_poll_once_no_data(mock_clob_fetcher):
     assert snapshot.spread is None
 
 
+@pytest.mark.asyncio
+async def test_rapid_orderbook_poller_poll_many():
+    """F-033: poll_many() uses one batched fetch and keeps pair order."""
+    fetcher = MagicMock()
+    fetcher.fetch_best_asks_batch = AsyncMock(return_value={
+        "y1": 0.45, "n1": 0.50, "y2": None, "n2": 0.30,
+    })
+
+    poller = RapidOrderbookPoller(fetcher)
+    snapshots = await poller.poll_many([("y1", "n1"), ("y2", "n2")])
+
+    fetcher.fetch_best_asks_batch.assert_called_once_with(["y1", "n1", "y2", "n2"])
+    assert len(snapshots) == 2
+    assert snapshots[0].spread == pytest.approx(0.95)
+    assert snapshots[1].yes_best_ask is None
+    assert snapshots[1].no_best_ask == 0.30
+    assert snapshots[1].spread is None
+
+
 def test_rapid_orderbook_poller_detect_opportunity_found():
     """detect_opportunity() returns SniperOpportunity when threshold met."""
     snapshot = OrderbookSnapshot(
@@ -624,7 +643,7 @@ def mock_telegram_alerter():
 
 @pytest.mark.asyncio
 async def test_event_driven_loop_run_idle_phase(
-    mock_config, mock_telegram_alerter
+    mock_config, mock_telegram_alerter, tmp_path
 ):
     """run() handles IDLE phase correctly."""
     mock_config.pre_open_window_secs = 30
@@ -638,7 +657,8 @@ async def test_event_driven_loop_run_idle_phase(
             schedule=mock_schedule,
             preparer=MagicMock(),
             poller=MagicMock(),
-            alerter=mock_telegram_alerter
+            alerter=mock_telegram_alerter,
+            data_dir=tmp_path,
         )
 
         # Mock sleep to exit after first iteration
@@ -660,7 +680,7 @@ async def test_event_driven_loop_run_idle_phase(
 
 @pytest.mark.asyncio
 async def test_event_driven_loop_run_pre_open_phase(
-    mock_config, mock_telegram_alerter
+    mock_config, mock_telegram_alerter, tmp_path
 ):
     """run() handles PRE_OPEN phase correctly."""
     mock_preparer = MagicMock()
@@ -678,7 +698,8 @@ async def test_event_driven_loop_run_pre_open_phase(
             schedule=mock_schedule,
             preparer=mock_preparer,
             poller=MagicMock(),
-            alerter=mock_telegram_alerter
+            alerter=mock_telegram_alerter,
+            data_dir=tmp_path,
         )
 
         # Mock sleep to exit after first phase
@@ -701,7 +722,7 @@ async def test_event_driven_loop_run_pre_open_phase(
 
 @pytest.mark.asyncio
 async def test_event_driven_loop_run_snipe_phase_with_opportunity(
-    mock_config, mock_telegram_alerter
+    mock_config, mock_telegram_alerter, tmp_path
 ):
     """run() handles SNIPE phase and detects opportunities."""
     mock_config.sniper_threshold = 0.48
@@ -722,7 +743,7 @@ async def test_event_driven_loop_run_snipe_phase_with_opportunity(
         timestamp=datetime.now(tz=timezone.utc),
     )
 
-    mock_poller.poll_once = AsyncMock(return_value=mock_snapshot)
+    mock_poller.poll_many = AsyncMock(return_value=[mock_snapshot])
     mock_poller.detect_opportunity.return_value = mock_opportunity
 
     with patch('poly24h.scheduler.event_scheduler.MarketOpenSchedule') as mock_schedule_class:
@@ -733,7 +754,8 @@ async def test_event_driven_loop_run_snipe_phase_with_opportunity(
             schedule=mock_schedule,
             preparer=MagicMock(),
             poller=mock_poller,
-            alerter=mock_telegram_alerter
+            alerter=mock_telegram_alerter,
+            data_dir=tmp_path,
         )
 
         # Set pre-discovered token pairs
@@ -752,7 +774,7 @@ async def test_event_driven_loop_run_snipe_phase_with_opportunity(
                 await loop.run(mock_config)
 
         # Should have polled orderbook and accumulated opportunity in batch
-        mock_poller.poll_once.assert_called()
+        mock_poller.poll_many.assert_called()
         # F-020: Alerts are now batched, so check pending_opps instead
         assert len(loop._pending_opps) > 0, "Opportunity should be accumulated in batch"
         assert loop._pending_opps[0][0].trigger_price == 0.40
@@ -786,13 +808,14 @@ def test_sniper_opportunity_creation(sniper_opportunity):
 # F-019: Paper trading & signal quality tests
 
 
-def test_event_driven_loop_paper_trading_summary():
+def test_event_driven_loop_paper_trading_summary(tmp_path):
     """F-019: get_paper_trading_summary() returns correct initial state."""
     loop = EventDrivenLoop(
         schedule=MagicMock(),
         preparer=MagicMock(),
         poller=MagicMock(),
-        alerter=MagicMock()
+        alerter=MagicMock(),
+        data_dir=tmp_path,
     )
 
     summary = loop.get_paper_trading_summary()
@@ -802,7 +825,39 @@ def test_event_driven_loop_paper_trading_summary():
     assert summary["realized_pnl"] == 0.0
 
 
-def test_event_driven_loop_record_paper_trade():
+def test_event_driven_loop_position_state_under_data_dir(tmp_path):
+    """F-042: Snapshot and journal live under the injected data dir."""
+    loop = EventDrivenLoop(MagicMock(), MagicMock(), MagicMock(), MagicMock(), data_dir=tmp_path)
+    loop._position_manager.enter_position(
+        market_id="m1", market_question="Q", side="YES", price=0.4, end_date="",
+    )
+    loop._position_manager.save_state(loop._state_path)
+
+    assert (tmp_path / "position_manager_journal.jsonl").exists()
+    assert (tmp_path / "position_manager_state.json").exists()
+
+
+def test_event_driven_loop_paper_trade_files_under_data_dir(tmp_path):
+    """F-055: Paired and market_stats logs are written under the injected data dir."""
+    loop = EventDrivenLoop(MagicMock(), MagicMock(), MagicMock(), MagicMock(), data_dir=tmp_path)
+
+    assert loop.paper_trade_dir == tmp_path / "paper_trades"
+    assert loop._paired_simulator.data_dir == loop.paper_trade_dir
+    assert loop._market_logger.data_dir == loop.paper_trade_dir
+    assert loop._settlement_tracker.data_dir == loop.paper_trade_dir
+
+
+def test_event_driven_loop_rollups_under_data_dir(tmp_path):
+    """F-057: Daily rollups are built on first use, under the injected data dir."""
+    loop = EventDrivenLoop(MagicMock(), MagicMock(), MagicMock(), MagicMock(), data_dir=tmp_path)
+    assert loop._rollups is None
+
+    assert loop._recent_rollup(7).single.total_trades == 0
+    assert loop._rollups.data_dir == tmp_path / "paper_trades"
+    assert (tmp_path / "paper_trades" / "trades.db").exists()
+
+
+def test_event_driven_loop_record_paper_trade(tmp_path):
     """F-019: _record_paper_trade() stores trade with correct fields."""
     from poly24h.position_manager import PositionManager
     with patch.object(PositionManager, 'load_state'):
@@ -811,7 +866,8 @@ def test_event_driven_loop_record_paper_trade():
                 schedule=MagicMock(),
                 preparer=MagicMock(),
                 poller=MagicMock(),
-                alerter=MagicMock()
+                alerter=MagicMock(),
+                data_dir=tmp_path,
             )
 
     market = _market(question="Will BTC go up?")
@@ -839,13 +895,14 @@ def test_event_driven_loop_record_paper_trade():
     assert summary["total_invested"] == 100.0
 
 
-def test_event_driven_loop_find_market_for_opp():
+def test_event_driven_loop_find_market_for_opp(tmp_path):
     """F-019: _find_market_for_opp() matches opp to market by index."""
     loop = EventDrivenLoop(
         schedule=MagicMock(),
         preparer=MagicMock(),
         poller=MagicMock(),
-        alerter=MagicMock()
+        alerter=MagicMock(),
+        data_dir=tmp_path,
     )
 
     market1 = _market(id="mkt_1", question="Will ETH go up?")
@@ -39,14 +39,14 @@ class TestEventDrivenLoopFairValue:
             event_title="Test Event",
         )
 
-    def test_loop_has_fair_value_calculators(self) -> None:
+    def test_loop_has_fair_value_calculators(self, tmp_path) -> None:
         """EventDrivenLoop should have fair value calculators initialized."""
         schedule = MagicMock(spec=MarketOpenSchedule)
         preparer = MagicMock()
         poller = MagicMock()
         alerter = MagicMock()
 
-        loop = EventDrivenLoop(schedule, preparer, poller, alerter)
+        loop = EventDrivenLoop(schedule, preparer, poller, alerter, data_dir=tmp_path)
 
         assert hasattr(loop, "_nba_fair_value")
         assert hasattr(loop, "_crypto_fair_value")
@@ -55,14 +55,14 @@ class TestEventDrivenLoopFairValue:
         assert isinstance(loop._crypto_fair_value, CryptoFairValueCalculator)
 
     @pytest.mark.asyncio
-    async def test_calculate_crypto_fair_value(self) -> None:
+    async def test_calculate_crypto_fair_value(self, tmp_path) -> None:
         """Test crypto fair value calculation with mocked Binance data."""
         schedule = MagicMock(spec=MarketOpenSchedule)
         preparer = MagicMock()
         poller = MagicMock()
         alerter = MagicMock()
 
-        loop = EventDrivenLoop(schedule, preparer, poller, alerter)
+        loop = EventDrivenLoop(schedule, preparer, poller, alerter, data_dir=tmp_path)
 
         market = self._make_market(
             "btc_up",
@@ -81,14 +81,14 @@ class TestEventDrivenLoopFairValue:
         assert fair_prob > 0.50
 
     @pytest.mark.asyncio
-    async def test_calculate_nba_fair_value(self) -> None:
+    async def test_calculate_nba_fair_value(self, tmp_path) -> None:
         """Test NBA fair value calculation."""
         schedule = MagicMock(spec=MarketOpenSchedule)
         preparer = MagicMock()
         poller = MagicMock()
         alerter = MagicMock()
 
-        loop = EventDrivenLoop(schedule, preparer, poller, alerter)
+        loop = EventDrivenLoop(schedule, preparer, poller, alerter, data_dir=tmp_path)
 
         market = self._make_market(
             "lakers_win",
@@ -102,14 +102,14 @@ class TestEventDrivenLoopFairValue:
         assert 0.30 <= fair_prob <= 0.70
 
     @pytest.mark.asyncio
-    async def test_calculate_fair_values_populates_dict(self) -> None:
+    async def test_calculate_fair_values_populates_dict(self, tmp_path) -> None:
         """Test that _calculate_fair_values populates _market_fair_values."""
         schedule = MagicMock(spec=MarketOpenSchedule)
         preparer = MagicMock()
         poller = MagicMock()
         alerter = MagicMock()
 
-        loop = EventDrivenLoop(schedule, preparer, poller, alerter)
+        loop = EventDrivenLoop(schedule, preparer, poller, alerter, data_dir=tmp_path)
 
         markets = [
             self._make_market("m1", "Will BTC go up?", MarketSource.HOURLY_CRYPTO),
@@ -132,14 +132,14 @@ class TestEventDrivenLoopFairValue:
         # Soccer uses default 0.50
         assert loop._market_fair_values["m3"] == 0.50
 
-    def test_is_market_undervalued_crypto(self) -> None:
+    def test_is_market_undervalued_crypto(self, tmp_path) -> None:
         """Test _is_market_undervalued for crypto markets."""
         schedule = MagicMock(spec=MarketOpenSchedule)
         preparer = MagicMock()
         poller = MagicMock()
         alerter = MagicMock()
 
-        loop = EventDrivenLoop(schedule, preparer, poller, alerter)
+        loop = EventDrivenLoop(schedule, preparer, poller, alerter, data_dir=tmp_path)
 
         market = self._make_market("btc_up", "BTC up?", MarketSource.HOURLY_CRYPTO)
 
@@ -155,14 +155,14 @@ class TestEventDrivenLoopFairValue:
         # NO at $0.25 should be undervalued (fair NO prob = 0.35, 0.25 < 0.35 - 0.05 = 0.30)
         assert loop._is_market_undervalued(market, "NO", 0.25, margin=0.05) is True
 
-    def test_is_market_undervalued_nba(self) -> None:
+    def test_is_market_undervalued_nba(self, tmp_path) -> None:
         """Test _is_market_undervalued for NBA markets."""
         schedule = MagicMock(spec=MarketOpenSchedule)
         preparer = MagicMock()
         poller = MagicMock()
         alerter = MagicMock()
 
-        loop = EventDrivenLoop(schedule, preparer, poller, alerter)
+        loop = EventDrivenLoop(schedule, preparer, poller, alerter, data_dir=tmp_path)
 
         market = self._make_market("lakers_win", "Lakers win?", MarketSource.NBA)
 
@@ -175,14 +175,14 @@ class TestEventDrivenLoopFairValue:
         # YES at $0.58 should NOT be undervalued (0.58 > 0.55)
         assert loop._is_market_undervalued(market, "YES", 0.58, margin=0.05) is False
 
-    def test_is_market_undervalued_unknown_source(self) -> None:
+    def test_is_market_undervalued_unknown_source(self, tmp_path) -> None:
         """Test _is_market_undervalued with unknown source uses threshold fallback."""
         schedule = MagicMock(spec=MarketOpenSchedule)
         preparer = MagicMock()
         poller = MagicMock()
         alerter = MagicMock()
 
-        loop = EventDrivenLoop(schedule, preparer, poller, alerter)
+        loop = EventDrivenLoop(schedule, preparer, poller, alerter, data_dir=tmp_path)
 
         market = self._make_market("soccer_match", "Team wins?", MarketSource.SOCCER)
         loop._market_fair_values["soccer_match"] = 0.50
@@ -198,10 +198,10 @@ class TestCryptoFairValueExtraction:
     """Tests for crypto asset extraction from market questions."""
 
     @pytest.mark.asyncio
-    async def test_extract_btc_from_question(self) -> None:
+    async def test_extract_btc_from_question(self, tmp_path) -> None:
         """Test BTC extraction from various question formats."""
         schedule = MagicMock(spec=MarketOpenSchedule)
-        loop = EventDrivenLoop(schedule, MagicMock(), MagicMock(), MagicMock())
+        loop = EventDrivenLoop(schedule, MagicMock(), MagicMock(), MagicMock(), data_dir=tmp_path)
 
         # Mock the fetch to return empty (will default to 0.50)
         with patch.object(
@@ -237,10 +237,10 @@ class TestNBATeamExtraction:
     """Tests for NBA team extraction from market questions."""
 
     @pytest.mark.asyncio
-    async def test_extract_teams_from_question(self) -> None:
+    async def test_extract_teams_from_question(self, tmp_path) -> None:
         """Test team extraction from various question formats."""
         schedule = MagicMock(spec=MarketOpenSchedule)
-        loop = EventDrivenLoop(schedule, MagicMock(), MagicMock(), MagicMock())
+        loop = EventDrivenLoop(schedule, MagicMock(), MagicMock(), MagicMock(), data_dir=tmp_path)
 
         test_cases = [
             ("Will Lakers beat Celtics?", 0.40, 0.60),  # Lakers vs Celtics
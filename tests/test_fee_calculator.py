@@ -13,6 +13,11 @@ from poly24h.strategy.fee_calculator import (
     calculate_real_cost,
     calculate_paired_cpp,
     is_profitable_after_fees,
+    is_profitable_after_fees_fast,
+    max_counter_price,
+    max_counter_prices,
+    price_to_tick,
+    real_cost_fast,
 )
 
 
@@ -176,3 +181,48 @@ class TestIntegration:
         assert result is expected_profitable, (
             f"YES={yes_price}, NO={no_price}: expected {expected_profitable}"
         )
+
+
+class TestFastPath:
+    """F-047: Per-tick tables must agree with the Decimal reference."""
+
+    def test_real_cost_matches_reference_on_every_tick(self):
+        for tick in range(1001):
+            price = tick / 1000
+            for maker in (False, True):
+                expected = calculate_real_cost(Decimal(tick) / 1000, is_maker=maker)
+                assert real_cost_fast(price, is_maker=maker) == float(expected)
+
+    @pytest.mark.parametrize("margin", ["0", "0.005", "0.01", "0.03"])
+    @pytest.mark.parametrize("use_taker", [True, False])
+    def test_profitability_matches_reference(self, margin, use_taker):
+        for yes_cents in range(1, 100):
+            for no_cents in range(1, 100):
+                yes, no = yes_cents / 100, no_cents / 100
+                expected = is_profitable_after_fees(
+                    Decimal(yes_cents) / 100, Decimal(no_cents) / 100,
+                    min_margin=Decimal(margin), use_taker=use_taker,
+                )
+                assert is_profitable_after_fees_fast(
+                    yes, no, min_margin=Decimal(margin), use_taker=use_taker,
+                ) is expected, (yes, no)
+
+    def test_off_grid_prices_fall_back(self):
+        assert price_to_tick(0.4505) is None
+        assert price_to_tick(0.45) == 450
+        assert is_profitable_after_fees_fast(0.4005, 0.45) == is_profitable_after_fees(
+            Decimal("0.4005"), Decimal("0.45"),
+        )
+
+    def test_max_counter_price_is_the_boundary(self):
+        margin = Decimal("0.005")
+        for yes in (0.30, 0.45, 0.481):
+            counter = max_counter_price(yes, margin)
+            assert is_profitable_after_fees_fast(yes, counter, margin)
+            assert not is_profitable_after_fees_fast(yes, round(counter + 0.001, 3), margin)
+
+    def test_max_counter_prices_batch(self):
+        result = max_counter_prices([0.45, 0.995, 0.4505], Decimal("0.005"))
+        assert result[0] == max_counter_price(0.45, Decimal("0.005"))
+        assert result[1] is None  # nothing left after fees
+        assert result[2] is None  # off-grid
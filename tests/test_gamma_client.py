@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import re
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import pytest
 from aioresponses import aioresponses
 
-from poly24h.discovery.gamma_client import GammaClient
+from poly24h.discovery.gamma_client import GammaClient, filter_stale_markets
 
 GAMMA_URL = "https://gamma-api.polymarket.com"
 EVENTS_PATTERN = re.compile(r"^https://gamma-api\.polymarket\.com/events\b")
@@ -182,3 +184,16 @@ class TestRetry:
             async with GammaClient(max_retries=3) as client:
                 events = await client.fetch_events(tag="crypto")
                 assert events == []
+
+
+class TestFilterStaleMarkets:
+    def test_drops_markets_settling_within_buffer(self):
+        now = datetime.now(tz=timezone.utc)
+        markets = [
+            SimpleNamespace(id="soon", end_date=now + timedelta(minutes=30)),
+            SimpleNamespace(id="later", end_date=now + timedelta(hours=3)),
+            SimpleNamespace(id="naive", end_date=(now + timedelta(hours=2)).replace(tzinfo=None)),
+            SimpleNamespace(id="none", end_date=None),
+        ]
+        fresh = filter_stale_markets(markets, buffer_hours=1.0)
+        assert [m.id for m in fresh] == ["later", "naive"]
@@ -0,0 +1,159 @@
+"""Tests for F-045: Predictive next-hour market resolution by slug template."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from poly24h.discovery.hourly_resolver import HourlyMarketResolver, hourly_slug
+from poly24h.discovery.market_scanner import MarketScanner
+from poly24h.scheduler.event_scheduler import EventDrivenLoop, PreOpenPreparer
+
+OPEN_AT = datetime(2026, 2, 6, 14, tzinfo=timezone.utc)  # 9AM ET
+CONFIG = {"enabled": True, "coins": ["BTC", "ETH"], "min_liquidity_usd": 1000}
+
+
+def _event(
+    slug: str, market_id: str, end: datetime = OPEN_AT + timedelta(hours=1),
+    liquidity: str = "5000",
+) -> dict:
+    return {
+        "id": f"ev-{market_id}",
+        "slug": slug,
+        "title": slug,
+        "markets": [{
+            "id": market_id,
+            "question": slug.replace("-", " "),
+            "outcomePrices": json.dumps(["0.5", "0.5"]),
+            "clobTokenIds": json.dumps([f"{market_id}-yes", f"{market_id}-no"]),
+            "liquidity": liquidity,
+            "endDate": end.isoformat().replace("+00:00", "Z"),
+            "active": True,
+            "closed": False,
+        }],
+    }
+
+
+def _client(events_by_slug: dict[str, list[dict]]) -> MagicMock:
+    client = MagicMock()
+    client.open = AsyncMock()
+    client.fetch_events_by_slug = AsyncMock(
+        side_effect=lambda slug: events_by_slug.get(slug, []),
+    )
+    return client
+
+
+class TestHourlySlug:
+    def test_standard_and_daylight_time(self):
+        assert hourly_slug("bitcoin", OPEN_AT) == "bitcoin-up-or-down-february-6-9am-et"
+        summer = datetime(2026, 7, 1, 13, tzinfo=timezone.utc)  # EDT
+        assert hourly_slug("xrp", summer) == "xrp-up-or-down-july-1-9am-et"
+
+    def test_noon_and_midnight(self):
+        assert hourly_slug("solana", OPEN_AT.replace(hour=17)).endswith("-6-12pm-et")
+        assert hourly_slug("solana", OPEN_AT.replace(hour=5)).endswith("-6-12am-et")
+
+
+class TestResolver:
+    async def test_resolves_all_predicted_slugs(self):
+        btc = "bitcoin-up-or-down-february-6-9am-et"
+        eth = "ethereum-up-or-down-february-6-9am-et"
+        resolver = HourlyMarketResolver(
+            _client({btc: [_event(btc, "1")], eth: [_event(eth, "2")]}), CONFIG,
+        )
+        resolution = await resolver.resolve(OPEN_AT)
+
+        assert resolution.complete
+        assert [m.yes_token_id for m in resolution.markets] == ["1-yes", "2-yes"]
+        assert resolver.cached(OPEN_AT) is resolution
+        assert resolver.cached(OPEN_AT + timedelta(hours=1)) is None
+
+    async def test_missing_or_wrong_hour_is_incomplete(self):
+        btc = "bitcoin-up-or-down-february-6-9am-et"
+        resolver = HourlyMarketResolver(
+            _client({btc: [_event(btc, "1", end=OPEN_AT)]}), CONFIG,
+        )
+        resolution = await resolver.resolve(OPEN_AT)
+
+        assert not resolution.complete
+        assert resolution.missing == [btc, "ethereum-up-or-down-february-6-9am-et"]
+
+
+class TestPreOpenIntegration:
+    async def test_prefetched_markets_replace_tag_query(self):
+        btc = "bitcoin-up-or-down-february-6-9am-et"
+        eth = "ethereum-up-or-down-february-6-9am-et"
+        client = _client({btc: [_event(btc, "1")], eth: [_event(eth, "2")]})
+        client.fetch_events_by_tag_slug = AsyncMock(return_value=[])
+        scanner = MarketScanner(client, config={"hourly_crypto": CONFIG})
+        preparer = PreOpenPreparer(client, scanner=scanner)
+
+        await preparer.prefetch_next_hour(OPEN_AT)
+        markets = await preparer.discover_upcoming_markets(OPEN_AT)
+
+        assert {m.id for m in markets} == {"1", "2"}
+        client.fetch_events_by_tag_slug.assert_not_called()
+
+    async def test_liquidity_rechecked_on_promotion(self):
+        btc = "bitcoin-up-or-down-february-6-9am-et"
+        eth = "ethereum-up-or-down-february-6-9am-et"
+        events = {btc: [_event(btc, "1")], eth: [_event(eth, "2", liquidity="10")]}
+        client = _client(events)
+        client.fetch_events_by_tag_slug = AsyncMock(return_value=[])
+        scanner = MarketScanner(client, config={"hourly_crypto": CONFIG})
+        preparer = PreOpenPreparer(client, scanner=scanner)
+
+        await preparer.prefetch_next_hour(OPEN_AT)
+        # Liquidity moves between the IDLE prefetch and PRE_OPEN
+        events[btc] = [_event(btc, "1", liquidity="10")]
+        events[eth] = [_event(eth, "2", liquidity="2500")]
+        markets = await preparer.discover_upcoming_markets(OPEN_AT)
+
+        assert [(m.id, m.liquidity_usd) for m in markets] == [("2", 2500.0)]
+        assert client.fetch_events_by_slug.await_count == 4
+        client.fetch_events_by_tag_slug.assert_not_called()
+
+    async def test_failed_promotion_lookup_falls_back(self):
+        btc = "bitcoin-up-or-down-february-6-9am-et"
+        eth = "ethereum-up-or-down-february-6-9am-et"
+        events = {btc: [_event(btc, "1")], eth: [_event(eth, "2")]}
+        client = _client(events)
+        client.fetch_events_by_tag_slug = AsyncMock(return_value=[])
+        scanner = MarketScanner(client, config={"hourly_crypto": CONFIG})
+        preparer = PreOpenPreparer(client, scanner=scanner)
+
+        await preparer.prefetch_next_hour(OPEN_AT)
+        del events[eth]
+        await preparer.discover_upcoming_markets(OPEN_AT)
+
+        client.fetch_events_by_tag_slug.assert_awaited_once()
+
+    async def test_incomplete_prefetch_falls_back(self):
+        client = _client({})
+        client.fetch_events_by_tag_slug = AsyncMock(return_value=[])
+        scanner = MarketScanner(client, config={"hourly_crypto": CONFIG})
+        preparer = PreOpenPreparer(client, scanner=scanner)
+
+        await preparer.prefetch_next_hour(OPEN_AT)
+        await preparer.discover_upcoming_markets(OPEN_AT)
+
+        client.fetch_events_by_tag_slug.assert_awaited_once()
+
+    async def test_idle_prefetch_subscribes_predicted_tokens(self, tmp_path):
+        btc = "bitcoin-up-or-down-february-6-9am-et"
+        client = _client({btc: [_event(btc, "1")]})
+        scanner = MarketScanner(client, config={"hourly_crypto": {**CONFIG, "coins": ["BTC"]}})
+        ws_manager = MagicMock()
+        ws_manager.set_subscriptions = AsyncMock()
+        loop = EventDrivenLoop(
+            MagicMock(), PreOpenPreparer(client, scanner=scanner), MagicMock(), MagicMock(),
+            ws_manager=ws_manager,
+            data_dir=tmp_path,
+        )
+        loop._active_token_pairs = [("s-yes", "s-no")]
+
+        await loop._prefetch_next_hour(OPEN_AT)
+
+        tokens = list(ws_manager.set_subscriptions.await_args.args[0])
+        assert tokens == ["s-yes", "s-no", "1-yes", "1-no"]
@@ -0,0 +1,149 @@
+"""Tests for F-034: Shared pooled HTTP transport."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+
+import pytest
+from aioresponses import aioresponses
+
+from poly24h.discovery.gamma_client import GammaClient
+from poly24h.http_transport import HttpTransport, get_default_transport
+from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher
+
+BOOK_PATTERN = re.compile(r"^https://clob\.polymarket\.com/book\b")
+EVENTS_PATTERN = re.compile(r"^https://gamma-api\.polymarket\.com/events\b")
+
+
+class TestSessionLifecycle:
+    async def test_session_created_lazily_and_reused(self):
+        transport = HttpTransport()
+        assert transport.closed
+        s1 = await transport.session()
+        s2 = await transport.session()
+        assert s1 is s2
+        assert transport.sessions_created == 1
+        await transport.close()
+        assert transport.closed
+
+    async def test_session_recreated_after_close(self):
+        transport = HttpTransport()
+        s1 = await transport.session()
+        await transport.close()
+        s2 = await transport.session()
+        assert s1 is not s2
+        assert transport.sessions_created == 2
+        await transport.close()
+
+    async def test_connector_pool_settings(self):
+        transport = HttpTransport(limit=50, limit_per_host=7, dns_ttl=120)
+        session = await transport.session()
+        connector = session.connector
+        assert connector.limit == 50
+        assert connector.limit_per_host == 7
+        assert connector.use_dns_cache is True
+        await transport.close()
+
+    def test_default_transport_is_singleton(self):
+        assert get_default_transport() is get_default_transport()
+
+
+class TestRequests:
+    async def test_get_returns_response(self):
+        transport = HttpTransport()
+        with aioresponses() as m:
+            m.get(BOOK_PATTERN, payload={"asks": []})
+            async with transport.get(
+                "https://clob.polymarket.com/book", params={"token_id": "t1"},
+            ) as resp:
+                assert resp.status == 200
+                assert await resp.json() == {"asks": []}
+        stats = transport.stats()
+        assert stats["requests"] == 1
+        assert stats["hosts"] == {"clob.polymarket.com": 1}
+        await transport.close()
+
+    async def test_429_retried_with_retry_after(self):
+        transport = HttpTransport(backoff_base=5.0)
+        with aioresponses() as m:
+            m.get(BOOK_PATTERN, status=429, headers={"Retry-After": "0"})
+            m.get(BOOK_PATTERN, payload={"ok": True})
+            async with transport.get("https://clob.polymarket.com/book") as resp:
+                assert resp.status == 200
+        assert transport.rate_limited_count == 1
+        assert transport.request_count == 2
+        await transport.close()
+
+    async def test_429_exhausted_returns_last_response(self):
+        transport = HttpTransport(max_429_retries=2, backoff_base=0.01)
+        with aioresponses() as m:
+            m.get(BOOK_PATTERN, status=429)
+            m.get(BOOK_PATTERN, status=429)
+            async with transport.get("https://clob.polymarket.com/book") as resp:
+                assert resp.status == 429
+        assert transport.rate_limited_count == 1
+        await transport.close()
+
+    async def test_429_cooldown_shared_across_requests(self):
+        transport = HttpTransport(backoff_base=0.2)
+        with aioresponses() as m:
+            m.get(BOOK_PATTERN, status=429)
+            m.get(BOOK_PATTERN, payload={})
+            async with transport.get("https://clob.polymarket.com/book"):
+                pass
+            # F-040: 쿨다운은 호스트 버킷 정지 + rate 감소로 기록됨
+            bucket = transport.rate_limiter.bucket("clob.polymarket.com")
+            assert bucket.rate_limited == 1
+            assert bucket.paused_until > 0
+        await transport.close()
+
+    async def test_host_concurrency_limit(self):
+        transport = HttpTransport(host_concurrency=1)
+        await transport.session()
+        sem = transport._semaphore("clob.polymarket.com")
+        await sem.acquire()
+        with aioresponses() as m:
+            m.get(BOOK_PATTERN, payload={})
+
+            async def _call():
+                async with transport.get("https://clob.polymarket.com/book") as resp:
+                    return resp.status
+
+            task = asyncio.create_task(_call())
+            await asyncio.sleep(0.05)
+            assert not task.done()  # 슬롯이 없어 대기 중
+            sem.release()
+            assert await task == 200
+        await transport.close()
+
+    async def test_network_error_propagates(self):
+        transport = HttpTransport()
+        with aioresponses() as m:
+            m.get(BOOK_PATTERN, exception=ConnectionError("boom"))
+            with pytest.raises(ConnectionError):
+                async with transport.get("https://clob.polymarket.com/book"):
+                    pass
+        await transport.close()
+
+
+class TestClientInjection:
+    async def test_clients_share_injected_transport(self):
+        transport = HttpTransport()
+        gamma = GammaClient(transport=transport)
+        fetcher = ClobOrderbookFetcher(transport=transport)
+        with aioresponses() as m:
+            m.get(EVENTS_PATTERN, payload=[{"id": "e1"}])
+            m.get(BOOK_PATTERN, payload={"asks": [{"price": "0.4", "size": "10"}]})
+            await gamma.open()
+            events = await gamma.fetch_events(tag="crypto")
+            summary = await fetcher._fetch_orderbook_summary("t1")
+        assert events == [{"id": "e1"}]
+        assert summary.best_ask == 0.4
+        assert transport.sessions_created == 1
+        assert transport.request_count == 2
+        # 클라이언트 close()는 공유 풀을 닫지 않는다
+        await gamma.close()
+        await fetcher.close()
+        assert not transport.closed
+        await transport.close()
@@ -0,0 +1,136 @@
+"""Tests for F-055: Shared background writer for JSONL sinks."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+from poly24h.jsonl_writer import JsonlWriter
+from poly24h.monitoring.market_logger import MarketOpportunityLogger
+from poly24h.strategy.moneyline_gate import MoneylineValidationGate
+
+
+def _lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestWriteThrough:
+    def test_unstarted_writer_writes_immediately(self, tmp_path):
+        writer = JsonlWriter()
+        path = tmp_path / "sub" / "a.jsonl"
+        writer.append(path, json.dumps({"n": 1}))
+        writer.append(path, json.dumps({"n": 2}))
+        assert _lines(path) == [{"n": 1}, {"n": 2}]
+        assert writer._handles == {}
+
+
+class TestBackground:
+    def test_batches_until_flush_and_drains_on_close(self, tmp_path):
+        writer = JsonlWriter(flush_interval=60.0)
+        writer.start()
+        day1, day2 = tmp_path / "x_2026-02-11.jsonl", tmp_path / "x_2026-02-12.jsonl"
+        for n in range(3):
+            writer.append(day1, json.dumps({"n": n}))
+        writer.append(day2, json.dumps({"n": 3}))
+
+        assert writer.flush()
+        assert len(_lines(day1)) == 3 and len(_lines(day2)) == 1
+        assert set(writer._handles) == {day1, day2}
+
+        writer.append(day2, json.dumps({"n": 4}))
+        writer.close()
+        assert not writer.running and writer._handles == {}
+        assert [r["n"] for r in _lines(day2)] == [3, 4]
+        assert writer.records_written == 5
+
+    def test_records_submitted_during_close_are_not_lost(self, tmp_path):
+        writer = JsonlWriter(flush_interval=60.0)
+        writer.start()
+        path = tmp_path / "a.jsonl"
+        stop = threading.Event()
+
+        def produce():
+            n = 0
+            while not stop.is_set() or n < 200:
+                writer.append(path, json.dumps({"n": n}))
+                n += 1
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while writer.pending_writes < 100:
+            time.sleep(0.001)
+        writer.close()
+        stop.set()
+        producer.join()
+
+        assert writer.pending_writes == 0
+        assert [r["n"] for r in _lines(path)] == list(range(writer._submitted))
+
+    def test_pending_writes_tracks_unflushed_records(self, tmp_path):
+        writer = JsonlWriter(flush_interval=60.0)
+        writer.start()
+        path = tmp_path / "a.jsonl"
+        writer.append(path, "{}")
+        writer.replace(tmp_path / "s.json", "[]")
+        writer.replace(tmp_path / "s.json", "[1]")
+        assert writer.pending_writes == 3
+
+        assert writer.flush()
+        assert writer.pending_writes == 0
+        writer.close()
+
+    def test_size_threshold_flushes_without_waiting(self, tmp_path):
+        writer = JsonlWriter(flush_interval=60.0, max_buffer_bytes=10)
+        writer.start()
+        path = tmp_path / "a.jsonl"
+        writer.append(path, json.dumps({"long": "x" * 20}))
+        deadline = time.monotonic() + 2.0
+        while not (path.exists() and path.read_text()) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(_lines(path)) == 1
+        writer.close()
+
+    def test_idle_handles_closed_on_rollover(self, tmp_path):
+        writer = JsonlWriter(flush_interval=0.01, idle_close_secs=0.0)
+        writer.start()
+        writer.append(tmp_path / "a.jsonl", "{}")
+        writer.flush()
+        writer.append(tmp_path / "b.jsonl", "{}")  # next tick closes a.jsonl
+        writer.flush()
+        writer.close()
+        assert (tmp_path / "a.jsonl").read_text() == "{}\n"
+
+    def test_replace_keeps_latest_snapshot(self, tmp_path):
+        writer = JsonlWriter(flush_interval=60.0)
+        writer.start()
+        history = tmp_path / "history.json"
+        gate = MoneylineValidationGate(history_file=str(history), writer=writer)
+        for i in range(3):
+            gate.record_trade(won=True, pnl=1.0, market_id=str(i))
+        assert not history.exists()
+
+        writer.close()
+        assert len(json.loads(history.read_text())) == 3
+        assert MoneylineValidationGate(history_file=str(history))._trades == gate._trades
+
+
+class TestSinks:
+    def test_logger_enqueues_and_reload_flushes(self, tmp_path):
+        writer = JsonlWriter(flush_interval=60.0)
+        writer.start()
+        mlogger = MarketOpportunityLogger(data_dir=str(tmp_path), writer=writer)
+        mlogger.record("m1", "Will BTC go up?", "hourly_crypto", "YES", 0.4)
+        assert mlogger.load_from_jsonl()[0].asset_symbol == "BTC"
+        writer.close()
+
+    def test_write_errors_are_logged_not_raised(self, tmp_path):
+        writer = JsonlWriter()
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        writer.append(blocker / "a.jsonl", "{}")
+        assert writer.error_count == 1
+        writer._handle = MagicMock(side_effect=OSError("disk full"))
+        writer.append(tmp_path / "b.jsonl", "{}")
+        assert writer.error_count == 2
@@ -0,0 +1,206 @@
+"""Tests for F-035: Incremental local L2 orderbook."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from poly24h.websocket.orderbook import ASK, BID, L2Book, normalize_side
+from poly24h.websocket.price_cache import PriceCache
+from poly24h.websocket.price_ws import PriceWebSocket
+
+
+def _book() -> L2Book:
+    book = L2Book()
+    book.apply_snapshot(
+        asks=[(0.55, 200.0), (0.50, 100.0), (0.60, 50.0)],
+        bids=[(0.42, 150.0), (0.45, 80.0)],
+    )
+    return book
+
+
+class TestL2Book:
+    def test_snapshot_best_levels(self):
+        book = _book()
+        assert book.best_ask == 0.50
+        assert book.best_ask_size == 100.0
+        assert book.best_bid == 0.45
+        assert book.best_bid_size == 80.0
+        assert book.ask_levels == 3
+        assert book.bid_levels == 2
+
+    def test_snapshot_drops_zero_size_levels(self):
+        book = L2Book()
+        book.apply_snapshot(asks=[(0.5, 0.0), (0.6, 10.0)], bids=[])
+        assert book.best_ask == 0.6
+        assert book.best_bid is None
+
+    def test_snapshot_keeps_unknown_size_levels(self):
+        book = L2Book()
+        book.apply_snapshot(asks=[(0.5, None), (0.6, 10.0)], bids=[(0.4, None)])
+        assert book.best_ask == 0.5
+        assert book.best_ask_size == 0.0
+        assert book.best_bid == 0.4
+        assert book.ask_depth_shares() == 10.0
+
+    def test_levels_best_first(self):
+        book = _book()
+        assert book.levels(ASK, 2) == [(0.50, 100.0), (0.55, 200.0)]
+        assert book.levels(BID) == [(0.45, 80.0), (0.42, 150.0)]
+
+    def test_delta_inserts_new_best(self):
+        book = _book()
+        book.apply_delta("SELL", 0.48, 30.0)
+        assert book.best_ask == 0.48
+        assert book.best_ask_size == 30.0
+
+    def test_delta_updates_existing_level(self):
+        book = _book()
+        book.apply_delta("SELL", 0.50, 10.0)
+        assert book.best_ask_size == 10.0
+        assert book.ask_levels == 3
+
+    def test_delta_zero_removes_level(self):
+        book = _book()
+        book.apply_delta("SELL", 0.50, 0.0)
+        assert book.best_ask == 0.55
+        book.apply_delta("BUY", 0.45, 0.0)
+        assert book.best_bid == 0.42
+
+    def test_delta_unknown_side_ignored(self):
+        book = _book()
+        book.apply_delta("???", 0.40, 10.0)
+        assert book.best_ask == 0.50
+
+    def test_normalize_side(self):
+        assert normalize_side("SELL") == ASK
+        assert normalize_side("buy") == BID
+        assert normalize_side("x") is None
+
+    def test_ask_depth(self):
+        book = _book()
+        assert book.ask_depth_shares() == pytest.approx(350.0)
+        assert book.ask_depth_usd() == pytest.approx(50 + 110 + 30)
+        assert book.ask_depth_usd(max_price=0.55) == pytest.approx(160.0)
+        assert book.ask_depth_shares(max_price=0.49) == 0.0
+
+    def test_cost_to_buy_shares(self):
+        book = _book()
+        # 100 @ 0.50 + 50 @ 0.55
+        assert book.cost_to_buy_shares(150) == pytest.approx(50 + 27.5)
+        assert book.cost_to_buy_shares(100) == pytest.approx(50.0)
+        assert book.cost_to_buy_shares(1000) is None
+
+    def test_shares_and_vwap_for_usd(self):
+        book = _book()
+        assert book.shares_for_usd(50) == pytest.approx(100.0)
+        assert book.shares_for_usd(77.5) == pytest.approx(150.0)
+        assert book.vwap_for_usd(77.5) == pytest.approx(77.5 / 150)
+        assert book.vwap_for_usd(10_000) is None
+
+    def test_prefix_sums_invalidated_by_delta(self):
+        book = _book()
+        assert book.ask_depth_usd() == pytest.approx(190.0)
+        book.apply_delta("SELL", 0.60, 0.0)
+        assert book.ask_depth_usd() == pytest.approx(160.0)
+
+
+class TestPriceCacheL2:
+    def test_snapshot_syncs_top_of_book(self):
+        cache = PriceCache()
+        cache.apply_book_snapshot("tok", [(0.5, 100.0)], [(0.4, 20.0)])
+        entry = cache.get_orderbook_entry("tok")
+        assert entry.best_ask == 0.5
+        assert entry.bid_size == 20.0
+        assert cache.get_price("tok") == 0.5
+
+    def test_delta_updates_entry(self):
+        cache = PriceCache()
+        cache.apply_book_snapshot("tok", [(0.5, 100.0)], [])
+        cache.apply_price_change("tok", "SELL", 0.47, 5.0)
+        assert cache.get_best_ask("tok") == 0.47
+        assert cache.get_orderbook_entry("tok").ask_size == 5.0
+
+    def test_asks_emptied_drops_entry(self):
+        cache = PriceCache()
+        cache.apply_book_snapshot("tok", [(0.5, 100.0)], [])
+        cache.apply_price_change("tok", "SELL", 0.5, 0.0)
+        assert cache.get_orderbook_entry("tok") is None
+        assert cache.get_best_ask("tok") is None
+
+    def test_cost_to_buy_usd(self):
+        cache = PriceCache()
+        assert cache.cost_to_buy_usd("tok", 10) is None
+        cache.apply_book_snapshot("tok", [(0.5, 100.0)], [])
+        assert cache.cost_to_buy_usd("tok", 10) == pytest.approx(0.5)
+
+    def test_clear_drops_books(self):
+        cache = PriceCache()
+        cache.apply_book_snapshot("tok", [(0.5, 100.0)], [])
+        cache.clear()
+        assert cache.get_book("tok") is None
+
+
+class TestPriceWebSocketL2:
+    def test_book_then_changes_delta(self):
+        cache = PriceCache()
+        ws = PriceWebSocket(cache)
+        ws._process_message(json.dumps({
+            "event_type": "book", "asset_id": "tok",
+            "asks": [{"price": "0.50", "size": "100"}, {"price": "0.55", "size": "10"}],
+            "bids": [{"price": "0.45", "size": "80"}],
+        }))
+        ws._process_message(json.dumps({
+            "event_type": "price_change", "asset_id": "tok",
+            "changes": [{"price": "0.50", "side": "SELL", "size": "0"}],
+        }))
+        assert cache.get_best_ask("tok") == 0.55
+        assert cache.get_book("tok").ask_levels == 1
+
+    def test_book_without_sizes_keeps_best_ask(self):
+        cache = PriceCache()
+        ws = PriceWebSocket(cache)
+        ws._process_message(json.dumps({
+            "event_type": "book", "asset_id": "legacy",
+            "asks": [["0.52"], ["0.50"]], "bids": [["0.40"]],
+        }))
+        ws._process_message(json.dumps({
+            "event_type": "book", "asset_id": "nosize",
+            "asks": [{"price": "0.61"}], "bids": [],
+        }))
+        assert cache.get_best_ask("legacy") == 0.50
+        assert cache.get_book("legacy").best_bid == 0.40
+        assert cache.get_best_ask("nosize") == 0.61
+
+    def test_price_changes_schema_with_per_item_asset(self):
+        cache = PriceCache()
+        ws = PriceWebSocket(cache)
+        ws._process_message(json.dumps({
+            "event_type": "book", "asset_id": "a",
+            "asks": [{"price": "0.50", "size": "100"}], "bids": [],
+        }))
+        ws._process_message(json.dumps({
+            "event_type": "price_change",
+            "price_changes": [
+                {"asset_id": "a", "price": "0.49", "side": "SELL", "size": "7"},
+                {"asset_id": "b", "price": "0.30", "side": "SELL", "size": "7"},
+            ],
+        }))
+        assert cache.get_best_ask("a") == 0.49
+        # 스냅샷 없는 토큰은 부분 book을 만들지 않음
+        assert cache.get_book("b") is None
+
+    def test_try_ws_cache_reports_depth(self):
+        from poly24h.scheduler.event_scheduler import EventDrivenLoop
+
+        cache = PriceCache()
+        cache.apply_book_snapshot("y", [(0.40, 100.0), (0.45, 100.0)], [])
+        cache.apply_book_snapshot("n", [(0.50, 10.0)], [])
+        loop = EventDrivenLoop.__new__(EventDrivenLoop)
+        loop._price_cache = cache
+        snap = loop._try_ws_cache("y", "n")
+        assert snap.yes_ask_depth_usd == pytest.approx(85.0)
+        assert snap.no_ask_depth_usd == pytest.approx(5.0)
+        assert snap.timestamp <= datetime.now(tz=timezone.utc)
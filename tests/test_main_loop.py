@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aioresponses import aioresponses
@@ -14,6 +16,7 @@ from poly24h.main import (
     detect_all,
     format_opportunity_line,
     log_results,
+    main_loop,
     parse_args,
     run_cycle,
 )
@@ -212,6 +215,26 @@ class TestRunCycle:
             assert opps == []
 
 
+# ---------------------------------------------------------------------------
+# main_loop
+# ---------------------------------------------------------------------------
+
+
+class TestMainLoop:
+    async def test_shared_transport_closed_on_exit(self):
+        """F-034: The shared pool is closed even when the loop is cancelled."""
+        transport = MagicMock()
+        transport.close = AsyncMock()
+        with (
+            patch("poly24h.main.get_default_transport", return_value=transport),
+            patch("poly24h.main.run_cycle", AsyncMock(side_effect=asyncio.CancelledError)),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await main_loop(BotConfig())
+
+        transport.close.assert_awaited_once()
+
+
 # ---------------------------------------------------------------------------
 # CLI argument parsing
 # ---------------------------------------------------------------------------
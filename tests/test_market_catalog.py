@@ -0,0 +1,190 @@
+"""Tests for F-038: Persistent market catalog with incremental discovery."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from poly24h.discovery.market_catalog import MarketCatalog
+from poly24h.discovery.market_scanner import SPORTS_RANGE_QUERY, MarketScanner
+from poly24h.models.market import MarketSource
+from poly24h.strategy.sport_config import NHL_CONFIG
+
+
+def _raw_market(
+    market_id: str,
+    hours: float = 6.0,
+    yes_price: float = 0.45,
+    liquidity: float = 6000.0,
+) -> dict:
+    end = (datetime.now(tz=timezone.utc) + timedelta(hours=hours)).isoformat()
+    return {
+        "id": market_id,
+        "question": f"Market {market_id}?",
+        "outcomePrices": f"[{yes_price}, {1 - yes_price:.2f}]",
+        "clobTokenIds": f'["{market_id}_yes", "{market_id}_no"]',
+        "liquidity": str(liquidity),
+        "endDate": end,
+        "active": True,
+        "closed": False,
+    }
+
+
+def _event(event_id: str, slug: str, markets: list[dict]) -> dict:
+    return {"id": event_id, "title": slug, "slug": slug, "markets": markets}
+
+
+def _game_slug(prefix: str = "nba") -> str:
+    day = (datetime.now(tz=timezone.utc) + timedelta(hours=6)).strftime("%Y-%m-%d")
+    return f"{prefix}-lal-bos-{day}"
+
+
+class TestCatalogIndexes:
+    def test_parse_reuses_unchanged_market(self):
+        catalog = MarketCatalog()
+        raw = _raw_market("m1")
+        event = _event("e1", "slug", [raw])
+        first = catalog.parse(raw, event, MarketSource.NBA)
+        second = catalog.parse(dict(raw), event, MarketSource.NBA)
+        assert second is first
+        assert catalog.stats()["parsed"] == 1
+        assert catalog.stats()["reused"] == 1
+
+    def test_parse_reparses_changed_market(self):
+        catalog = MarketCatalog()
+        raw = _raw_market("m1", yes_price=0.45)
+        event = _event("e1", "slug", [raw])
+        catalog.parse(raw, event, MarketSource.NBA)
+        changed = catalog.parse(_raw_market("m1", yes_price=0.30), event, MarketSource.NBA)
+        assert changed.yes_price == 0.30
+        assert catalog.get("m1") is changed
+        assert catalog.stats()["parsed"] == 2
+
+    def test_lookups_by_token_event_and_end_date(self):
+        catalog = MarketCatalog()
+        for mid, hours in (("a", 1), ("b", 5), ("c", 30)):
+            raw = _raw_market(mid, hours=hours)
+            catalog.parse(raw, _event("e1", "slug", [raw]), MarketSource.NBA)
+
+        assert catalog.get_by_token("b_no").id == "b"
+        assert {m.id for m in catalog.markets_for_event("e1")} == {"a", "b", "c"}
+        now = datetime.now(tz=timezone.utc)
+        soon = catalog.ending_between(now, now + timedelta(hours=24))
+        assert [m.id for m in soon] == ["a", "b"]
+
+    def test_upsert_moves_end_date_index(self):
+        catalog = MarketCatalog()
+        raw = _raw_market("a", hours=30)
+        catalog.parse(raw, _event("e1", "slug", [raw]), MarketSource.NBA)
+        raw = _raw_market("a", hours=2)
+        catalog.parse(raw, _event("e1", "slug", [raw]), MarketSource.NBA)
+        now = datetime.now(tz=timezone.utc)
+        assert [m.id for m in catalog.ending_between(now, now + timedelta(hours=3))] == ["a"]
+        assert len(catalog) == 1
+
+    def test_prune_expired(self):
+        catalog = MarketCatalog()
+        for mid, hours in (("old", -1), ("new", 2)):
+            raw = _raw_market(mid, hours=hours)
+            catalog.parse(raw, _event("e1", "slug", [raw]), MarketSource.NBA)
+        assert catalog.prune_expired() == 1
+        assert "old" not in catalog
+        assert catalog.get_by_token("old_yes") is None
+
+    def test_snapshot_roundtrip(self, tmp_path):
+        path = tmp_path / "catalog.json"
+        catalog = MarketCatalog(snapshot_path=path)
+        raw = _raw_market("m1")
+        event = _event("e1", "slug", [raw])
+        catalog.parse(raw, event, MarketSource.NBA)
+        catalog.record_query("q", ["m1"], datetime.now(tz=timezone.utc), full=True)
+        assert catalog.save() is True
+
+        restored = MarketCatalog(snapshot_path=path)
+        assert restored.load() == 1
+        assert restored.get("m1").source == MarketSource.NBA
+        assert [m.id for m in restored.query_markets("q")] == ["m1"]
+        assert restored.needs_full_refresh("q") is False
+        # Fingerprints survive restarts → unchanged markets are not re-parsed
+        restored.parse(raw, event, MarketSource.NBA)
+        assert restored.stats()["parsed"] == 0
+
+    def test_load_missing_or_corrupt_snapshot(self, tmp_path):
+        path = tmp_path / "catalog.json"
+        assert MarketCatalog(snapshot_path=path).load() == 0
+        path.write_text("{not json")
+        assert MarketCatalog(snapshot_path=path).load() == 0
+
+    async def test_shared_coalesces_concurrent_callers(self):
+        catalog = MarketCatalog(share_ttl=60.0)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return []
+
+        await asyncio.gather(*(catalog.shared("k", fetch) for _ in range(5)))
+        await catalog.shared("k", fetch)
+        assert calls == 1
+        assert catalog.shared_hits == 5
+
+
+class TestScannerWithCatalog:
+    def _scanner(self, events_by_call: list[list[dict]]) -> tuple[MarketScanner, MagicMock]:
+        client = MagicMock()
+        client.fetch_events_by_date_range = AsyncMock(side_effect=events_by_call)
+        client.fetch_game_events_by_series = AsyncMock(return_value=[])
+        scanner = MarketScanner(client, catalog=MarketCatalog())
+        return scanner, client
+
+    async def test_second_refresh_is_incremental(self):
+        first_event = _event("e1", _game_slug("nba"), [_raw_market("m1")])
+        new_event = _event("e2", _game_slug("nhl"), [_raw_market("m2", hours=40)])
+        scanner, client = self._scanner([[first_event], [new_event]])
+        configs = {"nba": {"enabled": True}, "nhl": {"enabled": True}}
+
+        first = await scanner.discover_all_sports(configs)
+        assert [m.id for m in first] == ["m1"]
+        covered = scanner.catalog.covered_until(SPORTS_RANGE_QUERY)
+
+        second = await scanner.discover_all_sports(configs)
+        assert [m.id for m in second] == ["m1", "m2"]
+        # Only the slice after the previous horizon was requested
+        kwargs = client.fetch_events_by_date_range.await_args_list[1].kwargs
+        assert kwargs["end_date_min"] == covered.isoformat()
+        assert scanner.catalog.stats()["parsed"] == 2
+
+    async def test_full_refresh_replaces_members(self):
+        scanner, _client = self._scanner([
+            [_event("e1", _game_slug(), [_raw_market("m1")])],
+            [_event("e2", _game_slug(), [_raw_market("m2")])],
+        ])
+        scanner.catalog.full_refresh_secs = 0.0
+        configs = {"nba": {"enabled": True}}
+        await scanner.discover_all_sports(configs)
+        markets = await scanner.discover_all_sports(configs)
+        assert [m.id for m in markets] == ["m2"]
+
+    async def test_liquidity_filter_applied_from_catalog(self):
+        event = _event("e1", _game_slug(), [_raw_market("m1", liquidity=4000.0)])
+        scanner, _client = self._scanner([[event]])
+        markets = await scanner.discover_all_sports(
+            {"nba": {"enabled": True, "min_liquidity_usd": 5000}},
+        )
+        assert markets == []
+        assert "m1" in scanner.catalog
+
+    async def test_sport_discovery_shared_between_monitors(self):
+        scanner, client = self._scanner([])
+        client.fetch_game_events_by_series.return_value = [
+            _event("e1", _game_slug("nhl"), [_raw_market("m1")]),
+        ]
+        a, b = await asyncio.gather(
+            scanner.discover_sport_markets(NHL_CONFIG),
+            scanner.discover_sport_markets(NHL_CONFIG),
+        )
+        assert [m.id for m in a] == [m.id for m in b] == ["m1"]
+        assert client.fetch_game_events_by_series.await_count == 1
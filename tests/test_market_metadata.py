@@ -0,0 +1,87 @@
+"""Tests for F-052: Question metadata parsed once per market."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from poly24h.models.market import Market, MarketSource
+from poly24h.models.market_metadata import MarketMetadata, market_metadata
+from poly24h.position_manager import PositionManager
+from poly24h.strategy.odds_api import GameOdds, MarketOdds, OddsAPIClient, team_matcher
+from poly24h.strategy.sport_config import NHL_CONFIG
+
+
+def _market(question: str) -> Market:
+    return Market(
+        id="m1", question=question, source=MarketSource.NHL,
+        yes_token_id="y", no_token_id="n", yes_price=0.5, no_price=0.5,
+        liquidity_usd=1000.0, end_date=datetime.now(timezone.utc) + timedelta(hours=3),
+        event_id="e1", event_title="",
+    )
+
+
+class TestParse:
+    def test_types_lines_and_labels(self):
+        totals = MarketMetadata.parse("Bruins vs. Rangers: O/U 5.5")
+        assert (totals.market_type, totals.line, totals.position_type) == ("totals", 5.5, "ou")
+        assert (totals.yes_label, totals.no_label) == ("Over", "Under")
+
+        spread = MarketMetadata.parse("Spread: Bruins (-1.5)")
+        assert (spread.market_type, spread.line, spread.is_moneyline) == ("spread", -1.5, False)
+
+        btts = MarketMetadata.parse("Both teams to score?")
+        assert btts.market_type is None and btts.is_moneyline
+
+        assert MarketMetadata.parse("Will BTC go up?").asset == "BTC"
+        assert MarketMetadata.parse("Will Arsenal vs Chelsea end in a draw?").is_draw
+
+    def test_market_parses_once_with_gamma_outcomes(self):
+        raw = {
+            "id": "1", "question": "Lakers vs. Celtics: O/U 220.5",
+            "outcomePrices": '["0.5", "0.5"]', "clobTokenIds": '["a", "b"]',
+            "outcomes": '["Higher", "Lower"]', "endDate": "2026-02-14T00:00:00Z",
+        }
+        market = Market.from_gamma_response(raw, {"id": "e"}, MarketSource.NBA)
+        assert market.metadata.line == 220.5
+        assert (market.metadata.yes_label, market.metadata.no_label) == ("Higher", "Lower")
+        assert market_metadata(market) is market.metadata
+
+    def test_duck_typed_markets_are_parsed_on_the_fly(self):
+        mock = MagicMock()
+        mock.question = "Spread: Lakers (-3.5)"
+        assert market_metadata(mock).line == -3.5
+
+
+class TestConsumers:
+    def test_team_matcher_cached_per_sport_and_memoized_per_market(self):
+        matcher = team_matcher(NHL_CONFIG)
+        assert team_matcher(NHL_CONFIG) is matcher
+
+        market = _market("Will the Boston Bruins beat the New York Rangers?")
+        teams = matcher.teams_in(market)
+        assert set(teams) == {"bruins", "rangers"}
+        assert matcher.teams_in(market) is teams
+
+    def test_fair_prob_reads_metadata(self):
+        game = GameOdds(
+            game_id="g1", home_team="Boston Bruins", away_team="New York Rangers",
+            commence_time="2026-02-14T00:00:00Z",
+            h2h=MarketOdds(outcomes=[
+                {"name": "Boston Bruins", "price": -150},
+                {"name": "New York Rangers", "price": 130},
+            ]),
+        )
+        client = OddsAPIClient()
+        market = _market("Will the New York Rangers beat the Boston Bruins?")
+        prob = client.get_fair_prob_for_market(market, [game], sport_config=NHL_CONFIG)
+        assert prob is not None and prob < 0.5
+
+        totals = _market("Rangers vs. Bruins: O/U 5.5")
+        assert client.get_fair_prob_for_market(totals, [game], sport_config=NHL_CONFIG) is None
+
+    def test_position_manager_filters_use_metadata(self):
+        pm = PositionManager(bankroll=1000.0, max_per_market=20.0)
+        assert pm.should_skip_entry(_market("Will the Bruins win?"), 0.20, "YES")
+        assert not pm.should_skip_entry(_market("Bruins vs. Rangers: O/U 5.5"), 0.20, "YES")
+        assert PositionManager._detect_market_type("Spread: Bruins (-1.5)") == "spread"
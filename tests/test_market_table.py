@@ -0,0 +1,137 @@
+"""Tests for F-046: Struct-of-arrays market state table."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from poly24h.models.market import Market, MarketSource
+from poly24h.scheduler.event_scheduler import (
+    EventDrivenLoop,
+    OrderbookSnapshot,
+    RapidOrderbookPoller,
+)
+from poly24h.scheduler.market_table import MarketStateTable
+from poly24h.strategy.dynamic_threshold import DynamicThreshold
+from poly24h.websocket.price_cache import PriceCache
+
+MIN_PRICE = RapidOrderbookPoller.MIN_MEANINGFUL_PRICE
+
+
+def _market(i: int, source=MarketSource.HOURLY_CRYPTO, liquidity=30_000.0) -> Market:
+    return Market(
+        id=f"m{i}", question=f"Q{i}", source=source,
+        yes_token_id=f"y{i}", no_token_id=f"n{i}",
+        yes_price=0.5, no_price=0.5, liquidity_usd=liquidity,
+        end_date=datetime.now(tz=timezone.utc) + timedelta(hours=1),
+        event_id=f"e{i}", event_title=f"E{i}",
+    )
+
+
+def _table(markets: list[Market], **kwargs) -> MarketStateTable:
+    table = MarketStateTable()
+    pairs = [(m.yes_token_id, m.no_token_id) for m in markets]
+    table.load(pairs, markets, **kwargs)
+    return table
+
+
+class TestPasses:
+    def test_sniper_slots_match_detect_opportunity(self):
+        rng = random.Random(7)
+        poller = RapidOrderbookPoller(MagicMock())
+        now = datetime.now(tz=timezone.utc)
+        snapshots = []
+        for _ in range(500):
+            yes = rng.choice([None, 0.001, round(rng.uniform(0.01, 0.99), 3)])
+            no = rng.choice([None, round(rng.uniform(0.01, 0.99), 3)])
+            snapshots.append(OrderbookSnapshot(yes, no, None, now))
+        table = _table([_market(i) for i in range(500)])
+        table.set_asks([s.yes_best_ask for s in snapshots], [s.no_best_ask for s in snapshots])
+
+        expected = [
+            i for i, s in enumerate(snapshots)
+            if poller.detect_opportunity(s, 0.48) is not None
+        ]
+        assert table.sniper_slots(0.48, MIN_PRICE) == expected
+
+    def test_paired_slots_respect_crypto_mask(self):
+        markets = [_market(0), _market(1, source=MarketSource.NBA), _market(2)]
+        table = _table(markets)
+        table.set_asks([0.45, 0.44, 0.60], [0.50, 0.50, 0.45])
+        assert table.paired_slots(0.98, 0.02) == [0, 1]
+        assert table.paired_slots(0.98, 0.02, crypto_only=True) == [0]
+
+    def test_entry_slots_apply_dynamic_threshold_and_edge(self):
+        thresholds = DynamicThreshold()
+        markets = [_market(0), _market(1, liquidity=1_000.0), _market(2)]
+        table = _table(
+            markets,
+            threshold_for=thresholds.get_threshold,
+            fair_values={"m0": 0.55, "m1": 0.55, "m2": 0.46},
+        )
+        # m1: $0.46 > low-liquidity threshold $0.45; m2: edge 0.46-0.45 < 3%
+        table.set_asks([0.46, 0.46, 0.45], [0.60, 0.60, 0.60])
+        assert table.sniper_slots(0.48, MIN_PRICE) == [0, 1, 2]
+        assert table.entry_slots(0.48, MIN_PRICE, min_edge=0.03) == [0]
+
+    def test_entry_slots_skip_crypto(self):
+        markets = [_market(0), _market(1, source=MarketSource.NBA)]
+        table = _table(markets, fair_values={"m0": 0.60, "m1": 0.60})
+        table.set_asks([0.40, 0.40], [0.60, 0.60])
+        assert table.entry_slots(0.48, MIN_PRICE, min_edge=0.03) == [0, 1]
+        assert table.entry_slots(0.48, MIN_PRICE, min_edge=0.03, skip_crypto=True) == [1]
+
+    def test_refresh_from_cache_and_missing_markets(self):
+        cache = PriceCache()
+        cache.update_orderbook("y0", best_ask=0.40, ask_size=10.0)
+        table = MarketStateTable()
+        pairs = [("y0", "n0"), ("y1", "n1")]
+        table.load(pairs, [_market(0)])
+        table.refresh_from_cache(cache)
+
+        assert table.built_from(pairs)
+        assert table.slot_of["n1"] == 1
+        assert table.yes_size[0] == 10.0
+        assert table.paired_slots(1.0, 0.0) == []
+        pairs.append(("y2", "n2"))
+        assert not table.built_from(pairs)
+
+
+class TestLoopIntegration:
+    async def test_paired_check_runs_only_for_candidates(self, tmp_path):
+        markets = [_market(i) for i in range(4)]
+        loop = EventDrivenLoop(
+            MagicMock(), MagicMock(), MagicMock(), MagicMock(), data_dir=tmp_path,
+        )
+        loop._active_markets = markets
+        loop._active_token_pairs = [(m.yes_token_id, m.no_token_id) for m in markets]
+        for m, (yes, no) in zip(markets, [(0.45, 0.46), (0.55, 0.50), (0.40, 0.50), (0.6, 0.6)]):
+            loop._price_cache.update_orderbook(m.yes_token_id, best_ask=yes, ask_size=100.0)
+            loop._price_cache.update_orderbook(m.no_token_id, best_ask=no, ask_size=100.0)
+
+        calls = []
+        loop._detect_paired_for_pair = lambda market, y, n: calls.append(market.id)
+        await loop._check_paired_entries(0.48)
+
+        assert calls == ["m0", "m2"]
+
+    async def test_entry_filter_poll_uses_current_fair_values(self, tmp_path):
+        markets = [_market(i, source=MarketSource.NBA) for i in range(3)]
+        loop = EventDrivenLoop(
+            MagicMock(), MagicMock(), RapidOrderbookPoller(MagicMock()), MagicMock(),
+            data_dir=tmp_path,
+        )
+        loop._active_markets = markets
+        loop._active_token_pairs = [(m.yes_token_id, m.no_token_id) for m in markets]
+        loop._sync_market_table(force=True)
+        for m in markets:
+            loop._price_cache.update_orderbook(m.yes_token_id, best_ask=0.45, ask_size=100.0)
+            loop._price_cache.update_orderbook(m.no_token_id, best_ask=0.55, ask_size=100.0)
+        # Fair values change after the table was built
+        loop._market_fair_values.update({"m0": 0.60, "m1": 0.46, "m2": 0.40})
+
+        results = await loop._poll_all_pairs(0.48, entry_filter=True)
+
+        assert [pair for _opp, pair in results] == [("y0", "n0")]
+        assert len(await loop._poll_all_pairs(0.48)) == 3
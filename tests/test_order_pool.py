@@ -0,0 +1,253 @@
+"""Tests for F-050: Pre-signed order template pool."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+from py_clob_client.clob_types import OrderType
+
+from poly24h.execution.order_pool import PreSignedOrderPool
+from poly24h.execution.sport_executor import SportExecutor
+from poly24h.http_transport import HttpTransport
+from poly24h.models.market import Market, MarketSource
+from poly24h.position_manager import PositionManager
+from poly24h.strategy.sport_config import NBA_CONFIG
+from poly24h.strategy.sports_monitor import SportsMonitor
+
+META_URL = re.compile(
+    r"^https://clob\.polymarket\.com/(tick-size|neg-risk|fee-rate)\?token_id=(\w+)$",
+)
+
+
+class FakeBuilder:
+    """Stands in for ``ClobClient.builder`` (signing with explicit options)."""
+
+    def __init__(self, signed: list):
+        self._signed = signed
+
+    def create_order(self, order_args, options):
+        self._signed.append((order_args, threading.current_thread().name))
+        return {"signed": order_args.token_id, "price": order_args.price, "options": options}
+
+
+class FakeClobClient:
+    """Records signing calls; create_order means ClobClient did its own lookups."""
+
+    def __init__(self):
+        self.signed: list = []
+        self.client_signed: list = []
+        self.builder = FakeBuilder(self.signed)
+        self.post_order = MagicMock(return_value={"orderID": "abc"})
+        self.get_order = MagicMock(return_value={"status": "MATCHED", "size_matched": "1"})
+
+    def create_order(self, order_args):
+        self.client_signed.append(order_args)
+        return {"signed": order_args.token_id, "price": order_args.price}
+
+
+def _mock_meta(
+    m: aioresponses,
+    fail_tokens: set[str] = frozenset(),
+    tick_sizes: dict[str, float] | None = None,
+) -> list[str]:
+    """Serve tick size / neg risk / fee rate; returns the looked-up token ids.
+
+    ``tick_sizes`` (default 0.01) is read per request, so tests can change it.
+    """
+    tick_sizes = {} if tick_sizes is None else tick_sizes
+    calls: list[str] = []
+
+    def callback(url, **kwargs):
+        token_id = kwargs["params"]["token_id"]
+        path = url.path
+        if path == "/tick-size":
+            calls.append(token_id)
+        if token_id in fail_tokens:
+            return CallbackResult(status=500)
+        payload = {
+            "/tick-size": {"minimum_tick_size": tick_sizes.get(token_id, 0.01)},
+            "/neg-risk": {"neg_risk": False},
+            "/fee-rate": {"base_fee": 0},
+        }[path]
+        return CallbackResult(payload=payload)
+
+    m.get(META_URL, callback=callback, repeat=True)
+    return calls
+
+
+@pytest.fixture
+async def transport():
+    transport = HttpTransport()
+    yield transport
+    await transport.close()
+
+
+class TestPool:
+    async def test_prepare_then_take_once(self, transport):
+        client = FakeClobClient()
+        pool = PreSignedOrderPool(client, transport)
+        with aioresponses() as m:
+            _mock_meta(m)
+            added = await pool.prepare([
+                ("tok", "BUY", 0.48, 20.0 / 0.48),
+                ("tok", "BUY", 0.47, 20.0 / 0.47),
+            ])
+
+        assert added == 2
+        assert all(name.startswith("presign") for _, name in client.signed)
+        assert all(args.expiration > time.time() for args, _ in client.signed)
+        assert client.client_signed == []
+
+        template = pool.take("tok", "BUY", 0.48, 20.0 / 0.48)  # 41.666… → 41.67
+        assert template is not None and template.signed["price"] == 0.48
+        assert pool.take("tok", "BUY", 0.48, 20.0 / 0.48) is None  # single use
+        assert pool.take("tok", "BUY", 0.46, 20.0 / 0.46) is None
+        assert (pool.hits, pool.misses, pool.size) == (1, 2, 1)
+
+    async def test_expired_templates_are_dropped(self, transport):
+        pool = PreSignedOrderPool(FakeClobClient(), transport, expiration_seconds=300, min_ttl=70)
+        with aioresponses() as m:
+            _mock_meta(m)
+            await pool.prepare([("tok", "BUY", 0.45, 10.0), ("tok", "BUY", 0.44, 10.0)])
+
+            assert pool.purge_expired(now=time.time() + 240) == 2
+            assert pool.size == 0
+
+            await pool.prepare([("tok", "BUY", 0.45, 10.0)])
+        pool.min_ttl = 10_000
+        assert pool.take("tok", "BUY", 0.45, 10.0) is None
+        assert pool.expired == 3
+
+    async def test_warm_tokens_once_and_tolerates_failures(self, transport):
+        pool = PreSignedOrderPool(FakeClobClient(), transport)
+        with aioresponses() as m:
+            calls = _mock_meta(m, fail_tokens={"bad"})
+            assert await pool.warm_tokens(["a", "bad", "a"]) == 1
+            assert await pool.warm_tokens(["a", "bad"]) == 0
+
+        assert sorted(calls) == ["a", "bad", "bad"]
+        assert pool.is_warm("a") and not pool.is_warm("bad")
+
+    async def test_sign_uses_warmed_metadata(self, transport):
+        client = FakeClobClient()
+        pool = PreSignedOrderPool(client, transport)
+        with aioresponses() as m:
+            _mock_meta(m)
+            await pool.warm_tokens(["tok"])
+
+        signed = pool.sign("tok", "BUY", 0.45, 10.0)
+        assert signed["options"].tick_size == "0.01"
+        assert client.client_signed == []
+
+        pool.sign("cold", "BUY", 0.45, 10.0)  # no metadata → ClobClient lookups
+        assert [args.token_id for args in client.client_signed] == ["cold"]
+
+    async def test_sign_rejects_prices_off_the_tick_grid(self, transport):
+        pool = PreSignedOrderPool(FakeClobClient(), transport)
+        with aioresponses() as m:
+            _mock_meta(m, tick_sizes={"fine": 0.001})
+            await pool.warm_tokens(["tok", "fine"])
+
+        with pytest.raises(ValueError, match="tick grid"):
+            pool.sign("tok", "BUY", 0.455, 10.0)
+        with pytest.raises(ValueError):
+            pool.sign("tok", "BUY", 0.995, 10.0)
+        pool.sign("fine", "BUY", 0.455, 10.0)
+        pool.sign("tok", "BUY", 0.07, 10.0)
+
+    async def test_expired_metadata_is_refetched_and_tick_change_drops_templates(
+        self, transport,
+    ):
+        client = FakeClobClient()
+        pool = PreSignedOrderPool(client, transport, meta_ttl=60.0)
+        ticks = {"tok": 0.01, "other": 0.01}
+        with aioresponses() as m:
+            calls = _mock_meta(m, tick_sizes=ticks)
+            await pool.prepare([("tok", "BUY", 0.05, 10.0), ("other", "BUY", 0.5, 10.0)])
+
+            for token in ("tok", "other"):
+                pool._meta[token] = replace(pool._meta[token], fetched_at=time.monotonic() - 61)
+            assert not pool.is_warm("tok")
+            pool.sign("tok", "BUY", 0.05, 10.0)  # stale → ClobClient's own lookup
+            assert len(client.client_signed) == 1
+
+            ticks["tok"] = 0.001
+            assert await pool.warm_tokens(["tok", "other"]) == 2
+
+        assert sorted(calls) == ["other", "other", "tok", "tok"]
+        assert pool._meta["tok"].tick_size == "0.001"
+        assert pool.take("tok", "BUY", 0.05, 10.0) is None
+        assert pool.take("other", "BUY", 0.5, 10.0) is not None
+
+
+class TestConsumers:
+    async def test_sport_executor_posts_template_without_signing(self, transport):
+        client = FakeClobClient()
+        pool = PreSignedOrderPool(client, transport)
+        with aioresponses() as m:
+            _mock_meta(m)
+            await pool.prepare([("tok", "BUY", 0.45, 10.0)])
+        client.signed.clear()
+        executor = SportExecutor(dry_run=False, clob_client=client, order_pool=pool)
+
+        executor._create_and_post("tok", "BUY", 0.45, 10.0)
+        client.post_order.assert_called_once()
+        assert client.post_order.call_args.args[1] == OrderType.GTD
+        assert client.signed == []
+
+        executor._create_and_post("tok", "BUY", 0.45, 10.0)  # pool empty → sign
+        assert len(client.signed) == 1
+        assert client.post_order.call_args.args[1] == OrderType.GTC
+
+    async def test_sports_monitor_presigns_ranked_entries(self, transport, tmp_path):
+        now = datetime.now(timezone.utc)
+        markets = [
+            Market(
+                id=mid, question=f"Game {mid} O/U 220.5", source=MarketSource.NBA,
+                yes_token_id=f"yes_{mid}", no_token_id=f"no_{mid}",
+                yes_price=0.5, no_price=0.5, liquidity_usd=10_000.0,
+                end_date=now + timedelta(hours=6), event_id=f"e_{mid}", event_title=mid,
+            )
+            for mid in ("big", "mid", "cold")
+        ]
+        asks = {"yes_big": 0.40, "no_big": 0.62, "yes_mid": 0.50, "no_mid": 0.52}
+        pm = PositionManager(bankroll=1000.0, max_per_market=20.0)
+        scanner = MagicMock()
+        scanner.discover_sport_markets = AsyncMock(return_value=markets)
+        scanner.client.open = AsyncMock()
+        odds = MagicMock()
+        odds.fetch_odds = AsyncMock(return_value=[])
+        odds.get_fair_prob_for_market.return_value = 0.60
+        fetcher = MagicMock()
+        fetcher.fetch_best_asks_batch = AsyncMock(
+            side_effect=lambda tokens: {t: asks.get(t) for t in tokens},
+        )
+        client = FakeClobClient()
+        pool = PreSignedOrderPool(client, transport)
+        executor = SportExecutor(dry_run=False, clob_client=client, order_pool=pool)
+        executor.POLL_INTERVAL_SEC = 0.01
+        monitor = SportsMonitor(
+            sport_config=NBA_CONFIG, odds_client=odds, market_scanner=scanner,
+            position_manager=pm, orderbook_fetcher=fetcher, rate_limiter=None,
+            sport_executor=executor, state_path=tmp_path / "position_manager_state.json",
+        )
+
+        with aioresponses() as m:
+            _mock_meta(m)
+            stats = await monitor.scan_and_trade()
+
+        assert stats["trades_entered"] == 2
+        for token in ("yes_big", "no_big", "yes_mid", "no_mid"):
+            assert pool.is_warm(token)
+        presigned = [args for args, name in client.signed if name.startswith("presign")]
+        assert [(a.token_id, a.price) for a in presigned] == [("yes_mid", 0.50)]
+        assert presigned[0].size == round(pm._positions["mid"].size_usd / 0.50, 2)
+        assert pool.hits + pool.size == 1  # used by try_enter, or still pooled
+        assert client.client_signed == []
@@ -728,3 +728,108 @@ class TestClobOrderbookFetcherSummary:
 
         assert yes_summary.best_ask is None
         assert no_summary.best_ask is None
+
+
+# ---------------------------------------------------------------------------
+# F-033: Batched multi-token fetching
+# ---------------------------------------------------------------------------
+
+CLOB_BOOKS_PATTERN = re.compile(r"^https://clob\.polymarket\.com/books\b")
+
+
+def _book_for(token_id: str, asks: list[tuple[str, str]]) -> dict:
+    """Helper: POST /books entry for one token."""
+    book = _orderbook(asks=asks)
+    book["asset_id"] = token_id
+    return book
+
+
+class TestClobOrderbookFetcherBatch:
+    """F-033: POST /books batch + per-token fallback."""
+
+    async def test_batch_single_request_for_many_tokens(self):
+        """All tokens answered by one POST /books → no GET /book calls."""
+        from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher
+
+        books = [
+            _book_for("ty1", [("0.48", "100"), ("0.47", "10")]),
+            _book_for("tn1", [("0.50", "100")]),
+            _book_for("ty2", []),
+        ]
+        with aioresponses() as m:
+            m.post(CLOB_BOOKS_PATTERN, payload=books)
+            fetcher = ClobOrderbookFetcher()
+            summaries = await fetcher.fetch_orderbooks(["ty1", "tn1", "ty2"])
+            await fetcher.close()
+
+        assert summaries["ty1"].best_ask == 0.47
+        assert summaries["ty1"].ask_levels == 2
+        assert summaries["tn1"].best_ask == 0.50
+        assert summaries["ty2"].best_ask is None
+
+    async def test_batch_chunks_by_batch_size(self):
+        """batch_size=2 with 3 tokens → two POST /books requests."""
+        from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher
+
+        with aioresponses() as m:
+            m.post(
+                CLOB_BOOKS_PATTERN,
+                payload=[_book_for("a", [("0.40", "10")]), _book_for("b", [("0.41", "10")])],
+            )
+            m.post(CLOB_BOOKS_PATTERN, payload=[_book_for("c", [("0.42", "10")])])
+            fetcher = ClobOrderbookFetcher(batch_size=2)
+            asks = await fetcher.fetch_best_asks_batch(["a", "b", "c"])
+            await fetcher.close()
+
+        assert asks == {"a": 0.40, "b": 0.41, "c": 0.42}
+
+    async def test_missing_tokens_fall_back_to_get(self):
+        """Token absent from the batch response is fetched via GET /book."""
+        from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher
+
+        with aioresponses() as m:
+            m.post(CLOB_BOOKS_PATTERN, payload=[_book_for("ty", [("0.45", "100")])])
+            m.get(CLOB_BOOK_PATTERN, payload=_orderbook(asks=[("0.52", "100")]))
+            fetcher = ClobOrderbookFetcher()
+            yes_ask, no_ask = await fetcher.fetch_best_asks("ty", "tn")
+            await fetcher.close()
+
+        assert yes_ask == 0.45
+        assert no_ask == 0.52
+
+    async def test_unsupported_batch_endpoint_disables_batching(self):
+        """404 on /books → per-token GETs now and no further POST attempts."""
+        from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher
+
+        with aioresponses() as m:
+            m.post(CLOB_BOOKS_PATTERN, status=404)
+            m.get(CLOB_BOOK_PATTERN, payload=_orderbook(asks=[("0.45", "100")]), repeat=True)
+            fetcher = ClobOrderbookFetcher()
+            first = await fetcher.fetch_best_asks_batch(["ty", "tn"])
+            # Second call goes straight to per-token GET /book
+            second = await fetcher.fetch_best_asks_batch(["ty", "tn"])
+            await fetcher.close()
+
+        assert first == {"ty": 0.45, "tn": 0.45}
+        assert second == first
+        assert fetcher._batch_supported is False
+
+    async def test_duplicate_and_empty_tokens_deduplicated(self):
+        """Duplicate IDs are requested once; empty IDs are ignored."""
+        from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher
+
+        with aioresponses() as m:
+            m.post(CLOB_BOOKS_PATTERN, payload=[_book_for("ty", [("0.30", "5")])])
+            fetcher = ClobOrderbookFetcher()
+            summaries = await fetcher.fetch_orderbooks(["ty", "", "ty"])
+            await fetcher.close()
+
+        assert list(summaries) == ["ty"]
+
+    async def test_empty_token_list(self):
+        """No tokens → empty dict, no HTTP."""
+        from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher
+
+        fetcher = ClobOrderbookFetcher()
+        assert await fetcher.fetch_orderbooks([]) == {}
+        await fetcher.close()
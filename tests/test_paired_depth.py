@@ -0,0 +1,132 @@
+"""Tests for F-048: Depth-aware VWAP paired-entry evaluator."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from poly24h.models.market import Market, MarketSource
+from poly24h.strategy.fee_calculator import real_cost_fast
+from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher, OrderbookSummary
+from poly24h.strategy.paired_depth import AskLadder, PairedDepthEvaluator, walk_ladders
+from poly24h.strategy.paired_entry import PairedEntryDetector, PairedEntrySimulator
+from poly24h.strategy.sports_paired_scanner import SportsPairedScanner
+from poly24h.websocket.orderbook import L2Book
+
+
+def _market(hours: float = 1.0) -> Market:
+    return Market(
+        id="m1", question="Q", source=MarketSource.HOURLY_CRYPTO,
+        yes_token_id="y", no_token_id="n", yes_price=0.5, no_price=0.5,
+        liquidity_usd=10_000.0,
+        end_date=datetime.now(tz=timezone.utc) + timedelta(hours=hours),
+        event_id="e", event_title="E",
+    )
+
+
+class TestWalkLadders:
+    def test_walk_stops_where_vwap_hits_cap(self):
+        yes = AskLadder.from_levels([(0.45, 10), (0.55, 100)], taker_fees=False)
+        no = AskLadder.from_levels([(0.45, 100)], taker_fees=False)
+        fill = walk_ladders(yes, no, max_cpp=0.95)
+
+        # 10 pairs @0.90, then x pairs @1.00: (9 + x) / (10 + x) = 0.95 → x = 10
+        assert fill.shares == pytest.approx(20.0)
+        assert fill.cpp_after_fees == pytest.approx(0.95)
+        assert (fill.yes_levels, fill.no_levels) == (2, 1)
+
+    def test_budget_caps_fill(self):
+        yes = AskLadder.from_levels([(0.40, 1000)], taker_fees=False)
+        no = AskLadder.from_levels([(0.50, 1000)], taker_fees=False)
+        fill = walk_ladders(yes, no, max_cpp=0.99, max_usd=45.0)
+        assert fill.shares == pytest.approx(50.0)
+        assert fill.cost_usd == pytest.approx(45.0)
+
+    def test_taker_fees_count_per_level(self):
+        levels_y, levels_n = [(0.45, 50)], [(0.50, 50)]
+        fee_free = walk_ladders(
+            AskLadder.from_levels(levels_y, False), AskLadder.from_levels(levels_n, False), 0.97,
+        )
+        with_fees = walk_ladders(
+            AskLadder.from_levels(levels_y), AskLadder.from_levels(levels_n), 0.97,
+        )
+        assert fee_free.shares == 50
+        assert with_fees.shares == 0  # 0.95 top-of-book, ~0.98 after taker fees
+        assert real_cost_fast(0.45) + real_cost_fast(0.50) > 0.97
+
+    def test_book_ladders_cached_per_version(self):
+        yes, no = L2Book(), L2Book()
+        yes.apply_snapshot([(0.45, 100)], [])
+        no.apply_snapshot([(0.45, 100)], [])
+        evaluator = PairedDepthEvaluator()
+        evaluator.evaluate(yes, no, 0.99)
+        evaluator.evaluate(yes, no, 0.99)
+        assert evaluator.ladder_builds == 2
+
+        yes.apply_delta("ask", 0.46, 50)
+        evaluator.evaluate(yes, no, 0.99)
+        assert evaluator.ladder_builds == 3
+
+
+class TestDetectorDepth:
+    def test_depth_limits_max_shares(self):
+        detector = PairedEntryDetector(taker_fees=False, max_cpp_after_fees=0.95)
+        opp = detector.detect(
+            _market(), 0.45, 0.45, yes_size=10, no_size=100,
+            yes_levels=[(0.45, 10), (0.55, 100)], no_levels=[(0.45, 100)],
+        )
+        assert opp.max_shares == pytest.approx(20.0)
+        assert opp.cpp_after_fees == pytest.approx(0.95)
+
+    def test_fee_cap_follows_combined_cost(self):
+        assert PairedEntryDetector().max_cpp_after_fees == pytest.approx(0.995)
+        detector = PairedEntryDetector(max_combined_cost=0.95)
+        assert detector.max_cpp_after_fees == pytest.approx(0.965)
+        assert PairedEntryDetector(max_combined_cost=0.995).max_cpp_after_fees == 1.0
+
+    def test_thin_depth_rejected(self):
+        detector = PairedEntryDetector(taker_fees=False, max_cpp_after_fees=0.95)
+        assert detector.detect(
+            _market(), 0.45, 0.45,
+            yes_levels=[(0.45, 5)], no_levels=[(0.45, 5)],
+        ) is None  # $2.25 per side < min_size_usd
+
+    def test_simulator_uses_depth_cost(self, tmp_path):
+        detector = PairedEntryDetector(taker_fees=False, max_cpp_after_fees=0.95)
+        opp = detector.detect(
+            _market(), 0.45, 0.45,
+            yes_levels=[(0.45, 10), (0.55, 100)], no_levels=[(0.45, 100)],
+        )
+        simulator = PairedEntrySimulator(paper_size_usd=100.0, data_dir=str(tmp_path))
+        trade = simulator.simulate_trade(opp)
+        assert trade.shares == pytest.approx(20.0)
+        assert trade.cost_usd == pytest.approx(19.0)
+        assert trade.guaranteed_profit == pytest.approx(1.0)
+
+
+class TestSportsScannerDepth:
+    async def test_scanner_sizes_by_vwap(self, tmp_path):
+        fetcher = ClobOrderbookFetcher(cache_ttl=0)
+
+        async def fake_fetch(tokens):
+            return {
+                "y": OrderbookSummary(best_ask=0.45, asks=((0.45, 10.0), (0.55, 100.0))),
+                "n": OrderbookSummary(best_ask=0.45, asks=((0.45, 100.0),)),
+            }
+
+        fetcher._fetch_orderbooks_uncached = fake_fetch
+        pm = MagicMock()
+        pm.can_enter.return_value = True
+        scanner = SportsPairedScanner(
+            fetcher, pm, cpp_threshold=0.96, min_hours_to_settle=0.0,
+            paper_trade_dir=str(tmp_path), paper_size_usd=50.0,
+        )
+        [opp] = await scanner.scan_markets([_market(hours=2)])
+
+        # 10 @0.90 + x @1.00 → (9 + x) / (10 + x) < 0.96 → x < 15
+        assert opp["max_shares"] == pytest.approx(25.0, rel=1e-6)
+        assert opp["cpp"] == pytest.approx(0.96, rel=1e-6)
+        record = scanner.enter_paired_position(opp, size_usd=50.0)
+        assert record["shares"] == pytest.approx(25.0, rel=1e-6)
@@ -0,0 +1,149 @@
+"""Tests for F-049: Concurrent two-leg paired execution with unwind (FakeClob)."""
+
+from __future__ import annotations
+
+import pytest
+
+from poly24h.execution.atomic_paired import PairState
+from poly24h.execution.executor import OrderExecutor, OrderStatus
+from poly24h.execution.fake_clob import FakeClob
+from poly24h.execution.kill_switch import KillSwitch
+from poly24h.execution.order_builder import Order
+from poly24h.execution.paired_engine import PairedExecutionEngine
+
+
+class RecordingClob(FakeClob):
+    """FakeClob that logs gateway calls in order (no wall-clock asserts)."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls: list[tuple] = []
+
+    async def place(self, token_id: str, side: str, price: float, size: float) -> str:
+        self.calls.append(("place", token_id))
+        order_id = await super().place(token_id, side, price, size)
+        self.calls.append(("ack", token_id))
+        return order_id
+
+    async def wait_filled(self, order_id: str, timeout: float) -> float:
+        filled = await super().wait_filled(order_id, timeout)
+        order = self.orders[order_id]
+        # A wait that ran out its timeout returns before any cancel
+        self.calls.append(("waited", order.token_id, order.cancelled))
+        return filled
+
+    async def cancel(self, order_id: str) -> float:
+        self.calls.append(("cancel", self.orders[order_id].token_id))
+        return await super().cancel(order_id)
+
+
+def _engine(clob: FakeClob, **kwargs) -> PairedExecutionEngine:
+    kwargs.setdefault("leg_timeout", 0.2)
+    kwargs.setdefault("unwind_budget", 0.2)
+    return PairedExecutionEngine(clob, **kwargs)
+
+
+async def _execute(engine: PairedExecutionEngine, shares: float = 100):
+    return await engine.execute("m1", "yes", "no", 0.45, 0.50, shares)
+
+
+class TestConcurrentLegs:
+    async def test_both_fill_commits(self):
+        clob = RecordingClob(ack_latency=0.05)
+        result = await _execute(_engine(clob))
+
+        assert result.success and result.state == PairState.COMMITTED
+        assert result.paired_shares == 100
+        # Legs go out together: both are sent before either is acked
+        assert [call[0] for call in clob.calls[:4]] == ["place", "place", "ack", "ack"]
+        assert max(result.yes.sent_at, result.no.sent_at) < min(
+            result.yes.acked_at, result.no.acked_at,
+        )
+
+    async def test_rejected_leg_cancels_peer_early(self):
+        clob = RecordingClob()
+        clob.script("no", reject="insufficient balance")
+        clob.script("yes", fill_after=None)
+        result = await _execute(_engine(clob, leg_timeout=5.0))
+
+        # YES is cancelled on the NO rejection, without running out the leg timeout
+        assert clob.calls.index(("cancel", "yes")) > clob.calls.index(("place", "no"))
+        assert ("waited", "yes", False) not in clob.calls
+        assert result.state == PairState.NONE_CONFIRMED
+        assert result.no.error == "insufficient balance"
+        assert clob.orders_for("yes")[0].cancelled
+
+
+class TestUnwind:
+    async def test_dangling_leg_unwound(self):
+        clob = FakeClob()
+        clob.script("no", fill_after=None)
+        clob.script("yes", side="SELL", fill_after=0.0)
+        result = await _execute(_engine(clob))
+
+        assert result.state == PairState.UNWOUND
+        assert result.unwound_shares == 100
+        assert result.paired_shares == 0
+        assert result.txn.unwind_attempts == 1
+        [sell] = clob.orders_for("yes", "SELL")
+        assert sell.price < 0.45
+
+    async def test_fill_racing_cancel_is_counted(self):
+        clob = FakeClob()
+        clob.script("no", fill_after=None, fill_on_cancel=40)
+        clob.script("yes", side="SELL", fill_after=0.0)
+        result = await _execute(_engine(clob))
+
+        assert result.no.filled == 40
+        assert result.paired_shares == 40
+        assert result.unwound_shares == pytest.approx(60)
+        assert clob.orders_for("yes", "SELL")[0].size == pytest.approx(60)
+
+    async def test_unwind_retries_more_aggressively(self):
+        clob = FakeClob()
+        clob.script("yes", fill_after=None)
+        clob.script("no", side="SELL", fill_after=None, fill_on_cancel=50)
+        result = await _execute(_engine(clob, unwind_budget=1.0, leg_timeout=0.05))
+
+        sells = clob.orders_for("no", "SELL")
+        assert [o.size for o in sells] == [100, 50]
+        assert sells[1].price < sells[0].price
+        assert result.state == PairState.UNWOUND
+        assert result.txn.unwind_attempts == 2
+
+    async def test_unwind_over_budget_trips_kill_switch(self, tmp_path):
+        clob = FakeClob()
+        clob.script("no", fill_after=None)
+        clob.script("yes", side="SELL", fill_after=None)
+        kill_switch = KillSwitch(kill_file=str(tmp_path / "KILL"))
+        result = await _execute(_engine(clob, kill_switch=kill_switch, unwind_budget=0.05))
+
+        assert result.halted
+        assert kill_switch.is_active
+        assert "dangling" in kill_switch.reason
+        # Next execution is blocked outright
+        blocked = await _execute(_engine(clob, kill_switch=kill_switch))
+        assert blocked.yes.error == "kill_switch_active"
+        assert not clob.orders_for("yes", "BUY")[1:]
+
+
+class TestExecutorIntegration:
+    async def test_execute_arb_async_uses_engine(self):
+        clob = FakeClob()
+        clob.script("no", fill_after=None, fill_on_cancel=30)
+        clob.script("yes", side="SELL", fill_after=0.0)
+        executor = OrderExecutor(dry_run=False, engine=_engine(clob))
+        yes = Order("yes", "BUY", 0.45, 100, 45.0)
+        no = Order("no", "BUY", 0.50, 100, 50.0)
+
+        result = await executor.execute_arb_async(yes, no, market_id="m1")
+        assert result.status == OrderStatus.PARTIAL
+        assert result.yes_filled and not result.no_filled
+
+    async def test_dry_run_falls_back_to_sync(self):
+        executor = OrderExecutor(dry_run=True, engine=_engine(FakeClob()))
+        yes = Order("yes", "BUY", 0.45, 100, 45.0)
+        no = Order("no", "BUY", 0.50, 100, 50.0)
+        result = await executor.execute_arb_async(yes, no)
+        assert result.status == OrderStatus.SUCCESS
+        assert not executor.engine.gateway.orders
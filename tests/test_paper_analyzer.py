@@ -7,9 +7,11 @@ import os
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
+from poly24h.analysis import paper_analyzer
 from poly24h.analysis.paper_analyzer import (
     AnalysisResult,
     AssetSummary,
@@ -226,6 +228,18 @@ class TestAnalyzerLoading:
 
         assert result.overall.total_trades == 0
 
+    def test_analyze_flushes_writer_only_with_pending_writes(self, tmp_path, monkeypatch):
+        writer = MagicMock(pending_writes=0)
+        monkeypatch.setattr(paper_analyzer, "get_default_writer", lambda: writer)
+        analyzer = PaperTradeAnalyzer(data_dir=str(tmp_path))
+
+        analyzer.analyze()
+        writer.flush.assert_not_called()
+
+        writer.pending_writes = 2
+        analyzer.analyze()
+        writer.flush.assert_called_once()
+
     def test_analyze_with_specific_date(self, tmp_data_dir):
         analyzer = PaperTradeAnalyzer(data_dir=str(tmp_data_dir))
         target = datetime(2026, 2, 7, tzinfo=timezone.utc)
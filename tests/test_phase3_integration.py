@@ -50,7 +50,7 @@ def sample_market():
 
 
 @pytest.fixture
-def loop_with_cache(sample_market):
+def loop_with_cache(sample_market, tmp_path):
     """Create EventDrivenLoop with a pre-populated price cache."""
     schedule = MarketOpenSchedule()
     gamma = MagicMock()
@@ -60,7 +60,9 @@ def loop_with_cache(sample_market):
     alerter = TelegramAlerter(bot_token=None, chat_id=None)
     cache = PriceCache()
 
-    loop = EventDrivenLoop(schedule, preparer, poller, alerter, price_cache=cache)
+    loop = EventDrivenLoop(
+        schedule, preparer, poller, alerter, price_cache=cache, data_dir=tmp_path,
+    )
     loop._active_markets = [sample_market]
     loop._active_token_pairs = [("yes_btc", "no_btc")]
     loop._token_to_market = {
@@ -138,7 +140,7 @@ class TestWSCacheFirstPolling:
             spread=0.97,
             timestamp=datetime.now(tz=timezone.utc),
         )
-        loop.poller.poll_once = AsyncMock(return_value=mock_snapshot)
+        loop.poller.poll_many = AsyncMock(return_value=[mock_snapshot])
 
         opps = await loop._poll_all_pairs(threshold=0.48)
 
@@ -311,7 +313,7 @@ class TestCycleEndReportPhase3:
 class TestEventDrivenLoopPhase3Init:
     """Test Phase 3 initialization of EventDrivenLoop."""
 
-    def test_default_price_cache(self):
+    def test_default_price_cache(self, tmp_path):
         """EventDrivenLoop creates default PriceCache if none provided."""
         schedule = MarketOpenSchedule()
         gamma = MagicMock()
@@ -320,11 +322,11 @@ class TestEventDrivenLoopPhase3Init:
         poller = RapidOrderbookPoller(fetcher)
         alerter = TelegramAlerter(bot_token=None, chat_id=None)
 
-        loop = EventDrivenLoop(schedule, preparer, poller, alerter)
+        loop = EventDrivenLoop(schedule, preparer, poller, alerter, data_dir=tmp_path)
         assert loop._price_cache is not None
         assert isinstance(loop._price_cache, PriceCache)
 
-    def test_injected_price_cache(self):
+    def test_injected_price_cache(self, tmp_path):
         """EventDrivenLoop uses injected PriceCache."""
         schedule = MarketOpenSchedule()
         gamma = MagicMock()
@@ -336,5 +338,6 @@ class TestEventDrivenLoopPhase3Init:
 
         loop = EventDrivenLoop(
             schedule, preparer, poller, alerter, price_cache=cache,
+            data_dir=tmp_path,
         )
         assert loop._price_cache is cache
@@ -0,0 +1,136 @@
+"""Tests for F-042: Append-only journal for PositionManager state."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from poly24h.journal import Journal
+from poly24h.position_manager import PositionManager
+
+
+def _pm(tmp_path, **kwargs) -> PositionManager:
+    return PositionManager(
+        bankroll=1000.0, max_per_market=100.0,
+        journal_path=tmp_path / "journal.jsonl", **kwargs,
+    )
+
+
+class TestJournal:
+    def test_append_and_replay_after_seq(self, tmp_path):
+        journal = Journal(tmp_path / "j.jsonl", fsync=False)
+        for i in range(3):
+            journal.append({"type": "x", "i": i})
+        assert [r["i"] for r in journal.replay(after_seq=1)] == [1, 2]
+
+        reopened = Journal(tmp_path / "j.jsonl", fsync=False)
+        assert reopened.last_seq == 3
+        assert reopened.pending == 3
+
+    def test_torn_last_line_skipped(self, tmp_path):
+        path = tmp_path / "j.jsonl"
+        journal = Journal(path, fsync=False)
+        journal.append({"type": "x"})
+        journal.close()
+        with open(path, "a") as f:
+            f.write('{"seq": 2, "type": "x", "tru')  # crash mid-write
+
+        journal = Journal(path, fsync=False)
+        journal.append({"type": "y"})
+        records = list(journal.replay())
+        assert [r["type"] for r in records] == ["x", "y"]
+
+    def test_truncate_keeps_sequence(self, tmp_path):
+        journal = Journal(tmp_path / "j.jsonl", fsync=False)
+        journal.append({"type": "x"})
+        journal.truncate()
+        assert journal.pending == 0
+        assert journal.append({"type": "y"}) == 2
+
+
+class TestPositionManagerJournal:
+    def test_restart_replays_journal(self, tmp_path):
+        state = tmp_path / "state.json"
+        pm = _pm(tmp_path)
+        pm.load_state(state)
+        pm.enter_position("m1", "Team A vs B", "YES", 0.50, "2026-02-08T02:00:00Z")
+        pm.enter_position("m2", "Team C vs D", "NO", 0.40, "2026-02-08T03:00:00Z")
+        pm.settle_position("m1", "YES")
+
+        restored = _pm(tmp_path)
+        restored.load_state(state)
+        assert restored.bankroll == pytest.approx(pm.bankroll)
+        assert restored.cumulative_pnl == pytest.approx(pm.cumulative_pnl)
+        assert restored.wins == 1
+        assert [p.market_id for p in restored.get_active_positions()] == ["m2"]
+        assert restored.can_enter("m2") is False
+
+    def test_save_state_compacts_only_periodically(self, tmp_path):
+        state = tmp_path / "state.json"
+        pm = _pm(tmp_path, compact_every=3)
+        pm.save_state(state)  # no snapshot yet → write one
+        snapshot = state.read_text()
+
+        pm.enter_position("m1", "Q1", "YES", 0.50, "")
+        pm.save_state(state)
+        assert state.read_text() == snapshot  # O(1): journal only
+
+        pm.enter_position("m2", "Q2", "YES", 0.50, "")
+        pm.enter_position("m3", "Q3", "YES", 0.50, "")
+        pm.save_state(state)
+        saved = json.loads(state.read_text())
+        assert set(saved["positions"]) == {"m1", "m2", "m3"}
+        assert (tmp_path / "journal.jsonl").read_text() == ""
+
+    def test_crash_between_snapshot_and_truncate(self, tmp_path):
+        state = tmp_path / "state.json"
+        journal_file = tmp_path / "journal.jsonl"
+        pm = _pm(tmp_path)
+        pm.enter_position("m1", "Q1", "YES", 0.50, "")
+        pending = journal_file.read_text()
+        pm.compact(state)
+        journal_file.write_text(pending)  # truncate "never happened"
+
+        restored = _pm(tmp_path)
+        restored.load_state(state)
+        assert restored.bankroll == pytest.approx(pm.bankroll)
+        assert restored.active_position_count == 1
+
+    def test_without_journal_snapshot_every_save(self, tmp_path):
+        state = tmp_path / "state.json"
+        pm = PositionManager(bankroll=1000.0, max_per_market=100.0)
+        pm.save_state(state)
+        pm.enter_position("m1", "Q1", "YES", 0.50, "")
+        pm.save_state(state)
+        assert "m1" in json.loads(state.read_text())["positions"]
+
+    def test_sync_skips_unchanged_files(self, tmp_path):
+        trades = tmp_path / "paper_trades"
+        trades.mkdir()
+        (trades / "2026-02-10.jsonl").write_text(json.dumps({
+            "market_id": "m1", "status": "open", "price": 0.5,
+            "paper_size_usd": 50.0, "paper_shares": 100.0,
+        }) + "\n")
+        state = tmp_path / "state.json"
+
+        pm = _pm(tmp_path)
+        pm.sync_from_paper_trades(trades)
+        pm.settle_position("m1", "NO")
+        pm.compact(state)
+
+        restored = _pm(tmp_path)
+        restored.load_state(state)
+        restored.sync_from_paper_trades(trades)
+        # Unchanged file is not rescanned → settled trade is not resurrected
+        assert restored.active_position_count == 0
+        assert restored.bankroll == pytest.approx(950.0)
+
+    def test_unloadable_snapshot_rewritten_on_next_save(self, tmp_path):
+        state = tmp_path / "state.json"
+        state.write_text("{not json")
+        pm = _pm(tmp_path)
+        pm.load_state(state)
+        pm.enter_position("m1", "Q1", "YES", 0.50, "")
+        pm.save_state(state)
+        assert "m1" in json.loads(state.read_text())["positions"]
@@ -115,6 +115,35 @@ class TestEnterPosition:
         assert pm.bankroll == 900.0  # No additional deduction
 
 
+class TestReservations:
+    """F-041: Slot + bankroll held while a live order is in flight."""
+
+    def test_reservation_blocks_other_entries_until_consumed(self):
+        pm = PositionManager(
+            bankroll=150.0, max_per_market=100.0, max_concurrent_positions=2,
+        )
+        assert pm.reserve("a", 100.0) == 100.0
+        assert not pm.can_enter("a")
+        assert pm.reserve("b", 100.0) == 50.0  # bankroll left after "a"
+        assert not pm.can_enter("c")  # both slots held
+
+        pos = pm.enter_position(
+            market_id="a", market_question="A", side="YES", price=0.5,
+            end_date="", size_override=80.0,
+        )
+        assert pos.size_usd == 80.0
+        assert pm.bankroll == 70.0
+
+    def test_release_frees_slot_and_bankroll(self):
+        pm = PositionManager(bankroll=100.0, max_per_market=100.0)
+        pm.reserve("a", 100.0)
+        assert pm.enter_position(
+            market_id="b", market_question="B", side="YES", price=0.5, end_date="",
+        ) is None
+        pm.release("a")
+        assert pm.can_enter("a") and pm.reserve("b", 100.0) == 100.0
+
+
 class TestSettlePosition:
     """Test position settlement mechanics."""
 
@@ -0,0 +1,115 @@
+"""Tests for F-043: PRE_OPEN warm-up seeds the orderbook cache."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from poly24h.scheduler.event_scheduler import EventDrivenLoop, RapidOrderbookPoller
+from poly24h.strategy.orderbook_scanner import ClobOrderbookFetcher, OrderbookSummary
+
+
+def _summary(ask: float) -> OrderbookSummary:
+    return OrderbookSummary(
+        best_ask=ask, best_ask_size=100.0, total_ask_depth_usd=ask * 100, ask_levels=1,
+        asks=((ask, 100.0),), bids=((ask - 0.02, 50.0),),
+    )
+
+
+def _loop(fetched: list[list[str]], data_dir: Path) -> EventDrivenLoop:
+    fetcher = ClobOrderbookFetcher(cache_ttl=0)
+
+    async def fake_fetch(tokens):
+        fetched.append(list(tokens))
+        return {t: _summary(0.45) for t in tokens}
+
+    fetcher._fetch_orderbooks_uncached = fake_fetch
+    poller = RapidOrderbookPoller(fetcher)
+    loop = EventDrivenLoop(MagicMock(), MagicMock(), poller, MagicMock(), data_dir=data_dir)
+    loop._active_token_pairs = [("y1", "n1"), ("y2", "n2")]
+    return loop
+
+
+class TestSummaryLevels:
+    def test_parse_summary_keeps_levels(self):
+        summary = ClobOrderbookFetcher._parse_summary({
+            "asks": [{"price": "0.50", "size": "10"}, {"price": "0.45", "size": "20"}],
+            "bids": [{"price": "0.40", "size": "5"}],
+        })
+        assert summary.asks == ((0.45, 20.0), (0.50, 10.0))
+        assert summary.bids == ((0.40, 5.0),)
+
+
+class TestSeeding:
+    async def test_seed_populates_cache_with_depth(self, tmp_path):
+        fetched: list[list[str]] = []
+        loop = _loop(fetched, tmp_path)
+        seeded = await loop._seed_orderbooks(["y1", "n1"])
+
+        assert seeded == 2
+        assert loop._price_cache.get_best_ask("y1") == 0.45
+        assert loop._price_cache.get_book("n1").best_bid == 0.43
+        assert loop._price_cache.orderbook_age("y1") < 1.0
+        assert loop._try_ws_cache("y1", "n1") is not None
+
+    async def test_first_tick_fetches_only_stale_tokens(self, tmp_path):
+        fetched: list[list[str]] = []
+        loop = _loop(fetched, tmp_path)
+        await loop._seed_orderbooks(["y1", "n1", "y2", "n2"])
+        # Pair 2 seeded long ago → stale by the first SNIPE tick
+        for token in ("y2", "n2"):
+            loop._price_cache.get_orderbook_entry(token).timestamp = time.time() - 60
+        fetched.clear()
+
+        loop.poller.poll_many = AsyncMock(wraps=loop.poller.poll_many)
+        await loop._poll_all_pairs(0.48)
+
+        assert loop.poller.poll_many.await_args.args[0] == [("y2", "n2")]
+        assert fetched == [["y2", "n2"]]
+
+    async def test_pre_open_refreshes_only_stale_books(self, monkeypatch, tmp_path):
+        fetched: list[list[str]] = []
+        loop = _loop(fetched, tmp_path)
+        market = MagicMock()
+        market.source.value = "hourly_crypto"
+        loop.preparer.discover_upcoming_markets = AsyncMock(return_value=[market])
+        loop.preparer.extract_token_pairs = MagicMock(return_value=[("y1", "n1"), ("y2", "n2")])
+        loop.preparer.extract_token_market_map = MagicMock(return_value={})
+        loop.schedule.is_snipe_window = MagicMock(return_value=False)
+        loop.schedule.seconds_until_open = MagicMock(side_effect=[30.0, 0.0])
+        loop._calculate_fair_values = AsyncMock()
+
+        async def fake_sleep(secs):
+            # While "waiting", WS keeps pair 1 fresh and pair 2 goes stale
+            for token in ("y2", "n2"):
+                loop._price_cache.get_orderbook_entry(token).timestamp = time.time() - 60
+
+        monkeypatch.setattr("poly24h.scheduler.event_scheduler.asyncio.sleep", fake_sleep)
+        await loop._handle_pre_open_phase(MagicMock())
+
+        assert fetched == [["y1", "n1", "y2", "n2"], ["y2", "n2"]]
+        loop.preparer.warm_clob_connection.assert_not_called()
+
+    async def test_pre_open_fair_value_failure_propagates(self, tmp_path):
+        fetched: list[list[str]] = []
+        loop = _loop(fetched, tmp_path)
+        market = MagicMock()
+        market.source.value = "nba"
+        loop.preparer.discover_upcoming_markets = AsyncMock(return_value=[market])
+        loop.preparer.extract_token_pairs = MagicMock(return_value=[("y1", "n1")])
+        loop.preparer.extract_token_market_map = MagicMock(return_value={})
+        loop._calculate_fair_values = AsyncMock(side_effect=RuntimeError("odds api down"))
+
+        with pytest.raises(RuntimeError, match="odds api down"):
+            await loop._handle_pre_open_phase(MagicMock())
+        # Seeding still ran alongside the failed calculation
+        assert fetched == [["y1", "n1"]]
+
+    async def test_stale_tokens(self, tmp_path):
+        loop = _loop([], tmp_path)
+        await loop._seed_orderbooks(["y1"])
+        assert loop._price_cache.stale_tokens(["y1", "n1"]) == ["n1"]
+        assert loop._price_cache.orderbook_age("n1") is None
@@ -0,0 +1,110 @@
+"""Tests for F-044: Exchange clock calibration + precision open timer."""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import time
+from email.utils import formatdate
+
+from aioresponses import aioresponses
+
+from poly24h.http_transport import HttpTransport
+from poly24h.precision_timer import ExchangeClock, PrecisionTimer
+from poly24h.rate_limiter import HostRateLimiter
+from poly24h.websocket.price_cache import PriceCache
+from poly24h.websocket.price_ws import PriceWebSocket
+
+BOOK_PATTERN = re.compile(r"^https://clob\.polymarket\.com/book\b")
+
+
+def _date_header(server_ts: float) -> str:
+    return formatdate(math.floor(server_ts), usegmt=True)
+
+
+class TestExchangeClock:
+    def test_http_dates_converge_on_offset(self):
+        clock = ExchangeClock()
+        true_offset = 0.3
+        for k in range(40):
+            local = 1_700_000_000.0 + k * 0.137  # varied sub-second phases
+            clock.observe_http_date(
+                _date_header(local + true_offset), local - 0.005, local + 0.005,
+            )
+        assert abs(clock.offset - true_offset) < 0.03
+        assert clock.uncertainty < 0.05
+
+    def test_single_date_is_coarse(self):
+        clock = ExchangeClock()
+        local = time.time()
+        assert clock.observe_http_date(_date_header(local), local, local + 0.01)
+        assert clock.uncertainty > 0.4
+        assert clock.observe_http_date("not a date", local, local) is False
+
+    def test_ws_timestamps_give_lower_bound(self):
+        clock = ExchangeClock()
+        now = time.time()
+        clock.observe_server_timestamp(now + 0.2, now)
+        assert abs(clock.offset - 0.2) < 1e-3
+        assert clock.uncertainty is None
+
+    def test_contradiction_resets_to_latest(self):
+        clock = ExchangeClock()
+        clock.observe_bounds(0.10, 0.12, observed_at=100.0)
+        clock.observe_bounds(0.50, 0.52, observed_at=101.0)  # clock jumped
+        assert clock.resets == 1
+        assert abs(clock.offset - 0.51) < 1e-9
+
+    def test_old_samples_expire(self):
+        clock = ExchangeClock(window_secs=10.0)
+        clock.observe_bounds(0.0, 1.0, observed_at=100.0)
+        clock.observe_bounds(0.4, 2.0, observed_at=120.0)
+        assert clock.stats()["samples"] == 1
+        assert abs(clock.offset - 1.2) < 1e-9
+
+
+class TestPrecisionTimer:
+    async def test_wakes_close_to_deadline(self):
+        timer = PrecisionTimer(ExchangeClock())
+        jitter = await timer.sleep_until(timer.clock.now() + 0.12)
+        assert -0.002 < jitter < 0.02
+        stats = timer.stats()
+        assert stats["wakeups"] == 1
+        assert stats["last_jitter_ms"] == round(jitter * 1000, 2)
+
+    async def test_deadline_in_exchange_time(self):
+        clock = ExchangeClock()
+        clock.observe_bounds(5.0, 5.0)  # exchange is 5s ahead of local
+        timer = PrecisionTimer(clock)
+        start = time.monotonic()
+        await timer.sleep_until(time.time() + 5.05)
+        assert time.monotonic() - start < 0.5
+
+    async def test_past_deadline_returns_immediately(self):
+        timer = PrecisionTimer(ExchangeClock())
+        jitter = await timer.sleep_until(timer.clock.now() - 1.0)
+        assert jitter >= 1.0
+
+
+class TestClockSources:
+    async def test_transport_samples_clob_date_header(self):
+        clock = ExchangeClock()
+        transport = HttpTransport(rate_limiter=HostRateLimiter(), clock=clock)
+        with aioresponses() as m:
+            m.get(BOOK_PATTERN, payload={}, headers={"Date": _date_header(time.time())})
+            async with transport.get("https://clob.polymarket.com/book"):
+                pass
+        assert clock.observations == 1
+        await transport.close()
+
+    def test_ws_message_timestamp_sampled(self):
+        clock = ExchangeClock()
+        ws = PriceWebSocket(PriceCache(), clock=clock)
+        ts_ms = int((time.time() + 0.25) * 1000)
+        ws._process_message(json.dumps([
+            {"event_type": "book", "asset_id": "t", "timestamp": str(ts_ms),
+             "asks": [], "bids": []},
+        ]))
+        assert clock.observations == 1
+        assert 0.2 < clock.offset < 0.3
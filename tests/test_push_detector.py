@@ -0,0 +1,223 @@
+"""Tests for F-037: Push-based opportunity detection from WS cache updates."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from poly24h.models.market import Market, MarketSource
+from poly24h.scheduler.push_detector import PushDetector, PushSignal
+from poly24h.websocket.price_cache import PriceCache
+
+
+def _signal(pair: tuple[str, str]) -> PushSignal:
+    return PushSignal(kind="snipe", pair=pair, market=None, opportunity=None)
+
+
+class _Recorder:
+    """evaluate() stand-in that records calls and emits one signal each."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, str]] = []
+
+    def __call__(self, yes_token: str, no_token: str) -> list[PushSignal]:
+        self.calls.append((yes_token, no_token))
+        return [_signal((yes_token, no_token))]
+
+
+class TestPriceCacheListeners:
+    def test_update_notifies_listener(self):
+        cache = PriceCache()
+        seen: list[str] = []
+        cache.add_listener(seen.append)
+        cache.update("tok", 0.4)
+        cache.update_orderbook("tok", 0.41, 0.39, 10.0, 10.0)
+        assert seen == ["tok", "tok"]
+
+    def test_remove_listener(self):
+        cache = PriceCache()
+        seen: list[str] = []
+        cache.add_listener(seen.append)
+        cache.remove_listener(seen.append)
+        cache.update("tok", 0.4)
+        assert seen == []
+
+    def test_failing_listener_does_not_break_update(self):
+        cache = PriceCache()
+
+        def boom(token_id: str) -> None:
+            raise RuntimeError("boom")
+
+        cache.add_listener(boom)
+        cache.update("tok", 0.4)
+        assert cache.get_price("tok") == 0.4
+
+
+class TestPushDetector:
+    async def test_update_evaluates_only_owning_market(self):
+        cache = PriceCache()
+        evaluate = _Recorder()
+        detector = PushDetector(cache, evaluate)
+        detector.set_pairs([("y1", "n1"), ("y2", "n2")])
+        detector.start()
+
+        cache.update_orderbook("n2", 0.40, 0.38, 10.0, 10.0)
+        signal = await asyncio.wait_for(detector.queue.get(), timeout=1.0)
+
+        assert evaluate.calls == [("y2", "n2")]
+        assert signal.pair == ("y2", "n2")
+
+    async def test_unknown_token_ignored(self):
+        cache = PriceCache()
+        evaluate = _Recorder()
+        detector = PushDetector(cache, evaluate)
+        detector.set_pairs([("y1", "n1")])
+        detector.start()
+
+        cache.update("other", 0.3)
+        await asyncio.sleep(0)
+        assert evaluate.calls == []
+        assert detector.stats()["updates"] == 0
+
+    async def test_same_tick_updates_coalesced(self):
+        cache = PriceCache()
+        evaluate = _Recorder()
+        detector = PushDetector(cache, evaluate)
+        detector.set_pairs([("y1", "n1")])
+        detector.start()
+
+        cache.update("y1", 0.40)
+        cache.update("n1", 0.45)
+        cache.update("y1", 0.39)
+        await asyncio.sleep(0)
+
+        assert evaluate.calls == [("y1", "n1")]
+        assert detector.stats()["updates"] == 3
+        assert detector.queue.qsize() == 1
+
+    async def test_full_queue_drops_oldest(self):
+        cache = PriceCache()
+        detector = PushDetector(cache, _Recorder(), maxsize=2)
+        detector.set_pairs([("a", "b"), ("c", "d"), ("e", "f")])
+        detector.start()
+
+        for token in ("a", "c", "e"):
+            cache.update(token, 0.4)
+            await asyncio.sleep(0)
+
+        assert detector.stats()["dropped"] == 1
+        first = detector.queue.get_nowait()
+        assert first.pair == ("c", "d")
+
+    async def test_stop_detaches_and_clears(self):
+        cache = PriceCache()
+        evaluate = _Recorder()
+        detector = PushDetector(cache, evaluate)
+        detector.set_pairs([("y1", "n1")])
+        detector.start()
+        cache.update("y1", 0.4)
+        await asyncio.sleep(0)
+
+        detector.stop()
+        assert detector.queue.empty()
+        cache.update("y1", 0.3)
+        await asyncio.sleep(0)
+        assert len(evaluate.calls) == 1
+
+    async def test_evaluate_error_is_contained(self):
+        cache = PriceCache()
+
+        def broken(yes_token: str, no_token: str) -> list[PushSignal]:
+            raise ValueError("bad book")
+
+        detector = PushDetector(cache, broken)
+        detector.set_pairs([("y1", "n1")])
+        detector.start()
+        cache.update("y1", 0.4)
+        await asyncio.sleep(0)
+        assert detector.stats()["evaluations"] == 1
+        assert detector.queue.empty()
+
+
+class TestEventLoopPush:
+    def _loop(self, data_dir):
+        from poly24h.scheduler.event_scheduler import EventDrivenLoop
+
+        market = Market(
+            id="mkt_btc",
+            question="Will BTC be above $100,000 at 2pm UTC?",
+            source=MarketSource.HOURLY_CRYPTO,
+            yes_token_id="y",
+            no_token_id="n",
+            yes_price=0.45,
+            no_price=0.50,
+            liquidity_usd=10000.0,
+            end_date=datetime.now(tz=timezone.utc) + timedelta(hours=1),
+            event_id="evt_btc",
+            event_title="BTC Hourly",
+        )
+        loop = EventDrivenLoop(
+            MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+            ws_manager=MagicMock(),
+            data_dir=data_dir,
+        )
+        loop._active_token_pairs = [("y", "n")]
+        loop._token_to_market = {"y": market, "n": market}
+        loop._push_detector.set_pairs(loop._active_token_pairs)
+        return loop, market
+
+    async def test_paired_push_signal_consumed_once(self, tmp_path):
+        loop, market = self._loop(tmp_path)
+        loop._push_detector.start()
+        cache = loop._price_cache
+
+        cache.apply_book_snapshot("y", [(0.40, 500.0)], [])
+        cache.apply_book_snapshot("n", [(0.45, 500.0)], [])
+        # A later tick on the same market must not re-enter the pair
+        await asyncio.sleep(0)
+        cache.apply_price_change("y", "SELL", 0.39, 500.0)
+
+        processed = await loop._consume_push_signals(0.05, seconds_since_open=5.0)
+
+        assert processed == 1
+        assert len(loop._pending_opps) == 1
+        opp, pending_market, _paper = loop._pending_opps[0]
+        assert opp.trigger_side == "PAIRED"
+        assert pending_market is market
+        assert loop._push_signals_consumed == 1
+        loop._push_detector.stop()
+
+    async def test_push_evaluation_defers_edge_to_consumer(self, tmp_path):
+        from poly24h.scheduler.event_scheduler import RapidOrderbookPoller
+
+        loop, market = self._loop(tmp_path)
+        market.source = MarketSource.NBA
+        loop.poller = RapidOrderbookPoller(MagicMock())
+        loop._market_fair_values[market.id] = 0.60
+        loop._push_threshold = 0.48
+        loop._price_cache.apply_book_snapshot("y", [(0.45, 500.0)], [])
+        loop._price_cache.apply_book_snapshot("n", [(0.55, 500.0)], [])
+
+        signals = loop._evaluate_pair_push("y", "n")
+
+        assert [s.kind for s in signals] == ["snipe"]
+        assert abs(signals[0].edge - 0.15) < 1e-9
+        # Evaluation on the WS hot path must not touch edge bookkeeping
+        assert loop._market_edges == {}
+
+        loop._record_paper_trade = MagicMock(return_value={})
+        loop._push_detector.queue.put_nowait(signals[0])
+        await loop._consume_push_signals(0.01, seconds_since_open=5.0)
+        assert abs(loop._market_edges[market.id] - 0.15) < 1e-9
+
+    async def test_stale_only_poll_skips_fresh_pairs(self, tmp_path):
+        loop, _market = self._loop(tmp_path)
+        loop._price_cache.apply_book_snapshot("y", [(0.40, 500.0)], [])
+        loop._price_cache.apply_book_snapshot("n", [(0.45, 500.0)], [])
+        loop.poller = MagicMock()
+
+        results = await loop._poll_all_pairs(0.48, "SNIPE", stale_only=True)
+
+        assert results == []
+        loop.poller.poll_many.assert_not_called()
@@ -0,0 +1,147 @@
+"""Tests for F-040: Adaptive per-host token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+
+from aioresponses import aioresponses
+
+from poly24h.http_transport import HttpTransport
+from poly24h.rate_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_SNIPE,
+    HostLimit,
+    HostRateLimiter,
+    TokenBucket,
+    priority_scope,
+    request_priority,
+)
+
+BOOK_PATTERN = re.compile(r"^https://clob\.polymarket\.com/book\b")
+
+
+def _bucket(rate: float = 100.0, burst: float = 2.0, **kwargs) -> TokenBucket:
+    return TokenBucket(
+        HostLimit(rate=rate, burst=burst, min_rate=1.0, max_rate=rate * 2), **kwargs,
+    )
+
+
+class TestTokenBucket:
+    async def test_burst_then_rate_limited(self):
+        bucket = _bucket(rate=50.0, burst=2.0)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        elapsed = time.monotonic() - start
+        assert elapsed >= 0.015  # third token needs ~1/50s of refill
+        assert bucket.acquired == 3
+        assert bucket.waited == 1
+
+    async def test_priority_lane_served_first(self):
+        bucket = _bucket(rate=100.0, burst=1.0)
+        bucket.on_rate_limited(retry_after=0.02)
+        order: list[str] = []
+
+        async def take(name: str, priority: int) -> None:
+            await bucket.acquire(priority)
+            order.append(name)
+
+        background = [
+            asyncio.create_task(take(f"bg{i}", PRIORITY_BACKGROUND)) for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        snipe = asyncio.create_task(take("snipe", PRIORITY_SNIPE))
+        await asyncio.gather(*background, snipe)
+        assert order[0] == "snipe"
+        assert order[1:] == ["bg0", "bg1", "bg2"]
+
+    async def test_pause_blocks_until_retry_after(self):
+        bucket = _bucket(rate=1000.0, burst=10.0)
+        bucket.on_rate_limited(retry_after=0.05)
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.045
+
+    async def test_cancelled_waiter_skipped(self):
+        bucket = _bucket(rate=100.0, burst=1.0)
+        bucket.on_rate_limited(retry_after=0.02)
+        cancelled = asyncio.create_task(bucket.acquire(PRIORITY_SNIPE))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.wait_for(bucket.acquire(PRIORITY_BACKGROUND), timeout=1.0)
+        assert bucket.acquired == 1
+
+    def test_aimd_adjustment(self):
+        bucket = _bucket(rate=10.0, increase_step=1.0, decrease_factor=0.5)
+        bucket.on_success()
+        assert bucket.rate == 11.0
+        for _ in range(20):
+            bucket.on_success()
+        assert bucket.rate == bucket.max_rate == 20.0
+        bucket.on_rate_limited(retry_after=None, pause=False)
+        assert bucket.rate == 10.0
+        for _ in range(10):
+            bucket.on_rate_limited(retry_after=0.0)
+        assert bucket.rate == bucket.min_rate
+
+
+class TestHostRateLimiter:
+    async def test_unknown_host_unlimited_until_429(self):
+        limiter = HostRateLimiter(limits={})
+        await limiter.acquire("example.com")
+        assert limiter.bucket("example.com") is None
+        limiter.on_rate_limited("example.com", retry_after=0.0)
+        assert limiter.bucket("example.com") is not None
+        assert limiter.stats()["example.com"]["rate_limited"] == 1
+
+    async def test_priority_taken_from_context(self):
+        limiter = HostRateLimiter(
+            limits={"h": HostLimit(rate=100.0, burst=1.0, min_rate=1.0, max_rate=100.0)},
+        )
+        limiter.on_rate_limited("h", retry_after=0.02)
+        order: list[str] = []
+
+        async def background() -> None:
+            request_priority.set(PRIORITY_BACKGROUND)
+            await limiter.acquire("h")
+            order.append("bg")
+
+        async def snipe() -> None:
+            with priority_scope(PRIORITY_SNIPE):
+                await limiter.acquire("h")
+            order.append("snipe")
+
+        bg = asyncio.create_task(background())
+        await asyncio.sleep(0)
+        await asyncio.gather(bg, snipe())
+        assert order == ["snipe", "bg"]
+
+
+class TestTransportIntegration:
+    async def test_429_lowers_host_rate(self):
+        limiter = HostRateLimiter()
+        transport = HttpTransport(rate_limiter=limiter)
+        start_rate = limiter.bucket("clob.polymarket.com").rate
+        with aioresponses() as m:
+            m.get(BOOK_PATTERN, status=429, headers={"Retry-After": "0"})
+            m.get(BOOK_PATTERN, payload={})
+            async with transport.get("https://clob.polymarket.com/book") as resp:
+                assert resp.status == 200
+        bucket = limiter.bucket("clob.polymarket.com")
+        # halved on 429, then one additive step on the successful retry
+        assert bucket.rate < start_rate
+        assert transport.stats()["limits"]["clob.polymarket.com"]["rate_limited"] == 1
+        await transport.close()
+
+    async def test_success_raises_rate(self):
+        limiter = HostRateLimiter()
+        transport = HttpTransport(rate_limiter=limiter)
+        start_rate = limiter.bucket("clob.polymarket.com").rate
+        with aioresponses() as m:
+            m.get(BOOK_PATTERN, payload={})
+            async with transport.get("https://clob.polymarket.com/book"):
+                pass
+        assert limiter.bucket("clob.polymarket.com").rate > start_rate
+        await transport.close()
@@ -0,0 +1,164 @@
+"""Tests for F-051: Staged SportsMonitor.scan_and_trade pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from poly24h.models.market import Market, MarketSource
+from poly24h.position_manager import PositionManager
+from poly24h.strategy.sport_config import NBA_CONFIG
+from poly24h.strategy.sports_monitor import SportsMonitor
+
+NOW = datetime.now(timezone.utc)
+
+
+def _market(market_id: str, hours: float = 6.0, question: str = "") -> Market:
+    return Market(
+        id=market_id, question=question or f"Game {market_id} O/U 220.5",
+        source=MarketSource.NBA,
+        yes_token_id=f"yes_{market_id}", no_token_id=f"no_{market_id}",
+        yes_price=0.5, no_price=0.5, liquidity_usd=10_000.0,
+        end_date=NOW + timedelta(hours=hours),
+        event_id=f"e_{market_id}", event_title=market_id,
+    )
+
+
+def _monitor(tmp_path, markets, fair_probs, asks, max_daily=100.0, **kwargs):
+    pm = PositionManager(bankroll=1000.0, max_per_market=20.0, max_daily_deployment_usd=max_daily)
+    scanner = MagicMock()
+    scanner.discover_sport_markets = AsyncMock(return_value=markets)
+    scanner.client.open = AsyncMock()
+    odds = MagicMock()
+    odds.fetch_odds = AsyncMock(return_value=[])
+    odds.get_fair_prob_for_market.side_effect = (
+        lambda m, games, sport_config=None: fair_probs.get(m.id)
+    )
+    fetcher = MagicMock()
+    fetcher.fetch_best_asks_batch = AsyncMock(
+        side_effect=lambda tokens: {t: asks.get(t) for t in tokens},
+    )
+    monitor = SportsMonitor(
+        sport_config=NBA_CONFIG, odds_client=odds, market_scanner=scanner,
+        position_manager=pm, orderbook_fetcher=fetcher, rate_limiter=None,
+        state_path=tmp_path / "position_manager_state.json", **kwargs,
+    )
+    return monitor, pm, fetcher
+
+
+class TestRanking:
+    async def test_enters_best_edge_first_and_reports_stages(self, tmp_path):
+        markets = [_market("small"), _market("big"), _market("mid")]
+        asks = {
+            "yes_small": 0.53, "no_small": 0.50,  # YES edge 7%
+            "yes_big": 0.40, "no_big": 0.62,      # YES edge 20%
+            "yes_mid": 0.50, "no_mid": 0.52,      # YES edge 10%
+        }
+        monitor, pm, _ = _monitor(
+            tmp_path,
+            markets, {m.id: 0.60 for m in markets}, asks, max_daily=40.0,
+        )
+        stats = await monitor.scan_and_trade()
+
+        assert stats["edges_found"] == 3
+        assert set(pm._positions) == {"big", "mid"}
+        assert set(stats["stage_ms"]) == {
+            "discover", "odds", "prefilter", "quotes", "rank", "enter",
+        }
+        assert monitor.last_stage_ms is stats["stage_ms"]
+
+    async def test_settlement_tier_beats_edge(self, tmp_path):
+        markets = [_market("far_big", hours=24 * 10), _market("near_small", hours=5)]
+        asks = {
+            "yes_far_big": 0.30, "no_far_big": 0.72,
+            "yes_near_small": 0.53, "no_near_small": 0.5,
+        }
+        monitor, pm, _ = _monitor(
+            tmp_path, markets, {m.id: 0.60 for m in markets}, asks, max_daily=20.0,
+        )
+        await monitor.scan_and_trade()
+        assert set(pm._positions) == {"near_small"}
+
+
+class TestQuotes:
+    async def test_prefilter_runs_before_any_fetch(self, tmp_path):
+        gate = MagicMock()
+        gate.is_validated.return_value = False
+        markets = [_market("ok"), _market("nofair"), _market("ml", question="Will LAL win?")]
+        monitor, _, fetcher = _monitor(
+            tmp_path,
+            markets, {"ok": 0.6, "ml": 0.6}, {}, moneyline_gate=gate,
+        )
+        stats = await monitor.scan_and_trade()
+
+        assert stats["matched"] == 1
+        fetcher.fetch_best_asks_batch.assert_awaited_once_with(["yes_ok", "no_ok"])
+
+    async def test_chunks_fetched_concurrently_within_bound(self, tmp_path):
+        markets = [_market(f"m{i}") for i in range(7)]
+        monitor, pm, fetcher = _monitor(
+            tmp_path,
+            markets, {m.id: 0.60 for m in markets}, {}, max_quote_concurrency=2,
+        )
+        monitor.QUOTE_CHUNK_MARKETS = 2
+        in_flight = peak = 0
+
+        async def slow_fetch(tokens):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "yes_m0" in tokens:
+                raise RuntimeError("boom")
+            return {t: (0.45 if t.startswith("yes") else 0.60) for t in tokens}
+
+        fetcher.fetch_best_asks_batch = AsyncMock(side_effect=slow_fetch)
+        stats = await monitor.scan_and_trade()
+
+        assert fetcher.fetch_best_asks_batch.await_count == 4
+        assert peak == 2
+        # The failed chunk (m0, m1) is skipped; the rest still trade
+        assert stats["edges_found"] == 5
+        assert "m0" not in pm._positions and "m2" in pm._positions
+
+
+class TestLiveEntry:
+    """F-041: try_enter reserves before awaiting the live order."""
+
+    def _executor(self, results):
+        executor = MagicMock(dry_run=False)
+        release = asyncio.Event()
+
+        async def submit(**kwargs):
+            await release.wait()
+            return results.pop(0)
+
+        executor.submit_order_async = AsyncMock(side_effect=submit)
+        return executor, release
+
+    async def test_concurrent_entries_cannot_overcommit(self, tmp_path):
+        executor, release = self._executor([{"success": True, "fill_price": 0.40}] * 2)
+        monitor, pm, _ = _monitor(tmp_path, [], {}, {}, sport_executor=executor)
+        pm._max_concurrent_positions = 1
+
+        entries = [
+            asyncio.create_task(monitor.try_enter(_market(mid), "YES", 0.40, 0.2))
+            for mid in ("a", "b")
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*entries)
+
+        assert executor.submit_order_async.await_count == 1
+        assert [r is not None for r in results] == [True, False]
+        assert set(pm._positions) == {"a"}
+
+    async def test_failed_order_releases_reservation(self, tmp_path):
+        executor, release = self._executor([{"success": False, "error": "rejected"}])
+        release.set()
+        monitor, pm, _ = _monitor(tmp_path, [], {}, {}, sport_executor=executor)
+
+        assert await monitor.try_enter(_market("a"), "YES", 0.40, 0.2) is None
+        assert pm.can_enter("a") and pm.bankroll == 1000.0
@@ -82,6 +82,11 @@ class TestPaperSettlementTracker:
             end_date="2025-01-15T13:00:00+00:00",
         )
 
+    def test_store_opened_on_first_use(self, tracker, sample_trade):
+        assert not tracker.data_dir.exists()
+        tracker.record_trade(sample_trade)
+        assert (tracker.data_dir / "trades.db").exists()
+
     def test_record_and_load(self, tracker, sample_trade):
         tracker.record_trade(sample_trade)
         trades = tracker.load_trades()
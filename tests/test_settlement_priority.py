@@ -38,7 +38,17 @@ def _make_market(
     )
 
 
-def _make_monitor(max_daily: float = 100.0, max_per_market: float = 20.0):
+def _batch_asks(yes_ask, no_ask):
+    """fetch_best_asks_batch side effect: every (YES, NO) token pair gets the same asks."""
+    async def _fetch(token_ids):
+        return {
+            token: (yes_ask if i % 2 == 0 else no_ask)
+            for i, token in enumerate(token_ids)
+        }
+    return _fetch
+
+
+def _make_monitor(tmp_path, max_daily: float = 100.0, max_per_market: float = 20.0):
     """Helper: SportsMonitor + mocked dependencies."""
     from poly24h.position_manager import PositionManager
 
@@ -60,6 +70,7 @@ def _make_monitor(max_daily: float = 100.0, max_per_market: float = 20.0):
         position_manager=pm,
         orderbook_fetcher=fetcher,
         rate_limiter=rate_limiter,
+        state_path=tmp_path / "position_manager_state.json",
     )
 
     return monitor, pm, odds_client, scanner, fetcher, rate_limiter
@@ -72,13 +83,14 @@ class TestSettlementPriority:
     """F-028: 24H 이내 정산 마켓 우선 배치."""
 
     @pytest.mark.asyncio
-    async def test_24h_markets_entered_before_30d(self):
+    async def test_24h_markets_entered_before_30d(self, tmp_path):
         """24H 마켓이 30일 마켓보다 먼저 진입.
 
         마켓 발견 순서: [30일, 24H, 30일, 24H]
         기대 진입 순서: 24H 마켓 먼저.
         """
         monitor, pm, odds_client, scanner, fetcher, rate_limiter = _make_monitor(
+            tmp_path,
             max_daily=40.0,  # $40 한도 → 2개만 진입 가능
         )
 
@@ -103,7 +115,7 @@ class TestSettlementPriority:
         odds_client.get_fair_prob_for_market.return_value = 0.60  # edge for NO side
 
         # Mock: fetcher → 동일 가격
-        fetcher.fetch_best_asks = AsyncMock(return_value=(0.55, 0.55))
+        fetcher.fetch_best_asks_batch = AsyncMock(side_effect=_batch_asks(0.55, 0.55))
 
         stats = await monitor.scan_and_trade()
 
@@ -121,9 +133,10 @@ class TestSettlementPriority:
         assert "far2" not in entered_ids, "25D market should NOT be entered"
 
     @pytest.mark.asyncio
-    async def test_preserves_edge_filter(self):
+    async def test_preserves_edge_filter(self, tmp_path):
         """정렬 후에도 edge 없는 마켓은 스킵."""
         monitor, pm, odds_client, scanner, fetcher, rate_limiter = _make_monitor(
+            tmp_path,
             max_daily=100.0,
         )
 
@@ -145,7 +158,7 @@ class TestSettlementPriority:
             return 0.60
 
         odds_client.get_fair_prob_for_market.side_effect = mock_fair_prob
-        fetcher.fetch_best_asks = AsyncMock(return_value=(0.55, 0.55))
+        fetcher.fetch_best_asks_batch = AsyncMock(side_effect=_batch_asks(0.55, 0.55))
 
         stats = await monitor.scan_and_trade()
 
@@ -153,9 +166,10 @@ class TestSettlementPriority:
         assert "hasedge" in pm._positions
 
     @pytest.mark.asyncio
-    async def test_daily_cap_with_settlement_priority(self):
+    async def test_daily_cap_with_settlement_priority(self, tmp_path):
         """daily cap $60일 때 24H 마켓 3개($60) 우선, 30일 마켓 차단."""
         monitor, pm, odds_client, scanner, fetcher, rate_limiter = _make_monitor(
+            tmp_path,
             max_daily=60.0,
             max_per_market=20.0,
         )
@@ -175,7 +189,7 @@ class TestSettlementPriority:
         rate_limiter.can_fetch.return_value = True
         odds_client.fetch_odds = AsyncMock(return_value=[])
         odds_client.get_fair_prob_for_market.return_value = 0.60
-        fetcher.fetch_best_asks = AsyncMock(return_value=(0.55, 0.55))
+        fetcher.fetch_best_asks_batch = AsyncMock(side_effect=_batch_asks(0.55, 0.55))
 
         stats = await monitor.scan_and_trade()
 
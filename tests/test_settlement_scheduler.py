@@ -0,0 +1,119 @@
+"""Tests for F-054: End-date-ordered settlement with concurrent resolution."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from poly24h.monitoring.settlement import PaperSettlementTracker, PaperTrade
+
+T0 = datetime(2026, 2, 11, 20, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self, now: datetime):
+        self.now = now.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _trade(market_id: str, end: datetime) -> PaperTrade:
+    return PaperTrade(
+        market_id=market_id, market_question=f"Q {market_id}", market_source="nba",
+        side="YES", price=0.5, shares=20.0, cost=10.0,
+        timestamp=T0.isoformat(), end_date=end.isoformat(),
+    )
+
+
+def _tracker(tmp_path, clock, winners: dict, **kwargs) -> tuple[PaperSettlementTracker, list]:
+    tracker = PaperSettlementTracker(data_dir=str(tmp_path), clock=clock, **kwargs)
+    queried: list[str] = []
+    in_flight = peak = 0
+
+    async def query(market_id: str) -> str:
+        nonlocal in_flight, peak
+        queried.append(market_id)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        outcome = winners.get(market_id, "pending")
+        return outcome.pop(0) if isinstance(outcome, list) else outcome
+
+    tracker.query_market_result = query
+    tracker.peak = lambda: peak
+    return tracker, queried
+
+
+class TestDueOrder:
+    async def test_only_due_markets_are_queried(self, tmp_path):
+        clock = FakeClock(T0)
+        tracker, queried = _tracker(tmp_path, clock, {"1": "YES", "2": "NO"})
+        tracker.record_trade(_trade("1", T0 + timedelta(hours=1)))
+        tracker.record_trade(_trade("2", T0 + timedelta(hours=3)))
+
+        summary = await tracker.check_and_settle()
+        assert queried == [] and summary.total_open == 2
+        assert tracker.seconds_until_next_due() == 3600 + 300
+
+        clock.now += 3600 + 300
+        summary = await tracker.check_and_settle()
+        assert queried == ["1"]
+        assert (summary.newly_settled, summary.total_open, summary.wins) == (1, 1, 1)
+
+        clock.now += 2 * 3600
+        summary = await tracker.check_and_settle()
+        assert queried == ["1", "2"]
+        assert (summary.total_settled, summary.losses) == (2, 1)
+        assert tracker.seconds_until_next_due() is None
+
+    async def test_due_markets_resolved_concurrently_within_bound(self, tmp_path):
+        clock = FakeClock(T0 + timedelta(days=1))
+        tracker, queried = _tracker(
+            tmp_path, clock, {str(i): "YES" for i in range(10)}, max_concurrency=3,
+        )
+        for i in range(10):
+            tracker.record_trade(_trade(str(i), T0))
+
+        summary = await tracker.check_and_settle()
+        assert summary.newly_settled == 10
+        assert tracker.peak() == 3
+
+
+class TestRetry:
+    async def test_pending_markets_back_off_exponentially(self, tmp_path):
+        clock = FakeClock(T0 + timedelta(hours=1))
+        tracker, queried = _tracker(
+            tmp_path, clock, {"1": ["pending", "unknown", "YES"]},
+            retry_base_secs=60, retry_max_secs=100,
+        )
+        tracker.record_trade(_trade("1", T0))
+
+        summary = await tracker.check_and_settle()
+        assert summary.total_expired == 1
+        assert tracker.seconds_until_next_due() == 60
+
+        clock.now += 59
+        await tracker.check_and_settle()
+        assert len(queried) == 1
+
+        clock.now += 1
+        await tracker.check_and_settle()
+        assert tracker.seconds_until_next_due() == 100  # 120 capped
+
+        clock.now += 100
+        summary = await tracker.check_and_settle()
+        assert (len(queried), summary.newly_settled, summary.total_expired) == (3, 1, 0)
+        assert tracker.load_trades()[0].status == "settled"
+
+    async def test_run_wakes_on_new_trades(self, tmp_path):
+        clock = FakeClock(T0 + timedelta(hours=1))
+        tracker, _ = _tracker(tmp_path, clock, {"1": "YES"})
+        settled = asyncio.Event()
+        task = asyncio.create_task(tracker.run(on_settled=lambda s: settled.set()))
+        await asyncio.sleep(0.01)
+
+        tracker.record_trade(_trade("1", T0))
+        await asyncio.wait_for(settled.wait(), timeout=1.0)
+        task.cancel()
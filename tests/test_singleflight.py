@@ -0,0 +1,246 @@
+"""Tests for F-039: Single-flight request coalescing + short-TTL cache."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+
+from aioresponses import aioresponses
+
+from poly24h.discovery.gamma_client import GammaClient
+from poly24h.scheduler.event_scheduler import EventDrivenLoop
+from poly24h.singleflight import RequestCoalescer
+from poly24h.strategy.orderbook_scanner import (
+    DEFAULT_BOOK_CACHE_TTL,
+    ClobOrderbookFetcher,
+    OrderbookSummary,
+)
+
+BOOKS_PATTERN = re.compile(r"^https://clob\.polymarket\.com/books\b")
+EVENTS_PATTERN = re.compile(r"^https://gamma-api\.polymarket\.com/events\b")
+
+
+class TestRequestCoalescer:
+    async def test_concurrent_calls_share_one_execution(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"ok": True}
+
+        results = await asyncio.gather(*(coalescer.do("k", fetch) for _ in range(5)))
+        assert calls == 1
+        assert all(r == {"ok": True} for r in results)
+        assert coalescer.stats()["coalesced"] == 4
+        assert coalescer.saved == 4
+
+    async def test_no_cache_without_ttl(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await coalescer.do("k", fetch) == 1
+        assert await coalescer.do("k", fetch) == 2
+
+    async def test_ttl_cache_hit_and_expiry(self):
+        coalescer = RequestCoalescer(ttl=0.05)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await coalescer.do("k", fetch) == 1
+        assert await coalescer.do("k", fetch) == 1
+        assert coalescer.cache_hits == 1
+        await asyncio.sleep(0.06)
+        assert await coalescer.do("k", fetch) == 2
+
+    async def test_uncacheable_result_not_stored(self):
+        coalescer = RequestCoalescer(ttl=10.0)
+
+        async def fetch():
+            return None
+
+        await coalescer.do("k", fetch)
+        await coalescer.do("k", fetch)
+        assert coalescer.executed == 2
+
+    async def test_error_propagates_to_waiters(self):
+        coalescer = RequestCoalescer()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            coalescer.do("k", fetch), coalescer.do("k", fetch),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        assert coalescer.stats()["inflight"] == 0
+
+    async def test_owner_cancel_does_not_cancel_waiter(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        owner = asyncio.create_task(coalescer.do("k", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(coalescer.do("k", fetch))
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        assert await waiter == 2
+        assert owner.cancelled()
+        assert coalescer.executed == 2
+        assert coalescer.stats()["inflight"] == 0
+
+    async def test_do_many_owner_cancel_refetches_for_waiter(self):
+        coalescer = RequestCoalescer()
+        requested: list[list[str]] = []
+
+        async def fetch_many(keys):
+            requested.append(list(keys))
+            await asyncio.sleep(0.01)
+            return {k: k.upper() for k in keys}
+
+        owner = asyncio.create_task(coalescer.do_many(["a", "b"], fetch_many))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(coalescer.do_many(["b"], fetch_many))
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        assert await waiter == {"b": "B"}
+        assert requested == [["a", "b"], ["b"]]
+
+    async def test_do_many_only_fetches_missing_keys(self):
+        coalescer = RequestCoalescer(ttl=10.0)
+        requested: list[list[str]] = []
+
+        async def fetch_many(keys):
+            requested.append(list(keys))
+            await asyncio.sleep(0.01)
+            return {k: k.upper() for k in keys}
+
+        first = asyncio.create_task(coalescer.do_many(["a", "b"], fetch_many))
+        await asyncio.sleep(0)
+        second = await coalescer.do_many(["b", "c"], fetch_many)
+        assert second == {"b": "B", "c": "C"}
+        assert await first == {"a": "A", "b": "B"}
+        assert requested == [["a", "b"], ["c"]]
+
+        cached = await coalescer.do_many(["a", "c"], fetch_many)
+        assert cached == {"a": "A", "c": "C"}
+        assert len(requested) == 2
+        assert coalescer.stats()["saved"] == 3
+
+    async def test_max_entries_evicts_oldest(self):
+        coalescer = RequestCoalescer(ttl=10.0, max_entries=2)
+
+        async def fetch_many(keys):
+            return {k: k for k in keys}
+
+        await coalescer.do_many(["a", "b", "c"], fetch_many)
+        assert coalescer.stats()["cached"] == 2
+        coalescer.invalidate()
+        assert coalescer.stats()["cached"] == 0
+
+
+class TestFetcherCoalescing:
+    async def test_concurrent_fetches_share_request(self):
+        fetcher = ClobOrderbookFetcher()
+        requested: list[list[str]] = []
+
+        async def fake_fetch(tokens):
+            requested.append(list(tokens))
+            await asyncio.sleep(0.01)
+            return {t: OrderbookSummary(best_ask=0.4) for t in tokens}
+
+        fetcher._fetch_orderbooks_uncached = fake_fetch
+        a, b = await asyncio.gather(
+            fetcher.fetch_best_asks("y", "n"),
+            fetcher.fetch_best_asks_batch(["y", "n", "z"]),
+        )
+        assert a == (0.4, 0.4)
+        assert b == {"y": 0.4, "n": 0.4, "z": 0.4}
+        assert requested == [["y", "n"], ["z"]]
+        assert fetcher.coalesce_stats()["coalesced"] == 2
+
+    async def test_books_cached_for_ttl(self):
+        fetcher = ClobOrderbookFetcher(cache_ttl=10.0)
+        book = {"asset_id": "y", "asks": [{"price": "0.40", "size": "10"}]}
+        with aioresponses() as m:
+            m.post(BOOKS_PATTERN, payload=[book])
+            first = await fetcher.fetch_best_asks_batch(["y"])
+            # Second call must not hit the network (no second mock registered)
+            second = await fetcher.fetch_best_asks_batch(["y"])
+        assert first == second == {"y": 0.40}
+        assert fetcher.coalesce_stats()["cache_hits"] == 1
+
+    def test_default_ttl_shorter_than_fastest_snipe_poll(self):
+        assert DEFAULT_BOOK_CACHE_TTL < EventDrivenLoop.SNIPE_ULTRA_EARLY_INTERVAL
+
+    async def test_empty_books_not_cached(self):
+        fetcher = ClobOrderbookFetcher(cache_ttl=10.0)
+
+        async def fake_fetch(tokens):
+            return {t: OrderbookSummary() for t in tokens}
+
+        fetcher._fetch_orderbooks_uncached = fake_fetch
+        await fetcher.fetch_best_asks_batch(["y"])
+        await fetcher.fetch_best_asks_batch(["y"])
+        assert fetcher.coalesce_stats()["executed"] == 2
+
+
+class TestGammaCoalescing:
+    async def test_identical_gets_coalesced(self):
+        client = GammaClient()
+        requests: list[dict] = []
+
+        async def slow_get(url, params):
+            requests.append(params)
+            await asyncio.sleep(0.01)
+            return [{"id": "e1"}]
+
+        client._get_list_uncached = slow_get
+        a, b = await asyncio.gather(
+            client.fetch_events_by_tag_slug("1H"),
+            client.fetch_events_by_tag_slug("1H"),
+        )
+        assert a == b == [{"id": "e1"}]
+        assert len(requests) == 1
+        assert client.coalesce_stats()["coalesced"] == 1
+
+    async def test_orderbook_lookup_cached(self):
+        book = {"asks": [{"price": "0.40", "size": "10"}]}
+        with aioresponses() as m:
+            m.get(re.compile(r"^https://gamma-api\.polymarket\.com/book\b"), payload=book)
+            async with GammaClient() as client:
+                first = await client.fetch_orderbook("tok")
+                second = await client.fetch_orderbook("tok")
+        assert first == second == book
+        assert client.coalesce_stats()["cache_hits"] == 1
+
+    async def test_different_params_not_coalesced(self):
+        with aioresponses() as m:
+            m.get(EVENTS_PATTERN, payload=[{"id": "e1"}], repeat=True)
+            async with GammaClient() as client:
+                await asyncio.gather(
+                    client.fetch_events_by_tag_slug("1H"),
+                    client.fetch_events_by_tag_slug("4H"),
+                )
+        assert client.coalesce_stats()["executed"] == 2
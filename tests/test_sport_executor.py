@@ -5,10 +5,11 @@ F-030: ClobClient를 통한 단일 사이드 오더 제출.
 F-031: 폴링, 취소, 재시도, 슬리피지, 킬스위치, 타임아웃.
 """
 
+import asyncio
 import logging
 import os
 import time
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -229,13 +230,13 @@ class TestRetryLogic:
 class TestKillSwitch:
     """F-031: Kill switch integration blocks orders."""
 
-    def test_kill_switch_blocks_order(self):
+    def test_kill_switch_blocks_order(self, tmp_path):
         """킬 스위치 활성 시 오더 미제출, success=False."""
         from poly24h.execution.kill_switch import KillSwitch
         from poly24h.execution.sport_executor import SportExecutor
 
         mock_client = MagicMock()
-        kill_switch = KillSwitch(kill_file="data/TEST_KILL_SWITCH_NONEXISTENT")
+        kill_switch = KillSwitch(kill_file=str(tmp_path / "KILL"))
         kill_switch.activate("Test kill")
 
         executor = SportExecutor(
@@ -307,3 +308,116 @@ class TestResponseValidation:
         assert result is not None
         assert result["success"] is False
         assert "error" in result
+
+
+class TestAsyncSubmission:
+    """F-041: Non-blocking async order path."""
+
+    @staticmethod
+    def _slow_client(delay: float = 0.05) -> MagicMock:
+        """ClobClient whose calls block the calling thread for ``delay``."""
+
+        def slow(result):
+            def call(*args, **kwargs):
+                time.sleep(delay)
+                return result
+            return call
+
+        mock_client = MagicMock()
+        mock_client.create_order.side_effect = slow({"id": "signed"})
+        mock_client.post_order.side_effect = slow({"orderID": "order_async"})
+        mock_client.get_order.side_effect = slow({
+            "status": "MATCHED", "size_matched": "10.0", "price": "0.45",
+            "associate_trades": [{"price": "0.46", "size": "10.0"}],
+        })
+        return mock_client
+
+    async def test_async_submit_fills(self):
+        """submit_order_async → 동기 경로와 같은 결과 dict."""
+        from poly24h.execution.sport_executor import SportExecutor
+
+        executor = SportExecutor(dry_run=False, clob_client=self._slow_client(0.0))
+        result = await executor.submit_order_async(
+            token_id="token123", side="BUY", price=0.45, size=10.0,
+        )
+
+        assert result["success"] is True
+        assert result["order_id"] == "order_async"
+        assert result["fill_price"] == pytest.approx(0.46)
+        assert result["size_matched"] == 10.0
+        assert executor.inflight == 0
+
+    async def test_event_loop_not_blocked(self):
+        """서명/조회가 스레드에서 도는 동안 루프의 다른 태스크가 계속 실행."""
+        from poly24h.execution.sport_executor import SportExecutor
+
+        executor = SportExecutor(dry_run=False, clob_client=self._slow_client(0.05))
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        await executor.submit_order_async(
+            token_id="token123", side="BUY", price=0.45, size=10.0,
+        )
+        task.cancel()
+        # 3 blocking calls × 50ms — a blocked loop would tick only once
+        assert ticks >= 10
+
+    async def test_orders_run_concurrently(self):
+        """여러 오더가 동시에 진행 (순차 합보다 빠름)."""
+        from poly24h.execution.sport_executor import SportExecutor
+
+        executor = SportExecutor(dry_run=False, clob_client=self._slow_client(0.05))
+        start = time.monotonic()
+        results = await asyncio.gather(*(
+            executor.submit_order_async(
+                token_id=f"token{i}", side="BUY", price=0.45, size=10.0,
+            )
+            for i in range(4)
+        ))
+        elapsed = time.monotonic() - start
+
+        assert all(r["success"] for r in results)
+        assert elapsed < 4 * 3 * 0.05
+
+    async def test_async_poll_timeout_cancels(self):
+        """async 폴링 타임아웃 → cancel 호출, status=TIMEOUT."""
+        from poly24h.execution.sport_executor import SportExecutor
+
+        mock_client = MagicMock()
+        mock_client.get_order.return_value = {
+            "status": "LIVE", "size_matched": "0", "price": "0.45",
+        }
+
+        executor = SportExecutor(dry_run=False, clob_client=mock_client)
+        result = await executor._poll_order_status_async(
+            "order_abc", timeout_sec=0.05, poll_interval=0.01,
+        )
+
+        assert result["status"] == "TIMEOUT"
+        mock_client.cancel.assert_called_with(order_ids=["order_abc"])
+
+    async def test_async_kill_switch_blocks_order(self, tmp_path):
+        """킬 스위치 활성 시 async 경로도 CLOB 미호출."""
+        from poly24h.execution.kill_switch import KillSwitch
+        from poly24h.execution.sport_executor import SportExecutor
+
+        mock_client = MagicMock()
+        kill_switch = KillSwitch(kill_file=str(tmp_path / "KILL"))
+        kill_switch.activate("Test kill")
+
+        executor = SportExecutor(
+            dry_run=False, clob_client=mock_client, kill_switch=kill_switch,
+        )
+        result = await executor.submit_order_async(
+            token_id="token123", side="BUY", price=0.45, size=10.0,
+        )
+
+        assert result["success"] is False
+        assert "kill_switch" in result["error"]
+        mock_client.create_order.assert_not_called()
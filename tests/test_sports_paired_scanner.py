@@ -37,16 +37,26 @@ def _make_market(
     return m
 
 
+def _batch_asks(yes_ask, no_ask):
+    """fetch_best_asks_batch side effect: every (YES, NO) token pair gets the same asks."""
+    async def _fetch(token_ids):
+        return {
+            token: (yes_ask if i % 2 == 0 else no_ask)
+            for i, token in enumerate(token_ids)
+        }
+    return _fetch
+
+
 class TestCppBelowThreshold:
     """Detect CPP < threshold as opportunity."""
 
     @pytest.mark.asyncio
-    async def test_cpp_below_threshold_detected(self):
+    async def test_cpp_below_threshold_detected(self, tmp_path):
         """YES@0.45 + NO@0.48 = CPP 0.93 < 0.96 → opportunity detected."""
         from poly24h.strategy.sports_paired_scanner import SportsPairedScanner
 
         mock_fetcher = AsyncMock()
-        mock_fetcher.fetch_best_asks.return_value = (0.45, 0.48)
+        mock_fetcher.fetch_best_asks_batch.side_effect = _batch_asks(0.45, 0.48)
 
         mock_pm = MagicMock()
         mock_pm.can_enter.return_value = True
@@ -55,6 +65,7 @@ class TestCppBelowThreshold:
             orderbook_fetcher=mock_fetcher,
             position_manager=mock_pm,
             cpp_threshold=0.96,
+            paper_trade_dir=str(tmp_path),
         )
 
         market = _make_market()
@@ -72,12 +83,12 @@ class TestCppAboveThreshold:
     """Skip when CPP >= threshold."""
 
     @pytest.mark.asyncio
-    async def test_cpp_above_threshold_skipped(self):
+    async def test_cpp_above_threshold_skipped(self, tmp_path):
         """YES@0.50 + NO@0.50 = CPP 1.00 >= 0.96 → no opportunity."""
         from poly24h.strategy.sports_paired_scanner import SportsPairedScanner
 
         mock_fetcher = AsyncMock()
-        mock_fetcher.fetch_best_asks.return_value = (0.50, 0.50)
+        mock_fetcher.fetch_best_asks_batch.side_effect = _batch_asks(0.50, 0.50)
 
         mock_pm = MagicMock()
         mock_pm.can_enter.return_value = True
@@ -86,6 +97,7 @@ class TestCppAboveThreshold:
             orderbook_fetcher=mock_fetcher,
             position_manager=mock_pm,
             cpp_threshold=0.96,
+            paper_trade_dir=str(tmp_path),
         )
 
         market = _make_market()
@@ -98,12 +110,12 @@ class TestInsufficientLiquidity:
     """Skip when orderbook returns None (no liquidity)."""
 
     @pytest.mark.asyncio
-    async def test_insufficient_liquidity_skipped(self):
+    async def test_insufficient_liquidity_skipped(self, tmp_path):
         """Orderbook returns None for one side → skip."""
         from poly24h.strategy.sports_paired_scanner import SportsPairedScanner
 
         mock_fetcher = AsyncMock()
-        mock_fetcher.fetch_best_asks.return_value = (0.45, None)
+        mock_fetcher.fetch_best_asks_batch.side_effect = _batch_asks(0.45, None)
 
         mock_pm = MagicMock()
         mock_pm.can_enter.return_value = True
@@ -112,6 +124,7 @@ class TestInsufficientLiquidity:
             orderbook_fetcher=mock_fetcher,
             position_manager=mock_pm,
             cpp_threshold=0.96,
+            paper_trade_dir=str(tmp_path),
         )
 
         market = _make_market()
@@ -129,12 +142,12 @@ class TestScanner24HFilter:
     """Only scan markets settling within 24 hours."""
 
     @pytest.mark.asyncio
-    async def test_scanner_24h_filter(self):
+    async def test_scanner_24h_filter(self, tmp_path):
         """Market settling in 12H → included. Market settling in 48H → excluded."""
         from poly24h.strategy.sports_paired_scanner import SportsPairedScanner
 
         mock_fetcher = AsyncMock()
-        mock_fetcher.fetch_best_asks.return_value = (0.45, 0.48)
+        mock_fetcher.fetch_best_asks_batch.side_effect = _batch_asks(0.45, 0.48)
 
         mock_pm = MagicMock()
         mock_pm.can_enter.return_value = True
@@ -144,6 +157,7 @@ class TestScanner24HFilter:
             position_manager=mock_pm,
             cpp_threshold=0.96,
             max_hours_to_settle=24,
+            paper_trade_dir=str(tmp_path),
         )
 
         now = datetime.now(timezone.utc)
@@ -170,12 +184,12 @@ class TestScannerRunLoop:
     """Scanner has run_forever() that discovers and scans markets."""
 
     @pytest.mark.asyncio
-    async def test_scanner_run_loop(self):
+    async def test_scanner_run_loop(self, tmp_path):
         """run_forever() calls discover + scan on each cycle."""
         from poly24h.strategy.sports_paired_scanner import SportsPairedScanner
 
         mock_fetcher = AsyncMock()
-        mock_fetcher.fetch_best_asks.return_value = (0.45, 0.48)
+        mock_fetcher.fetch_best_asks_batch.side_effect = _batch_asks(0.45, 0.48)
 
         mock_pm = MagicMock()
         mock_pm.can_enter.return_value = True
@@ -195,6 +209,7 @@ class TestScannerRunLoop:
             market_scanner=mock_market_scanner,
             sport_configs=[MagicMock()],
             scan_interval=0.01,
+            paper_trade_dir=str(tmp_path),
         )
 
         # Run for a brief period then cancel
@@ -214,12 +229,12 @@ class TestPairedPositionTracking:
     """Track YES+NO paired entries separately from PositionManager."""
 
     @pytest.mark.asyncio
-    async def test_paired_position_tracking(self):
+    async def test_paired_position_tracking(self, tmp_path):
         """Enter paired position records both YES and NO as one record."""
         from poly24h.strategy.sports_paired_scanner import SportsPairedScanner
 
         mock_fetcher = AsyncMock()
-        mock_fetcher.fetch_best_asks.return_value = (0.45, 0.48)
+        mock_fetcher.fetch_best_asks_batch.side_effect = _batch_asks(0.45, 0.48)
 
         mock_pm = MagicMock()
         mock_pm.can_enter.return_value = True
@@ -0,0 +1,131 @@
+"""Tests for F-056: Streaming, mergeable, process-parallel paper trade analysis."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
+
+import pytest
+
+from poly24h.analysis import paper_analyzer
+from poly24h.analysis.paper_analyzer import (
+    KIND_MARKET_STATS,
+    KIND_PAIRED,
+    KIND_SINGLE,
+    PaperTradeAnalyzer,
+    TradeAggregate,
+    aggregate_files,
+    find_files,
+)
+
+SINGLES = [
+    {"market_id": "1", "market_source": "nba", "price": 0.4, "cost": 10.0, "status": "settled",
+     "pnl": 15.0, "payout": 25.0, "timestamp": "2026-02-07T01:00:00+00:00"},
+    {"market_id": "2", "market_source": "nhl", "price": 0.5, "cost": 10.0, "status": "settled",
+     "pnl": -10.0, "payout": 0.0, "timestamp": "2026-02-08T01:00:00+00:00"},
+    {"market_id": "3", "market_source": "nba", "price": 0.45, "cost": 20.0, "status": "open",
+     "timestamp": "2026-02-08T02:00:00+00:00"},
+]
+PAIRED = [
+    {"market_source": "nba", "cost_usd": 9.5, "guaranteed_profit": 0.5, "total_cost": 0.95,
+     "roi_pct": 5.2, "status": "open", "timestamp": "2026-02-06T03:00:00+00:00"},
+]
+STATS = [
+    {"asset_symbol": "BTC", "trigger_price": 0.42, "is_paired": True},
+    {"asset_symbol": "BTC", "trigger_price": 0.46},
+    {"asset_symbol": "", "trigger_price": 0.0},
+]
+
+
+def _write(path, records) -> None:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+
+class TestAggregate:
+    def test_merged_partials_equal_single_pass(self):
+        whole = (
+            TradeAggregate().add(KIND_SINGLE, SINGLES).add(KIND_PAIRED, PAIRED)
+            .add(KIND_MARKET_STATS, STATS)
+        )
+        parts = [
+            TradeAggregate().add(KIND_SINGLE, SINGLES[:1]),
+            TradeAggregate().add(KIND_SINGLE, SINGLES[1:]).add(KIND_MARKET_STATS, STATS[:1]),
+            TradeAggregate().add(KIND_PAIRED, PAIRED).add(KIND_MARKET_STATS, STATS[1:]),
+        ]
+        merged = parts[0].merge(parts[1]).merge(parts[2])
+        assert asdict(merged.result(0)) == asdict(whole.result(0))
+
+        result = whole.result(0)
+        assert (result.overall.wins, result.overall.losses) == (1, 1)
+        assert result.overall.avg_price == pytest.approx(0.45)
+        assert result.date_range == "2026-02-06 ~ 2026-02-08"
+        btc = next(a for a in result.by_asset if a.symbol == "BTC")
+        assert (btc.paired_signals, btc.avg_trigger_price) == (1, pytest.approx(0.44))
+
+    def test_result_leaves_aggregate_mergeable(self):
+        part = TradeAggregate().add(KIND_MARKET_STATS, [{"asset_symbol": "ETH"}])
+        before = part.to_dict()
+        assert part.result(0).by_asset[0].min_trigger_price == 0.0
+        assert part.to_dict() == before
+
+        eth = [{"asset_symbol": "ETH", "trigger_price": 0.4}]
+        merged = part.merge(TradeAggregate().add(KIND_MARKET_STATS, eth))
+        assert merged.result(0).by_asset[0].min_trigger_price == 0.4
+
+
+class _FailingPool:
+    """Process pool whose map() dies after its first result."""
+
+    def __init__(self, max_workers):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, *iterables):
+        for args in zip(*iterables):
+            yield fn(*args)
+            raise BrokenProcessPool("worker died")
+
+
+class TestAnalyzer:
+    @pytest.fixture
+    def paper_dir(self, tmp_path):
+        _write(tmp_path / "2026-02-07.jsonl", SINGLES[:1])
+        _write(tmp_path / "2026-02-08.jsonl", SINGLES[1:])
+        _write(tmp_path / "paired_2026-02-06.jsonl", PAIRED)
+        _write(tmp_path / "market_stats_2026-02-07.jsonl", STATS[:2])
+        _write(tmp_path / "market_stats_2026-02-08.jsonl", STATS[2:])
+        _write(tmp_path / "paired_sports_2026-02-08.jsonl", PAIRED)  # not a dated kind
+        return tmp_path
+
+    def test_files_classified_with_one_glob(self, paper_dir):
+        files = find_files(paper_dir)
+        assert [f.name for f in files[KIND_SINGLE]] == ["2026-02-07.jsonl", "2026-02-08.jsonl"]
+        assert [f.name for f in files[KIND_PAIRED]] == ["paired_2026-02-06.jsonl"]
+        assert len(files[KIND_MARKET_STATS]) == 2
+
+    def test_process_pool_matches_serial(self, paper_dir):
+        serial = PaperTradeAnalyzer(data_dir=str(paper_dir), max_workers=1).analyze()
+        parallel = PaperTradeAnalyzer(
+            data_dir=str(paper_dir), max_workers=2, parallel_min_bytes=0,
+        ).analyze()
+        assert asdict(parallel) == asdict(serial)
+        assert serial.overall.total_trades == 3
+        assert serial.files_read == 6  # db + 2 day files + 1 paired + 2 stats
+
+    def test_pool_failure_mid_map_yields_each_partial_once(self, paper_dir, monkeypatch):
+        monkeypatch.setattr(paper_analyzer, "ProcessPoolExecutor", _FailingPool)
+        files = find_files(paper_dir)
+        tasks = [(kind, path) for kind in files for path in files[kind]]
+
+        parts = list(aggregate_files(tasks, max_workers=2, parallel_min_bytes=0))
+        assert len(parts) == len(tasks)
+        merged = TradeAggregate()
+        for part in parts:
+            merged.merge(part)
+        assert merged.single.total_trades == 3
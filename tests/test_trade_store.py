@@ -0,0 +1,116 @@
+"""Tests for F-053: Indexed embedded paper-trade store."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from poly24h.monitoring.settlement import PaperSettlementTracker, PaperTrade
+from poly24h.position_manager import PositionManager
+from poly24h.trade_store import TradeStore
+
+
+def _trade(market_id: str, **kwargs) -> PaperTrade:
+    defaults = dict(
+        market_id=market_id, market_question=f"Q {market_id}", market_source="nba",
+        side="YES", price=0.5, shares=20.0, cost=10.0,
+        timestamp="2026-02-11T20:00:00+00:00", end_date="2026-02-11T22:00:00+00:00",
+    )
+    defaults.update(kwargs)
+    return PaperTrade(**defaults)
+
+
+class TestTradeStore:
+    def test_insert_dedups_per_day_and_streams_in_pages(self, tmp_path):
+        store = TradeStore(tmp_path / "t.db")
+        store.BATCH_SIZE = 2
+        assert store.insert(_trade("1").to_dict(), "2026-02-11")
+        assert not store.insert(_trade("1").to_dict(), "2026-02-11")
+        assert store.insert(_trade("1").to_dict(), "2026-02-12")
+        store.insert_many([_trade(str(i)).to_dict() for i in range(2, 6)], "2026-02-12")
+
+        assert [t["market_id"] for t in store.iter_trades(days=["2026-02-12"])] == [
+            "1", "2", "3", "4", "5",
+        ]
+        assert len(store.trades(start_day="2026-02-12")) == 5
+        assert store.market_ids("2026-02-11") == {"1"}
+
+    def test_insert_rolls_back_when_revision_bump_fails(self, tmp_path):
+        store = TradeStore(tmp_path / "t.db")
+        store._conn.execute("DROP TABLE day_revisions")
+
+        with pytest.raises(sqlite3.OperationalError):
+            store.insert(_trade("1").to_dict(), "2026-02-11")
+        assert store.trades() == []
+
+    def test_settlement_is_in_place_and_preserves_extra_fields(self, tmp_path):
+        store = TradeStore(tmp_path / "t.db")
+        store.insert({**_trade("1").to_dict(), "spread": 0.03}, "2026-02-11")
+        store.insert(_trade("1").to_dict(), "2026-02-12")
+
+        settled = {**_trade("1").to_dict(), "status": "settled", "winner": "YES",
+                   "payout": 20.0, "pnl": 10.0}
+        assert store.update_settlements([settled]) == 2
+        assert store.update_settlements([settled]) == 0
+        record = store.trades(days=["2026-02-11"])[0]
+        assert (record["status"], record["pnl"], record["spread"]) == ("settled", 10.0, 0.03)
+
+    def test_jsonl_import_only_when_changed_and_export(self, tmp_path):
+        day_file = tmp_path / "2026-02-11.jsonl"
+        day_file.write_text(
+            json.dumps(_trade("1").to_dict()) + "\nnot json\n"
+            + json.dumps({"market_id": "2", "paper_size_usd": 50.0, "status": "open"}) + "\n",
+        )
+        (tmp_path / "paired_2026-02-11.jsonl").write_text("{}\n")
+        store = TradeStore.for_dir(tmp_path)
+
+        assert store.import_dir(tmp_path) == 2
+        assert store.import_dir(tmp_path) == 0
+        assert store.trades(days=["2026-02-11"])[1]["cost"] == 50.0
+
+        store.update_settlements([{"market_id": "1", "status": "settled", "pnl": 5.0}])
+        assert store.export_jsonl("2026-02-11", day_file) == 2
+        assert json.loads(day_file.read_text().splitlines()[0])["status"] == "settled"
+        assert store.import_jsonl(day_file) == 0
+
+
+class TestConsumers:
+    async def test_tracker_settles_in_store(self, tmp_path):
+        tracker = PaperSettlementTracker(data_dir=str(tmp_path))
+        tracker.record_trade(_trade("111"))
+        tracker.record_trade(_trade("111"))  # duplicate
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        assert len(tracker.store.trades(days=[day])) == 1
+        assert not (tmp_path / f"{day}.jsonl").exists()
+
+        tracker.query_market_result = AsyncMock(return_value="YES")
+        summary = await tracker.check_and_settle()
+        assert summary.newly_settled == 1
+        assert tracker.load_trades()[0].pnl == pytest.approx(10.0)
+
+    def test_position_sync_reads_only_new_store_rows(self, tmp_path):
+        store = TradeStore.for_dir(tmp_path)
+        store.insert(_trade("m1").to_dict(), "2026-02-11")
+        pm = PositionManager(bankroll=1000.0, max_per_market=100.0)
+        pm.sync_from_paper_trades(tmp_path, store=store)
+        assert pm.bankroll == pytest.approx(990.0)
+
+        pm.settle_position("m1", "NO")
+        store.insert(_trade("m2").to_dict(), "2026-02-11")
+        pm.sync_from_paper_trades(tmp_path, store=store)
+        assert set(pm._positions) == {"m2"}
+
+    def test_position_sync_closes_the_store_it_opens(self, tmp_path, monkeypatch):
+        TradeStore.for_dir(tmp_path).insert(_trade("m1").to_dict(), "2026-02-11")
+        closed = []
+        real_close = TradeStore.close
+        monkeypatch.setattr(TradeStore, "close", lambda self: closed.append(real_close(self)))
+
+        pm = PositionManager(bankroll=1000.0, max_per_market=100.0)
+        pm.sync_from_paper_trades(tmp_path)
+        assert set(pm._positions) == {"m1"}
+        assert len(closed) == 1
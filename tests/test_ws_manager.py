@@ -0,0 +1,241 @@
+"""Tests for F-036: Sharded, self-healing WebSocket manager.
+
+Uses an in-process WebSocket stand-in (``FakeWSServer``) instead of the
+real Polymarket endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from poly24h.websocket.price_cache import PriceCache
+from poly24h.websocket.ws_manager import WebSocketManager
+
+
+class FakeConnection:
+    """Client side of a fake socket: recv() reads from a queue."""
+
+    def __init__(self, server: "FakeWSServer"):
+        self.server = server
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.sent: list[dict] = []
+        self.closed = False
+
+    async def send(self, msg: str) -> None:
+        if self.closed:
+            raise ConnectionError("closed")
+        self.sent.append(json.loads(msg))
+
+    async def recv(self) -> str:
+        item = await self.inbox.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def close(self) -> None:
+        self.closed = True
+
+    @property
+    def subscribed(self) -> set[str]:
+        tokens: set[str] = set()
+        for msg in self.sent:
+            if msg.get("type") == "market":
+                tokens.update(msg["assets_ids"])
+            elif msg.get("type") == "unsubscribe":
+                tokens.difference_update(msg["assets_ids"])
+        return tokens
+
+
+class FakeWSServer:
+    """Local WebSocket stand-in: hands out FakeConnections, can drop them."""
+
+    def __init__(self, fail_first: int = 0):
+        self.connections: list[FakeConnection] = []
+        self.fail_first = fail_first
+        self.attempts = 0
+
+    async def connect(self, url: str) -> FakeConnection:
+        self.attempts += 1
+        if self.attempts <= self.fail_first:
+            raise ConnectionError("refused")
+        conn = FakeConnection(self)
+        self.connections.append(conn)
+        return conn
+
+    def live(self) -> list[FakeConnection]:
+        return [c for c in self.connections if not c.closed]
+
+    def push_book(self, conn: FakeConnection, token: str, ask: float) -> None:
+        conn.inbox.put_nowait(json.dumps({
+            "event_type": "book", "asset_id": token,
+            "asks": [{"price": str(ask), "size": "100"}], "bids": [],
+        }))
+
+    def drop(self, conn: FakeConnection) -> None:
+        conn.inbox.put_nowait(ConnectionError("dropped"))
+
+
+async def _until(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.005)
+
+
+def _manager(server: FakeWSServer, **kwargs) -> WebSocketManager:
+    kwargs.setdefault("backoff_base", 0.01)
+    kwargs.setdefault("backoff_max", 0.05)
+    return WebSocketManager(PriceCache(), connect_fn=server.connect, **kwargs)
+
+
+class TestSharding:
+    async def test_tokens_split_across_shards(self):
+        server = FakeWSServer()
+        manager = _manager(server, max_tokens_per_conn=2, max_connections=3)
+        await manager.subscribe(["a", "b", "c", "d", "e"])
+        sizes = sorted(s["tokens"] for s in manager.stats())
+        assert sizes == [1, 2, 2]
+        assert manager.subscribed_tokens == {"a", "b", "c", "d", "e"}
+
+    async def test_overflow_goes_to_least_loaded(self):
+        server = FakeWSServer()
+        manager = _manager(server, max_tokens_per_conn=1, max_connections=2)
+        await manager.subscribe(["a", "b", "c"])
+        assert len(manager.stats()) == 2
+        assert sum(s["tokens"] for s in manager.stats()) == 3
+
+    async def test_set_subscriptions_diff(self):
+        server = FakeWSServer()
+        manager = _manager(server)
+        await manager.set_subscriptions(["a", "b"])
+        await manager.set_subscriptions(["b", "c"])
+        assert manager.subscribed_tokens == {"b", "c"}
+
+
+class TestSupervision:
+    async def test_connects_and_replays_subscriptions(self):
+        server = FakeWSServer()
+        manager = _manager(server, max_tokens_per_conn=2)
+        await manager.subscribe(["a", "b", "c"])
+        await manager.start()
+        try:
+            await _until(lambda: len(server.live()) == 2)
+            await _until(lambda: all(c.sent for c in server.live()))
+            union = set().union(*(c.subscribed for c in server.live()))
+            assert union == {"a", "b", "c"}
+        finally:
+            await manager.stop()
+        assert server.live() == []
+
+    async def test_messages_reach_cache(self):
+        server = FakeWSServer()
+        manager = _manager(server)
+        await manager.subscribe(["a"])
+        await manager.start()
+        try:
+            await _until(lambda: len(server.live()) == 1)
+            server.push_book(server.live()[0], "a", 0.42)
+            await _until(lambda: manager._cache.get_best_ask("a") == 0.42)
+            stats = manager.stats()[0]
+            assert stats["connected"] is True
+            assert stats["messages"] == 1
+            assert stats["msg_rate"] > 0
+            assert stats["lag_secs"] is not None
+        finally:
+            await manager.stop()
+
+    async def test_reconnect_after_drop_replays(self):
+        server = FakeWSServer()
+        manager = _manager(server)
+        await manager.subscribe(["a", "b"])
+        await manager.start()
+        try:
+            await _until(lambda: len(server.live()) == 1)
+            first = server.live()[0]
+            server.drop(first)
+            await _until(lambda: len(server.connections) == 2 and server.live())
+            second = server.live()[0]
+            assert second is not first
+            await _until(lambda: second.subscribed == {"a", "b"})
+            assert manager.stats()[0]["reconnects"] >= 1
+        finally:
+            await manager.stop()
+
+    async def test_retries_refused_connect(self):
+        server = FakeWSServer(fail_first=2)
+        manager = _manager(server)
+        await manager.subscribe(["a"])
+        await manager.start()
+        try:
+            await _until(lambda: len(server.live()) == 1)
+            assert server.attempts == 3
+        finally:
+            await manager.stop()
+
+    async def test_stalled_shard_reconnects(self):
+        server = FakeWSServer()
+        manager = _manager(server, idle_timeout=0.05)
+        await manager.subscribe(["a"])
+        await manager.start()
+        try:
+            await _until(lambda: len(server.connections) >= 2)
+        finally:
+            await manager.stop()
+
+    async def test_subscribe_while_running_starts_new_shard(self):
+        server = FakeWSServer()
+        manager = _manager(server, max_tokens_per_conn=1)
+        await manager.start()
+        try:
+            await manager.subscribe(["a"])
+            await _until(lambda: len(server.live()) == 1)
+            await manager.subscribe(["b"])
+            await _until(lambda: len(server.live()) == 2)
+        finally:
+            await manager.stop()
+
+
+class TestHealth:
+    async def test_stalled_tokens_when_disconnected(self):
+        server = FakeWSServer()
+        manager = _manager(server, max_tokens_per_conn=1)
+        await manager.subscribe(["a", "b"])
+        # Not started → no shard connected → every token counts as stalled
+        assert manager.stalled_tokens(max_lag=5.0) == {"a", "b"}
+
+    def test_backoff_has_jitter_and_cap(self):
+        manager = WebSocketManager(PriceCache(), backoff_base=1.0, backoff_max=8.0)
+        delays = [manager._backoff(10) for _ in range(20)]
+        assert all(4.0 <= d <= 8.0 for d in delays)
+        assert len(set(delays)) > 1
+
+
+class TestEventLoopIntegration:
+    async def test_pre_open_sets_ws_subscriptions(self, tmp_path):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from poly24h.scheduler.event_scheduler import EventDrivenLoop
+
+        ws_manager = MagicMock()
+        ws_manager.set_subscriptions = AsyncMock()
+        market = MagicMock()
+        market.source.value = "hourly_crypto"
+        preparer = MagicMock()
+        preparer.discover_upcoming_markets = AsyncMock(return_value=[market])
+        preparer.extract_token_pairs = MagicMock(return_value=[("y", "n")])
+        preparer.extract_token_market_map = MagicMock(return_value={})
+        preparer.warm_clob_connection = AsyncMock(return_value=True)
+        schedule = MagicMock()
+        schedule.is_snipe_window = MagicMock(return_value=True)
+
+        loop = EventDrivenLoop(
+            schedule, preparer, MagicMock(), MagicMock(), ws_manager=ws_manager,
+            data_dir=tmp_path,
+        )
+        loop._calculate_fair_values = AsyncMock()
+        await loop._handle_pre_open_phase(MagicMock())
+
+        tokens = list(ws_manager.set_subscriptions.await_args.args[0])
+        assert tokens == ["y", "n"]